@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import math
 import uuid
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Awaitable, Callable, Optional
 
 from fastapi import HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
@@ -9,8 +10,12 @@ from redis import Redis
 
 from app.core.config import Configuration
 from app.core.security.roles import ROLE_PERMISSIONS_MAP, UserRole
+from app.domain.interfaces.utils import RateLimiterUtilsInterface
 from app.models.user import User
-from app.utils.rate_limiter import login_rate_limiter
+from app.utils.rate_limiter import (
+    default_rate_limiter_utils,
+    login_rate_limiter,
+)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
@@ -46,9 +51,48 @@ class AuthDeps:
 auth_deps = AuthDeps()
 
 
+class RateLimit:
+    """Route dependencies enforcing named policies from ``RATE_LIMITS``.
+
+    Declared per route, e.g. ``dependencies=[Depends(RateLimit.policy("oauth"))]``.
+    Callers are keyed by client IP, or by user id (set by the auth
+    middleware) for ``/user`` policies; excess requests get a 429.
+    """
+
+    # Bound to the container's rate_limiter_utils when the app is created
+    _rate_limiter_utils: Optional[RateLimiterUtilsInterface] = None
+
+    @classmethod
+    def bind(cls, rate_limiter_utils: RateLimiterUtilsInterface) -> None:
+        """Use *rate_limiter_utils* for every rate-limit dependency."""
+        cls._rate_limiter_utils = rate_limiter_utils
+
+    @classmethod
+    def policy(cls, name: str) -> Callable[[Request], Awaitable[None]]:
+        """Return a dependency counting each request against policy *name*."""
+
+        async def rate_limit(request: Request) -> None:
+            utils = cls._rate_limiter_utils or default_rate_limiter_utils
+            user_id = getattr(request.state, "user_id", None)
+            result = await utils.check(
+                name,
+                request.client.host if request.client else "unknown",
+                str(user_id) if user_id else None,
+            )
+            if not result.allowed:
+                retry_after = max(1, math.ceil(result.retry_after))
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Too many requests, please try again later.",
+                    headers={"Retry-After": str(retry_after)},
+                )
+
+        return rate_limit
+
+
 def get_user_id_from_request(request: Request) -> uuid.UUID:
     """
-    Get user_id from request state (set by JWTAuthMiddleware).
+    Get user_id from request state (set by RequestContextMiddleware).
     Raises HTTPException if user is not authenticated.
     """
     user_id = getattr(request.state, "user_id", None)
@@ -63,7 +107,8 @@ def get_user_id_from_request(request: Request) -> uuid.UUID:
 
 async def get_user_from_request(request: Request) -> User:
     """
-    Get user from database using user_id from request state (set by JWTAuthMiddleware).
+    Get user from database using user_id from request state (set by
+    RequestContextMiddleware).
     Attaches roles and attributes from token payload to the user object.
     Raises HTTPException if user is not authenticated or not found.
     """
@@ -109,6 +154,7 @@ async def get_user_from_request(request: Request) -> User:
 
 
 __all__ = [
+    "RateLimit",
     "auth_deps",
     "get_redis",
     "get_user_id_from_request",
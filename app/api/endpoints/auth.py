@@ -15,9 +15,11 @@ from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel, Field
 from starlette.status import HTTP_401_UNAUTHORIZED
 
+from app.api.dependencies import RateLimit
 from app.domain.errors import (
     InactiveUserError,
     InvalidCredentialsError,
+    PasswordHashingBusyError,
     UnverifiedEmailError,
 )
 from app.domain.schemas.auth_token import TokenResponse
@@ -26,6 +28,10 @@ from app.usecase.auth_usecase import AuthUsecase, DuplicateError
 from app.utils.logging import Audit
 from app.utils.rate_limiter import RateLimiterUtils
 
+# Module-level dependency instances to satisfy B008
+_token_rate_limit = Depends(RateLimit.policy("auth_token"))
+_refresh_rate_limit = Depends(RateLimit.policy("auth_refresh"))
+
 
 class _RefreshRequest(BaseModel):
     refresh_token: str | None = Field(None, description="Valid JWT refresh token")
@@ -89,6 +95,13 @@ class Auth:
                 status_code=status.HTTP_409_CONFLICT,
                 detail=f"{dup.field} already exists",
             ) from dup
+        except PasswordHashingBusyError:
+            # Answered with 429 by the global exception handler
+            Audit.warning(
+                "User registration shed - password hashing saturated",
+                client_ip=client_ip,
+            )
+            raise
         except Exception as exc:
             Audit.error(
                 "User registration failed with unexpected error",
@@ -104,6 +117,7 @@ class Auth:
         "/token",
         summary="Obtain JWT bearer tokens",
         response_model=TokenResponse,
+        dependencies=[_token_rate_limit],
     )
     async def login_for_access_token(
         request: Request,
@@ -192,6 +206,13 @@ class Auth:
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Email address not verified",
             )
+        except PasswordHashingBusyError:
+            # Answered with 429 by the global exception handler
+            Audit.warning(
+                "User login shed - password hashing saturated",
+                client_ip=identifier,
+            )
+            raise
         except Exception as exc:
             Audit.error(
                 "User login failed with unexpected error",
@@ -207,6 +228,7 @@ class Auth:
         "/refresh",
         summary="Refresh access token using refresh JWT",
         response_model=TokenResponse,
+        dependencies=[_refresh_rate_limit],
     )
     async def refresh_access_token(
         request: Request,
@@ -1,31 +1,40 @@
 import time
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Request, status
+from fastapi import APIRouter, Depends, Request
 
 # Dependency imports
-from app.api.dependencies import get_user_id_from_request
+from app.api.dependencies import RateLimit, get_user_id_from_request
 from app.domain.schemas.defi import PortfolioSnapshot
+from app.domain.schemas.defi_aggregate import AggregateMetricsSchema
 from app.domain.schemas.defi_dashboard import DefiKPI, ProtocolBreakdown
 from app.domain.schemas.portfolio_timeline import PortfolioTimeline
-from app.domain.schemas.wallet import WalletResponse
+from app.domain.schemas.wallet import WalletResponse, WalletSort
+from app.usecase.defi_aggregate_usecase import DefiAggregateUsecase
 from app.usecase.wallet_usecase import WalletUsecase
 from app.utils.logging import Audit
 
+# Module-level dependency instance to satisfy B008; applied to the routes
+# that aggregate or compute over a whole portfolio
+_rate_limit = Depends(RateLimit.policy("defi"))
+
 
 class DeFi:
     """DeFi endpoint using singleton pattern with dependency injection."""
 
     ep = APIRouter(tags=["defi"])
     __wallet_uc: WalletUsecase
+    __defi_aggregate_uc: DefiAggregateUsecase
 
     def __init__(
         self,
         wallet_usecase: WalletUsecase,
+        defi_aggregate_usecase: DefiAggregateUsecase,
     ):
         """Initialize with injected dependencies."""
         DeFi.__wallet_uc = wallet_usecase
+        DeFi.__defi_aggregate_uc = defi_aggregate_usecase
 
     @staticmethod
     @ep.get(
@@ -34,16 +43,22 @@ class DeFi:
     )
     async def get_wallets(
         request: Request,
+        sort: Optional[WalletSort] = None,
     ):
         """Get all wallets for the current user (proxy to existing wallet endpoint)."""
         start_time = time.time()
         client_ip = request.client.host or "unknown"
         user_id = get_user_id_from_request(request)
 
-        Audit.info("DeFi wallet listing started", user_id=user_id, client_ip=client_ip)
+        Audit.info(
+            "DeFi wallet listing started",
+            user_id=user_id,
+            sort=sort,
+            client_ip=client_ip,
+        )
 
         try:
-            result = await DeFi.__wallet_uc.list_wallets(user_id)
+            result = await DeFi.__wallet_uc.list_wallets(user_id, sort)
 
             duration = int((time.time() - start_time) * 1000)
             Audit.info(
@@ -87,20 +102,7 @@ class DeFi:
         )
 
         try:
-            # Get all user wallets and find the specific one
-            wallets = await DeFi.__wallet_uc.list_wallets(user_id)
-            wallet = next(
-                (w for w in wallets if w.address.lower() == wallet_address.lower()),
-                None,
-            )
-
-            if not wallet:
-                from fastapi import HTTPException
-
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Wallet not found or access denied",
-                )
+            wallet = await DeFi.__wallet_uc.get_wallet(user_id, wallet_address)
 
             duration = int((time.time() - start_time) * 1000)
             Audit.info(
@@ -124,10 +126,59 @@ class DeFi:
             )
             raise
 
+    @staticmethod
+    @ep.get(
+        "/defi/wallets/{wallet_address}/metrics",
+        response_model=AggregateMetricsSchema,
+        dependencies=[_rate_limit],
+    )
+    async def get_wallet_aggregate_metrics(
+        request: Request,
+        wallet_address: str,
+    ):
+        """Get TVL, borrowings and weighted APY of a wallet (cached)."""
+        start_time = time.time()
+        client_ip = request.client.host or "unknown"
+        user_id = get_user_id_from_request(request)
+
+        Audit.info(
+            "DeFi aggregate metrics started",
+            user_id=user_id,
+            wallet_address=wallet_address,
+            client_ip=client_ip,
+        )
+
+        try:
+            result = await DeFi.__defi_aggregate_uc.get_wallet_metrics(
+                user_id, wallet_address
+            )
+
+            duration = int((time.time() - start_time) * 1000)
+            Audit.info(
+                "DeFi aggregate metrics completed",
+                user_id=str(user_id),
+                wallet_address=wallet_address,
+                duration_ms=duration,
+            )
+
+            return result
+        except Exception as exc:
+            duration = int((time.time() - start_time) * 1000)
+            Audit.error(
+                "DeFi aggregate metrics failed",
+                user_id=str(user_id),
+                wallet_address=wallet_address,
+                duration_ms=duration,
+                error=str(exc),
+                exc_info=True,
+            )
+            raise
+
     @staticmethod
     @ep.get(
         "/defi/timeline/{address}",
         response_model=PortfolioTimeline,
+        dependencies=[_rate_limit],
     )
     async def get_portfolio_timeline_for_address(
         request: Request,
@@ -187,6 +238,7 @@ class DeFi:
     @ep.get(
         "/defi/portfolio/timeline",
         response_model=PortfolioTimeline,
+        dependencies=[_rate_limit],
     )
     async def get_aggregated_portfolio_timeline(
         request: Request,
@@ -290,6 +342,7 @@ class DeFi:
     @ep.get(
         "/defi/portfolio/snapshot",
         response_model=PortfolioSnapshot,
+        dependencies=[_rate_limit],
     )
     async def get_current_portfolio_snapshot(
         request: Request,
@@ -458,6 +511,7 @@ class DeFi:
     @ep.get(
         "/defi/portfolio/kpi",
         response_model=DefiKPI,
+        dependencies=[_rate_limit],
     )
     async def get_portfolio_kpi(
         request: Request,
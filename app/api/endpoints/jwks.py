@@ -1,6 +1,6 @@
 """JWKS endpoint for serving JSON Web Key Sets."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response, status
 
 from app.domain.schemas.jwks import JWKSet
 from app.usecase.jwks_usecase import JWKSUsecase
@@ -17,19 +17,31 @@ class JWKS:
         JWKS.__jwks_uc = jwks_usecase
 
     @staticmethod
-    @ep.get("/.well-known/jwks.json", response_model=JWKSet)
-    async def get_jwks() -> JWKSet:
+    @ep.get(
+        "/.well-known/jwks.json",
+        response_model=JWKSet,
+        response_model_exclude_none=True,
+    )
+    async def get_jwks(request: Request) -> Response:
         """Return the JSON Web Key Set for JWT verification.
 
         This endpoint provides the public keys needed by clients to verify
         JWT signatures. The keys are returned in the standard JWK format
         as defined by RFC 7517.
 
-        The response is cached in Redis to improve performance. The cache
-        is invalidated when keys are rotated to ensure fresh keys are
-        published immediately.
+        The body is served pre-encoded from an in-process copy, with a
+        strong ``ETag`` and ``Cache-Control: max-age`` so clients can cache
+        it and revalidate with ``If-None-Match`` (answered with 304). Key
+        rotation invalidates every process's copy.
 
         Returns:
             JWKSet: A JSON Web Key Set containing all active public keys.
         """
-        return await JWKS.__jwks_uc.get_jwks()
+        document = await JWKS.__jwks_uc.get_jwks_document()
+        headers = {
+            "ETag": document.etag,
+            "Cache-Control": f"public, max-age={document.max_age}",
+        }
+        if document.matches(request.headers.get("if-none-match")):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(document.body, media_type="application/json", headers=headers)
@@ -3,13 +3,14 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.responses import RedirectResponse
 
-from app.api.dependencies import get_redis
+from app.api.dependencies import RateLimit, get_redis
 from app.usecase.oauth_usecase import OAuthUsecase
 from app.utils.logging import Audit
 from app.utils.oauth_state_cache import verify_state
 
 # Module-level dependency instances to satisfy B008
 _redis_dependency = Depends(get_redis)
+_rate_limit = Depends(RateLimit.policy("oauth"))
 
 
 class OAuth:
@@ -23,7 +24,7 @@ class OAuth:
         OAuth.__oauth_uc = oauth_usecase
 
     @staticmethod
-    @ep.get("/{provider}/login")
+    @ep.get("/{provider}/login", dependencies=[_rate_limit])
     async def oauth_login(
         provider: str,
         redis=_redis_dependency,
@@ -32,7 +33,7 @@ class OAuth:
         return await OAuth.__oauth_uc.generate_login_redirect(provider, redis)
 
     @staticmethod
-    @ep.get("/{provider}/callback")
+    @ep.get("/{provider}/callback", dependencies=[_rate_limit])
     async def oauth_callback(
         request: Request,
         provider: str,
@@ -141,7 +141,7 @@ class PasswordReset:
             raise HTTPException(status_code=400, detail="User not found")
 
         # Update password
-        hashed_password = PasswordReset.__password_hasher.hash_password(
+        hashed_password = await PasswordReset.__password_hasher.hash_password_async(
             payload.password
         )
         await PasswordReset.__user_repo.update(user, hashed_password=hashed_password)
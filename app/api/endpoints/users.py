@@ -6,6 +6,7 @@ import uuid
 from fastapi import APIRouter, HTTPException, Request, UploadFile, status
 
 from app.api.dependencies import get_user_id_from_request
+from app.domain.errors import PasswordHashingBusyError
 from app.domain.schemas.user import (
     PasswordChange,
     UserCreate,
@@ -226,6 +227,9 @@ class Users:
                 path="/users/me/change-password",
             )
 
+        except PasswordHashingBusyError:
+            # Answered with 429 by the global exception handler
+            raise
         except Exception as e:
             if "Current password is incorrect" in str(e):
                 raise HTTPException(
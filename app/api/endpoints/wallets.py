@@ -1,13 +1,19 @@
 import time
-from typing import List
+import uuid
+from datetime import datetime
+from typing import List, Optional
 
-from fastapi import APIRouter, Request, status
+from fastapi import APIRouter, HTTPException, Query, Request, status
 
 # Dependency imports
 from app.api.dependencies import get_user_id_from_request
+from app.domain.schemas.bulk import BulkWriteResponse
 from app.domain.schemas.historical_balance import (
+    HistoricalBalanceBatchCreate,
     HistoricalBalanceCreate,
     HistoricalBalanceResponse,
+    HistoricalBalanceRevalue,
+    WalletValuation,
 )
 from app.domain.schemas.portfolio_metrics import PortfolioMetrics
 from app.domain.schemas.portfolio_timeline import (
@@ -16,16 +22,26 @@ from app.domain.schemas.portfolio_timeline import (
 )
 from app.domain.schemas.token import TokenCreate, TokenResponse
 from app.domain.schemas.token_balance import (
+    TokenBalanceBatchCreate,
     TokenBalanceCreate,
     TokenBalanceResponse,
 )
-from app.domain.schemas.token_price import TokenPriceCreate, TokenPriceResponse
-from app.domain.schemas.wallet import WalletCreate, WalletResponse
+from app.domain.schemas.token_price import (
+    CandleInterval,
+    LatestTokenPrice,
+    PriceCandleSeries,
+    TokenPriceBatchCreate,
+    TokenPriceCreate,
+    TokenPriceResponse,
+)
+from app.domain.schemas.transaction import TransactionPage
+from app.domain.schemas.wallet import WalletCreate, WalletResponse, WalletSort
 from app.usecase.historical_balance_usecase import HistoricalBalanceUsecase
 from app.usecase.portfolio_snapshot_usecase import PortfolioSnapshotUsecase
 from app.usecase.token_balance_usecase import TokenBalanceUsecase
 from app.usecase.token_price_usecase import TokenPriceUsecase
 from app.usecase.token_usecase import TokenUsecase
+from app.usecase.transaction_usecase import TransactionUsecase
 from app.usecase.wallet_usecase import WalletUsecase
 from app.utils.logging import Audit
 
@@ -40,6 +56,7 @@ class Wallets:
     __token_price_uc: TokenPriceUsecase
     __token_balance_uc: TokenBalanceUsecase
     __portfolio_snapshot_uc: PortfolioSnapshotUsecase
+    __transaction_uc: TransactionUsecase
 
     def __init__(
         self,
@@ -49,6 +66,7 @@ class Wallets:
         token_price_usecase: TokenPriceUsecase,
         token_balance_usecase: TokenBalanceUsecase,
         portfolio_snapshot_usecase: PortfolioSnapshotUsecase,
+        transaction_usecase: TransactionUsecase,
     ):
         """Initialize with injected dependencies."""
         Wallets.__wallet_uc = wallet_usecase
@@ -57,6 +75,7 @@ class Wallets:
         Wallets.__token_price_uc = token_price_usecase
         Wallets.__token_balance_uc = token_balance_usecase
         Wallets.__portfolio_snapshot_uc = portfolio_snapshot_usecase
+        Wallets.__transaction_uc = transaction_usecase
 
     @staticmethod
     @ep.post(
@@ -117,16 +136,19 @@ class Wallets:
     )
     async def list_wallets(
         request: Request,
+        sort: Optional[WalletSort] = None,
     ):
-        """List all wallets."""
+        """List all wallets, optionally sorted by cached USD balance."""
         start_time = time.time()
         client_ip = request.client.host or "unknown"
         user_id = get_user_id_from_request(request)
 
-        Audit.info("Wallet listing started", user_id=user_id, client_ip=client_ip)
+        Audit.info(
+            "Wallet listing started", user_id=user_id, sort=sort, client_ip=client_ip
+        )
 
         try:
-            result = await Wallets.__wallet_uc.list_wallets(user_id)
+            result = await Wallets.__wallet_uc.list_wallets(user_id, sort)
 
             duration = int((time.time() - start_time) * 1000)
             Audit.info(
@@ -203,6 +225,37 @@ class Wallets:
         """Create a new token."""
         return await Wallets.__token_uc.create_token(token)
 
+    @staticmethod
+    @ep.get(
+        "/tokens/{key}/price",
+        response_model=LatestTokenPrice,
+    )
+    async def get_latest_token_price(key: str):
+        """Get the latest price of a token by address, symbol or id."""
+        price = Wallets.__token_price_uc.get_latest_price(key)
+        if price is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No price known for token",
+            )
+        return price
+
+    @staticmethod
+    @ep.get(
+        "/tokens/{address}/prices",
+        response_model=PriceCandleSeries,
+    )
+    async def get_token_price_candles(
+        address: str,
+        interval: CandleInterval = "1h",
+        start: Optional[datetime] = Query(None, alias="from"),
+        end: Optional[datetime] = Query(None, alias="to"),
+    ):
+        """Get OHLC candles of a token's price history."""
+        return await Wallets.__token_price_uc.get_price_candles(
+            address, interval=interval, start=start, end=end
+        )
+
     @staticmethod
     @ep.post(
         "/historical_balances",
@@ -213,6 +266,25 @@ class Wallets:
         """Create a new historical balance."""
         return await Wallets.__historical_balance_uc.create_historical_balance(hb)
 
+    @staticmethod
+    @ep.post(
+        "/historical_balances/batch",
+        response_model=BulkWriteResponse,
+        status_code=status.HTTP_201_CREATED,
+    )
+    async def create_historical_balances(batch: HistoricalBalanceBatchCreate):
+        """Create many historical balances in one transaction."""
+        return await Wallets.__historical_balance_uc.create_historical_balances(batch)
+
+    @staticmethod
+    @ep.post(
+        "/historical_balances/revalue",
+        response_model=BulkWriteResponse,
+    )
+    async def revalue_historical_balances(req: HistoricalBalanceRevalue):
+        """Reprice a token's balance points from the stored price history."""
+        return await Wallets.__historical_balance_uc.revalue_historical_balances(req)
+
     @staticmethod
     @ep.post(
         "/token_prices",
@@ -223,6 +295,16 @@ class Wallets:
         """Create a new token price."""
         return await Wallets.__token_price_uc.create_token_price(tp)
 
+    @staticmethod
+    @ep.post(
+        "/token_prices/batch",
+        response_model=BulkWriteResponse,
+        status_code=status.HTTP_201_CREATED,
+    )
+    async def create_token_prices(batch: TokenPriceBatchCreate):
+        """Create many token prices in one transaction."""
+        return await Wallets.__token_price_uc.create_token_prices(batch)
+
     @staticmethod
     @ep.post(
         "/token_balances",
@@ -233,6 +315,15 @@ class Wallets:
         """Create a new token balance."""
         return await Wallets.__token_balance_uc.create_token_balance(tb)
 
+    @staticmethod
+    @ep.post(
+        "/token_balances/batch",
+        response_model=BulkWriteResponse,
+    )
+    async def upsert_token_balances(batch: TokenBalanceBatchCreate):
+        """Insert or update many token balances keyed on (wallet_id, token_id)."""
+        return await Wallets.__token_balance_uc.upsert_token_balances(batch)
+
     @staticmethod
     @ep.get(
         "/wallets/{address}/portfolio/snapshots",
@@ -277,3 +368,44 @@ class Wallets:
         return await Wallets.__wallet_uc.get_portfolio_timeline(
             user_id, address, interval, limit, offset
         )
+
+    @staticmethod
+    @ep.get(
+        "/wallets/{address}/valuation",
+        response_model=WalletValuation,
+    )
+    async def get_wallet_valuation(
+        request: Request,
+        address: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ):
+        """Get a wallet's USD value series priced as of each balance point."""
+        user_id = get_user_id_from_request(request)
+        return await Wallets.__historical_balance_uc.get_wallet_valuation(
+            user_id, address, start=start, end=end
+        )
+
+    @staticmethod
+    @ep.get(
+        "/wallets/{address}/transactions",
+        response_model=TransactionPage,
+    )
+    async def list_wallet_transactions(
+        request: Request,
+        address: str,
+        limit: int = Query(50, ge=1, le=200),
+        cursor: Optional[str] = None,
+        token_id: Optional[uuid.UUID] = None,
+        type: Optional[str] = None,
+    ):
+        """List a wallet's transactions, newest first, with keyset pagination."""
+        user_id = get_user_id_from_request(request)
+        return await Wallets.__transaction_uc.list_wallet_transactions(
+            user_id,
+            address,
+            limit=limit,
+            cursor=cursor,
+            token_id=token_id,
+            tx_type=type,
+        )
@@ -9,4 +9,9 @@ from .main import di_container
 celery_service = di_container.get_core("celery")
 celery = celery_service.get_celery_app()
 
+import app.tasks.defi_metrics  # noqa: F401, E402
 import app.tasks.jwt_rotation  # noqa: F401, E402
+import app.tasks.price_candles  # noqa: F401, E402
+import app.tasks.price_feed  # noqa: F401, E402
+import app.tasks.token_cleanup  # noqa: F401, E402
+import app.tasks.transaction_indexer  # noqa: F401, E402
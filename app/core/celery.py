@@ -31,7 +31,31 @@ class CoreCelery:
             "jwt-rotation-beat": {
                 "task": "app.tasks.jwt_rotation.promote_and_retire_keys_task",
                 "schedule": crontab(*self.config.JWT_ROTATION_SCHEDULE_CRON.split()),
-            }
+            },
+            "transaction-indexer-beat": {
+                "task": "app.tasks.transaction_indexer.index_transactions_task",
+                "schedule": crontab(*self.config.INDEXER_SCHEDULE_CRON.split()),
+            },
+            "price-feed-beat": {
+                "task": "app.tasks.price_feed.ingest_prices_task",
+                "schedule": crontab(*self.config.PRICE_FEED_SCHEDULE_CRON.split()),
+            },
+            "defi-metrics-refresh-beat": {
+                "task": "app.tasks.defi_metrics.refresh_defi_metrics_task",
+                "schedule": crontab(
+                    *self.config.DEFI_METRICS_REFRESH_SCHEDULE_CRON.split()
+                ),
+            },
+            "price-candle-rollup-beat": {
+                "task": "app.tasks.price_candles.rollup_price_candles_task",
+                "schedule": crontab(
+                    *self.config.PRICE_CANDLE_ROLLUP_SCHEDULE_CRON.split()
+                ),
+            },
+            "token-sweep-beat": {
+                "task": "app.tasks.token_cleanup.sweep_expired_tokens_task",
+                "schedule": crontab(*self.config.TOKEN_SWEEP_SCHEDULE_CRON.split()),
+            },
         }
 
     @property
@@ -44,6 +44,17 @@ class Configuration(BaseSettings):
     # pooling via SQLAlchemy – keep defaults modest for dev/tests).
     DB_POOL_SIZE: int = 5
     DB_MAX_OVERFLOW: int = 10
+    DB_POOL_PRE_PING: bool = True  # test connections before handing them out
+    DB_POOL_RECYCLE_SEC: int = 1800  # replace connections older than this
+    DB_POOL_TIMEOUT_SEC: float = 30.0  # max wait for a free connection
+    # asyncpg prepared-statement LRU per connection (0 disables; required
+    # behind PgBouncer in transaction pooling mode)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+
+    # Optional read replicas (JSON list of URLs). Read-only repository
+    # methods are routed to them; everything else stays on DATABASE_URL.
+    DATABASE_READ_URLS: List[str] = []
+    DB_READ_STRATEGY: str = "round_robin"  # or "least_connections"
 
     @field_validator("DATABASE_URL", mode="before")
     @classmethod
@@ -100,22 +111,44 @@ class Configuration(BaseSettings):
 
     # Password hashing
     BCRYPT_ROUNDS: int = 12  # Default cost factor for bcrypt
+    # Threads hashing/verifying off the event loop (0 = one per CPU core)
+    PASSWORD_HASH_WORKERS: int = 0
+    # Calls allowed to wait for a hashing thread before answering 429
+    PASSWORD_HASH_QUEUE_SIZE: int = 32
 
     # GPG encryption
     GPG_RECIPIENT_KEY_ID: Optional[str] = None
 
     # JWT configuration
+    # HS256/384/512 (shared secret), RS256/384/512, ES256/384/512 or EdDSA
+    # (Ed25519); asymmetric algorithms read the JWT_*_KEY_PATH PEM files.
     JWT_ALGORITHM: str = "HS256"
     JWT_PRIVATE_KEY_PATH: Optional[str] = None
     JWT_PUBLIC_KEY_PATH: Optional[str] = None
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
+    # Verified access tokens cached per API process (0 disables)
+    JWT_VERIFIED_TOKEN_CACHE_SIZE: int = 10000
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # How long a mirrored "not revoked" refresh-token state is trusted before
+    # the database is consulted again; bounds a revocation lost to Redis
+    REFRESH_TOKEN_CACHE_VALID_TTL_SEC: int = 60
     JWT_SECRET_KEY: Optional[str] = "insecure-test-key"
 
     # Authentication rate-limiting (login attempts)
     AUTH_RATE_LIMIT_ATTEMPTS: int = 5  # max attempts per window
     AUTH_RATE_LIMIT_WINDOW_SECONDS: int = 60  # rolling window size
 
+    # Route rate-limit policies as "<limit>/<seconds>[/user]", keyed by the
+    # name routes refer to; "/user" policies count per authenticated user.
+    # Shared by all workers through Redis when REDIS_URL is set, otherwise
+    # enforced per process. Removing an entry disables that limit.
+    RATE_LIMITS: dict[str, str] = {
+        "auth_token": "20/60",
+        "auth_refresh": "60/60",
+        "oauth": "30/60",
+        "defi": "120/60/user",
+    }
+
     # Web3
     ARBITRUM_RPC_URL: Optional[str] = None
     WEB3_PROVIDER_URI: Optional[str] = None
@@ -135,8 +168,8 @@ class Configuration(BaseSettings):
 
     # --- Key-Rotation Support ---------------------------
     # Mapping of key-id (kid) → PEM/secret used for verifying signatures.
-    # In HS* algorithms the value is the raw secret; for RS* algorithms the
-    # value should be the *public* key PEM string.  The active signing key is
+    # In HS* algorithms the value is the raw secret; for RS*, ES* and EdDSA
+    # the value should be the *public* key PEM string.  The active signing key is
     # controlled by *ACTIVE_JWT_KID*.  Additional keys may exist in the map
     # during a grace-period following rotation so that previously-issued
     # tokens remain valid.
@@ -168,6 +201,71 @@ class Configuration(BaseSettings):
 
     # JWKS caching configuration
     JWKS_CACHE_TTL_SEC: int = 3600  # 1 hour default TTL
+    # Cache-Control max-age sent to JWKS clients (gateways, resource servers)
+    JWKS_MAX_AGE_SEC: int = 300
+    # Each process re-reads Redis after this long even without an
+    # invalidation message on JWKS_CHANNEL
+    JWKS_LOCAL_TTL_SEC: int = 60
+    JWKS_CHANNEL: str = "jwks:invalidate"
+
+    # In-process latest-price index, kept in sync across workers via pub/sub
+    PRICE_INDEX_CHANNEL: str = "token_prices:latest"
+    PRICE_INDEX_RECONNECT_MAX_SEC: int = 30
+
+    # Optional OHLC rollup of token_prices (token_price_candles table). When
+    # enabled, candle queries read completed buckets from the rollup and only
+    # compute the most recent bucket from raw prices.
+    PRICE_CANDLE_ROLLUP_ENABLED: bool = False
+    PRICE_CANDLE_ROLLUP_SCHEDULE_CRON: str = "*/5 * * * *"
+    # Raw prices newer than this are re-aggregated on every rollup run
+    PRICE_CANDLE_ROLLUP_LOOKBACK_HOURS: int = 48
+
+    # Expired/used refresh, email-verification and password-reset tokens are
+    # deleted in batches of TOKEN_SWEEP_BATCH_SIZE rows, pausing between
+    # batches so no single statement holds locks for long.
+    TOKEN_SWEEP_SCHEDULE_CRON: str = "17 * * * *"  # hourly
+    TOKEN_SWEEP_BATCH_SIZE: int = 1000
+    TOKEN_SWEEP_PAUSE_SEC: float = 0.2
+    TOKEN_SWEEP_MAX_BATCHES: int = 500  # per table and run
+
+    # --- On-chain transaction indexer ------------------------------------
+    INDEXER_CHAIN_ID: int = 1
+    # First block scanned when no checkpoint exists yet. ``None`` starts
+    # ``INDEXER_INITIAL_LOOKBACK_BLOCKS`` behind the current safe head.
+    INDEXER_START_BLOCK: Optional[int] = None
+    INDEXER_INITIAL_LOOKBACK_BLOCKS: int = 7200  # ~1 day on mainnet
+    INDEXER_CHUNK_SIZE: int = 2000  # blocks per eth_getLogs request
+    INDEXER_CONCURRENCY: int = 4  # parallel eth_getLogs requests
+    INDEXER_CONFIRMATIONS: int = 12  # stay this far behind the head
+    INDEXER_MAX_BLOCKS_PER_RUN: int = 100_000
+    # Lending pools (Aave v3 compatible) whose Supply/Borrow/Repay/Withdraw
+    # events are indexed in addition to ERC-20 transfers.
+    INDEXER_LENDING_POOL_ADDRESSES: List[str] = []
+    INDEXER_SCHEDULE_CRON: str = "* * * * *"  # every minute
+    INDEXER_LOCK_TTL_SEC: int = 900
+
+    # --- Price feed (CoinGecko-compatible) -------------------------------
+    PRICE_FEED_BASE_URL: str = "https://api.coingecko.com/api/v3"
+    PRICE_FEED_PLATFORM: str = "ethereum"  # asset platform of token addresses
+    # Header carrying COINGECKO_API_KEY (``x-cg-pro-api-key`` on the pro API)
+    PRICE_FEED_API_KEY_HEADER: str = "x-cg-demo-api-key"
+    PRICE_FEED_BATCH_SIZE: int = 50  # contract addresses per request
+    PRICE_FEED_RATE_PER_MIN: int = 30  # provider request allowance
+    PRICE_FEED_BURST: int = 5
+    PRICE_FEED_MAX_RETRIES: int = 3
+    PRICE_FEED_TIMEOUT_SEC: int = 10
+    PRICE_FEED_SCHEDULE_CRON: str = "*/5 * * * *"
+    PRICE_FEED_LOCK_TTL_SEC: int = 300
+
+    # --- Aggregate DeFi metrics cache (refresh-ahead) --------------------
+    DEFI_METRICS_CACHE_TTL_SEC: int = 180
+    # Hot keys with less TTL left than this are recomputed by the refresher;
+    # keep it above the refresher interval so hot keys never expire.
+    DEFI_METRICS_REFRESH_AHEAD_SEC: int = 90
+    # A key is hot if it was read within this window.
+    DEFI_METRICS_HOT_WINDOW_SEC: int = 900
+    DEFI_METRICS_REFRESH_SCHEDULE_CRON: str = "* * * * *"  # every minute
+    DEFI_METRICS_REFRESH_LOCK_TTL_SEC: int = 120
 
     # Pydantic v2 config – ignore extra environment variables to prevent
     # validation errors when the host machine defines unrelated keys
@@ -1,8 +1,14 @@
 # Synchronous SQLAlchemy imports for Celery / legacy callers
-from contextlib import asynccontextmanager
+import asyncio
+import itertools
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from functools import cached_property
+from typing import Optional
 
-from sqlalchemy import create_engine  # type: ignore
+from sqlalchemy import create_engine, event  # type: ignore
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -11,23 +17,82 @@ from sqlalchemy.orm import sessionmaker  # type: ignore
 from sqlalchemy.orm import declarative_base
 
 from app.core.config import Configuration
+from app.core.db_metrics import InstrumentedAsyncQueuePool, instrument_engine
 from app.utils.logging import Audit
 
 
+def _enable_sqlite_savepoints(engine) -> None:
+    """Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work on SQLite.
+
+    The sqlite3 driver otherwise starts transactions lazily on its own,
+    which breaks the savepoints used by :meth:`CoreDatabase.unit_of_work`.
+    """
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _on_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+class _SessionScope:
+    """Session shared by one task for the duration of a request or unit of work."""
+
+    __slots__ = ("database", "owner", "session", "unit_of_work", "wrote")
+
+    def __init__(self, database, session=None, unit_of_work=False):
+        self.database = database
+        # Only the task that opened the scope uses the shared session; tasks
+        # spawned from it (e.g. asyncio.gather) inherit the contextvar but
+        # an AsyncSession must not be used concurrently.
+        self.owner = asyncio.current_task()
+        self.session: Optional[AsyncSession] = session
+        self.unit_of_work = unit_of_work
+        # Set once the shared session commits; later reads in the scope then
+        # stay on the primary (read-your-writes)
+        self.wrote = False
+
+    def mark_written(self, *_args) -> None:
+        self.wrote = True
+
+
+_current_scope: ContextVar[Optional[_SessionScope]] = ContextVar(
+    "db_session_scope", default=None
+)
+_force_primary: ContextVar[bool] = ContextVar("db_force_primary", default=False)
+
+
 class CoreDatabase:
     """Database service managing database connections and sessions."""
 
     def __init__(self, config: Configuration, audit: Audit):
         self.config = config
         self._setup_async_engine()
-        self._setup_sync_engine()
+        self._setup_read_engines()
         self._setup_session_factories()
         self.audit = audit
 
     def _setup_async_engine(self):
         """Set up the async database engine."""
-        db_url = self.config.DATABASE_URL
+        self.async_engine = self._create_async_engine(self.config.DATABASE_URL)
+        if isinstance(self.async_engine, AsyncEngine):
+            instrument_engine(self.async_engine, "primary")
+
+    def _setup_read_engines(self):
+        """Set up one async engine per configured read replica."""
+        read_urls = getattr(self.config, "DATABASE_READ_URLS", None) or []
+        self.read_engines = [self._create_async_engine(url) for url in read_urls]
+        self._read_strategy = getattr(self.config, "DB_READ_STRATEGY", "round_robin")
+        self._read_cursor = itertools.count()
+        self._read_in_use = [0] * len(self.read_engines)
+        for index, engine in enumerate(self.read_engines):
+            if isinstance(engine, AsyncEngine):
+                instrument_engine(engine, f"replica{index}")
 
+    def _create_async_engine(self, db_url: str):
+        """Create an async engine for *db_url* with the configured pool."""
         # Handle async drivers for different database types
         if db_url.startswith("sqlite:///") and "+aiosqlite" not in db_url:
             db_url = db_url.replace("sqlite:///", "sqlite+aiosqlite:///")
@@ -37,22 +102,38 @@ class CoreDatabase:
         # Create async engine connection args
         connect_args = {"check_same_thread": False} if "sqlite" in db_url else {}
 
-        # For Postgres we tune the pool size based on settings; SQLite keeps default
+        # For Postgres we tune the pool based on settings; SQLite keeps default
         pool_kwargs = {}
         if "postgresql" in str(db_url):
+            config = self.config
             pool_kwargs = {
-                "pool_size": self.config.DB_POOL_SIZE,
-                "max_overflow": self.config.DB_MAX_OVERFLOW,
+                "poolclass": InstrumentedAsyncQueuePool,
+                "pool_size": config.DB_POOL_SIZE,
+                "max_overflow": config.DB_MAX_OVERFLOW,
+                "pool_pre_ping": config.DB_POOL_PRE_PING,
+                "pool_recycle": config.DB_POOL_RECYCLE_SEC,
+                "pool_timeout": config.DB_POOL_TIMEOUT_SEC,
             }
+            if "+asyncpg" in db_url:
+                connect_args[
+                    "prepared_statement_cache_size"
+                ] = config.DB_STATEMENT_CACHE_SIZE
 
-        self.async_engine = create_async_engine(
+        engine = create_async_engine(
             db_url,
             connect_args=connect_args,
             **pool_kwargs,  # type: ignore[arg-type]
         )
+        if "sqlite" in db_url and isinstance(engine, AsyncEngine):
+            _enable_sqlite_savepoints(engine.sync_engine)
+        return engine
 
-    def _setup_sync_engine(self):
-        """Set up the sync database engine for Celery tasks."""
+    @cached_property
+    def sync_engine(self):
+        """Sync database engine for Celery tasks, created on first access.
+
+        API workers never touch it, so they skip building the sync driver.
+        """
         sync_db_url = self.config.DATABASE_URL
 
         # Convert async drivers back to sync for synchronous operations
@@ -61,15 +142,20 @@ class CoreDatabase:
         elif "+asyncpg" in sync_db_url:
             sync_db_url = sync_db_url.replace("+asyncpg", "")
 
-        self.sync_engine = create_engine(
+        return create_engine(
             sync_db_url,
             connect_args={"check_same_thread": False}
             if "sqlite" in sync_db_url
             else {},
         )
 
+    @cached_property
+    def sync_session_factory(self):
+        """Session factory bound to :attr:`sync_engine`."""
+        return sessionmaker(autocommit=False, autoflush=False, bind=self.sync_engine)
+
     def _setup_session_factories(self):
-        """Set up session factories for both async and sync operations."""
+        """Set up the async session factories."""
         self.async_session_factory = async_sessionmaker(
             autocommit=False,
             autoflush=False,
@@ -78,9 +164,16 @@ class CoreDatabase:
             expire_on_commit=False,
         )
 
-        self.sync_session_factory = sessionmaker(
-            autocommit=False, autoflush=False, bind=self.sync_engine
-        )
+        self.read_session_factories = [
+            async_sessionmaker(
+                autocommit=False,
+                autoflush=False,
+                bind=engine,
+                class_=AsyncSession,
+                expire_on_commit=False,
+            )
+            for engine in self.read_engines
+        ]
 
     async def init_db(self) -> None:
         """
@@ -108,11 +201,141 @@ class CoreDatabase:
             self.audit.error("database_connection_check_failed", error=str(e))
             return False
 
+    def _active_scope(self) -> Optional[_SessionScope]:
+        scope = _current_scope.get()
+        if (
+            scope is None
+            or scope.database is not self
+            or scope.owner is not asyncio.current_task()
+        ):
+            return None
+        return scope
+
     @asynccontextmanager
     async def get_session(self):
-        """Get an async database session."""
-        async with self.async_session_factory() as session:
-            yield session
+        """Get an async database session.
+
+        Inside :meth:`request_scope` or :meth:`unit_of_work` every call made by
+        the owning task gets the same session (one identity map, no extra
+        pool checkouts); otherwise a fresh session is opened per call.
+        """
+        scope = self._active_scope()
+        if scope is None:
+            async with self.async_session_factory() as session:
+                yield session
+            return
+
+        if scope.session is None:
+            scope.session = self.async_session_factory()
+            event.listen(scope.session.sync_session, "after_commit", scope.mark_written)
+        try:
+            yield scope.session
+        except BaseException:
+            # Leave the shared session usable for the rest of the request and
+            # drop half-done work, whatever aborted the block (including
+            # non-database errors and cancellation).
+            await scope.session.rollback()
+            raise
+
+    def _pick_replica(self) -> int:
+        if self._read_strategy == "least_connections":
+            return min(range(len(self.read_engines)), key=self._read_in_use.__getitem__)
+        return next(self._read_cursor) % len(self.read_engines)
+
+    @asynccontextmanager
+    async def get_read_session(self):
+        """Get an async session for read-only queries.
+
+        Uses a read replica when ``DATABASE_READ_URLS`` is configured, picked
+        round-robin or by fewest sessions in use (``DB_READ_STRATEGY``).
+        Falls back to :meth:`get_session` without replicas, inside a unit of
+        work, after the current request scope has committed a write
+        (read-your-writes) and under :meth:`use_primary`.
+        """
+        scope = self._active_scope()
+        if (
+            not self.read_engines
+            or _force_primary.get()
+            or (scope is not None and (scope.unit_of_work or scope.wrote))
+        ):
+            async with self.get_session() as session:
+                yield session
+            return
+
+        index = self._pick_replica()
+        self._read_in_use[index] += 1
+        try:
+            async with self.read_session_factories[index]() as session:
+                yield session
+        finally:
+            self._read_in_use[index] -= 1
+
+    @contextmanager
+    def use_primary(self):
+        """Route every :meth:`get_read_session` in this block to the primary."""
+        token = _force_primary.set(True)
+        try:
+            yield
+        finally:
+            _force_primary.reset(token)
+
+    @asynccontextmanager
+    async def request_scope(self):
+        """Share one lazily opened session across all calls in this scope."""
+        if self._active_scope() is not None:
+            yield
+            return
+
+        scope = _SessionScope(self)
+        token = _current_scope.set(scope)
+        try:
+            yield
+        finally:
+            _current_scope.reset(token)
+            if scope.session is not None:
+                await scope.session.close()
+
+    @asynccontextmanager
+    async def unit_of_work(self):
+        """Run every repository call in this block in one transaction.
+
+        The session joins an outer connection-level transaction with
+        ``create_savepoint``, so ``session.commit()`` calls made by
+        repositories only release savepoints. The outer transaction commits
+        when the block exits cleanly and rolls back on any exception.
+        Nested units of work join the enclosing one.
+        """
+        scope = self._active_scope()
+        if scope is not None and scope.unit_of_work:
+            yield scope.session
+            return
+
+        async with self.async_engine.connect() as conn:
+            transaction = await conn.begin()
+            session = self.async_session_factory(
+                bind=conn, join_transaction_mode="create_savepoint"
+            )
+            token = _current_scope.set(
+                _SessionScope(self, session=session, unit_of_work=True)
+            )
+            try:
+                yield session
+                await session.flush()
+                await transaction.commit()
+            except BaseException:
+                await transaction.rollback()
+                raise
+            finally:
+                _current_scope.reset(token)
+                await session.close()
+
+    async def dispose(self) -> None:
+        """Dispose the engine pools, including the sync one if it was built."""
+        await self.async_engine.dispose()
+        for engine in self.read_engines:
+            await engine.dispose()
+        if "sync_engine" in self.__dict__:
+            self.sync_engine.dispose()
 
     def get_sync_session(self):
         """Get a sync database session for Celery tasks."""
@@ -7,6 +7,7 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from sqlalchemy.exc import IntegrityError
 
+from app.domain.errors import PasswordHashingBusyError
 from app.domain.schemas.error import ErrorResponse
 from app.domain.schemas.user import WeakPasswordError
 from app.utils.logging import Audit
@@ -135,3 +136,21 @@ class CoreErrorHandling:
         ).model_dump()
         self.audit.warning("weak_password", **payload)
         return JSONResponse(status_code=400, content=payload)
+
+    async def password_hashing_busy_handler(
+        self, request: Request, exc: PasswordHashingBusyError
+    ) -> JSONResponse:
+        """Shed load with 429 while the password hashing pool is saturated."""
+        trace_id = self._get_trace_id(request)
+        payload = ErrorResponse(
+            detail="Server busy, please retry shortly",
+            code="RATE_LIMIT",
+            status_code=429,
+            trace_id=trace_id,
+        ).model_dump()
+        self.audit.warning("password_hashing_busy", **payload)
+        return JSONResponse(
+            status_code=429,
+            content=payload,
+            headers={"Retry-After": str(exc.retry_after)},
+        )
@@ -6,153 +6,217 @@ import uuid
 from typing import Optional
 
 import structlog
-from fastapi import Request, Response
-from starlette.middleware.base import (
-    BaseHTTPMiddleware,
-    RequestResponseEndpoint,
-)
-
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from jose import jwt
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import cookie_parser
+
+from app.core.error_handling import CoreErrorHandling
+from app.domain.schemas.error import ErrorResponse
+from app.utils.jwt import is_key_retired
 from app.utils.logging import Audit
-
-
-class CorrelationIdMiddleware(BaseHTTPMiddleware):
-    """Attach a per-request *trace_id* (UUID4) to request, response, and log context."""
-
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:  # type: ignore[override]
-        trace_id = str(uuid.uuid4())
-
-        # Bind to structlog contextvars for automatic inclusion
-        structlog.contextvars.bind_contextvars(trace_id=trace_id)
-        request.state.trace_id = trace_id
-
-        # Process downstream handlers with proper exception handling for
-        # BaseHTTPMiddleware
-        try:
-            response: Response = await call_next(request)
-            # Include correlation ID in response header
-            response.headers["X-Trace-ID"] = trace_id
-            return response
-        except Exception as exc:
-            # For HTTPExceptions, we need to create a proper response
-            from fastapi import HTTPException
-            from fastapi.responses import JSONResponse
-
-            if isinstance(exc, HTTPException):
-                # Create a proper response for HTTPException to prevent
-                # "No response returned"
-                from app.domain.schemas.error import ErrorResponse
-
-                code_map = {
-                    400: "BAD_REQUEST",
-                    401: "AUTH_FAILURE",
-                    403: "AUTH_FAILURE",
-                    404: "NOT_FOUND",
-                    409: "CONFLICT",
-                    422: "VALIDATION_ERROR",
-                    429: "RATE_LIMIT",
-                }
-                code = code_map.get(exc.status_code, "ERROR")
-
-                payload = ErrorResponse(
-                    detail=exc.detail,
-                    code=code,
-                    status_code=exc.status_code,
-                    trace_id=trace_id,
-                ).model_dump()
-
-                response = JSONResponse(status_code=exc.status_code, content=payload)
-                response.headers["X-Trace-ID"] = trace_id
-                return response
-            else:
-                # For other exceptions, re-raise to let FastAPI's exception
-                # handlers deal with it
-                raise
-
-
-class JWTAuthMiddleware(BaseHTTPMiddleware):
-    """Extract user_id from JWT token and add it to request state."""
-
-    def __init__(self, app, di_container=None, protected_paths: Optional[list] = None):
-        super().__init__(app)
+from app.utils.verified_token_cache import VerifiedTokenCache
+
+# Route flags stored in the prefix trie
+_PROTECTED = 1
+_EXCLUDED = 2
+
+
+class _TrieNode:
+    __slots__ = ("children", "flags")
+
+    def __init__(self):
+        self.children: dict[str, _TrieNode] = {}
+        self.flags = 0
+
+
+class PrefixTrie:
+    """Character trie of path prefixes, each tagged with bit flags.
+
+    :meth:`match` returns the union of the flags of every registered prefix
+    of *path* in one walk over the path, instead of one ``startswith`` per
+    registered prefix.
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+
+    def add(self, prefix: str, flag: int) -> None:
+        """Tag every path starting with *prefix* with *flag*."""
+        node = self._root
+        for char in prefix:
+            node = node.children.setdefault(char, _TrieNode())
+        node.flags |= flag
+
+    def match(self, path: str) -> int:
+        """Return the combined flags of all registered prefixes of *path*."""
+        node = self._root
+        flags = node.flags
+        for char in path:
+            node = node.children.get(char)
+            if node is None:
+                break
+            flags |= node.flags
+        return flags
+
+
+class RequestContextMiddleware:
+    """Per-request trace id and JWT authentication, as plain ASGI.
+
+    Every HTTP request gets a *trace_id* (UUID4) bound to the structlog
+    context, ``request.state`` and the ``X-Trace-ID`` response header. On
+    protected paths the bearer token (``Authorization`` header or
+    ``access_token`` cookie) is verified and ``request.state.user_id`` /
+    ``token_payload`` are set; failures leave ``user_id`` as None for the
+    endpoint to reject. Only the response start message is touched, so
+    streaming bodies pass through unbuffered.
+    """
+
+    excluded_paths = (
+        "/auth/token",
+        "/auth/refresh",
+        "/oauth/",
+        "/health",
+        "/jwks",
+        "/docs",
+        "/openapi.json",
+        "/redoc",
+    )
+
+    def __init__(
+        self,
+        app,
+        di_container=None,
+        protected_paths: Optional[list] = None,
+        token_cache_size: int = 10000,
+    ):
+        self.app = app
         self.di_container = di_container
+        # Verified payloads of recently seen tokens, so repeat requests with
+        # the same token skip signature checks and payload validation
+        self.token_cache = VerifiedTokenCache(token_cache_size, is_key_retired)
         # Define which paths require authentication
         self.protected_paths = protected_paths or [
             "/users",
             "/wallets",
+            "/defi",
             "/admin",
         ]
-        # Paths that should be excluded from auth
-        self.excluded_paths = [
-            "/auth/token",
-            "/auth/refresh",
-            "/oauth/",
-            "/health",
-            "/jwks",
-            "/docs",
-            "/openapi.json",
-            "/redoc",
-        ]
+        self.routes = PrefixTrie()
+        for prefix in self.protected_paths:
+            self.routes.add(prefix, _PROTECTED)
+        for prefix in self.excluded_paths:
+            self.routes.add(prefix, _EXCLUDED)
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:  # type: ignore[override]
-        # Initialize user_id as None
-        request.state.user_id = None
+    def requires_auth(self, path: str) -> bool:
+        """Return True if *path* is protected and not excluded from auth."""
+        return self.routes.match(path) == _PROTECTED
 
-        # Check if this path requires authentication
-        path = request.url.path
-        requires_auth = any(
-            path.startswith(protected) for protected in self.protected_paths
-        )
-        is_excluded = any(path.startswith(excluded) for excluded in self.excluded_paths)
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        if not requires_auth or is_excluded:
-            # Skip auth for non-protected or excluded paths
-            return await call_next(request)
+        trace_id = str(uuid.uuid4())
+        # Bind to structlog contextvars for automatic inclusion
+        structlog.contextvars.bind_contextvars(trace_id=trace_id)
+        state = scope.setdefault("state", {})
+        state["trace_id"] = trace_id
+        state["user_id"] = None
 
-        # Extract token from Authorization header or cookies
-        token = None
+        if self.requires_auth(scope["path"]):
+            self._authenticate(scope, state)
 
-        # First try Authorization header
-        auth_header = request.headers.get("Authorization")
+        response_started = False
+
+        async def send_with_trace_id(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                MutableHeaders(scope=message).append("X-Trace-ID", trace_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_trace_id)
+        except HTTPException as exc:
+            # Exception handlers normally answer these; this covers
+            # HTTPExceptions raised outside their reach
+            if response_started:
+                raise
+            payload = ErrorResponse(
+                detail=exc.detail,
+                code=CoreErrorHandling._CODE_MAP.get(exc.status_code, "ERROR"),
+                status_code=exc.status_code,
+                trace_id=trace_id,
+            ).model_dump()
+            response = JSONResponse(status_code=exc.status_code, content=payload)
+            await response(scope, receive, send_with_trace_id)
+
+    def _authenticate(self, scope, state: dict) -> None:
+        """Verify the request's token and store the caller in *state*."""
+        headers = Headers(scope=scope)
+
+        # First try Authorization header, then the access_token cookie
+        token = None
+        auth_header = headers.get("authorization")
         if auth_header and auth_header.startswith("Bearer "):
             token = auth_header.split(" ")[1]
-
-        # If no Authorization header, try access_token cookie
         if not token:
-            token = request.cookies.get("access_token")
-
+            token = cookie_parser(headers.get("cookie", "")).get("access_token")
         if not token:
             # Let the endpoint handle the 401 error
-            return await call_next(request)
+            return
 
         try:
-            # Use the injected DI container or fall back to global import
-            if self.di_container:
-                jwt_utils = self.di_container.get_utility("jwt_utils")
-            else:
-                # Local import to avoid circular dependency
-                from app.main import di_container
-
-                jwt_utils = di_container.get_utility("jwt_utils")
-
-            # Decode token and extract user_id
-            payload = jwt_utils.decode_token(token)
-            user_id = uuid.UUID(str(payload["sub"]))
-
-            # Add user_id to request state
-            request.state.user_id = user_id
-            request.state.token_payload = payload
+            payload = self.token_cache.get(token)
+            if payload is None:
+                payload = self._verify_token(token)
 
+            state["user_id"] = uuid.UUID(str(payload["sub"]))
+            state["token_payload"] = payload
         except Exception as exc:
             # Log the error but let the endpoint handle the auth failure
             Audit.warning("JWT auth middleware failed", error=str(exc))
-            # Leave user_id as None, endpoint can check this
 
-        # Continue to endpoint
-        return await call_next(request)
+    def _verify_token(self, token: str) -> dict:
+        """Fully verify *token* and cache its payload for later requests."""
+        # Use the injected DI container or fall back to global import
+        if self.di_container:
+            jwt_utils = self.di_container.get_utility("jwt_utils")
+        else:
+            # Local import to avoid circular dependency
+            from app.main import di_container
+
+            jwt_utils = di_container.get_utility("jwt_utils")
+
+        payload = jwt_utils.decode_token(token)
+        if payload.get("exp") is not None:
+            kid = jwt.get_unverified_header(token).get("kid")
+            self.token_cache.put(token, payload, kid)
+        return payload
+
+
+class DBSessionMiddleware:
+    """Share one database session across the repositories of an HTTP request.
+
+    Implemented as plain ASGI (not ``BaseHTTPMiddleware``) so the endpoint
+    runs in the same task that owns the request scope; it must not be
+    registered inside a ``BaseHTTPMiddleware``, which hands requests to a
+    new task.
+    """
+
+    def __init__(self, app, database=None):
+        self.app = app
+        self.database = database
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self.database is None:
+            await self.app(scope, receive, send)
+            return
+
+        async with self.database.request_scope():
+            await self.app(scope, receive, send)
 
 
 class Middleware:
@@ -162,19 +226,13 @@ class Middleware:
         """Initialize middleware service with audit logging."""
         self.audit = audit
 
-    def get_correlation_id_middleware(self) -> type[CorrelationIdMiddleware]:
-        """Get the correlation ID middleware class."""
-        return CorrelationIdMiddleware
-
-    def create_correlation_id_middleware(self) -> CorrelationIdMiddleware:
-        """Create a new instance of correlation ID middleware."""
-        return CorrelationIdMiddleware(app=None)  # app will be set by FastAPI
-
-    def get_jwt_auth_middleware(self) -> type[JWTAuthMiddleware]:
-        """Get the JWT Auth middleware class."""
-        return JWTAuthMiddleware
+    def get_request_context_middleware(self) -> type[RequestContextMiddleware]:
+        """Get the trace-id / JWT auth middleware class."""
+        return RequestContextMiddleware
 
-    def create_jwt_auth_middleware(self, di_container=None) -> JWTAuthMiddleware:
-        """Create a new instance of JWT Auth middleware."""
+    def create_request_context_middleware(
+        self, di_container=None
+    ) -> RequestContextMiddleware:
+        """Create a new instance of the trace-id / JWT auth middleware."""
         # app will be set by FastAPI
-        return JWTAuthMiddleware(app=None, di_container=di_container)
+        return RequestContextMiddleware(app=None, di_container=di_container)
@@ -11,7 +11,6 @@ from app.api.endpoints.oauth import OAuth
 from app.api.endpoints.password_reset import PasswordReset
 from app.api.endpoints.users import Users
 from app.api.endpoints.wallets import Wallets
-from app.core.celery import CoreCelery
 from app.core.config import Configuration
 from app.core.database import CoreDatabase
 from app.core.error_handling import CoreErrorHandling
@@ -23,6 +22,9 @@ from app.repositories.email_verification_repository import (
 from app.repositories.historical_balance_repository import (
     HistoricalBalanceRepository,
 )
+from app.repositories.indexer_checkpoint_repository import (
+    IndexerCheckpointRepository,
+)
 from app.repositories.oauth_account_repository import OAuthAccountRepository
 from app.repositories.password_reset_repository import PasswordResetRepository
 from app.repositories.portfolio_snapshot_repository import (
@@ -32,6 +34,7 @@ from app.repositories.refresh_token_repository import RefreshTokenRepository
 from app.repositories.token_balance_repository import TokenBalanceRepository
 from app.repositories.token_price_repository import TokenPriceRepository
 from app.repositories.token_repository import TokenRepository
+from app.repositories.transaction_repository import TransactionRepository
 from app.repositories.user_repository import UserRepository
 from app.repositories.wallet_repository import WalletRepository
 
@@ -39,9 +42,12 @@ from app.repositories.wallet_repository import WalletRepository
 from app.services.email_service import EmailService
 from app.services.file_upload_service import FileUploadService
 from app.services.oauth_service import OAuthService
+from app.services.price_feed_service import PriceFeedService
+from app.services.transaction_indexer_service import TransactionIndexerService
 from app.usecase.auth_usecase import AuthUsecase
 
 # Usecase imports
+from app.usecase.defi_aggregate_usecase import DefiAggregateUsecase
 from app.usecase.email_verification_usecase import EmailVerificationUsecase
 from app.usecase.historical_balance_usecase import HistoricalBalanceUsecase
 from app.usecase.jwks_usecase import JWKSUsecase
@@ -50,6 +56,7 @@ from app.usecase.portfolio_snapshot_usecase import PortfolioSnapshotUsecase
 from app.usecase.token_balance_usecase import TokenBalanceUsecase
 from app.usecase.token_price_usecase import TokenPriceUsecase
 from app.usecase.token_usecase import TokenUsecase
+from app.usecase.transaction_usecase import TransactionUsecase
 from app.usecase.user_profile_usecase import UserProfileUsecase
 from app.usecase.wallet_usecase import WalletUsecase
 from app.utils.encryption import EncryptionUtils
@@ -57,7 +64,10 @@ from app.utils.jwks_cache import JWKSCacheUtils
 from app.utils.jwt import JWTUtils
 from app.utils.jwt_keys import JWTKeyUtils
 from app.utils.logging import Audit
+from app.utils.metrics_cache import MetricsCacheUtils
+from app.utils.price_index import PriceIndex
 from app.utils.rate_limiter import RateLimiterUtils
+from app.utils.refresh_token_cache import RefreshTokenCacheUtils
 from app.utils.security import PasswordHasher
 
 
@@ -70,6 +80,7 @@ class DIContainer:
     def __init__(self):
         """Initialize the container, register services, and set up dependencies."""
         self._core = {}
+        self._core_factories = {}
         self._services = {}
         self._repositories = {}
         self._usecases = {}
@@ -96,8 +107,8 @@ class DIContainer:
         logging = CoreLogging(config)
         self.register_core("logging", logging)
 
-        celery = CoreCelery(config)
-        self.register_core("celery", celery)
+        # Celery is only used by workers and beat; build it on first access
+        self.register_core_factory("celery", lambda: self._create_celery(config))
 
         error_handling = CoreErrorHandling(audit)
         self.register_core("error_handling", error_handling)
@@ -105,6 +116,13 @@ class DIContainer:
         middleware = Middleware(audit)
         self.register_core("middleware", middleware)
 
+    @staticmethod
+    def _create_celery(config: Configuration):
+        """Create the Celery service, importing Celery only when needed."""
+        from app.core.celery import CoreCelery
+
+        return CoreCelery(config)
+
     def _initialize_services(self):
         """Initialize and register core services as singletons."""
         config = self.get_core("config")
@@ -131,6 +149,23 @@ class DIContainer:
         file_upload_service = FileUploadService(audit)
         self.register_service("file_upload", file_upload_service)
 
+        transaction_indexer_service = TransactionIndexerService(
+            self.get_repository("transaction"),
+            self.get_repository("indexer_checkpoint"),
+            self.get_repository("wallet"),
+            self.get_repository("token"),
+            config,
+            audit,
+        )
+        self.register_service("transaction_indexer", transaction_indexer_service)
+
+        price_feed_service = PriceFeedService(
+            self.get_repository("token"),
+            config,
+            audit,
+        )
+        self.register_service("price_feed", price_feed_service)
+
     def _initialize_utilities(self):
         """Initialize and register utility classes."""
         config = self.get_core("config")
@@ -145,6 +180,12 @@ class DIContainer:
         jwks_cache_utils = JWKSCacheUtils(config)
         self.register_utility("jwks_cache_utils", jwks_cache_utils)
 
+        metrics_cache_utils = MetricsCacheUtils(config)
+        self.register_utility("metrics_cache_utils", metrics_cache_utils)
+
+        refresh_token_cache_utils = RefreshTokenCacheUtils(config)
+        self.register_utility("refresh_token_cache_utils", refresh_token_cache_utils)
+
         jwt_key_utils = JWTKeyUtils(config)
         self.register_utility("jwt_key_utils", jwt_key_utils)
 
@@ -154,6 +195,9 @@ class DIContainer:
         password_hasher = PasswordHasher(config)
         self.register_utility("password_hasher", password_hasher)
 
+        price_index = PriceIndex(config)
+        self.register_utility("price_index", price_index)
+
     def _initialize_repositories(self):
         """Initialize and register repository singletons."""
         database = self.get_core("database")
@@ -181,7 +225,9 @@ class DIContainer:
             password_reset_repository,
         )
 
-        refresh_token_repository = RefreshTokenRepository(database, audit)
+        refresh_token_repository = RefreshTokenRepository(
+            database, audit, self.get_utility("refresh_token_cache_utils")
+        )
         self.register_repository(
             "refresh_token",
             refresh_token_repository,
@@ -217,6 +263,15 @@ class DIContainer:
             token_balance_repository,
         )
 
+        transaction_repository = TransactionRepository(database, audit)
+        self.register_repository("transaction", transaction_repository)
+
+        indexer_checkpoint_repository = IndexerCheckpointRepository(database, audit)
+        self.register_repository(
+            "indexer_checkpoint",
+            indexer_checkpoint_repository,
+        )
+
     def _initialize_usecases(self):
         """Initialize and register usecase singletons."""
         # Get required services
@@ -234,10 +289,12 @@ class DIContainer:
         token_repo = self.get_repository("token")
         token_price_repo = self.get_repository("token_price")
         token_balance_repo = self.get_repository("token_balance")
+        transaction_repo = self.get_repository("transaction")
 
         # Get the newly added services
         email_service = self.get_service("email")
         jwt_utils = self.get_utility("jwt_utils")
+        password_hasher = self.get_utility("password_hasher")
 
         # Create and register usecases
         auth_usecase = AuthUsecase(
@@ -246,6 +303,7 @@ class DIContainer:
             refresh_token_repo,
             email_service,
             jwt_utils,
+            password_hasher,
             config,
             audit,
         )
@@ -286,6 +344,8 @@ class DIContainer:
 
         token_price_uc = TokenPriceUsecase(
             token_price_repo,
+            token_repo,
+            self.get_utility("price_index"),
             config,
             audit,
         )
@@ -300,6 +360,7 @@ class DIContainer:
 
         historical_balance_uc = HistoricalBalanceUsecase(
             historical_balance_repo,
+            wallet_repo,
             config,
             audit,
         )
@@ -312,6 +373,14 @@ class DIContainer:
         )
         self.register_usecase("token_balance", token_balance_uc)
 
+        transaction_uc = TransactionUsecase(
+            transaction_repo,
+            wallet_repo,
+            config,
+            audit,
+        )
+        self.register_usecase("transaction", transaction_uc)
+
         portfolio_snapshot_uc = PortfolioSnapshotUsecase(
             portfolio_snapshot_repo,
             wallet_repo,
@@ -319,7 +388,16 @@ class DIContainer:
         )
         self.register_usecase("portfolio_snapshot", portfolio_snapshot_uc)
 
-        user_profile_uc = UserProfileUsecase(user_repo, audit)
+        defi_aggregate_uc = DefiAggregateUsecase(
+            portfolio_snapshot_repo,
+            wallet_repo,
+            self.get_utility("metrics_cache_utils"),
+            config,
+            audit,
+        )
+        self.register_usecase("defi_aggregate", defi_aggregate_uc)
+
+        user_profile_uc = UserProfileUsecase(user_repo, password_hasher, audit)
         self.register_usecase("user_profile", user_profile_uc)
 
         jwks_cache_utils = self.get_utility("jwks_cache_utils")
@@ -346,6 +424,8 @@ class DIContainer:
         token_price_uc = self.get_usecase("token_price")
         historical_balance_uc = self.get_usecase("historical_balance")
         portfolio_snapshot_uc = self.get_usecase("portfolio_snapshot")
+        transaction_uc = self.get_usecase("transaction")
+        defi_aggregate_uc = self.get_usecase("defi_aggregate")
 
         # Get repositories
         user_repo = self.get_repository("user")
@@ -396,16 +476,21 @@ class DIContainer:
             token_price_uc,
             token_balance_uc,
             portfolio_snapshot_uc,
+            transaction_uc,
         )
         self.register_endpoint("wallets", wallets_endpoint)
 
-        defi_endpoint = DeFi(wallet_uc)
+        defi_endpoint = DeFi(wallet_uc, defi_aggregate_uc)
         self.register_endpoint("defi", defi_endpoint)
 
     def register_core(self, name: str, core):
         """Register a Core instance."""
         self._core[name] = core
 
+    def register_core_factory(self, name: str, factory):
+        """Register a factory building a Core instance on first access."""
+        self._core_factories[name] = factory
+
     def register_service(self, name: str, service):
         """Register a service instance."""
         self._services[name] = service
@@ -429,6 +514,9 @@ class DIContainer:
     def get_core(self, name: str):
         """Get a core instance by name."""
         core = self._core.get(name)
+        if core is None and name in self._core_factories:
+            core = self._core_factories.pop(name)()
+            self.register_core(name, core)
         if not core:
             raise ValueError(f"Core '{name}' not found.")
         return core
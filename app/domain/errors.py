@@ -14,9 +14,18 @@ class UnverifiedEmailError(AuthenticationError):
     """Raised when the user's email address has not been verified."""
 
 
+class PasswordHashingBusyError(Exception):
+    """Raised when the password hashing pool is saturated; retry later."""
+
+    def __init__(self, retry_after: int = 1):
+        super().__init__("Password hashing capacity exhausted")
+        self.retry_after = retry_after
+
+
 __all__ = [
     "AuthenticationError",
     "InvalidCredentialsError",
     "InactiveUserError",
     "UnverifiedEmailError",
+    "PasswordHashingBusyError",
 ]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
 
 from app.domain.schemas.historical_balance import HistoricalBalanceCreate
 from app.models.historical_balance import HistoricalBalance
@@ -14,3 +16,24 @@ class HistoricalBalanceRepositoryInterface(ABC):
         self, data: HistoricalBalanceCreate
     ) -> HistoricalBalance:  # pragma: no cover
         """Create a new historical balance record."""
+
+    @abstractmethod
+    async def bulk_create(
+        self, items: Sequence[HistoricalBalanceCreate]
+    ) -> int:  # pragma: no cover
+        """Insert many records in a single transaction."""
+
+    @abstractmethod
+    async def value_series(
+        self,
+        wallet_id,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[Any]:  # pragma: no cover
+        """Return the wallet's as-of USD value at each balance timestamp."""
+
+    @abstractmethod
+    async def revalue(
+        self, token_id, since: Optional[datetime] = None
+    ) -> int:  # pragma: no cover
+        """Recompute ``balance_usd`` of a token's points in a single pass."""
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.models.indexer_checkpoint import IndexerCheckpoint
+
+
+class IndexerCheckpointRepositoryInterface(ABC):
+    """Interface for indexer checkpoint persistence."""
+
+    @abstractmethod
+    async def get(
+        self, chain_id: int, stream: str = "live"
+    ) -> Optional[IndexerCheckpoint]:  # pragma: no cover
+        """Return the checkpoint for *chain_id* / *stream* if any."""
+
+    @abstractmethod
+    async def save(
+        self, chain_id: int, last_block: int, stream: str = "live"
+    ) -> None:  # pragma: no cover
+        """Persist *last_block* as the last fully indexed block."""
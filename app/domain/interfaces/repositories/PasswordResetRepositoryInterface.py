@@ -30,3 +30,12 @@ class PasswordResetRepositoryInterface(ABC):
     @abstractmethod
     async def delete_expired(self) -> int:  # pragma: no cover
         """Delete expired tokens and return the number removed."""
+
+    @abstractmethod
+    async def delete_expired_batch(
+        self, limit: int, *, before: datetime | None = None
+    ) -> int:  # pragma: no cover
+        """Delete up to *limit* expired or used password reset tokens.
+
+        Returns the number of rows removed.
+        """
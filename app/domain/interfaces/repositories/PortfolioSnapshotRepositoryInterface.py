@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import uuid
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
@@ -38,6 +39,15 @@ class PortfolioSnapshotRepositoryInterface(ABC):
     ) -> List[PortfolioSnapshot]:  # pragma: no cover
         """Return snapshots for a specific wallet address."""
 
+    @abstractmethod
+    async def get_owned_snapshots(
+        self,
+        user_id: uuid.UUID,
+        wallet_address: str,
+        limit: Optional[int] = None,
+    ) -> Optional[List[PortfolioSnapshot]]:  # pragma: no cover
+        """Return snapshots of a wallet owned by the user, or None if not owned."""
+
     @abstractmethod
     async def delete_snapshot(self, snapshot_id: int) -> None:  # pragma: no cover
         """Delete a snapshot by id."""
@@ -79,3 +89,16 @@ class PortfolioSnapshotRepositoryInterface(ABC):
         interval: str = "none",
     ) -> List[PortfolioSnapshot]:  # pragma: no cover
         """Return timeline of snapshots with optional interval aggregation."""
+
+    @abstractmethod
+    async def get_owned_timeline(
+        self,
+        user_id: uuid.UUID,
+        user_address: str,
+        from_ts: int,
+        to_ts: int,
+        limit: int = 100,
+        offset: int = 0,
+        interval: str = "none",
+    ) -> Optional[List[PortfolioSnapshot]]:  # pragma: no cover
+        """Owner-scoped timeline; None if the wallet is not owned by the user."""
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 from app.models.refresh_token import RefreshToken
 
+if TYPE_CHECKING:  # pragma: no cover
+    from app.utils.refresh_token_cache import RefreshTokenState
+
 
 class RefreshTokenRepositoryInterface(ABC):
     """Interface for refresh token persistence."""
@@ -21,6 +24,18 @@ class RefreshTokenRepositoryInterface(ABC):
     ) -> Optional[RefreshToken]:  # pragma: no cover
         """Return a refresh token by its hashed JTI."""
 
+    @abstractmethod
+    async def get_state(
+        self, jti_hash: str
+    ) -> Optional[RefreshTokenState]:  # pragma: no cover
+        """Return the owner, expiry and revoked flag of a token."""
+
+    @abstractmethod
+    async def revoke_by_jti_hash(
+        self, jti_hash: str, user_id: str, expires_at: float
+    ) -> bool:  # pragma: no cover
+        """Revoke a token by its hashed JTI; return True if it existed."""
+
     @abstractmethod
     async def revoke(self, token: RefreshToken) -> None:  # pragma: no cover
         """Mark the provided refresh token as revoked."""
@@ -31,6 +46,15 @@ class RefreshTokenRepositoryInterface(ABC):
     ) -> int:  # pragma: no cover
         """Delete tokens expired before *before* and return the number removed."""
 
+    @abstractmethod
+    async def delete_expired_batch(
+        self, limit: int, *, before: datetime | None = None
+    ) -> int:  # pragma: no cover
+        """Delete up to *limit* expired or revoked refresh tokens.
+
+        Returns the number of rows removed.
+        """
+
     @abstractmethod
     async def create_from_jti(
         self, jti: str, user_id: UUID, ttl: timedelta
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Sequence
 
 from app.domain.schemas.token_balance import TokenBalanceCreate
 from app.models.token_balance import TokenBalance
@@ -14,3 +15,9 @@ class TokenBalanceRepositoryInterface(ABC):
         self, data: TokenBalanceCreate
     ) -> TokenBalance:  # pragma: no cover
         """Create a new token balance record."""
+
+    @abstractmethod
+    async def bulk_upsert(
+        self, items: Sequence[TokenBalanceCreate]
+    ) -> int:  # pragma: no cover
+        """Upsert many records keyed on ``(wallet_id, token_id)``."""
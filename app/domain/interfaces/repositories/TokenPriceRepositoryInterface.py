@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Iterable, List, Optional, Sequence
 
-from app.domain.schemas.token_price import TokenPriceCreate
+from app.domain.schemas.token_price import (
+    LatestTokenPrice,
+    PriceCandle,
+    TokenPriceCreate,
+)
 from app.models.token_price import TokenPrice
 
 
@@ -12,3 +18,33 @@ class TokenPriceRepositoryInterface(ABC):
     @abstractmethod
     async def create(self, data: TokenPriceCreate) -> TokenPrice:  # pragma: no cover
         """Create a new token price record."""
+
+    @abstractmethod
+    async def bulk_create(
+        self, items: Sequence[TokenPriceCreate]
+    ) -> int:  # pragma: no cover
+        """Insert many records in a single transaction."""
+
+    @abstractmethod
+    async def get_latest_prices(
+        self, token_ids: Optional[Iterable] = None
+    ) -> List[LatestTokenPrice]:  # pragma: no cover
+        """Return the latest price of every token (or of *token_ids*)."""
+
+    @abstractmethod
+    async def list_candles(
+        self, token_id, interval: str, start: datetime, end: datetime
+    ) -> List[PriceCandle]:  # pragma: no cover
+        """Compute OHLC candles for a token from raw prices."""
+
+    @abstractmethod
+    async def list_rollup_candles(
+        self, token_id, interval: str, start: datetime, end: datetime
+    ) -> List[PriceCandle]:  # pragma: no cover
+        """Read pre-aggregated candles from the rollup table."""
+
+    @abstractmethod
+    async def refresh_candles(
+        self, interval: str, since: datetime, until: Optional[datetime] = None
+    ) -> int:  # pragma: no cover
+        """Recompute rollup candles of every token from *since* on."""
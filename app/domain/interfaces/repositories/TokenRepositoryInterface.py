@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Iterable, List
 
 from app.domain.schemas.token import TokenCreate
 from app.models.token import Token
@@ -12,3 +13,13 @@ class TokenRepositoryInterface(ABC):
     @abstractmethod
     async def create(self, data: TokenCreate) -> Token:  # pragma: no cover
         """Create a new token."""
+
+    @abstractmethod
+    async def get_by_addresses(
+        self, addresses: Iterable[str]
+    ) -> dict[str, Token]:  # pragma: no cover
+        """Return known tokens keyed by lower-cased contract address."""
+
+    @abstractmethod
+    async def list_tracked(self) -> List[Token]:  # pragma: no cover
+        """Return tokens held or transacted by any active wallet."""
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+from uuid import UUID
+
+from app.models.transaction import Transaction
+
+
+class TransactionRepositoryInterface(ABC):
+    """Interface for transaction persistence."""
+
+    @abstractmethod
+    async def bulk_upsert(
+        self, rows: Sequence[dict[str, Any]]
+    ) -> int:  # pragma: no cover
+        """Insert or update transactions keyed on ``(hash, log_index, wallet_id)``."""
+
+    @abstractmethod
+    async def list_by_wallet(
+        self,
+        wallet_id: UUID,
+        limit: int,
+        after: Optional[tuple[datetime, UUID]] = None,
+        token_id: Optional[UUID] = None,
+        tx_type: Optional[str] = None,
+    ) -> List[Transaction]:  # pragma: no cover
+        """Keyset-paginated transactions of a wallet, newest first."""
@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from uuid import UUID
 
+from app.domain.schemas.wallet import WalletSort
 from app.models.wallet import Wallet
 
 
@@ -16,6 +17,12 @@ class WalletRepositoryInterface(ABC):
     ) -> Optional[Wallet]:  # pragma: no cover
         """Retrieve a wallet by address."""
 
+    @abstractmethod
+    async def get_by_user_and_address(
+        self, user_id: UUID, address: str
+    ) -> Optional[Wallet]:  # pragma: no cover
+        """Retrieve the wallet *address* owned by *user_id*."""
+
     @abstractmethod
     async def create(
         self, address: str, user_id: UUID, name: str | None = None
@@ -23,8 +30,14 @@ class WalletRepositoryInterface(ABC):
         """Create a new wallet."""
 
     @abstractmethod
-    async def list_by_user(self, user_id: UUID) -> List[Wallet]:  # pragma: no cover
-        """List wallets owned by a user."""
+    async def list_by_user(
+        self, user_id: UUID, sort: Optional[WalletSort] = None
+    ) -> List[Wallet]:  # pragma: no cover
+        """List wallets owned by a user, optionally ordered."""
+
+    @abstractmethod
+    async def list_tracked(self) -> List[Wallet]:  # pragma: no cover
+        """List every active wallet across all users."""
 
     @abstractmethod
     async def delete(self, address: str, user_id: UUID) -> bool:  # pragma: no cover
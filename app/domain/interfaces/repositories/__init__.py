@@ -4,6 +4,9 @@ from .EmailVerificationRepositoryInterface import (
 from .HistoricalBalanceRepositoryInterface import (
     HistoricalBalanceRepositoryInterface,
 )
+from .IndexerCheckpointRepositoryInterface import (
+    IndexerCheckpointRepositoryInterface,
+)
 from .OAuthAccountRepositoryInterface import OAuthAccountRepositoryInterface
 from .PasswordResetRepositoryInterface import PasswordResetRepositoryInterface
 from .PortfolioSnapshotRepositoryInterface import (
@@ -13,12 +16,14 @@ from .RefreshTokenRepositoryInterface import RefreshTokenRepositoryInterface
 from .TokenBalanceRepositoryInterface import TokenBalanceRepositoryInterface
 from .TokenPriceRepositoryInterface import TokenPriceRepositoryInterface
 from .TokenRepositoryInterface import TokenRepositoryInterface
+from .TransactionRepositoryInterface import TransactionRepositoryInterface
 from .UserRepositoryInterface import UserRepositoryInterface
 from .WalletRepositoryInterface import WalletRepositoryInterface
 
 __all__ = [
     "EmailVerificationRepositoryInterface",
     "HistoricalBalanceRepositoryInterface",
+    "IndexerCheckpointRepositoryInterface",
     "OAuthAccountRepositoryInterface",
     "PasswordResetRepositoryInterface",
     "PortfolioSnapshotRepositoryInterface",
@@ -26,6 +31,7 @@ __all__ = [
     "TokenBalanceRepositoryInterface",
     "TokenPriceRepositoryInterface",
     "TokenRepositoryInterface",
+    "TransactionRepositoryInterface",
     "UserRepositoryInterface",
     "WalletRepositoryInterface",
 ]
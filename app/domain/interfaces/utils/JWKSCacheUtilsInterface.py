@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from redis.asyncio import Redis
 
 from app.domain.schemas.jwks import JWKSet
 
+if TYPE_CHECKING:  # pragma: no cover
+    from app.utils.jwks_cache import JWKSDocument
+
 
 class JWKSCacheUtilsInterface(ABC):
     """Interface for JWKS caching helpers."""
@@ -19,6 +22,10 @@ class JWKSCacheUtilsInterface(ABC):
     async def get_jwks_cache(self, redis: Redis) -> Optional[JWKSet]:
         """Retrieve JWKS from Redis cache."""
 
+    @abstractmethod
+    async def get_jwks_body(self, redis: Redis) -> Optional[bytes]:
+        """Retrieve the serialized JWKS from Redis cache."""
+
     @abstractmethod
     async def set_jwks_cache(self, redis: Redis, jwks: JWKSet) -> bool:
         """Store JWKS in Redis cache."""
@@ -30,3 +37,15 @@ class JWKSCacheUtilsInterface(ABC):
     @abstractmethod
     def invalidate_jwks_cache_sync(self) -> bool:
         """Synchronous wrapper for JWKS cache invalidation."""
+
+    @abstractmethod
+    def get_local(self) -> Optional[JWKSDocument]:
+        """Return this process's JWKS document if still valid."""
+
+    @abstractmethod
+    def set_local(self, body: bytes) -> JWKSDocument:
+        """Keep a serialized JWKS as this process's document."""
+
+    @abstractmethod
+    def clear_local(self) -> None:
+        """Drop this process's JWKS document."""
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from app.utils.jwt_rotation import Key
 
@@ -19,6 +19,6 @@ class JWTKeyUtilsInterface(ABC):
 
     @abstractmethod
     def format_public_key_to_jwk(
-        self, public_key_pem: str | bytes, kid: str, *, alg: str = "RS256"
+        self, public_key_pem: str | bytes, kid: str, *, alg: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Convert an RSA public key to a JWK dictionary conforming to RFC-7517."""
+        """Convert a public key to a JWK dictionary conforming to RFC-7517."""
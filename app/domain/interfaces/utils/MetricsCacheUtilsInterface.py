@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from redis.asyncio import Redis
+
+from app.domain.schemas.defi_aggregate import AggregateMetricsSchema
+
+
+class MetricsCacheUtilsInterface(ABC):
+    """Interface for aggregate DeFi metrics caching helpers."""
+
+    @abstractmethod
+    def _build_redis_client(self) -> Redis:
+        """Return an async Redis client using Configuration.redis_url."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release the shared Redis client."""
+
+    @abstractmethod
+    async def get_metrics_cache(
+        self, wallet_id: str
+    ) -> Optional[AggregateMetricsSchema]:
+        """Retrieve cached metrics for a wallet."""
+
+    @abstractmethod
+    async def set_metrics_cache(
+        self, wallet_id: str, metrics: AggregateMetricsSchema
+    ) -> bool:
+        """Store metrics for a wallet."""
+
+    @abstractmethod
+    async def mark_hot(self, wallet_id: str) -> None:
+        """Record a read so the refresher keeps the entry warm."""
+
+    @abstractmethod
+    async def get_keys_due_for_refresh(self) -> List[str]:
+        """Return hot wallet ids whose entry is missing or about to expire."""
@@ -13,3 +13,11 @@ class PasswordHasherInterface(ABC):
     @abstractmethod
     def verify_password(self, plain: str, hashed: str) -> bool:
         """Verify a password against its hash."""
+
+    @abstractmethod
+    async def hash_password_async(self, plain: str) -> str:
+        """Hash a plain-text password without blocking the event loop."""
+
+    @abstractmethod
+    async def verify_password_async(self, plain: str, hashed: str) -> bool:
+        """Verify a password against its hash without blocking the event loop."""
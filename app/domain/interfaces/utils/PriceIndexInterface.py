@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+from app.domain.schemas.token_price import LatestTokenPrice
+
+
+class PriceIndexInterface(ABC):
+    """Interface for the in-process latest-price index."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[LatestTokenPrice]:
+        """Look up a price by token address, symbol or id."""
+
+    @abstractmethod
+    def load(self, quotes: Iterable[LatestTokenPrice]) -> None:
+        """Replace the index contents with *quotes*."""
+
+    @abstractmethod
+    def apply(self, quote: LatestTokenPrice) -> bool:
+        """Merge *quote* into the index unless a newer price is held."""
+
+    @abstractmethod
+    async def publish(self, quotes: Iterable[LatestTokenPrice]) -> None:
+        """Apply *quotes* locally and broadcast them to other processes."""
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Start listening for price updates from other processes."""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop the update listener and release the Redis connection."""
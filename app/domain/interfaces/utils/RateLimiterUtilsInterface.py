@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:  # pragma: no cover - for type hints only
-    from app.utils.rate_limiter import InMemoryRateLimiter
+    from app.utils.rate_limiter import InMemoryRateLimiter, RateLimitResult
 
 
 class RateLimiterUtilsInterface(ABC):
@@ -14,3 +14,9 @@ class RateLimiterUtilsInterface(ABC):
     @abstractmethod
     def login_rate_limiter(self) -> InMemoryRateLimiter:
         """Return the login rate limiter instance."""
+
+    @abstractmethod
+    async def check(
+        self, policy: str, client_ip: str, user_id: Optional[str] = None
+    ) -> RateLimitResult:
+        """Count one request against the named route policy."""
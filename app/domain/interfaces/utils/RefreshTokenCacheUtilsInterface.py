@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional
+
+from redis.asyncio import Redis
+
+if TYPE_CHECKING:  # pragma: no cover
+    from app.utils.refresh_token_cache import RefreshTokenState
+
+
+class RefreshTokenCacheUtilsInterface(ABC):
+    """Interface for the Redis mirror of refresh-token state."""
+
+    @abstractmethod
+    def _build_redis_client(self) -> Redis:
+        """Return an async Redis client using Configuration.redis_url."""
+
+    @abstractmethod
+    async def get(self, jti_hash: str) -> Optional[RefreshTokenState]:
+        """Return the mirrored state of a token, or None on a miss."""
+
+    @abstractmethod
+    async def set(self, jti_hash: str, state: RefreshTokenState) -> bool:
+        """Mirror a token's state until it expires."""
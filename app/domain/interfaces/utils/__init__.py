@@ -4,8 +4,11 @@ from .EncryptionUtilsInterface import EncryptionUtilsInterface
 from .JWKSCacheUtilsInterface import JWKSCacheUtilsInterface
 from .JWTKeyUtilsInterface import JWTKeyUtilsInterface
 from .JWTUtilsInterface import JWTUtilsInterface
+from .MetricsCacheUtilsInterface import MetricsCacheUtilsInterface
 from .PasswordHasherInterface import PasswordHasherInterface
+from .PriceIndexInterface import PriceIndexInterface
 from .RateLimiterUtilsInterface import RateLimiterUtilsInterface
+from .RefreshTokenCacheUtilsInterface import RefreshTokenCacheUtilsInterface
 
 __all__ = [
     "EncryptionUtilsInterface",
@@ -14,4 +17,7 @@ __all__ = [
     "JWTKeyUtilsInterface",
     "RateLimiterUtilsInterface",
     "PasswordHasherInterface",
+    "MetricsCacheUtilsInterface",
+    "PriceIndexInterface",
+    "RefreshTokenCacheUtilsInterface",
 ]
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+# Upper bound on rows accepted by a single batch ingestion request.
+MAX_BATCH_SIZE = 5000
+
+
+class BulkWriteResponse(BaseModel):
+    """Result of a batch ingestion request."""
+
+    count: int
@@ -1,7 +1,10 @@
 import uuid
 from datetime import datetime
+from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from app.domain.schemas.bulk import MAX_BATCH_SIZE
 
 
 class HistoricalBalanceCreate(BaseModel):
@@ -12,6 +15,12 @@ class HistoricalBalanceCreate(BaseModel):
     timestamp: datetime
 
 
+class HistoricalBalanceBatchCreate(BaseModel):
+    items: List[HistoricalBalanceCreate] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_SIZE
+    )
+
+
 class HistoricalBalanceResponse(BaseModel):
     id: uuid.UUID
     wallet_id: uuid.UUID
@@ -19,3 +28,26 @@ class HistoricalBalanceResponse(BaseModel):
     balance: float
     balance_usd: float
     timestamp: datetime
+
+
+class HistoricalBalanceRevalue(BaseModel):
+    """Request to reprice a token's balance points after a price correction."""
+
+    token_id: uuid.UUID
+    since: Optional[datetime] = None
+
+
+class WalletValuationPoint(BaseModel):
+    """Wallet USD value at one balance timestamp."""
+
+    timestamp: datetime
+    value_usd: float
+    tokens: int
+    unpriced_tokens: int = 0
+
+
+class WalletValuation(BaseModel):
+    """USD value series of a wallet computed from balances and as-of prices."""
+
+    wallet_address: str
+    points: List[WalletValuationPoint]
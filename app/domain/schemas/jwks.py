@@ -1,50 +1,60 @@
 """Pydantic schemas for JSON Web Key (JWK) and JSON Web Key Set (JWKS).
 
-These models intentionally cover the subset of fields required for RSA
-signing keys used by our authentication system ("sig" use, RS256 alg).  The
-schema can be extended to support additional key types (EC, OKP, symmetric)
-in future tasks.
+These models cover the public signing keys used by our authentication
+system ("sig" use): RSA (RS*), EC (ES*) and OKP/Ed25519 (EdDSA) keys.
 """
 from __future__ import annotations
 
-from typing import List, Literal
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field, constr, field_validator
+from pydantic import BaseModel, Field, constr, field_validator, model_validator
 
 # ---------------------------------------------------------------------------
-# Individual JWK schema – supporting RSA public keys ("kty" == "RSA").
+# Individual JWK schema – RSA, EC and OKP public keys.
 # ---------------------------------------------------------------------------
 
+# Members each key type must carry (RFC-7518 §6, RFC-8037 §2)
+_REQUIRED_MEMBERS = {"RSA": ("n", "e"), "EC": ("crv", "x", "y"), "OKP": ("crv", "x")}
+
 
 class JWK(BaseModel):
-    """JSON Web Key representation (RSA, public, signature use).
+    """JSON Web Key representation (public, signature use).
 
-    Required fields for RSA public keys according to RFC-7517 / RFC-7518:
-    - kty: Key Type – "RSA"
+    Common fields according to RFC-7517 / RFC-7518:
+    - kty: Key Type – "RSA", "EC" or "OKP"
     - use: Public Key Use – "sig" (signature verification)
     - kid: Key ID – unique identifier referenced by JWT *kid* header
-    - alg: Algorithm – e.g. "RS256"
-    - n:   Modulus – base64url-encoded big-endian unsigned integer
-    - e:   Exponent – base64url-encoded big-endian unsigned integer
+    - alg: Algorithm – e.g. "RS256", "ES256", "EdDSA"
+
+    RSA keys carry the modulus *n* and exponent *e*; EC keys the curve *crv*
+    and coordinates *x*/*y*; OKP keys the curve *crv* and public key *x*.
+    All binary members are base64url-encoded without padding.
     """
 
-    kty: Literal["RSA"] = Field(
-        "RSA", description="Key Type – always 'RSA' for our keys"
-    )
+    kty: Literal["RSA", "EC", "OKP"] = Field("RSA", description="Key Type")
     use: Literal["sig"] = Field(
         "sig", description="Public Key Use – 'sig' for signature"
     )
     kid: constr(strip_whitespace=True, min_length=1) = Field(
         ..., description="Key identifier"
     )
-    alg: Literal["RS256", "RS384", "RS512"] = Field(
+    alg: Literal["RS256", "RS384", "RS512", "ES256", "ES384", "ES512", "EdDSA"] = Field(
         "RS256", description="Signature algorithm"
     )
-    n: constr(strip_whitespace=True, min_length=1) = Field(
-        ..., description="Base64url modulus"
+    n: Optional[constr(strip_whitespace=True, min_length=1)] = Field(
+        None, description="Base64url modulus (RSA)"
+    )
+    e: Optional[constr(strip_whitespace=True, min_length=1)] = Field(
+        None, description="Base64url exponent (RSA)"
     )
-    e: constr(strip_whitespace=True, min_length=1) = Field(
-        ..., description="Base64url exponent"
+    crv: Optional[Literal["P-256", "P-384", "P-521", "Ed25519"]] = Field(
+        None, description="Curve (EC / OKP)"
+    )
+    x: Optional[constr(strip_whitespace=True, min_length=1)] = Field(
+        None, description="Base64url x coordinate (EC) or public key (OKP)"
+    )
+    y: Optional[constr(strip_whitespace=True, min_length=1)] = Field(
+        None, description="Base64url y coordinate (EC)"
     )
 
     class Config:
@@ -60,15 +70,20 @@ class JWK(BaseModel):
             }
         }
 
-    # Basic validator: ensure *n* and *e* are base64url (no padding, url-safe)
-    @field_validator("n", "e")
-    def _no_padding(cls, v: str) -> str:  # noqa: N805
-        if "=" in v:
-            raise ValueError(
-                "Base64url fields *n* and *e* must not contain '=' padding"
-            )
+    # Basic validator: ensure binary members are base64url (no padding)
+    @field_validator("n", "e", "x", "y")
+    def _no_padding(cls, v: Optional[str]) -> Optional[str]:  # noqa: N805
+        if v is not None and "=" in v:
+            raise ValueError("Base64url key members must not contain '=' padding")
         return v
 
+    @model_validator(mode="after")
+    def _members_match_key_type(self) -> "JWK":
+        missing = [m for m in _REQUIRED_MEMBERS[self.kty] if getattr(self, m) is None]
+        if missing:
+            raise ValueError(f"{self.kty} JWK is missing {', '.join(missing)}")
+        return self
+
 
 # ---------------------------------------------------------------------------
 # JWK Set – wrapper object holding a list of JWKs as per RFC-7517 §5.  The
@@ -1,6 +1,9 @@
 import uuid
+from typing import List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from app.domain.schemas.bulk import MAX_BATCH_SIZE
 
 
 class TokenBalanceCreate(BaseModel):
@@ -10,6 +13,12 @@ class TokenBalanceCreate(BaseModel):
     balance_usd: float
 
 
+class TokenBalanceBatchCreate(BaseModel):
+    items: List[TokenBalanceCreate] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_SIZE
+    )
+
+
 class TokenBalanceResponse(BaseModel):
     id: uuid.UUID
     token_id: uuid.UUID
@@ -1,14 +1,61 @@
 import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from app.domain.schemas.bulk import MAX_BATCH_SIZE
 
 
 class TokenPriceCreate(BaseModel):
     token_id: uuid.UUID
     price_usd: float
+    # Observation time of the price; defaults to "now" when omitted.
+    timestamp: Optional[datetime] = None
+
+
+class TokenPriceBatchCreate(BaseModel):
+    items: List[TokenPriceCreate] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
 
 
 class TokenPriceResponse(BaseModel):
     id: uuid.UUID
     token_id: uuid.UUID
     price_usd: float
+
+
+class LatestTokenPrice(BaseModel):
+    """Most recent known price of a token, as held by the in-process index."""
+
+    token_id: uuid.UUID
+    address: Optional[str] = None
+    symbol: Optional[str] = None
+    price_usd: float
+    timestamp: Optional[datetime] = None
+
+
+# Supported candle widths; buckets are aligned to UTC hour / day boundaries.
+CandleInterval = Literal["1h", "1d"]
+CANDLE_INTERVALS: Dict[str, timedelta] = {
+    "1h": timedelta(hours=1),
+    "1d": timedelta(days=1),
+}
+MAX_CANDLES = 10_000
+
+
+class PriceCandle(BaseModel):
+    """OHLC summary of a token's prices within one interval bucket."""
+
+    timestamp: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    samples: int
+
+
+class PriceCandleSeries(BaseModel):
+    token_id: uuid.UUID
+    address: str
+    interval: CandleInterval
+    candles: List[PriceCandle]
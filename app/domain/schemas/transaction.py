@@ -0,0 +1,33 @@
+import uuid
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class TransactionResponse(BaseModel):
+    """A single indexed on-chain transaction leg for a wallet."""
+
+    id: uuid.UUID
+    hash: str
+    log_index: Optional[int] = None
+    wallet_id: uuid.UUID
+    token_id: Optional[uuid.UUID] = None
+    type: str
+    amount: float
+    usd_value: Optional[float] = None
+    timestamp: datetime
+    from_address: Optional[str] = None
+    to_address: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class TransactionPage(BaseModel):
+    """Keyset-paginated page of transactions, newest first."""
+
+    items: List[TransactionResponse]
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page; null on the last page."
+    )
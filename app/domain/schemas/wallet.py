@@ -1,9 +1,14 @@
 import re
 import uuid
-from typing import Optional
+from datetime import datetime
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+# Orderings accepted by wallet listings; balance orderings use the cached
+# ``balance_usd`` maintained on snapshot writes.
+WalletSort = Literal["balance_desc", "balance_asc", "address"]
+
 
 class WalletCreate(BaseModel):
     """
@@ -43,6 +48,9 @@ class WalletResponse(BaseModel):
     name: Optional[str]
     is_active: bool
     balance_usd: Optional[float]
+    last_snapshot_at: Optional[datetime] = None
+    holdings_usd: Optional[float] = None
+    holdings_as_of: Optional[datetime] = None
 
     class Config:
         """
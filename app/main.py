@@ -7,8 +7,10 @@ from sqlalchemy.exc import IntegrityError  # local import
 import app.models as models  # noqa: F401
 
 # --- New imports for structured logging & error handling ---
-from app.core.middleware import CorrelationIdMiddleware, JWTAuthMiddleware
+from app.api.dependencies import RateLimit
+from app.core.middleware import DBSessionMiddleware, RequestContextMiddleware
 from app.di import DIContainer
+from app.domain.errors import PasswordHashingBusyError
 from app.domain.schemas.user import WeakPasswordError  # local import
 
 
@@ -47,13 +49,22 @@ class ApplicationFactory:
             allow_headers=["*"],
         )
 
+        # Route rate-limit policies use the container's limiter
+        RateLimit.bind(self.di_container.get_utility("rate_limiter_utils"))
+
         # Add middleware only if not skipped (for tests)
         if not self.skip_middleware:
-            # Correlation-ID middleware (must run early)
-            app.add_middleware(CorrelationIdMiddleware)
-
-            # JWT Auth middleware (extract user_id from tokens)
-            app.add_middleware(JWTAuthMiddleware, di_container=self.di_container)
+            # Request-scoped DB session (innermost, same task as the endpoint)
+            app.add_middleware(
+                DBSessionMiddleware, database=self.di_container.get_core("database")
+            )
+
+            # Trace id and JWT auth (extract user_id from tokens)
+            app.add_middleware(
+                RequestContextMiddleware,
+                di_container=self.di_container,
+                token_cache_size=config.JWT_VERIFIED_TOKEN_CACHE_SIZE,
+            )
 
         # Register global exception handlers
         error_handling = self.di_container.get_core("error_handling")
@@ -80,6 +91,11 @@ class ApplicationFactory:
             WeakPasswordError, error_handling.weak_password_error_handler
         )
 
+        app.add_exception_handler(
+            PasswordHashingBusyError,
+            error_handling.password_hashing_busy_handler,  # type: ignore[arg-type]
+        )
+
         # Initialize database tables on startup
         if not self.skip_startup:
 
@@ -101,11 +117,40 @@ class ApplicationFactory:
                     )  # Also print stdout for Docker logs
                     raise
 
+                await self._start_price_index()
+                await self.di_container.get_utility("jwks_cache_utils").start()
+
+            @app.on_event("shutdown")
+            async def on_shutdown() -> None:
+                """FastAPI shutdown event handler."""
+                for utility in ("price_index", "jwks_cache_utils"):
+                    try:
+                        await self.di_container.get_utility(utility).stop()
+                    except Exception:  # noqa: BLE001 – nothing left to clean up
+                        pass
+                await self.di_container.get_utility("metrics_cache_utils").close()
+
         # Register singleton endpoint routers
         self._register_singleton_routers(app)
 
         return app
 
+    async def _start_price_index(self) -> None:
+        """Load the latest-price index and subscribe to its updates.
+
+        Failures are logged, not raised: the API can serve without the index
+        and it fills up again as new prices are written.
+        """
+        logger = self.di_container.get_core("logging").get_logger("startup")
+        try:
+            loaded = await self.di_container.get_usecase(
+                "token_price"
+            ).load_price_index()
+            await self.di_container.get_utility("price_index").start()
+            logger.info(f"Price index loaded with {loaded} tokens")
+        except Exception as e:
+            logger.warning(f"Price index initialization failed: {str(e)}")
+
     def _register_singleton_routers(self, app: FastAPI):
         """Register singleton endpoint routers from DIContainer."""
         email_verification_endpoint = self.di_container.get_endpoint(
@@ -144,10 +189,25 @@ class ApplicationFactory:
             app.include_router(auth_endpoint.ep, tags=["auth"])
 
 
-# Create app using DIContainer
-di_container = DIContainer()
-app_factory = ApplicationFactory(di_container)
-app = app_factory.create_app()
+# The module-level container and app are built on first access (e.g. by
+# ``uvicorn app.main:app``) rather than at import, so importing this module
+# for ApplicationFactory or create_app() does not build a second container.
+_LAZY_ATTRIBUTES = ("di_container", "app_factory", "app")
+_lazy: dict = {}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if not _lazy:
+        container = DIContainer()
+        factory = ApplicationFactory(container)
+        _lazy.update(di_container=container, app_factory=factory)
+        _lazy["app"] = factory.create_app()
+    # Cache as a real module global; _lazy keeps the same instances if a
+    # test patches and then deletes the global again
+    globals()[name] = _lazy[name]
+    return _lazy[name]
 
 
 def create_app() -> FastAPI:
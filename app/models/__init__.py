@@ -2,6 +2,7 @@ from app.core.database import Base
 
 from .email_verification import EmailVerification
 from .historical_balance import HistoricalBalance
+from .indexer_checkpoint import IndexerCheckpoint
 from .oauth_account import OAuthAccount
 from .password_reset import PasswordReset
 from .portfolio_snapshot import PortfolioSnapshot
@@ -10,6 +11,7 @@ from .refresh_token import RefreshToken
 from .token import Token
 from .token_balance import TokenBalance
 from .token_price import TokenPrice
+from .token_price_candle import TokenPriceCandle
 from .transaction import Transaction
 from .user import User
 from .wallet import Wallet
@@ -29,4 +31,6 @@ __all__ = [
     "PasswordReset",
     "EmailVerification",
     "OAuthAccount",
+    "IndexerCheckpoint",
+    "TokenPriceCandle",
 ]
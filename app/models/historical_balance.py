@@ -1,6 +1,6 @@
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, ForeignKey, Numeric
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Numeric
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -9,6 +9,9 @@ from app.core.database import Base
 
 class HistoricalBalance(Base):
     __tablename__ = "historical_balances"
+    __table_args__ = (
+        Index("ix_historical_balances_wallet_ts", "wallet_id", "timestamp"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid4)
     wallet_id = Column(
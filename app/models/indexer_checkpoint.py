@@ -0,0 +1,33 @@
+"""SQLAlchemy model tracking how far the on-chain log indexer has progressed.
+
+One row exists per ``(chain_id, stream)`` pair.  The ``live`` stream follows the
+chain head while ad-hoc backfills use their own stream so that both can be
+resumed independently after a restart.
+"""
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String, func
+
+from app.core.database import Base
+
+
+class IndexerCheckpoint(Base):
+    """Last fully indexed block for a chain / stream."""
+
+    __tablename__ = "indexer_checkpoints"
+
+    chain_id = Column(Integer, primary_key=True, autoincrement=False)
+    stream = Column(String(length=32), primary_key=True, default="live")
+    last_block = Column(BigInteger, nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover – debug helper
+        return (
+            f"<IndexerCheckpoint chain_id={self.chain_id} stream={self.stream} "
+            f"last_block={self.last_block}>"
+        )
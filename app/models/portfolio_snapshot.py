@@ -2,8 +2,10 @@ from uuid import uuid4
 
 from sqlalchemy import JSON, BigInteger, Column, Float, String
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import validates
 
 from . import Base
+from .wallet import normalize_address
 
 
 class PortfolioSnapshot(Base):
@@ -23,3 +25,7 @@ class PortfolioSnapshot(Base):
     staked_positions = Column(JSON, nullable=False)
     health_scores = Column(JSON, nullable=False)
     protocol_breakdown = Column(JSON, nullable=False)
+
+    @validates("user_address")
+    def _normalize_user_address(self, key, user_address):
+        return normalize_address(user_address)
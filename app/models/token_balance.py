@@ -1,6 +1,6 @@
 from uuid import uuid4
 
-from sqlalchemy import Column, ForeignKey, Numeric
+from sqlalchemy import Column, ForeignKey, Numeric, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -25,6 +25,11 @@ class TokenBalance(Base):
     wallet = relationship("Wallet", back_populates="token_balances")
     token = relationship("Token", back_populates="balances")
 
+    # One current balance per wallet/token – natural key for bulk upserts.
+    __table_args__ = (
+        UniqueConstraint("wallet_id", "token_id", name="uq_token_balance_wallet_token"),
+    )
+
     def __repr__(self):
         """
         Return a string representation of the token balance instance.
@@ -1,6 +1,6 @@
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, ForeignKey, Numeric
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Numeric
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -14,6 +14,8 @@ class TokenPrice(Base):
     """
 
     __tablename__ = "token_prices"
+    # Serves "latest price at or before T" lookups used by as-of valuation
+    __table_args__ = (Index("ix_token_prices_token_ts", "token_id", "timestamp"),)
 
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid4)
     token_id = Column(UUID(as_uuid=True), ForeignKey("tokens.id"), index=True)
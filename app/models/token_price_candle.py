@@ -0,0 +1,35 @@
+"""SQLAlchemy model for pre-aggregated OHLC price candles.
+
+Rows are an optional rollup of ``token_prices``: one row per token, candle
+interval and bucket start. They are refreshed periodically so long-range
+charts read a few hundred pre-computed rows instead of every raw price.
+"""
+from __future__ import annotations
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.database import Base
+
+
+class TokenPriceCandle(Base):
+    """OHLC candle of a token's price over one interval bucket."""
+
+    __tablename__ = "token_price_candles"
+
+    token_id = Column(
+        UUID(as_uuid=True), ForeignKey("tokens.id"), primary_key=True, nullable=False
+    )
+    interval = Column(String(length=8), primary_key=True, nullable=False)
+    bucket_start = Column(DateTime, primary_key=True, nullable=False)
+    open = Column(Numeric(precision=18, scale=8), nullable=False)
+    high = Column(Numeric(precision=18, scale=8), nullable=False)
+    low = Column(Numeric(precision=18, scale=8), nullable=False)
+    close = Column(Numeric(precision=18, scale=8), nullable=False)
+    samples = Column(Integer, nullable=False)
+
+    def __repr__(self) -> str:  # pragma: no cover – debug helper
+        return (
+            f"<TokenPriceCandle token_id={self.token_id} interval={self.interval} "
+            f"bucket_start={self.bucket_start}>"
+        )
@@ -1,6 +1,17 @@
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, ForeignKey, Numeric, String
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -17,7 +28,10 @@ class Transaction(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid4)
     wallet_id = Column(UUID(as_uuid=True), ForeignKey("wallets.id"), index=True)
-    hash = Column(String, unique=True, index=True)
+    hash = Column(String, index=True)
+    # Position of the event log inside the transaction; one transaction can
+    # emit several legs for the same wallet, so ``hash`` alone is not unique.
+    log_index = Column(Integer, nullable=True)
     token_id = Column(
         UUID(as_uuid=True), ForeignKey("tokens.id"), nullable=True, index=True
     )
@@ -25,11 +39,47 @@ class Transaction(Base):
     amount = Column(Numeric(precision=18, scale=8), nullable=False)
     usd_value = Column(Numeric(precision=18, scale=2), nullable=True)
     timestamp = Column(DateTime, index=True)
+    from_address = Column(String, nullable=True, index=True)
+    to_address = Column(String, nullable=True, index=True)
+    # Indexer bookkeeping (block number, log index, raw amount, contract…)
+    extra_metadata = Column(JSON, nullable=True)
 
     # Relationships
     wallet = relationship("Wallet", back_populates="transactions")
     token = relationship("Token")
 
+    # Composite indexes backing keyset pagination of wallet history on
+    # ``(timestamp, id)`` for each supported filter combination.
+    __table_args__ = (
+        UniqueConstraint(
+            "hash", "log_index", "wallet_id", name="uq_transactions_hash_log_wallet"
+        ),
+        # Rows not produced by the log indexer carry no log index and stay
+        # unique on ``hash`` alone.
+        Index(
+            "uq_transactions_hash_without_log",
+            "hash",
+            unique=True,
+            postgresql_where=text("log_index IS NULL"),
+            sqlite_where=text("log_index IS NULL"),
+        ),
+        Index("ix_transactions_wallet_ts_id", "wallet_id", "timestamp", "id"),
+        Index(
+            "ix_transactions_wallet_token_ts_id",
+            "wallet_id",
+            "token_id",
+            "timestamp",
+            "id",
+        ),
+        Index(
+            "ix_transactions_wallet_type_ts_id",
+            "wallet_id",
+            "type",
+            "timestamp",
+            "id",
+        ),
+    )
+
     def __repr__(self):
         """
         Return a string representation of the transaction instance.
@@ -3,26 +3,43 @@ import uuid
 
 from sqlalchemy import (
     Boolean,
+    CheckConstraint,
     Column,
+    DateTime,
     Float,
     ForeignKey,
+    Index,
     String,
     UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 
 from app.core.database import Base
 
 
+def normalize_address(address: str) -> str:
+    """Return the canonical (lower-case) form of an EVM address.
+
+    Wallet addresses are stored canonicalized so checksummed and lower-case
+    variants hit the same ``(user_id, address)`` index entry.
+    """
+    return address.strip().lower() if address else address
+
+
 class Wallet(Base):
     """
     Represents a wallet in the database.
     - `id`: Primary key.
-    - `address`: EVM wallet address.
+    - `address`: EVM wallet address, stored lower-case.
     - `name`: User-defined wallet name.
     - `is_active`: Flag for active status.
-    - `balance_usd`: Cached balance in USD.
+    - `balance_usd`: Cached net value in USD of the latest portfolio snapshot
+      (collateral minus borrowings), maintained on snapshot writes.
+    - `last_snapshot_at`: Timestamp of the snapshot `balance_usd` comes from.
+    - `holdings_usd`: Cached USD total of the latest historical balance points,
+      maintained on balance point writes and revaluations.
+    - `holdings_as_of`: Timestamp of the points `holdings_usd` comes from.
     """
 
     __tablename__ = "wallets"
@@ -53,6 +70,19 @@ class Wallet(Base):
     balance_usd = Column(
         Float, default=0.0, nullable=True, doc="Cached balance in USD."
     )
+    last_snapshot_at = Column(
+        DateTime,
+        nullable=True,
+        doc="Timestamp (UTC) of the snapshot balance_usd was taken from.",
+    )
+    holdings_usd = Column(
+        Float, nullable=True, doc="Cached USD total of the latest balance points."
+    )
+    holdings_as_of = Column(
+        DateTime,
+        nullable=True,
+        doc="Timestamp (UTC) of the balance points holdings_usd was summed from.",
+    )
 
     # One-to-many – time-series of token balances
     historical_balances = relationship(
@@ -79,8 +109,15 @@ class Wallet(Base):
 
     __table_args__ = (
         UniqueConstraint("user_id", "address", name="uq_wallet_user_address"),
+        CheckConstraint("address = lower(address)", name="ck_wallets_address_lower"),
+        # Serves per-user listings sorted by value
+        Index("ix_wallets_user_balance_usd", "user_id", "balance_usd"),
     )
 
+    @validates("address")
+    def _normalize_address(self, key, address):
+        return normalize_address(address)
+
     def __repr__(self):
         """
         Return a string representation of the wallet instance.
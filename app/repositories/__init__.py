@@ -4,6 +4,9 @@ from .email_verification_repository import (  # noqa: F401
 from .historical_balance_repository import (  # noqa: F401
     HistoricalBalanceRepository,
 )
+from .indexer_checkpoint_repository import (  # noqa: F401
+    IndexerCheckpointRepository,
+)
 from .oauth_account_repository import OAuthAccountRepository  # noqa: F401
 from .password_reset_repository import PasswordResetRepository  # noqa: F401
 from .portfolio_snapshot_repository import (  # noqa: F401
@@ -13,5 +16,6 @@ from .refresh_token_repository import RefreshTokenRepository  # noqa: F401
 from .token_balance_repository import TokenBalanceRepository  # noqa: F401
 from .token_price_repository import TokenPriceRepository  # noqa: F401
 from .token_repository import TokenRepository  # noqa: F401
+from .transaction_repository import TransactionRepository  # noqa: F401
 from .user_repository import UserRepository  # noqa: F401
 from .wallet_repository import WalletRepository  # noqa: F401
@@ -5,6 +5,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import Optional
 
+from sqlalchemy import or_
 from sqlalchemy.future import select
 
 from app.core.database import CoreDatabase
@@ -12,6 +13,8 @@ from app.domain.interfaces.repositories import (
     EmailVerificationRepositoryInterface,
 )
 from app.models.email_verification import EmailVerification
+from app.utils.batched_delete import build_batch_delete
+from app.utils.bulk_insert import dialect_name
 from app.utils.logging import Audit
 
 
@@ -131,3 +134,41 @@ class EmailVerificationRepository(EmailVerificationRepositoryInterface):
                 "email_verification_repository_delete_expired_failed", error=str(e)
             )
             raise
+
+    async def delete_expired_batch(
+        self, limit: int, *, before: datetime | None = None
+    ) -> int:
+        """Delete up to *limit* expired or used verification tokens; return rowcount.
+
+        Call repeatedly until fewer than *limit* rows are removed; each batch
+        is its own short transaction.
+        """
+        cutoff = before or datetime.now(timezone.utc)
+
+        try:
+            async with self.__database.get_session() as session:
+                stmt = build_batch_delete(
+                    dialect_name(session),
+                    EmailVerification.__table__,
+                    or_(
+                        EmailVerification.expires_at < cutoff,
+                        EmailVerification.used.is_(True),
+                    ),
+                    limit,
+                )
+                result = await session.execute(stmt)
+                await session.commit()
+
+                self.__audit.info(
+                    "email_verification_repository_delete_expired_batch_success",
+                    count=result.rowcount,
+                    cutoff=cutoff.isoformat(),
+                )
+                return result.rowcount
+        except Exception as e:
+            self.__audit.error(
+                "email_verification_repository_delete_expired_batch_failed",
+                cutoff=cutoff.isoformat(),
+                error=str(e),
+            )
+            raise
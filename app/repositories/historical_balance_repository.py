@@ -1,12 +1,73 @@
+import time
+from datetime import datetime, timezone
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import func, insert, literal, select, true, update
+from sqlalchemy.orm import aliased
+
 from app.core.database import CoreDatabase
 from app.domain.interfaces.repositories import (
     HistoricalBalanceRepositoryInterface,
 )
 from app.domain.schemas.historical_balance import HistoricalBalanceCreate
 from app.models.historical_balance import HistoricalBalance
+from app.models.token_price import TokenPrice
+from app.models.wallet import Wallet
+from app.repositories.wallet_repository import wallet_holdings_update
+from app.utils.bulk_insert import chunk_rows, dialect_name
 from app.utils.logging import Audit
 
 
+def _as_naive_utc(value: datetime) -> datetime:
+    """Return *value* as a naive UTC datetime for the ``timestamp`` column."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _latest_holdings_update(wallet_ids):
+    """Set each wallet's cached holdings to its latest balance point total.
+
+    Recomputed from the table rather than from the batch, so points of one
+    timestamp split across batches still add up.
+    """
+    newer = aliased(HistoricalBalance)
+    latest_ts = (
+        select(func.max(HistoricalBalance.timestamp))
+        .where(HistoricalBalance.wallet_id == Wallet.id)
+        .scalar_subquery()
+    )
+    latest_value = (
+        select(func.coalesce(func.sum(HistoricalBalance.balance_usd), 0))
+        .where(
+            HistoricalBalance.wallet_id == Wallet.id,
+            HistoricalBalance.timestamp
+            == select(func.max(newer.timestamp))
+            .where(newer.wallet_id == HistoricalBalance.wallet_id)
+            .scalar_subquery(),
+        )
+        .scalar_subquery()
+    )
+    return wallet_holdings_update(Wallet.id.in_(wallet_ids), latest_value, latest_ts)
+
+
+def _price_asof():
+    """Latest ``price_usd`` of the balance's token at or before its timestamp.
+
+    Correlated against :class:`HistoricalBalance`; each evaluation is a single
+    backwards probe of ``ix_token_prices_token_ts``.
+    """
+    return (
+        select(TokenPrice.price_usd)
+        .where(
+            TokenPrice.token_id == HistoricalBalance.token_id,
+            TokenPrice.timestamp <= HistoricalBalance.timestamp,
+        )
+        .order_by(TokenPrice.timestamp.desc())
+        .limit(1)
+    )
+
+
 class HistoricalBalanceRepository(HistoricalBalanceRepositoryInterface):
     """Repository for :class:`~app.models.historical_balance.HistoricalBalance`."""
 
@@ -51,3 +112,185 @@ class HistoricalBalanceRepository(HistoricalBalanceRepositoryInterface):
                 error=str(e),
             )
             raise
+
+    async def bulk_create(self, items: Sequence[HistoricalBalanceCreate]) -> int:
+        """Insert many balance points in one transaction.
+
+        Uses multi-row ``INSERT … VALUES`` batches and a single commit.
+        """
+        if not items:
+            return 0
+
+        start_time = time.time()
+        self.__audit.info(
+            "historical_balance_repository_bulk_create_started", count=len(items)
+        )
+
+        try:
+            rows = [
+                {
+                    "wallet_id": item.wallet_id,
+                    "token_id": item.token_id,
+                    "balance": item.balance,
+                    "balance_usd": item.balance_usd,
+                    "timestamp": _as_naive_utc(item.timestamp),
+                }
+                for item in items
+            ]
+            async with self.__database.get_session() as session:
+                for chunk in chunk_rows(rows):
+                    await session.execute(insert(HistoricalBalance), list(chunk))
+                await session.execute(
+                    _latest_holdings_update({row["wallet_id"] for row in rows})
+                )
+                await session.commit()
+
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.info(
+                "historical_balance_repository_bulk_create_success",
+                count=len(rows),
+                duration_ms=duration,
+            )
+            return len(rows)
+        except Exception as e:
+            self.__audit.error(
+                "historical_balance_repository_bulk_create_failed",
+                count=len(items),
+                error=str(e),
+            )
+            raise
+
+    async def value_series(
+        self,
+        wallet_id,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[Any]:
+        """Return the wallet's USD value at each balance timestamp.
+
+        Every balance point is priced with the latest price of its token at or
+        before the point (an as-of join) and the products are summed per
+        timestamp, all inside the database. PostgreSQL runs the join as a
+        ``LEFT JOIN LATERAL``; other dialects fall back to an equivalent
+        correlated scalar subquery.
+
+        Returns:
+            Rows of ``(timestamp, value_usd, tokens, priced_tokens)`` ordered by
+            timestamp; ``priced_tokens < tokens`` flags points with no price.
+        """
+        start_time = time.time()
+        self.__audit.info(
+            "historical_balance_repository_value_series_started",
+            wallet_id=str(wallet_id),
+        )
+
+        try:
+            async with self.__database.get_read_session() as session:
+                if dialect_name(session) == "postgresql":
+                    price = _price_asof().lateral("price_asof")
+                    price_col = price.c.price_usd
+                    source = HistoricalBalance.__table__.outerjoin(price, true())
+                else:
+                    price_col = _price_asof().scalar_subquery()
+                    source = HistoricalBalance.__table__
+
+                stmt = (
+                    select(
+                        HistoricalBalance.timestamp,
+                        func.coalesce(
+                            func.sum(HistoricalBalance.balance * price_col),
+                            literal(0),
+                        ).label("value_usd"),
+                        func.count().label("tokens"),
+                        func.count(price_col).label("priced_tokens"),
+                    )
+                    .select_from(source)
+                    .where(HistoricalBalance.wallet_id == wallet_id)
+                    .group_by(HistoricalBalance.timestamp)
+                    .order_by(HistoricalBalance.timestamp)
+                )
+                if start is not None:
+                    stmt = stmt.where(
+                        HistoricalBalance.timestamp >= _as_naive_utc(start)
+                    )
+                if end is not None:
+                    stmt = stmt.where(HistoricalBalance.timestamp <= _as_naive_utc(end))
+
+                rows = (await session.execute(stmt)).all()
+
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.info(
+                "historical_balance_repository_value_series_success",
+                wallet_id=str(wallet_id),
+                points=len(rows),
+                duration_ms=duration,
+            )
+            return rows
+        except Exception as e:
+            self.__audit.error(
+                "historical_balance_repository_value_series_failed",
+                wallet_id=str(wallet_id),
+                error=str(e),
+            )
+            raise
+
+    async def revalue(self, token_id, since: Optional[datetime] = None) -> int:
+        """Recompute ``balance_usd`` of a token's balance points from prices.
+
+        Issued as one ``UPDATE`` so a price correction costs a single pass over
+        the affected rows. Points without a price at or before them keep their
+        stored value. ``Wallet.holdings_usd`` of the wallets holding the token
+        is recomputed in the same transaction.
+
+        Returns:
+            Number of rows updated.
+        """
+        start_time = time.time()
+        self.__audit.info(
+            "historical_balance_repository_revalue_started",
+            token_id=str(token_id),
+            since=since,
+        )
+
+        try:
+            price = _price_asof().scalar_subquery()
+            stmt = (
+                update(HistoricalBalance)
+                .where(HistoricalBalance.token_id == token_id)
+                .values(
+                    balance_usd=func.coalesce(
+                        HistoricalBalance.balance * price,
+                        HistoricalBalance.balance_usd,
+                    )
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if since is not None:
+                stmt = stmt.where(HistoricalBalance.timestamp >= _as_naive_utc(since))
+
+            holders = (
+                select(HistoricalBalance.wallet_id)
+                .where(HistoricalBalance.token_id == token_id)
+                .distinct()
+            )
+
+            async with self.__database.get_session() as session:
+                result = await session.execute(stmt)
+                await session.execute(_latest_holdings_update(holders))
+                await session.commit()
+
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.info(
+                "historical_balance_repository_revalue_success",
+                token_id=str(token_id),
+                count=result.rowcount,
+                duration_ms=duration,
+            )
+            return result.rowcount
+        except Exception as e:
+            self.__audit.error(
+                "historical_balance_repository_revalue_failed",
+                token_id=str(token_id),
+                error=str(e),
+            )
+            raise
@@ -0,0 +1,71 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.core.database import CoreDatabase
+from app.domain.interfaces.repositories import (
+    IndexerCheckpointRepositoryInterface,
+)
+from app.models.indexer_checkpoint import IndexerCheckpoint
+from app.utils.bulk_insert import build_upsert, dialect_name
+from app.utils.logging import Audit
+
+
+class IndexerCheckpointRepository(IndexerCheckpointRepositoryInterface):
+    """Repository for :class:`~app.models.indexer_checkpoint.IndexerCheckpoint`."""
+
+    def __init__(self, database: CoreDatabase, audit: Audit):
+        self.__database = database
+        self.__audit = audit
+
+    async def get(
+        self, chain_id: int, stream: str = "live"
+    ) -> Optional[IndexerCheckpoint]:
+        """Return the checkpoint for *chain_id* / *stream* if one exists."""
+        try:
+            async with self.__database.get_session() as session:
+                return await session.get(IndexerCheckpoint, (chain_id, stream))
+        except Exception as exc:
+            self.__audit.error(
+                "indexer_checkpoint_repository_get_failed",
+                chain_id=chain_id,
+                stream=stream,
+                error=str(exc),
+            )
+            raise
+
+    async def save(self, chain_id: int, last_block: int, stream: str = "live") -> None:
+        """Upsert *last_block* as the last fully indexed block."""
+        try:
+            async with self.__database.get_session() as session:
+                stmt = build_upsert(
+                    dialect_name(session),
+                    IndexerCheckpoint,
+                    [
+                        {
+                            "chain_id": chain_id,
+                            "stream": stream,
+                            "last_block": last_block,
+                            "updated_at": datetime.now(timezone.utc),
+                        }
+                    ],
+                    conflict_columns=("chain_id", "stream"),
+                    update_columns=("last_block", "updated_at"),
+                )
+                await session.execute(stmt)
+                await session.commit()
+
+            self.__audit.info(
+                "indexer_checkpoint_repository_save_success",
+                chain_id=chain_id,
+                stream=stream,
+                last_block=last_block,
+            )
+        except Exception as exc:
+            self.__audit.error(
+                "indexer_checkpoint_repository_save_failed",
+                chain_id=chain_id,
+                stream=stream,
+                last_block=last_block,
+                error=str(exc),
+            )
+            raise
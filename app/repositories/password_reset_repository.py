@@ -5,11 +5,14 @@ import uuid
 from datetime import datetime, timezone
 from typing import Optional
 
+from sqlalchemy import or_
 from sqlalchemy.future import select
 
 from app.core.database import CoreDatabase
 from app.domain.interfaces.repositories import PasswordResetRepositoryInterface
 from app.models.password_reset import PasswordReset
+from app.utils.batched_delete import build_batch_delete
+from app.utils.bulk_insert import dialect_name
 from app.utils.logging import Audit
 
 
@@ -129,3 +132,40 @@ class PasswordResetRepository(PasswordResetRepositoryInterface):
                 "password_reset_repository_delete_expired_failed", error=str(e)
             )
             raise
+
+    async def delete_expired_batch(
+        self, limit: int, *, before: datetime | None = None
+    ) -> int:
+        """Delete up to *limit* expired or used password reset tokens. Returns rowcount.
+
+        Call repeatedly until fewer than *limit* rows are removed; each batch
+        is its own short transaction.
+        """
+        cutoff = before or datetime.now(timezone.utc)
+
+        try:
+            async with self.__database.get_session() as session:
+                stmt = build_batch_delete(
+                    dialect_name(session),
+                    PasswordReset.__table__,
+                    or_(
+                        PasswordReset.expires_at < cutoff, PasswordReset.used.is_(True)
+                    ),
+                    limit,
+                )
+                result = await session.execute(stmt)
+                await session.commit()
+
+                self.__audit.info(
+                    "password_reset_repository_delete_expired_batch_success",
+                    count=result.rowcount,
+                    cutoff=cutoff.isoformat(),
+                )
+                return result.rowcount
+        except Exception as e:
+            self.__audit.error(
+                "password_reset_repository_delete_expired_batch_failed",
+                cutoff=cutoff.isoformat(),
+                error=str(e),
+            )
+            raise
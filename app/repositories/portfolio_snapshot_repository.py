@@ -1,5 +1,6 @@
-from datetime import datetime, timedelta
-from typing import List, Optional
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Optional
 
 from sqlalchemy import and_, delete, desc, or_, select
 
@@ -9,9 +10,56 @@ from app.domain.interfaces.repositories import (
 )
 from app.models.portfolio_snapshot import PortfolioSnapshot
 from app.models.portfolio_snapshot_cache import PortfolioSnapshotCache
+from app.models.wallet import Wallet, normalize_address
+from app.repositories.wallet_repository import wallet_balance_update
 from app.utils.logging import Audit
 
 
+def _group_by_interval(
+    snapshots: List[PortfolioSnapshot], interval: str
+) -> List[PortfolioSnapshot]:
+    """Keep the latest snapshot per day/week of ascending *snapshots*."""
+    if interval == "none":
+        return list(snapshots)
+    if interval not in ("daily", "weekly"):
+        raise ValueError("Invalid interval")
+
+    grouped = {}
+    for snap in snapshots:
+        dt = datetime.utcfromtimestamp(snap.timestamp)
+        bucket = dt.date() if interval == "daily" else dt.isocalendar()[:2]
+        if bucket not in grouped or snap.timestamp > grouped[bucket].timestamp:
+            grouped[bucket] = snap
+    return sorted(grouped.values(), key=lambda snap: snap.timestamp)
+
+
+def _owned_snapshots_query(user_id: uuid.UUID, address: str, *snapshot_filters: Any):
+    """Select ``(Wallet.id, PortfolioSnapshot)`` for the owner's wallet.
+
+    Extra filters go into the join condition so the wallet row is still
+    returned, with a ``NULL`` snapshot, when no snapshot matches.
+    """
+    return (
+        select(Wallet.id, PortfolioSnapshot)
+        .select_from(Wallet)
+        .outerjoin(
+            PortfolioSnapshot,
+            and_(PortfolioSnapshot.user_address == Wallet.address, *snapshot_filters),
+        )
+        .where(
+            Wallet.user_id == user_id,
+            Wallet.address == normalize_address(address),
+        )
+    )
+
+
+def _owned_rows(rows) -> Optional[List[PortfolioSnapshot]]:
+    """Snapshots from :func:`_owned_snapshots_query` rows; ``None`` if not owned."""
+    if not rows:
+        return None
+    return [row.PortfolioSnapshot for row in rows if row.PortfolioSnapshot is not None]
+
+
 class PortfolioSnapshotRepository(PortfolioSnapshotRepositoryInterface):
     """Repository for :class:`~app.models.portfolio_snapshot.PortfolioSnapshot`."""
 
@@ -24,23 +72,37 @@ class PortfolioSnapshotRepository(PortfolioSnapshotRepositoryInterface):
     # ------------------------------------------------------------------
 
     async def create_snapshot(self, snapshot: PortfolioSnapshot) -> PortfolioSnapshot:
-        """Persist a new snapshot and return it back refreshed."""
+        """Persist a new snapshot and return it back refreshed.
+
+        Wallets with the snapshot's address get their cached ``balance_usd``
+        (net of borrowings) and ``last_snapshot_at`` updated in the same
+        transaction.
+        """
         self.__audit.info(
             "portfolio_snapshot_repository_create_snapshot_started",
             user_address=snapshot.user_address,
-            timestamp=snapshot.timestamp,
+            snapshot_timestamp=snapshot.timestamp,
         )
 
         try:
             async with self.__database.get_session() as session:
                 session.add(snapshot)
+                await session.execute(
+                    wallet_balance_update(
+                        Wallet.address == snapshot.user_address,
+                        snapshot.total_collateral_usd - snapshot.total_borrowings_usd,
+                        datetime.fromtimestamp(
+                            snapshot.timestamp, tz=timezone.utc
+                        ).replace(tzinfo=None),
+                    )
+                )
                 await session.commit()
                 await session.refresh(snapshot)
 
                 self.__audit.info(
                     "portfolio_snapshot_repository_create_snapshot_success",
                     user_address=snapshot.user_address,
-                    timestamp=snapshot.timestamp,
+                    snapshot_timestamp=snapshot.timestamp,
                     snapshot_id=snapshot.id,
                 )
                 return snapshot
@@ -48,7 +110,7 @@ class PortfolioSnapshotRepository(PortfolioSnapshotRepositoryInterface):
             self.__audit.error(
                 "portfolio_snapshot_repository_create_snapshot_failed",
                 user_address=snapshot.user_address,
-                timestamp=snapshot.timestamp,
+                snapshot_timestamp=snapshot.timestamp,
                 error=str(e),
             )
             raise
@@ -72,12 +134,13 @@ class PortfolioSnapshotRepository(PortfolioSnapshotRepositoryInterface):
         )
 
         try:
-            async with self.__database.get_session() as session:
+            async with self.__database.get_read_session() as session:
                 result = await session.execute(
                     select(PortfolioSnapshot)
                     .where(
                         and_(
-                            PortfolioSnapshot.user_address == user_address,
+                            PortfolioSnapshot.user_address
+                            == normalize_address(user_address),
                             PortfolioSnapshot.timestamp >= from_ts,
                             PortfolioSnapshot.timestamp <= to_ts,
                         )
@@ -116,10 +179,13 @@ class PortfolioSnapshotRepository(PortfolioSnapshotRepositoryInterface):
         )
 
         try:
-            async with self.__database.get_session() as session:
+            async with self.__database.get_read_session() as session:
                 result = await session.execute(
                     select(PortfolioSnapshot)
-                    .where(PortfolioSnapshot.user_address == user_address)
+                    .where(
+                        PortfolioSnapshot.user_address
+                        == normalize_address(user_address)
+                    )
                     .order_by(desc(PortfolioSnapshot.timestamp))
                     .limit(1)
                 )
@@ -149,10 +215,13 @@ class PortfolioSnapshotRepository(PortfolioSnapshotRepositoryInterface):
         )
 
         try:
-            async with self.__database.get_session() as session:
+            async with self.__database.get_read_session() as session:
                 result = await session.execute(
                     select(PortfolioSnapshot)
-                    .where(PortfolioSnapshot.user_address == wallet_address)
+                    .where(
+                        PortfolioSnapshot.user_address
+                        == normalize_address(wallet_address)
+                    )
                     .order_by(desc(PortfolioSnapshot.timestamp))
                 )
                 snapshots = result.scalars().all()
@@ -171,6 +240,117 @@ class PortfolioSnapshotRepository(PortfolioSnapshotRepositoryInterface):
             )
             raise
 
+    async def get_owned_snapshots(
+        self,
+        user_id: uuid.UUID,
+        wallet_address: str,
+        limit: Optional[int] = None,
+    ) -> Optional[List[PortfolioSnapshot]]:
+        """Return snapshots of a wallet owned by *user_id*, newest first.
+
+        Ownership and data are resolved in one statement: the owner's wallet
+        row is outer-joined to its snapshots, so an owned wallet without
+        snapshots yields ``[]`` while an unknown or foreign wallet yields
+        ``None``.
+        """
+        self.__audit.info(
+            "portfolio_snapshot_repository_get_owned_snapshots_started",
+            user_id=str(user_id),
+            wallet_address=wallet_address,
+            limit=limit,
+        )
+
+        try:
+            async with self.__database.get_read_session() as session:
+                stmt = (
+                    _owned_snapshots_query(user_id, wallet_address)
+                    .order_by(desc(PortfolioSnapshot.timestamp))
+                    .limit(limit)
+                )
+                rows = (await session.execute(stmt)).all()
+                snapshots = _owned_rows(rows)
+
+                self.__audit.info(
+                    "portfolio_snapshot_repository_get_owned_snapshots_success",
+                    user_id=str(user_id),
+                    wallet_address=wallet_address,
+                    owned=snapshots is not None,
+                    count=len(snapshots or []),
+                )
+                return snapshots
+        except Exception as e:
+            self.__audit.error(
+                "portfolio_snapshot_repository_get_owned_snapshots_failed",
+                user_id=str(user_id),
+                wallet_address=wallet_address,
+                error=str(e),
+            )
+            raise
+
+    async def get_owned_timeline(
+        self,
+        user_id: uuid.UUID,
+        user_address: str,
+        from_ts: int,
+        to_ts: int,
+        limit: int = 100,
+        offset: int = 0,
+        interval: str = "none",
+    ) -> Optional[List[PortfolioSnapshot]]:
+        """Owner-scoped :meth:`get_timeline`; ``None`` if the wallet is not owned."""
+        self.__audit.info(
+            "portfolio_snapshot_repository_get_owned_timeline_started",
+            user_id=str(user_id),
+            user_address=user_address,
+            from_ts=from_ts,
+            to_ts=to_ts,
+            interval=interval,
+            limit=limit,
+            offset=offset,
+        )
+
+        try:
+            async with self.__database.get_read_session() as session:
+                stmt = _owned_snapshots_query(
+                    user_id,
+                    user_address,
+                    PortfolioSnapshot.timestamp >= from_ts,
+                    PortfolioSnapshot.timestamp <= to_ts,
+                ).order_by(PortfolioSnapshot.timestamp.asc())
+                rows = (await session.execute(stmt)).all()
+                snapshots = _owned_rows(rows)
+                if snapshots is None:
+                    self.__audit.info(
+                        "portfolio_snapshot_repository_get_owned_timeline_success",
+                        user_id=str(user_id),
+                        user_address=user_address,
+                        owned=False,
+                    )
+                    return None
+
+                filtered = _group_by_interval(snapshots, interval)
+                result_snapshots = filtered[offset : offset + limit]  # noqa: E203
+
+                self.__audit.info(
+                    "portfolio_snapshot_repository_get_owned_timeline_success",
+                    user_id=str(user_id),
+                    user_address=user_address,
+                    owned=True,
+                    interval=interval,
+                    total_count=len(snapshots),
+                    result_count=len(result_snapshots),
+                )
+                return result_snapshots
+        except Exception as e:
+            self.__audit.error(
+                "portfolio_snapshot_repository_get_owned_timeline_failed",
+                user_id=str(user_id),
+                user_address=user_address,
+                interval=interval,
+                error=str(e),
+            )
+            raise
+
     async def delete_snapshot(self, snapshot_id: int) -> None:
         """Delete a snapshot by ID."""
         self.__audit.info(
@@ -229,7 +409,8 @@ class PortfolioSnapshotRepository(PortfolioSnapshotRepositoryInterface):
                 now = datetime.utcnow()
                 result = await session.execute(
                     select(PortfolioSnapshotCache).where(
-                        PortfolioSnapshotCache.user_address == user_address,
+                        PortfolioSnapshotCache.user_address
+                        == normalize_address(user_address),
                         PortfolioSnapshotCache.from_ts == from_ts,
                         PortfolioSnapshotCache.to_ts == to_ts,
                         PortfolioSnapshotCache.interval == interval,
@@ -286,7 +467,8 @@ class PortfolioSnapshotRepository(PortfolioSnapshotRepositoryInterface):
                 # Delete existing cache entries
                 await session.execute(
                     delete(PortfolioSnapshotCache).where(
-                        PortfolioSnapshotCache.user_address == user_address,
+                        PortfolioSnapshotCache.user_address
+                        == normalize_address(user_address),
                         PortfolioSnapshotCache.from_ts == from_ts,
                         PortfolioSnapshotCache.to_ts == to_ts,
                         PortfolioSnapshotCache.interval == interval,
@@ -297,7 +479,7 @@ class PortfolioSnapshotRepository(PortfolioSnapshotRepositoryInterface):
 
                 # Create new cache entry
                 cache = PortfolioSnapshotCache(
-                    user_address=user_address,
+                    user_address=normalize_address(user_address),
                     from_ts=from_ts,
                     to_ts=to_ts,
                     interval=interval,
@@ -350,11 +532,12 @@ class PortfolioSnapshotRepository(PortfolioSnapshotRepositoryInterface):
         )
 
         try:
-            async with self.__database.get_session() as session:
+            async with self.__database.get_read_session() as session:
                 result = await session.execute(
                     select(PortfolioSnapshot)
                     .where(
-                        PortfolioSnapshot.user_address == user_address,
+                        PortfolioSnapshot.user_address
+                        == normalize_address(user_address),
                         PortfolioSnapshot.timestamp >= from_ts,
                         PortfolioSnapshot.timestamp <= to_ts,
                     )
@@ -362,31 +545,7 @@ class PortfolioSnapshotRepository(PortfolioSnapshotRepositoryInterface):
                 )
                 snapshots = result.scalars().all()
 
-                if interval == "none":
-                    filtered = snapshots
-                elif interval == "daily":
-                    grouped = {}
-                    for snap in snapshots:
-                        day = datetime.utcfromtimestamp(snap.timestamp).date()
-                        if (
-                            day not in grouped
-                            or snap.timestamp > grouped[day].timestamp
-                        ):
-                            grouped[day] = snap
-                    filtered = sorted(grouped.values(), key=lambda snap: snap.timestamp)
-                elif interval == "weekly":
-                    grouped = {}
-                    for snap in snapshots:
-                        dt = datetime.utcfromtimestamp(snap.timestamp)
-                        week = dt.isocalendar()[:2]
-                        if (
-                            week not in grouped
-                            or snap.timestamp > grouped[week].timestamp
-                        ):
-                            grouped[week] = snap
-                    filtered = sorted(grouped.values(), key=lambda snap: snap.timestamp)
-                else:
-                    raise ValueError("Invalid interval")
+                filtered = _group_by_interval(snapshots, interval)
 
                 # Slice pagination (ignore E203 whitespace rule for flake8/black)
                 result_snapshots = filtered[offset : offset + limit]  # noqa: E203
@@ -5,20 +5,44 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+from sqlalchemy import or_, update
 from sqlalchemy.future import select
 
 from app.core.database import CoreDatabase
 from app.domain.interfaces.repositories import RefreshTokenRepositoryInterface
+from app.domain.interfaces.utils import RefreshTokenCacheUtilsInterface
 from app.models.refresh_token import RefreshToken
+from app.utils.batched_delete import build_batch_delete
+from app.utils.bulk_insert import dialect_name
 from app.utils.logging import Audit
+from app.utils.refresh_token_cache import RefreshTokenState
+
+
+def _state_of(token: RefreshToken) -> RefreshTokenState:
+    expires_at = token.expires_at
+    if expires_at.tzinfo is None:  # SQLite drops the timezone
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return RefreshTokenState(
+        str(token.user_id), expires_at.timestamp(), bool(token.revoked)
+    )
 
 
 class RefreshTokenRepository(RefreshTokenRepositoryInterface):
-    """Async repository handling refresh token persistence & queries."""
+    """Async repository handling refresh token persistence & queries.
 
-    def __init__(self, database: CoreDatabase, audit: Audit):
+    When a *cache* is given, the state of each token is mirrored there so
+    :meth:`get_state` and :meth:`revoke_by_jti_hash` rarely touch the rows.
+    """
+
+    def __init__(
+        self,
+        database: CoreDatabase,
+        audit: Audit,
+        cache: Optional[RefreshTokenCacheUtilsInterface] = None,
+    ):
         self.__database = database
         self.__audit = audit
+        self.__cache = cache
 
     async def save(self, token: RefreshToken) -> RefreshToken:
         """Save a refresh token to the database."""
@@ -75,6 +99,70 @@ class RefreshTokenRepository(RefreshTokenRepositoryInterface):
             )
             raise
 
+    async def get_state(self, jti_hash: str) -> Optional[RefreshTokenState]:
+        """Return the owner, expiry and revoked flag of a token by JTI hash.
+
+        Served from the cache when mirrored; otherwise read from the
+        database and mirrored for the next lookup.
+        """
+        if self.__cache is not None:
+            state = await self.__cache.get(jti_hash)
+            if state is not None:
+                return state
+
+        token = await self.get_by_jti_hash(jti_hash)
+        if token is None:
+            return None
+        state = _state_of(token)
+        if self.__cache is not None:
+            await self.__cache.set(jti_hash, state)
+        return state
+
+    async def revoke_by_jti_hash(
+        self, jti_hash: str, user_id: str, expires_at: float
+    ) -> bool:
+        """Revoke a token without loading it. Returns True if a row matched.
+
+        The revoked state is mirrored first, so the token is rejected even
+        before the ``UPDATE`` commits. If that fails, a mirrored valid state
+        is still served until its short TTL runs out.
+        """
+        self.__audit.info(
+            "refresh_token_repository_revoke_by_jti_hash_started",
+            jti_hash=jti_hash[:8],
+        )
+
+        if self.__cache is not None and not await self.__cache.set(
+            jti_hash, RefreshTokenState(user_id, expires_at, revoked=True)
+        ):
+            self.__audit.warning(
+                "refresh_token_repository_revoke_mirror_failed",
+                jti_hash=jti_hash[:8],
+            )
+        try:
+            async with self.__database.get_session() as session:
+                stmt = (
+                    update(RefreshToken)
+                    .where(RefreshToken.jti_hash == jti_hash)
+                    .values(revoked=True)
+                )
+                result = await session.execute(stmt)
+                await session.commit()
+
+                self.__audit.info(
+                    "refresh_token_repository_revoke_by_jti_hash_success",
+                    jti_hash=jti_hash[:8],
+                    found=result.rowcount > 0,
+                )
+                return result.rowcount > 0
+        except Exception as e:
+            self.__audit.error(
+                "refresh_token_repository_revoke_by_jti_hash_failed",
+                jti_hash=jti_hash[:8],
+                error=str(e),
+            )
+            raise
+
     async def revoke(self, token: RefreshToken) -> None:
         """Revoke a refresh token."""
         self.__audit.info(
@@ -89,12 +177,16 @@ class RefreshTokenRepository(RefreshTokenRepositoryInterface):
                 merged_token = await session.merge(token)
                 merged_token.revoked = True
                 await session.commit()
-
-                self.__audit.info(
-                    "refresh_token_repository_revoke_success",
-                    user_id=str(token.user_id),
-                    jti_hash=token.jti_hash[:8],
+            if self.__cache is not None:
+                await self.__cache.set(
+                    token.jti_hash, _state_of(token)._replace(revoked=True)
                 )
+
+            self.__audit.info(
+                "refresh_token_repository_revoke_success",
+                user_id=str(token.user_id),
+                jti_hash=token.jti_hash[:8],
+            )
         except Exception as e:
             self.__audit.error(
                 "refresh_token_repository_revoke_failed",
@@ -133,6 +225,43 @@ class RefreshTokenRepository(RefreshTokenRepositoryInterface):
             )
             raise
 
+    async def delete_expired_batch(
+        self, limit: int, *, before: datetime | None = None
+    ) -> int:
+        """Delete up to *limit* expired or revoked refresh tokens. Returns rowcount.
+
+        Call repeatedly until fewer than *limit* rows are removed; each batch
+        is its own short transaction.
+        """
+        cutoff = before or datetime.now(timezone.utc)
+
+        try:
+            async with self.__database.get_session() as session:
+                stmt = build_batch_delete(
+                    dialect_name(session),
+                    RefreshToken.__table__,
+                    or_(
+                        RefreshToken.expires_at < cutoff, RefreshToken.revoked.is_(True)
+                    ),
+                    limit,
+                )
+                result = await session.execute(stmt)
+                await session.commit()
+
+                self.__audit.info(
+                    "refresh_token_repository_delete_expired_batch_success",
+                    count=result.rowcount,
+                    cutoff=cutoff.isoformat(),
+                )
+                return result.rowcount
+        except Exception as e:
+            self.__audit.error(
+                "refresh_token_repository_delete_expired_batch_failed",
+                cutoff=cutoff.isoformat(),
+                error=str(e),
+            )
+            raise
+
     async def create_from_jti(
         self, jti: str, user_id: uuid.UUID, ttl: timedelta
     ) -> RefreshToken:
@@ -145,7 +274,10 @@ class RefreshTokenRepository(RefreshTokenRepositoryInterface):
 
         try:
             token = RefreshToken.from_raw_jti(jti, user_id, ttl)
+            state = _state_of(token)
             saved_token = await self.save(token)
+            if self.__cache is not None:
+                await self.__cache.set(token.jti_hash, state)
 
             self.__audit.info(
                 "refresh_token_repository_create_from_jti_success",
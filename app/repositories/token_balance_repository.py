@@ -1,9 +1,20 @@
+import time
+import uuid
+from typing import Sequence
+
+from sqlalchemy import select
+
 from app.core.database import CoreDatabase
 from app.domain.interfaces.repositories import TokenBalanceRepositoryInterface
 from app.domain.schemas.token_balance import TokenBalanceCreate
 from app.models.token_balance import TokenBalance
+from app.utils.bulk_insert import build_upsert, chunk_rows, dialect_name
 from app.utils.logging import Audit
 
+# A wallet holds one current balance per token.
+_CONFLICT_COLUMNS = ("wallet_id", "token_id")
+_UPDATE_COLUMNS = ("balance", "balance_usd")
+
 
 class TokenBalanceRepository(TokenBalanceRepositoryInterface):
     """Repository for :class:`~app.models.token_balance.TokenBalance`."""
@@ -13,7 +24,12 @@ class TokenBalanceRepository(TokenBalanceRepositoryInterface):
         self.__audit = audit
 
     async def create(self, data: TokenBalanceCreate) -> TokenBalance:
-        """Create a new token balance record."""
+        """Create or update the current balance of ``(wallet_id, token_id)``.
+
+        A wallet holds one current balance per token, so posting the same pair
+        again overwrites the stored amounts instead of violating
+        ``uq_token_balance_wallet_token``.
+        """
         self.__audit.info(
             "token_balance_repository_create_started",
             token_id=str(data.token_id),
@@ -23,15 +39,23 @@ class TokenBalanceRepository(TokenBalanceRepositoryInterface):
 
         try:
             async with self.__database.get_session() as session:
-                balance = TokenBalance(
-                    token_id=data.token_id,
-                    wallet_id=data.wallet_id,
-                    balance=data.balance,
-                    balance_usd=data.balance_usd,
+                stmt = build_upsert(
+                    dialect_name(session),
+                    TokenBalance,
+                    [self._to_row(data)],
+                    conflict_columns=_CONFLICT_COLUMNS,
+                    update_columns=_UPDATE_COLUMNS,
                 )
-                session.add(balance)
+                await session.execute(stmt)
                 await session.commit()
-                await session.refresh(balance)
+                balance = await session.scalar(
+                    select(TokenBalance)
+                    .where(
+                        TokenBalance.wallet_id == data.wallet_id,
+                        TokenBalance.token_id == data.token_id,
+                    )
+                    .execution_options(populate_existing=True)
+                )
 
                 self.__audit.info(
                     "token_balance_repository_create_success",
@@ -48,3 +72,64 @@ class TokenBalanceRepository(TokenBalanceRepositoryInterface):
                 error=str(e),
             )
             raise
+
+    @staticmethod
+    def _to_row(item: TokenBalanceCreate) -> dict:
+        """Return the insert parameters for *item*."""
+        return {
+            "id": uuid.uuid4(),
+            "wallet_id": item.wallet_id,
+            "token_id": item.token_id,
+            "balance": item.balance,
+            "balance_usd": item.balance_usd,
+        }
+
+    async def bulk_upsert(self, items: Sequence[TokenBalanceCreate]) -> int:
+        """Insert or update current balances keyed on ``(wallet_id, token_id)``.
+
+        A batch is written with multi-row ``INSERT … ON CONFLICT DO UPDATE``
+        statements and one commit. When the same pair appears more than once
+        in *items* the last occurrence wins.
+
+        Returns:
+            Number of distinct balances written.
+        """
+        if not items:
+            return 0
+
+        start_time = time.time()
+        self.__audit.info(
+            "token_balance_repository_bulk_upsert_started", count=len(items)
+        )
+
+        try:
+            # A single statement may not touch the same conflict key twice.
+            latest = {(item.wallet_id, item.token_id): item for item in items}
+            rows = [self._to_row(item) for item in latest.values()]
+            async with self.__database.get_session() as session:
+                dialect = dialect_name(session)
+                for chunk in chunk_rows(rows):
+                    stmt = build_upsert(
+                        dialect,
+                        TokenBalance,
+                        chunk,
+                        conflict_columns=_CONFLICT_COLUMNS,
+                        update_columns=_UPDATE_COLUMNS,
+                    )
+                    await session.execute(stmt)
+                await session.commit()
+
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.info(
+                "token_balance_repository_bulk_upsert_success",
+                count=len(rows),
+                duration_ms=duration,
+            )
+            return len(rows)
+        except Exception as e:
+            self.__audit.error(
+                "token_balance_repository_bulk_upsert_failed",
+                count=len(items),
+                error=str(e),
+            )
+            raise
@@ -1,10 +1,133 @@
+import time
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Sequence
+
+from sqlalchemy import case, func, insert, literal, literal_column, select
+
 from app.core.database import CoreDatabase
 from app.domain.interfaces.repositories import TokenPriceRepositoryInterface
-from app.domain.schemas.token_price import TokenPriceCreate
+from app.domain.schemas.token_price import (
+    CANDLE_INTERVALS,
+    LatestTokenPrice,
+    PriceCandle,
+    TokenPriceCreate,
+)
+from app.models.token import Token
 from app.models.token_price import TokenPrice
+from app.models.token_price_candle import TokenPriceCandle
+from app.utils.bulk_insert import (
+    chunk_rows,
+    dialect_insert,
+    dialect_name,
+    on_conflict_update,
+)
 from app.utils.logging import Audit
 
 
+def _as_naive_utc(value: Optional[datetime]) -> datetime:
+    """Return *value* (default: now) as a naive UTC datetime for the column."""
+    if value is None:
+        return datetime.now(timezone.utc).replace(tzinfo=None)
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+# date_trunc() units (PostgreSQL) and strftime() patterns (SQLite) per
+# interval. The SQLite pattern matches SQLAlchemy's DateTime storage format so
+# bucket strings compare correctly against bound datetime parameters.
+_PG_TRUNC = {"1h": "hour", "1d": "day"}
+_SQLITE_TRUNC = {"1h": "%Y-%m-%d %H:00:00.000000", "1d": "%Y-%m-%d 00:00:00.000000"}
+
+
+def align_to_bucket(value: datetime, interval: str) -> datetime:
+    """Floor *value* (naive UTC) to the start of its *interval* bucket."""
+    value = _as_naive_utc(value)
+    return value - (value - _EPOCH) % CANDLE_INTERVALS[interval]
+
+
+def _bucket_expr(dialect: str, interval: str):
+    """SQL expression mapping ``token_prices.timestamp`` to its bucket start."""
+    if dialect == "postgresql":
+        # Inline the unit (from a fixed map) so every occurrence of the
+        # expression is textually identical for PARTITION BY / GROUP BY
+        unit = literal_column(f"'{_PG_TRUNC[interval]}'")
+        return func.date_trunc(unit, TokenPrice.timestamp)
+    return func.strftime(_SQLITE_TRUNC[interval], TokenPrice.timestamp)
+
+
+def _candle_select(
+    dialect: str,
+    interval: str,
+    start: datetime,
+    end: Optional[datetime] = None,
+    token_id=None,
+):
+    """Aggregate raw prices in ``[start, end)`` into one OHLC row per bucket.
+
+    Open/close are the first/last price of each bucket, picked with
+    ``row_number()`` windows so the whole computation is one statement.
+    Without *token_id* every token with prices in the range is aggregated.
+    """
+    bucket = _bucket_expr(dialect, interval).label("bucket")
+    partition = (TokenPrice.token_id, bucket)
+    filters = [TokenPrice.timestamp >= start, TokenPrice.price_usd.isnot(None)]
+    if end is not None:
+        filters.append(TokenPrice.timestamp < end)
+    if token_id is not None:
+        filters.append(TokenPrice.token_id == token_id)
+    ranked = (
+        select(
+            TokenPrice.token_id,
+            bucket,
+            TokenPrice.price_usd.label("price"),
+            func.row_number()
+            .over(
+                partition_by=partition,
+                order_by=(TokenPrice.timestamp.asc(), TokenPrice.id.asc()),
+            )
+            .label("rn_first"),
+            func.row_number()
+            .over(
+                partition_by=partition,
+                order_by=(TokenPrice.timestamp.desc(), TokenPrice.id.desc()),
+            )
+            .label("rn_last"),
+        )
+        .where(*filters)
+        .subquery()
+    )
+    return select(
+        ranked.c.token_id,
+        ranked.c.bucket,
+        func.max(case((ranked.c.rn_first == 1, ranked.c.price))).label("open"),
+        func.max(ranked.c.price).label("high"),
+        func.min(ranked.c.price).label("low"),
+        func.max(case((ranked.c.rn_last == 1, ranked.c.price))).label("close"),
+        func.count().label("samples"),
+    ).group_by(ranked.c.token_id, ranked.c.bucket)
+
+
+def _as_datetime(value) -> datetime:
+    """Bucket values come back as strings on SQLite."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+def _to_candle(bucket, open_, high, low, close, samples) -> PriceCandle:
+    return PriceCandle(
+        timestamp=_as_datetime(bucket),
+        open=float(open_),
+        high=float(high),
+        low=float(low),
+        close=float(close),
+        samples=samples,
+    )
+
+
 class TokenPriceRepository(TokenPriceRepositoryInterface):
     """Repository for :class:`~app.models.token_price.TokenPrice`."""
 
@@ -25,6 +148,7 @@ class TokenPriceRepository(TokenPriceRepositoryInterface):
                 price = TokenPrice(
                     token_id=data.token_id,
                     price_usd=data.price_usd,
+                    timestamp=_as_naive_utc(data.timestamp),
                 )
                 session.add(price)
                 await session.commit()
@@ -43,3 +167,277 @@ class TokenPriceRepository(TokenPriceRepositoryInterface):
                 error=str(e),
             )
             raise
+
+    async def bulk_create(self, items: Sequence[TokenPriceCreate]) -> int:
+        """Insert many price points in one transaction.
+
+        Rows are sent as multi-row ``INSERT … VALUES`` batches (SQLAlchemy's
+        *insertmanyvalues*), so thousands of points cost a handful of
+        round-trips and a single commit instead of one per row.
+        """
+        if not items:
+            return 0
+
+        start_time = time.time()
+        self.__audit.info(
+            "token_price_repository_bulk_create_started", count=len(items)
+        )
+
+        try:
+            now = _as_naive_utc(None)
+            rows = [
+                {
+                    "token_id": item.token_id,
+                    "price_usd": item.price_usd,
+                    "timestamp": _as_naive_utc(item.timestamp)
+                    if item.timestamp
+                    else now,
+                }
+                for item in items
+            ]
+            async with self.__database.get_session() as session:
+                for chunk in chunk_rows(rows):
+                    await session.execute(insert(TokenPrice), list(chunk))
+                await session.commit()
+
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.info(
+                "token_price_repository_bulk_create_success",
+                count=len(rows),
+                duration_ms=duration,
+            )
+            return len(rows)
+        except Exception as e:
+            self.__audit.error(
+                "token_price_repository_bulk_create_failed",
+                count=len(items),
+                error=str(e),
+            )
+            raise
+
+    async def get_latest_prices(
+        self, token_ids: Optional[Iterable] = None
+    ) -> List[LatestTokenPrice]:
+        """Return the latest price of every token (or of *token_ids*).
+
+        The newest ``token_prices`` row per token is picked with a window
+        function; tokens without price history fall back to
+        ``tokens.current_price_usd``. Tokens with neither are omitted.
+        """
+        ids = list(token_ids) if token_ids is not None else None
+        if ids is not None and not ids:
+            return []
+
+        self.__audit.info(
+            "token_price_repository_get_latest_prices_started",
+            count=len(ids) if ids is not None else None,
+        )
+
+        try:
+            ranked = select(
+                TokenPrice.token_id,
+                TokenPrice.price_usd,
+                TokenPrice.timestamp,
+                func.row_number()
+                .over(
+                    partition_by=TokenPrice.token_id,
+                    order_by=TokenPrice.timestamp.desc(),
+                )
+                .label("rn"),
+            )
+            if ids is not None:
+                ranked = ranked.where(TokenPrice.token_id.in_(ids))
+            ranked = ranked.subquery()
+
+            stmt = select(
+                Token.id,
+                Token.address,
+                Token.symbol,
+                func.coalesce(ranked.c.price_usd, Token.current_price_usd),
+                ranked.c.timestamp,
+            ).outerjoin(ranked, (ranked.c.token_id == Token.id) & (ranked.c.rn == 1))
+            if ids is not None:
+                stmt = stmt.where(Token.id.in_(ids))
+
+            async with self.__database.get_session() as session:
+                rows = (await session.execute(stmt)).all()
+
+            quotes = [
+                LatestTokenPrice(
+                    token_id=token_id,
+                    address=address,
+                    symbol=symbol,
+                    price_usd=float(price),
+                    timestamp=timestamp,
+                )
+                for token_id, address, symbol, price, timestamp in rows
+                if price is not None
+            ]
+
+            self.__audit.info(
+                "token_price_repository_get_latest_prices_success",
+                count=len(quotes),
+            )
+            return quotes
+        except Exception as e:
+            self.__audit.error(
+                "token_price_repository_get_latest_prices_failed",
+                error=str(e),
+            )
+            raise
+
+    async def list_candles(
+        self, token_id, interval: str, start: datetime, end: datetime
+    ) -> List[PriceCandle]:
+        """Compute OHLC candles for a token from raw prices in ``[start, end)``.
+
+        *start* is aligned down to its bucket so the first candle is complete.
+        The ``(token_id, timestamp)`` index keeps this a single range scan.
+        """
+        start_time = time.time()
+        self.__audit.info(
+            "token_price_repository_list_candles_started",
+            token_id=str(token_id),
+            interval=interval,
+        )
+
+        try:
+            async with self.__database.get_read_session() as session:
+                stmt = _candle_select(
+                    dialect_name(session),
+                    interval,
+                    align_to_bucket(start, interval),
+                    _as_naive_utc(end),
+                    token_id=token_id,
+                )
+                rows = (await session.execute(stmt.order_by("bucket"))).all()
+
+            candles = [_to_candle(*row[1:]) for row in rows]
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.info(
+                "token_price_repository_list_candles_success",
+                token_id=str(token_id),
+                interval=interval,
+                count=len(candles),
+                duration_ms=duration,
+            )
+            return candles
+        except Exception as e:
+            self.__audit.error(
+                "token_price_repository_list_candles_failed",
+                token_id=str(token_id),
+                interval=interval,
+                error=str(e),
+            )
+            raise
+
+    async def list_rollup_candles(
+        self, token_id, interval: str, start: datetime, end: datetime
+    ) -> List[PriceCandle]:
+        """Read pre-aggregated candles with bucket start in ``[start, end)``."""
+        try:
+            async with self.__database.get_read_session() as session:
+                result = await session.execute(
+                    select(
+                        TokenPriceCandle.bucket_start,
+                        TokenPriceCandle.open,
+                        TokenPriceCandle.high,
+                        TokenPriceCandle.low,
+                        TokenPriceCandle.close,
+                        TokenPriceCandle.samples,
+                    )
+                    .where(
+                        TokenPriceCandle.token_id == token_id,
+                        TokenPriceCandle.interval == interval,
+                        TokenPriceCandle.bucket_start
+                        >= align_to_bucket(start, interval),
+                        TokenPriceCandle.bucket_start < _as_naive_utc(end),
+                    )
+                    .order_by(TokenPriceCandle.bucket_start)
+                )
+                return [_to_candle(*row) for row in result.all()]
+        except Exception as e:
+            self.__audit.error(
+                "token_price_repository_list_rollup_candles_failed",
+                token_id=str(token_id),
+                interval=interval,
+                error=str(e),
+            )
+            raise
+
+    async def refresh_candles(
+        self, interval: str, since: datetime, until: Optional[datetime] = None
+    ) -> int:
+        """Recompute rollup candles of every token for buckets from *since* on.
+
+        Runs as one ``INSERT … SELECT … ON CONFLICT DO UPDATE`` so partially
+        filled buckets are overwritten as more prices arrive.
+
+        Returns:
+            Number of candle rows written.
+        """
+        start_time = time.time()
+        self.__audit.info(
+            "token_price_repository_refresh_candles_started",
+            interval=interval,
+            since=since,
+        )
+
+        try:
+            async with self.__database.get_session() as session:
+                dialect = dialect_name(session)
+                source = _candle_select(
+                    dialect,
+                    interval,
+                    align_to_bucket(since, interval),
+                    _as_naive_utc(until) if until else None,
+                )
+                candles = source.subquery()
+                stmt = dialect_insert(dialect, TokenPriceCandle).from_select(
+                    [
+                        "token_id",
+                        "interval",
+                        "bucket_start",
+                        "open",
+                        "high",
+                        "low",
+                        "close",
+                        "samples",
+                    ],
+                    select(
+                        candles.c.token_id,
+                        literal(interval),
+                        candles.c.bucket,
+                        candles.c.open,
+                        candles.c.high,
+                        candles.c.low,
+                        candles.c.close,
+                        candles.c.samples,
+                    )
+                    # SQLite needs a WHERE clause to parse INSERT … SELECT …
+                    # ON CONFLICT unambiguously
+                    .where(candles.c.samples > 0),
+                )
+                stmt = on_conflict_update(
+                    stmt,
+                    ("token_id", "interval", "bucket_start"),
+                    ("open", "high", "low", "close", "samples"),
+                )
+                result = await session.execute(stmt)
+                await session.commit()
+
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.info(
+                "token_price_repository_refresh_candles_success",
+                interval=interval,
+                count=result.rowcount,
+                duration_ms=duration,
+            )
+            return result.rowcount
+        except Exception as e:
+            self.__audit.error(
+                "token_price_repository_refresh_candles_failed",
+                interval=interval,
+                error=str(e),
+            )
+            raise
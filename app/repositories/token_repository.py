@@ -1,7 +1,15 @@
+import time
+from typing import Iterable, List
+
+from sqlalchemy import func, select, union
+
 from app.core.database import CoreDatabase
 from app.domain.interfaces.repositories import TokenRepositoryInterface
 from app.domain.schemas.token import TokenCreate
 from app.models.token import Token
+from app.models.token_balance import TokenBalance
+from app.models.transaction import Transaction
+from app.models.wallet import Wallet
 from app.utils.logging import Audit
 
 
@@ -48,3 +56,68 @@ class TokenRepository(TokenRepositoryInterface):
                 error=str(e),
             )
             raise
+
+    async def get_by_addresses(self, addresses: Iterable[str]) -> dict[str, Token]:
+        """Return known tokens keyed by lower-cased contract address."""
+        wanted = {a.lower() for a in addresses}
+        if not wanted:
+            return {}
+
+        try:
+            async with self.__database.get_session() as session:
+                result = await session.execute(
+                    select(Token).where(func.lower(Token.address).in_(wanted))
+                )
+                return {t.address.lower(): t for t in result.scalars().all()}
+        except Exception as e:
+            self.__audit.error(
+                "token_repository_get_by_addresses_failed",
+                count=len(wanted),
+                error=str(e),
+            )
+            raise
+
+    async def list_tracked(self) -> List[Token]:
+        """Return tokens held or transacted by any active wallet.
+
+        Used by background jobs (e.g. the price feed) that only need prices
+        for tokens somebody is actually tracking.
+        """
+        start_time = time.time()
+        self.__audit.info("token_repository_list_tracked_started")
+
+        try:
+            held = (
+                select(TokenBalance.token_id)
+                .join(Wallet, Wallet.id == TokenBalance.wallet_id)
+                .where(Wallet.is_active.is_(True))
+            )
+            transacted = (
+                select(Transaction.token_id)
+                .join(Wallet, Wallet.id == Transaction.wallet_id)
+                .where(
+                    Wallet.is_active.is_(True),
+                    Transaction.token_id.isnot(None),
+                )
+            )
+            referenced = union(held, transacted).subquery()
+
+            async with self.__database.get_session() as session:
+                result = await session.execute(
+                    select(Token).where(Token.id.in_(select(referenced.c[0])))
+                )
+                tokens = result.scalars().all()
+
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.info(
+                "token_repository_list_tracked_success",
+                token_count=len(tokens),
+                duration_ms=duration,
+            )
+            return tokens
+        except Exception as e:
+            self.__audit.error(
+                "token_repository_list_tracked_failed",
+                error=str(e),
+            )
+            raise
@@ -0,0 +1,159 @@
+import time
+import uuid
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import select, tuple_
+
+from app.core.database import CoreDatabase
+from app.domain.interfaces.repositories import TransactionRepositoryInterface
+from app.models.transaction import Transaction
+from app.utils.bulk_insert import build_upsert, chunk_rows, dialect_name
+from app.utils.logging import Audit
+
+# Columns refreshed when a log is re-indexed (e.g. after a token gets listed
+# and its decimals become known). ``id`` and the conflict key
+# ``(hash, log_index, wallet_id)`` are never rewritten.
+_CONFLICT_COLUMNS = ("hash", "log_index", "wallet_id")
+_UPSERT_UPDATE_COLUMNS = (
+    "token_id",
+    "type",
+    "amount",
+    "usd_value",
+    "timestamp",
+    "from_address",
+    "to_address",
+    "extra_metadata",
+)
+
+
+class TransactionRepository(TransactionRepositoryInterface):
+    """Repository for :class:`~app.models.transaction.Transaction`."""
+
+    def __init__(self, database: CoreDatabase, audit: Audit):
+        self.__database = database
+        self.__audit = audit
+
+    async def bulk_upsert(self, rows: Sequence[dict[str, Any]]) -> int:
+        """Insert or update *rows* keyed on ``(hash, log_index, wallet_id)``.
+
+        Rows are written with one multi-row ``INSERT … ON CONFLICT`` statement
+        per chunk inside a single transaction, so re-indexing an already
+        processed block range is idempotent.
+
+        Returns:
+            Number of rows submitted.
+        """
+        if not rows:
+            return 0
+
+        start_time = time.time()
+        self.__audit.info("transaction_repository_bulk_upsert_started", count=len(rows))
+
+        try:
+            prepared = [self._prepare_row(row) for row in rows]
+            async with self.__database.get_session() as session:
+                dialect = dialect_name(session)
+                for chunk in chunk_rows(prepared):
+                    stmt = build_upsert(
+                        dialect,
+                        Transaction,
+                        chunk,
+                        conflict_columns=_CONFLICT_COLUMNS,
+                        update_columns=_UPSERT_UPDATE_COLUMNS,
+                    )
+                    await session.execute(stmt)
+                await session.commit()
+
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.info(
+                "transaction_repository_bulk_upsert_success",
+                count=len(prepared),
+                duration_ms=duration,
+            )
+            return len(prepared)
+        except Exception as exc:
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.error(
+                "transaction_repository_bulk_upsert_failed",
+                count=len(rows),
+                duration_ms=duration,
+                error=str(exc),
+            )
+            raise
+
+    @staticmethod
+    def _prepare_row(row: dict[str, Any]) -> dict[str, Any]:
+        """Return a copy of *row* with every upsert column present.
+
+        Multi-row inserts require homogeneous parameter sets, and Python-side
+        defaults such as the UUID primary key are filled here explicitly.
+        """
+        prepared = {col: row.get(col) for col in _UPSERT_UPDATE_COLUMNS}
+        for col in _CONFLICT_COLUMNS:
+            prepared[col] = row[col]
+        prepared["id"] = row.get("id") or uuid.uuid4()
+        return prepared
+
+    async def list_by_wallet(
+        self,
+        wallet_id: uuid.UUID,
+        limit: int,
+        after: Optional[tuple[datetime, uuid.UUID]] = None,
+        token_id: Optional[uuid.UUID] = None,
+        tx_type: Optional[str] = None,
+    ) -> List[Transaction]:
+        """Return up to *limit* transactions for a wallet, newest first.
+
+        Pagination is keyset based on ``(timestamp, id)``: *after* is the sort
+        key of the last row of the previous page. Each filter combination is
+        served by a matching composite index so deep pages cost the same as
+        the first one. Rows without a timestamp have no place in that order
+        and are left out.
+        """
+        start_time = time.time()
+        self.__audit.info(
+            "transaction_repository_list_by_wallet_started",
+            wallet_id=str(wallet_id),
+            limit=limit,
+            has_cursor=after is not None,
+        )
+
+        try:
+            stmt = select(Transaction).where(
+                Transaction.wallet_id == wallet_id,
+                Transaction.timestamp.is_not(None),
+            )
+            if token_id is not None:
+                stmt = stmt.where(Transaction.token_id == token_id)
+            if tx_type is not None:
+                stmt = stmt.where(Transaction.type == tx_type)
+            if after is not None:
+                stmt = stmt.where(
+                    tuple_(Transaction.timestamp, Transaction.id) < tuple_(*after)
+                )
+            stmt = stmt.order_by(
+                Transaction.timestamp.desc(), Transaction.id.desc()
+            ).limit(limit)
+
+            async with self.__database.get_read_session() as session:
+                result = await session.execute(stmt)
+                transactions = result.scalars().all()
+
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.info(
+                "transaction_repository_list_by_wallet_success",
+                wallet_id=str(wallet_id),
+                count=len(transactions),
+                duration_ms=duration,
+            )
+            return transactions
+        except Exception as exc:
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.error(
+                "transaction_repository_list_by_wallet_failed",
+                wallet_id=str(wallet_id),
+                duration_ms=duration,
+                error=str(exc),
+            )
+            raise
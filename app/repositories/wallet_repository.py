@@ -1,16 +1,69 @@
 import time
 import uuid
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import Update, or_, select, update
 from sqlalchemy.exc import IntegrityError
 
 from app.core.database import CoreDatabase
 from app.domain.interfaces.repositories import WalletRepositoryInterface
+from app.domain.schemas.wallet import WalletSort
 from app.models import Wallet
+from app.models.wallet import normalize_address
 from app.utils.logging import Audit
 
+_WALLET_ORDER = {
+    "balance_desc": (Wallet.balance_usd.desc(),),
+    "balance_asc": (Wallet.balance_usd.asc(),),
+    "address": (Wallet.address.asc(),),
+}
+
+
+def _newest_wins_update(
+    condition: Any, value_column: Any, as_of_column: Any, value: Any, as_of: Any
+) -> Update:
+    """Build an UPDATE of a cached wallet value that never moves back in time.
+
+    Wallets whose *as_of_column* is already newer than *as_of* are left alone,
+    so out-of-order writes cannot regress the value. *value* and *as_of* may
+    be literals or correlated SQL expressions.
+    """
+    return (
+        update(Wallet)
+        .where(
+            condition,
+            or_(as_of_column.is_(None), as_of_column <= as_of),
+        )
+        .values({value_column: value, as_of_column: as_of})
+        .execution_options(synchronize_session=False)
+    )
+
+
+def wallet_balance_update(condition: Any, balance_usd: Any, as_of: Any) -> Update:
+    """Build the UPDATE keeping ``Wallet.balance_usd`` in step with snapshots.
+
+    ``balance_usd`` is the net value (collateral minus borrowings) of the
+    wallet's latest portfolio snapshot. Snapshot writers execute the UPDATE in
+    their own session so the cached balance commits atomically with the
+    snapshot.
+    """
+    return _newest_wins_update(
+        condition, Wallet.balance_usd, Wallet.last_snapshot_at, balance_usd, as_of
+    )
+
+
+def wallet_holdings_update(condition: Any, holdings_usd: Any, as_of: Any) -> Update:
+    """Build the UPDATE keeping ``Wallet.holdings_usd`` in step with balances.
+
+    ``holdings_usd`` is the USD total of the wallet's latest historical
+    balance points; it is written by the balance point writers in the same
+    transaction as the points themselves.
+    """
+    return _newest_wins_update(
+        condition, Wallet.holdings_usd, Wallet.holdings_as_of, holdings_usd, as_of
+    )
+
 
 class WalletRepository(WalletRepositoryInterface):
     """Repository layer for wallet persistence operations."""
@@ -27,7 +80,7 @@ class WalletRepository(WalletRepositoryInterface):
         try:
             async with self.__database.get_session() as session:
                 result = await session.execute(
-                    select(Wallet).where(Wallet.address == address)
+                    select(Wallet).where(Wallet.address == normalize_address(address))
                 )
                 wallet = result.scalars().first()
 
@@ -50,6 +103,52 @@ class WalletRepository(WalletRepositoryInterface):
             )
             raise
 
+    async def get_by_user_and_address(
+        self, user_id: uuid.UUID, address: str
+    ) -> Optional[Wallet]:
+        """Get the wallet *address* owned by *user_id*.
+
+        Matches the ``uq_wallet_user_address`` unique constraint, so ownership
+        is checked by the same single indexed lookup that loads the wallet.
+        """
+        start_time = time.time()
+        self.__audit.info(
+            "wallet_repository_get_by_user_and_address_started",
+            user_id=str(user_id),
+            address=address,
+        )
+
+        try:
+            async with self.__database.get_session() as session:
+                result = await session.execute(
+                    select(Wallet).where(
+                        Wallet.user_id == user_id,
+                        Wallet.address == normalize_address(address),
+                    )
+                )
+                wallet = result.scalars().first()
+
+                duration = int((time.time() - start_time) * 1000)
+                self.__audit.info(
+                    "wallet_repository_get_by_user_and_address_success",
+                    user_id=str(user_id),
+                    address=address,
+                    found=wallet is not None,
+                    duration_ms=duration,
+                )
+
+                return wallet
+        except Exception as exc:
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.error(
+                "wallet_repository_get_by_user_and_address_failed",
+                user_id=str(user_id),
+                address=address,
+                duration_ms=duration,
+                error=str(exc),
+            )
+            raise
+
     async def create(
         self,
         address: str,
@@ -124,18 +223,25 @@ class WalletRepository(WalletRepositoryInterface):
             )
             raise
 
-    async def list_by_user(self, user_id: uuid.UUID) -> List[Wallet]:
-        """Return wallets owned by *user_id*."""
+    async def list_by_user(
+        self, user_id: uuid.UUID, sort: Optional[WalletSort] = None
+    ) -> List[Wallet]:
+        """Return wallets owned by *user_id*.
+
+        ``sort="balance_desc"``/``"balance_asc"`` order by the cached
+        ``balance_usd`` and are served by the ``(user_id, balance_usd)`` index.
+        """
         start_time = time.time()
         self.__audit.info(
-            "wallet_repository_list_by_user_started", user_id=str(user_id)
+            "wallet_repository_list_by_user_started", user_id=str(user_id), sort=sort
         )
 
         try:
+            query = select(Wallet).where(Wallet.user_id == user_id)
+            if sort is not None:
+                query = query.order_by(*_WALLET_ORDER[sort])
             async with self.__database.get_session() as session:
-                result = await session.execute(
-                    select(Wallet).where(Wallet.user_id == user_id)
-                )
+                result = await session.execute(query)
                 wallets = result.scalars().all()
 
                 duration = int((time.time() - start_time) * 1000)
@@ -157,6 +263,39 @@ class WalletRepository(WalletRepositoryInterface):
             )
             raise
 
+    async def list_tracked(self) -> List[Wallet]:
+        """Return every active wallet across all users.
+
+        Used by background jobs (e.g. the transaction indexer) that need the
+        full set of addresses to follow on-chain.
+        """
+        start_time = time.time()
+        self.__audit.info("wallet_repository_list_tracked_started")
+
+        try:
+            async with self.__database.get_session() as session:
+                result = await session.execute(
+                    select(Wallet).where(Wallet.is_active.is_(True))
+                )
+                wallets = result.scalars().all()
+
+                duration = int((time.time() - start_time) * 1000)
+                self.__audit.info(
+                    "wallet_repository_list_tracked_success",
+                    wallet_count=len(wallets),
+                    duration_ms=duration,
+                )
+
+                return wallets
+        except Exception as exc:
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.error(
+                "wallet_repository_list_tracked_failed",
+                duration_ms=duration,
+                error=str(exc),
+            )
+            raise
+
     async def delete(self, address: str, user_id: uuid.UUID) -> bool:
         """Delete wallet.
 
@@ -173,9 +312,12 @@ class WalletRepository(WalletRepositoryInterface):
 
         try:
             async with self.__database.get_session() as session:
-                # Get the wallet first
+                # Owner-scoped lookup on the (user_id, address) unique index
                 result = await session.execute(
-                    select(Wallet).where(Wallet.address == address)
+                    select(Wallet).where(
+                        Wallet.user_id == user_id,
+                        Wallet.address == normalize_address(address),
+                    )
                 )
                 wallet = result.scalars().first()
 
@@ -0,0 +1,223 @@
+"""Batched price-feed client for tokens referenced by tracked wallets.
+
+Prices come from a CoinGecko compatible ``/simple/token_price/{platform}``
+endpoint, which accepts many contract addresses per call. The service keeps
+the number of provider requests minimal:
+
+* addresses are de-duplicated and split into ``PRICE_FEED_BATCH_SIZE``
+  batches, one request each;
+* concurrent callers asking for an address that is already being fetched
+  await the in-flight request instead of issuing another one;
+* every request first takes a token from an :class:`AsyncTokenBucket` sized
+  to the provider's allowance, and a ``429`` drains the bucket and honours
+  ``Retry-After`` before retrying.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+import aiohttp
+
+from app.core.config import Configuration
+from app.domain.interfaces.repositories import TokenRepositoryInterface
+from app.domain.schemas.token_price import TokenPriceCreate
+from app.utils.logging import Audit
+from app.utils.token_bucket import AsyncTokenBucket
+
+
+class PriceFeedError(RuntimeError):
+    """Raised when the provider keeps failing after all retries."""
+
+
+class PriceQuote:
+    """USD price of one contract address as reported by the provider."""
+
+    __slots__ = ("price_usd", "timestamp")
+
+    def __init__(self, price_usd: float, timestamp: datetime):
+        self.price_usd = price_usd
+        self.timestamp = timestamp
+
+
+def _batches(items: List[str], size: int) -> Iterable[List[str]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class PriceFeedService:
+    """Fetch current USD prices of tracked tokens in as few calls as possible."""
+
+    def __init__(
+        self,
+        token_repo: TokenRepositoryInterface,
+        config: Configuration,
+        audit: Audit,
+        bucket: Optional[AsyncTokenBucket] = None,
+    ):
+        self.__token_repo = token_repo
+        self.__config = config
+        self.__audit = audit
+        self.__bucket = bucket or AsyncTokenBucket(
+            rate=config.PRICE_FEED_RATE_PER_MIN / 60,
+            capacity=config.PRICE_FEED_BURST,
+        )
+        self.__inflight: Dict[str, asyncio.Future] = {}
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def collect(self) -> List[TokenPriceCreate]:
+        """Fetch prices for every tracked token.
+
+        Returns:
+            One :class:`TokenPriceCreate` per token the provider priced, ready
+            for the bulk token-price write path.
+        """
+        tokens = await self.__token_repo.list_tracked()
+        by_address = {t.address.lower(): t for t in tokens if t.address}
+        self.__audit.info("price_feed_collect_started", token_count=len(by_address))
+
+        quotes = await self.fetch_prices(by_address.keys())
+        items = [
+            TokenPriceCreate(
+                token_id=by_address[address].id,
+                price_usd=quote.price_usd,
+                timestamp=quote.timestamp,
+            )
+            for address, quote in quotes.items()
+            if address in by_address
+        ]
+
+        self.__audit.info(
+            "price_feed_collect_success",
+            token_count=len(by_address),
+            priced=len(items),
+        )
+        return items
+
+    async def fetch_prices(self, addresses: Iterable[str]) -> Dict[str, PriceQuote]:
+        """Return quotes keyed by lower-cased address.
+
+        Addresses the provider does not know are omitted. Requests for
+        addresses already being fetched by another caller are coalesced onto
+        that request.
+        """
+        wanted = list(dict.fromkeys(a.lower() for a in addresses if a))
+        waiting = {a: self.__inflight[a] for a in wanted if a in self.__inflight}
+        missing = [a for a in wanted if a not in waiting]
+
+        loop = asyncio.get_running_loop()
+        owned = {a: loop.create_future() for a in missing}
+        self.__inflight.update(owned)
+        try:
+            if missing:
+                timeout = aiohttp.ClientTimeout(
+                    total=self.__config.PRICE_FEED_TIMEOUT_SEC
+                )
+                async with aiohttp.ClientSession(timeout=timeout) as http:
+                    await asyncio.gather(
+                        *(
+                            self._fetch_batch(http, batch, owned)
+                            for batch in _batches(
+                                missing, self.__config.PRICE_FEED_BATCH_SIZE
+                            )
+                        )
+                    )
+        except BaseException as exc:
+            for future in owned.values():
+                if not future.done():
+                    future.set_exception(exc)
+            raise
+        finally:
+            for address in owned:
+                self.__inflight.pop(address, None)
+
+        results: Dict[str, PriceQuote] = {}
+        for address, future in {**waiting, **owned}.items():
+            try:
+                quote = await future
+            except Exception:  # noqa: BLE001 – failure belongs to its owner
+                continue
+            if quote is not None:
+                results[address] = quote
+        return results
+
+    # ------------------------------------------------------------------
+    # Provider access
+    # ------------------------------------------------------------------
+
+    async def _fetch_batch(
+        self,
+        http: aiohttp.ClientSession,
+        batch: List[str],
+        futures: Dict[str, asyncio.Future],
+    ) -> None:
+        """Fetch one batch and resolve its futures (``None`` = not priced)."""
+        payload = await self._request(http, batch)
+        now = datetime.now(timezone.utc)
+        for address in batch:
+            entry = payload.get(address) or payload.get(address.lower()) or {}
+            quote = None
+            if entry.get("usd") is not None:
+                updated = entry.get("last_updated_at")
+                quote = PriceQuote(
+                    price_usd=float(entry["usd"]),
+                    timestamp=(
+                        datetime.fromtimestamp(updated, tz=timezone.utc)
+                        if updated
+                        else now
+                    ),
+                )
+            futures[address].set_result(quote)
+
+    async def _request(self, http: aiohttp.ClientSession, batch: List[str]) -> dict:
+        """GET one batch, retrying on 429 / 5xx with provider-driven backoff."""
+        url = (
+            f"{self.__config.PRICE_FEED_BASE_URL.rstrip('/')}"
+            f"/simple/token_price/{self.__config.PRICE_FEED_PLATFORM}"
+        )
+        params = {
+            "contract_addresses": ",".join(batch),
+            "vs_currencies": "usd",
+            "include_last_updated_at": "true",
+        }
+        headers = {}
+        if self.__config.COINGECKO_API_KEY:
+            headers[
+                self.__config.PRICE_FEED_API_KEY_HEADER
+            ] = self.__config.COINGECKO_API_KEY
+
+        attempts = self.__config.PRICE_FEED_MAX_RETRIES + 1
+        for attempt in range(attempts):
+            await self.__bucket.acquire()
+            async with http.get(url, params=params, headers=headers) as resp:
+                if resp.status == 200:
+                    data = await resp.json(content_type=None)
+                    return {k.lower(): v for k, v in (data or {}).items()}
+                if resp.status != 429 and resp.status < 500:
+                    raise PriceFeedError(f"Price provider returned HTTP {resp.status}")
+                delay = self._retry_after(resp, attempt)
+
+            self.__audit.warning(
+                "price_feed_request_retry",
+                status=resp.status,
+                attempt=attempt + 1,
+                delay_sec=delay,
+            )
+            if resp.status == 429:
+                # Everybody waits: the provider says we are over the limit
+                self.__bucket.drain()
+            await asyncio.sleep(delay)
+
+        raise PriceFeedError(f"Price provider still failing after {attempts} attempts")
+
+    @staticmethod
+    def _retry_after(resp: aiohttp.ClientResponse, attempt: int) -> float:
+        header = resp.headers.get("Retry-After")
+        try:
+            return max(0.0, float(header)) if header is not None else 2.0**attempt
+        except ValueError:
+            return 2.0**attempt
@@ -0,0 +1,441 @@
+"""Incremental on-chain event-log indexer for tracked wallets.
+
+The indexer scans ERC-20 ``Transfer`` logs and Aave v3 compatible lending pool
+events (``Supply`` / ``Withdraw`` / ``Borrow`` / ``Repay``) touching tracked
+wallet addresses and bulk-upserts them into the ``transactions`` table.
+
+Block ranges are split into chunks fetched concurrently (bounded by
+``INDEXER_CONCURRENCY``).  When a provider refuses a range because it would
+return too many logs, the range is bisected until it fits.  After each window
+of chunks has been persisted a per-chain checkpoint is written so an
+interrupted run – or a year-long backfill – resumes where it stopped instead
+of starting over.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Iterable, Optional
+
+from eth_utils import keccak
+from pydantic import BaseModel
+
+from app.core.config import Configuration
+from app.domain.interfaces.repositories import (
+    IndexerCheckpointRepositoryInterface,
+    TokenRepositoryInterface,
+    TransactionRepositoryInterface,
+    WalletRepositoryInterface,
+)
+from app.utils.logging import Audit
+
+
+def _topic(signature: str) -> str:
+    return "0x" + keccak(text=signature).hex()
+
+
+TRANSFER_TOPIC = _topic("Transfer(address,address,uint256)")
+
+# topic0 -> (transaction type, index of the ``amount`` word in log data)
+LENDING_EVENTS: dict[str, tuple[str, int]] = {
+    _topic("Supply(address,address,address,uint256,uint16)"): ("SUPPLY", 1),
+    _topic("Withdraw(address,address,address,uint256)"): ("WITHDRAW", 0),
+    _topic("Borrow(address,address,address,uint256,uint8,uint256,uint16)"): (
+        "BORROW",
+        1,
+    ),
+    _topic("Repay(address,address,address,uint256,bool)"): ("REPAY", 0),
+}
+
+# Providers cap the number of OR-ed topic values per filter.
+_ADDRESS_BATCH_SIZE = 200
+_BLOCK_TIMESTAMP_CACHE_SIZE = 4096
+# Numeric(18, 8) holds at most 10 integer digits.
+_MAX_AMOUNT = Decimal(10) ** 10
+_AMOUNT_QUANTUM = Decimal("1e-8")
+
+# Substrings of provider error messages meaning "ask for a smaller range".
+_RANGE_ERROR_MARKERS = (
+    "more than",
+    "too many",
+    "limit exceeded",
+    "response size",
+    "block range",
+    "range is too large",
+    "query timeout",
+    "-32005",
+)
+
+
+class IndexerNotConfiguredError(RuntimeError):
+    """Raised when no RPC provider is configured for the indexer."""
+
+
+class IndexerRunResult(BaseModel):
+    """Summary of a single indexer run."""
+
+    chain_id: int
+    stream: str
+    from_block: Optional[int] = None
+    to_block: Optional[int] = None
+    logs: int = 0
+    transactions: int = 0
+
+
+def _hex(value: Any) -> str:
+    """Normalise bytes / HexBytes / str values to a lower-case ``0x`` string."""
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + bytes(value).hex()
+    value = str(value).lower()
+    return value if value.startswith("0x") else "0x" + value
+
+
+def _topic_to_address(topic: Any) -> str:
+    return "0x" + _hex(topic)[-40:]
+
+
+def _address_to_topic(address: str) -> str:
+    return "0x" + address.lower()[2:].rjust(64, "0")
+
+
+def _data_word(data: Any, index: int) -> int:
+    raw = _hex(data)[2:]
+    word = raw[index * 64 : (index + 1) * 64]
+    return int(word, 16) if word else 0
+
+
+def _is_range_error(exc: Exception) -> bool:
+    message = str(exc).lower()
+    return any(marker in message for marker in _RANGE_ERROR_MARKERS)
+
+
+class TransactionIndexerService:
+    """Scan event logs for tracked wallets and persist them as transactions."""
+
+    def __init__(
+        self,
+        transaction_repo: TransactionRepositoryInterface,
+        checkpoint_repo: IndexerCheckpointRepositoryInterface,
+        wallet_repo: WalletRepositoryInterface,
+        token_repo: TokenRepositoryInterface,
+        config: Configuration,
+        audit: Audit,
+        web3: Any = None,
+    ):
+        self.__transaction_repo = transaction_repo
+        self.__checkpoint_repo = checkpoint_repo
+        self.__wallet_repo = wallet_repo
+        self.__token_repo = token_repo
+        self.__config = config
+        self.__audit = audit
+        self.__web3 = web3
+        self.__block_timestamps: OrderedDict[int, int] = OrderedDict()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def run(self, max_blocks: Optional[int] = None) -> IndexerRunResult:
+        """Index from the live checkpoint up to the confirmed chain head."""
+        chain_id = self.__config.INDEXER_CHAIN_ID
+        w3 = self._get_web3()
+        safe_head = await w3.eth.block_number - self.__config.INDEXER_CONFIRMATIONS
+
+        checkpoint = await self.__checkpoint_repo.get(chain_id)
+        if checkpoint is not None:
+            start = checkpoint.last_block + 1
+        elif self.__config.INDEXER_START_BLOCK is not None:
+            start = self.__config.INDEXER_START_BLOCK
+        else:
+            start = max(0, safe_head - self.__config.INDEXER_INITIAL_LOOKBACK_BLOCKS)
+
+        limit = max_blocks or self.__config.INDEXER_MAX_BLOCKS_PER_RUN
+        end = min(safe_head, start + limit - 1)
+        return await self._index(w3, chain_id, "live", start, end)
+
+    async def backfill(
+        self, from_block: int, to_block: int, max_blocks: Optional[int] = None
+    ) -> IndexerRunResult:
+        """Index a historical range under its own resumable checkpoint.
+
+        Re-running with the same *from_block* continues after the last
+        persisted window; *max_blocks* bounds the work done per call.
+        """
+        chain_id = self.__config.INDEXER_CHAIN_ID
+        stream = f"backfill-{from_block}"
+        checkpoint = await self.__checkpoint_repo.get(chain_id, stream)
+        start = checkpoint.last_block + 1 if checkpoint is not None else from_block
+        end = to_block
+        if max_blocks:
+            end = min(end, start + max_blocks - 1)
+        return await self._index(self._get_web3(), chain_id, stream, start, end)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _get_web3(self):
+        """Return the injected client or build an ``AsyncWeb3`` for this run."""
+        if self.__web3 is not None:
+            return self.__web3
+
+        uri = self.__config.WEB3_PROVIDER_URI
+        if not uri:
+            raise IndexerNotConfiguredError("WEB3_PROVIDER_URI is not configured")
+
+        # Imported lazily – web3 is heavy and only needed by worker processes.
+        from web3 import AsyncHTTPProvider, AsyncWeb3
+
+        return AsyncWeb3(AsyncHTTPProvider(uri))
+
+    async def _index(
+        self, w3: Any, chain_id: int, stream: str, start: int, end: int
+    ) -> IndexerRunResult:
+        result = IndexerRunResult(chain_id=chain_id, stream=stream)
+        if start > end:
+            return result
+
+        self.__audit.info(
+            "transaction_indexer_run_started",
+            chain_id=chain_id,
+            stream=stream,
+            from_block=start,
+            to_block=end,
+        )
+        result.from_block = start
+
+        try:
+            wallets_by_address = await self._tracked_wallets()
+            semaphore = asyncio.Semaphore(max(1, self.__config.INDEXER_CONCURRENCY))
+            chunk = max(1, self.__config.INDEXER_CHUNK_SIZE)
+            window = chunk * max(1, self.__config.INDEXER_CONCURRENCY)
+
+            cursor = start
+            while cursor <= end:
+                window_end = min(end, cursor + window - 1)
+                if wallets_by_address:
+                    ranges = [
+                        (a, min(a + chunk - 1, window_end))
+                        for a in range(cursor, window_end + 1, chunk)
+                    ]
+                    batches = await asyncio.gather(
+                        *(
+                            self._fetch_logs(
+                                w3, semaphore, a, b, list(wallets_by_address)
+                            )
+                            for a, b in ranges
+                        )
+                    )
+                    logs = [log for batch in batches for log in batch]
+                    rows = await self._build_rows(
+                        w3, semaphore, chain_id, logs, wallets_by_address
+                    )
+                    await self.__transaction_repo.bulk_upsert(rows)
+                    result.logs += len(logs)
+                    result.transactions += len(rows)
+
+                await self.__checkpoint_repo.save(chain_id, window_end, stream)
+                result.to_block = window_end
+                cursor = window_end + 1
+
+            self.__audit.info(
+                "transaction_indexer_run_success",
+                chain_id=chain_id,
+                stream=stream,
+                from_block=start,
+                to_block=end,
+                logs=result.logs,
+                transactions=result.transactions,
+            )
+            return result
+        except Exception as exc:
+            self.__audit.error(
+                "transaction_indexer_run_failed",
+                chain_id=chain_id,
+                stream=stream,
+                from_block=start,
+                checkpoint=result.to_block,
+                error=str(exc),
+            )
+            raise
+
+    async def _tracked_wallets(self) -> dict[str, list[Any]]:
+        """Map lower-cased address -> wallet ids following it."""
+        wallets_by_address: dict[str, list[Any]] = {}
+        for wallet in await self.__wallet_repo.list_tracked():
+            wallets_by_address.setdefault(wallet.address.lower(), []).append(wallet.id)
+        return wallets_by_address
+
+    async def _fetch_logs(
+        self,
+        w3: Any,
+        semaphore: asyncio.Semaphore,
+        from_block: int,
+        to_block: int,
+        addresses: list[str],
+    ) -> list[Any]:
+        """Fetch every relevant log for one chunk of blocks."""
+        filters: list[dict[str, Any]] = []
+        pools = self.__config.INDEXER_LENDING_POOL_ADDRESSES
+        for i in range(0, len(addresses), _ADDRESS_BATCH_SIZE):
+            batch = addresses[i : i + _ADDRESS_BATCH_SIZE]
+            topics = [_address_to_topic(a) for a in batch]
+            filters.append({"topics": [TRANSFER_TOPIC, topics]})
+            filters.append({"topics": [TRANSFER_TOPIC, None, topics]})
+            if pools:
+                filters.append(
+                    {
+                        "address": pools,
+                        "topics": [list(LENDING_EVENTS), None, topics],
+                    }
+                )
+
+        batches = await asyncio.gather(
+            *(
+                self._get_logs_adaptive(w3, semaphore, f, from_block, to_block)
+                for f in filters
+            )
+        )
+        # IN and OUT filters both match self-transfers – dedupe on position.
+        unique: dict[tuple[str, int], Any] = {}
+        for log in (log for batch in batches for log in batch):
+            unique[(_hex(log["transactionHash"]), int(log["logIndex"]))] = log
+        return list(unique.values())
+
+    async def _get_logs_adaptive(
+        self,
+        w3: Any,
+        semaphore: asyncio.Semaphore,
+        log_filter: dict[str, Any],
+        from_block: int,
+        to_block: int,
+    ) -> list[Any]:
+        """``eth_getLogs`` that bisects the range when the provider caps it."""
+        try:
+            async with semaphore:
+                return list(
+                    await w3.eth.get_logs(
+                        {**log_filter, "fromBlock": from_block, "toBlock": to_block}
+                    )
+                )
+        except Exception as exc:
+            if from_block >= to_block or not _is_range_error(exc):
+                raise
+            mid = (from_block + to_block) // 2
+            self.__audit.debug(
+                "transaction_indexer_range_split",
+                from_block=from_block,
+                to_block=to_block,
+                error=str(exc),
+            )
+            left, right = await asyncio.gather(
+                self._get_logs_adaptive(w3, semaphore, log_filter, from_block, mid),
+                self._get_logs_adaptive(w3, semaphore, log_filter, mid + 1, to_block),
+            )
+            return left + right
+
+    async def _block_timestamps(
+        self, w3: Any, semaphore: asyncio.Semaphore, numbers: Iterable[int]
+    ) -> dict[int, int]:
+        """Return block timestamps, fetching only those not cached yet."""
+        cache = self.__block_timestamps
+        found = {n: cache[n] for n in set(numbers) if n in cache}
+        missing = [n for n in set(numbers) if n not in found]
+
+        async def _fetch(number: int) -> tuple[int, int]:
+            async with semaphore:
+                block = await w3.eth.get_block(number)
+            return number, int(block["timestamp"])
+
+        for number, ts in await asyncio.gather(*(_fetch(n) for n in missing)):
+            found[number] = ts
+            cache[number] = ts
+            if len(cache) > _BLOCK_TIMESTAMP_CACHE_SIZE:
+                cache.popitem(last=False)
+
+        return found
+
+    async def _build_rows(
+        self,
+        w3: Any,
+        semaphore: asyncio.Semaphore,
+        chain_id: int,
+        logs: list[Any],
+        wallets_by_address: dict[str, list[Any]],
+    ) -> list[dict[str, Any]]:
+        """Convert raw logs into ``transactions`` rows, one per wallet side."""
+        if not logs:
+            return []
+
+        block_numbers = [int(log["blockNumber"]) for log in logs]
+        timestamps = await self._block_timestamps(w3, semaphore, block_numbers)
+
+        events: list[tuple[Any, str, str, str, str, int]] = []
+        token_addresses: set[str] = set()
+        for log in logs:
+            topics = [_hex(t) for t in log["topics"]]
+            if not topics:
+                continue
+            topic0 = topics[0]
+            if topic0 == TRANSFER_TOPIC and len(topics) == 3:
+                # Four-topic transfers are ERC-721 and carry no amount.
+                token = _hex(log["address"])
+                sender = _topic_to_address(topics[1])
+                receiver = _topic_to_address(topics[2])
+                amount = _data_word(log["data"], 0)
+                if receiver in wallets_by_address:
+                    events.append((log, "IN", token, sender, receiver, amount))
+                if sender in wallets_by_address and sender != receiver:
+                    events.append((log, "OUT", token, sender, receiver, amount))
+                token_addresses.add(token)
+            elif topic0 in LENDING_EVENTS and len(topics) >= 3:
+                tx_type, amount_word = LENDING_EVENTS[topic0]
+                reserve = _topic_to_address(topics[1])
+                account = _topic_to_address(topics[2])
+                amount = _data_word(log["data"], amount_word)
+                pool = _hex(log["address"])
+                events.append((log, tx_type, reserve, account, pool, amount))
+                token_addresses.add(reserve)
+
+        tokens = await self.__token_repo.get_by_addresses(token_addresses)
+
+        rows: list[dict[str, Any]] = []
+        for log, tx_type, token_address, sender, receiver, raw_amount in events:
+            token = tokens.get(token_address)
+            decimals = token.decimals if token is not None else 18
+            amount = (Decimal(raw_amount).scaleb(-decimals)).quantize(_AMOUNT_QUANTUM)
+            overflow = amount >= _MAX_AMOUNT
+            tx_hash = _hex(log["transactionHash"])
+            log_index = int(log["logIndex"])
+            block_number = int(log["blockNumber"])
+            wallet_address = sender if tx_type != "IN" else receiver
+
+            for wallet_id in wallets_by_address.get(wallet_address, ()):
+                rows.append(
+                    {
+                        "hash": tx_hash,
+                        "log_index": log_index,
+                        "wallet_id": wallet_id,
+                        "token_id": token.id if token is not None else None,
+                        "type": tx_type,
+                        "amount": Decimal(0) if overflow else amount,
+                        "usd_value": None,
+                        "timestamp": datetime.fromtimestamp(
+                            timestamps[block_number], tz=timezone.utc
+                        ).replace(tzinfo=None),
+                        "from_address": sender,
+                        "to_address": receiver,
+                        "extra_metadata": {
+                            "chain_id": chain_id,
+                            "tx_hash": tx_hash,
+                            "log_index": log_index,
+                            "block_number": block_number,
+                            "contract": token_address,
+                            "raw_amount": str(raw_amount),
+                            "amount_overflow": overflow,
+                        },
+                    }
+                )
+        return rows
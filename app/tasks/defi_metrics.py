@@ -0,0 +1,59 @@
+"""Celery task keeping hot aggregate DeFi metrics warm.
+
+Recomputes cache entries that were read recently and are missing or about
+to expire, so dashboard reads are served from cache instead of waiting for
+a recomputation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+from app.celery_app import celery, di_container
+from app.utils.logging import Audit
+from app.utils.redis_lock import acquire_lock
+
+
+def _build_redis_client():  # pragma: no cover – isolation for patching
+    """Return an *async* Redis client instance configured from environment."""
+
+    from redis.asyncio import Redis
+
+    return Redis.from_url(di_container.get_core("config").redis_url)
+
+
+async def _refresh_metrics() -> Optional[int]:
+    """Refresh hot entries once under a distributed lock."""
+    config = di_container.get_core("config")
+    database = di_container.get_core("database")
+
+    redis = _build_redis_client()
+    try:
+        async with acquire_lock(
+            redis,
+            "defi_metrics_refresh",
+            timeout=config.DEFI_METRICS_REFRESH_LOCK_TTL_SEC,
+        ) as got_lock:
+            if not got_lock:
+                Audit.debug("DeFi metrics refresh: lock not acquired – skipping run.")
+                return None
+            return await di_container.get_usecase(
+                "defi_aggregate"
+            ).refresh_hot_metrics()
+    finally:
+        await redis.close()
+        # Each task invocation runs in a fresh event loop; pooled connections
+        # bound to the previous loop must not be reused.
+        await di_container.get_utility("metrics_cache_utils").close()
+        await database.dispose()
+
+
+@celery.task(bind=True, name="app.tasks.defi_metrics.refresh_defi_metrics_task")
+def refresh_defi_metrics_task(self):  # noqa: D401 – Celery signature
+    """Refresh aggregate DeFi metrics of recently read wallets."""
+    try:
+        return asyncio.run(_refresh_metrics())
+    except Exception as exc:  # pragma: no cover – capture unexpected errors
+        Audit.error("DeFi metrics refresh failed", error=str(exc))
+        raise self.retry(exc=exc, countdown=30)
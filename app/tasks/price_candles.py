@@ -0,0 +1,39 @@
+"""Celery task refreshing the optional OHLC candle rollup.
+
+Re-aggregates raw ``token_prices`` of the last
+``PRICE_CANDLE_ROLLUP_LOOKBACK_HOURS`` into ``token_price_candles``. The
+upsert is idempotent, so overlapping runs are harmless.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+from app.celery_app import celery, di_container
+from app.utils.logging import Audit
+
+
+async def _refresh_candles() -> Optional[dict]:
+    """Run one rollup refresh and release pooled connections afterwards."""
+    config = di_container.get_core("config")
+    if not config.PRICE_CANDLE_ROLLUP_ENABLED:
+        return None
+
+    database = di_container.get_core("database")
+    try:
+        return await di_container.get_usecase("token_price").refresh_price_candles()
+    finally:
+        # Each task invocation runs in a fresh event loop; pooled connections
+        # bound to the previous loop must not be reused.
+        await database.dispose()
+
+
+@celery.task(bind=True, name="app.tasks.price_candles.rollup_price_candles_task")
+def rollup_price_candles_task(self):  # noqa: D401 – Celery signature
+    """Refresh recent OHLC candles when the rollup is enabled."""
+    try:
+        return asyncio.run(_refresh_candles())
+    except Exception as exc:  # pragma: no cover – capture unexpected errors
+        Audit.error("Price candle rollup failed", error=str(exc))
+        raise self.retry(exc=exc, countdown=60)
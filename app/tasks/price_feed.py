@@ -0,0 +1,68 @@
+"""Celery task ingesting current prices of tracked tokens.
+
+Fetching and request coalescing live in
+:class:`~app.services.price_feed_service.PriceFeedService`; this module adds
+single-worker locking and writes the quotes through the bulk token-price
+path, which also refreshes the latest-price index.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+from app.celery_app import celery, di_container
+from app.domain.schemas.bulk import MAX_BATCH_SIZE
+from app.domain.schemas.token_price import TokenPriceBatchCreate
+from app.utils.logging import Audit
+from app.utils.redis_lock import acquire_lock
+
+
+def _build_redis_client():  # pragma: no cover – isolation for patching
+    """Return an *async* Redis client instance configured from environment."""
+
+    from redis.asyncio import Redis
+
+    return Redis.from_url(di_container.get_core("config").redis_url)
+
+
+async def _ingest_prices() -> Optional[dict]:
+    """Fetch and store prices once under a distributed lock."""
+    config = di_container.get_core("config")
+    database = di_container.get_core("database")
+    price_feed = di_container.get_service("price_feed")
+    token_price_uc = di_container.get_usecase("token_price")
+
+    redis = _build_redis_client()
+    try:
+        async with acquire_lock(
+            redis, "price_feed", timeout=config.PRICE_FEED_LOCK_TTL_SEC
+        ) as got_lock:
+            if not got_lock:
+                Audit.debug("Price feed: lock not acquired – skipping run.")
+                return None
+
+            items = await price_feed.collect()
+            written = 0
+            for start in range(0, len(items), MAX_BATCH_SIZE):
+                batch = TokenPriceBatchCreate(
+                    items=items[start : start + MAX_BATCH_SIZE]
+                )
+                written += (await token_price_uc.create_token_prices(batch)).count
+            return {"priced": len(items), "written": written}
+    finally:
+        await redis.close()
+        # Each task invocation runs in a fresh event loop; pooled connections
+        # bound to the previous loop must not be reused.
+        await database.dispose()
+
+
+@celery.task(bind=True, name="app.tasks.price_feed.ingest_prices_task")
+def ingest_prices_task(self):  # noqa: D401 – Celery signature
+    """Fetch current USD prices for tokens held or traded by tracked wallets."""
+    try:
+        return asyncio.run(_ingest_prices())
+    except Exception as exc:  # pragma: no cover – capture unexpected errors
+        Audit.error("Price feed ingestion failed", error=str(exc))
+        retry_delay = min(15 * 60, (self.request.retries + 1) * 60)
+        raise self.retry(exc=exc, countdown=retry_delay)
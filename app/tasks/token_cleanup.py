@@ -0,0 +1,68 @@
+"""Celery task deleting expired and used single-use tokens.
+
+Refresh, email-verification and password-reset tokens are only read by
+their unique hash, but their tables otherwise grow forever. Each run
+deletes expired (and revoked or used) rows in ``TOKEN_SWEEP_BATCH_SIZE``
+batches, committing and pausing ``TOKEN_SWEEP_PAUSE_SEC`` between batches,
+and reports the rows removed per table.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict
+
+from app.celery_app import celery, di_container
+from app.utils.logging import Audit
+
+# Repository name → table swept through its ``delete_expired_batch``
+SWEPT_REPOSITORIES = {
+    "refresh_token": "refresh_tokens",
+    "email_verification": "email_verification_tokens",
+    "password_reset": "password_reset_tokens",
+}
+
+
+async def _sweep_repository(repository, config, cutoff: datetime) -> int:
+    batch_size = config.TOKEN_SWEEP_BATCH_SIZE
+    removed = 0
+    for batch in range(config.TOKEN_SWEEP_MAX_BATCHES):
+        if batch:
+            await asyncio.sleep(config.TOKEN_SWEEP_PAUSE_SEC)
+        count = await repository.delete_expired_batch(batch_size, before=cutoff)
+        removed += count
+        if count < batch_size:
+            break
+    return removed
+
+
+async def _sweep_expired_tokens() -> Dict[str, int]:
+    """Sweep every token table once and release pooled connections."""
+    config = di_container.get_core("config")
+    database = di_container.get_core("database")
+    # One cutoff per run so later batches do not chase newly expired rows
+    cutoff = datetime.now(timezone.utc)
+    try:
+        removed = {
+            table: await _sweep_repository(
+                di_container.get_repository(name), config, cutoff
+            )
+            for name, table in SWEPT_REPOSITORIES.items()
+        }
+    finally:
+        # Each task invocation runs in a fresh event loop; pooled connections
+        # bound to the previous loop must not be reused.
+        await database.dispose()
+    Audit.info("Expired tokens swept", **removed)
+    return removed
+
+
+@celery.task(bind=True, name="app.tasks.token_cleanup.sweep_expired_tokens_task")
+def sweep_expired_tokens_task(self):  # noqa: D401 – Celery signature
+    """Delete expired and used tokens in bounded batches."""
+    try:
+        return asyncio.run(_sweep_expired_tokens())
+    except Exception as exc:  # pragma: no cover – capture unexpected errors
+        Audit.error("Expired token sweep failed", error=str(exc))
+        raise self.retry(exc=exc, countdown=300)
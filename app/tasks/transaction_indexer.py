@@ -0,0 +1,103 @@
+"""Celery task driving the incremental on-chain transaction indexer.
+
+The heavy lifting lives in
+:class:`~app.services.transaction_indexer_service.TransactionIndexerService`;
+this module only adds single-worker locking, retries and the event-loop
+plumbing Celery needs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+from app.celery_app import celery, di_container
+from app.services.transaction_indexer_service import IndexerNotConfiguredError
+from app.utils.logging import Audit
+from app.utils.redis_lock import acquire_lock
+
+
+def _build_redis_client():  # pragma: no cover – isolation for patching
+    """Return an *async* Redis client instance configured from environment."""
+
+    from redis.asyncio import Redis
+
+    return Redis.from_url(di_container.get_core("config").redis_url)
+
+
+async def _run_indexer(
+    from_block: Optional[int] = None,
+    to_block: Optional[int] = None,
+    max_blocks: Optional[int] = None,
+) -> Optional[dict]:
+    """Run the indexer once under a distributed lock.
+
+    The live stream and each backfill stream use distinct locks so a long
+    backfill never blocks head-following runs.
+    """
+    config = di_container.get_core("config")
+    database = di_container.get_core("database")
+    indexer = di_container.get_service("transaction_indexer")
+
+    lock_name = "transaction_indexer"
+    if from_block is not None:
+        lock_name = f"transaction_indexer:backfill:{from_block}"
+
+    redis = _build_redis_client()
+    try:
+        async with acquire_lock(
+            redis, lock_name, timeout=config.INDEXER_LOCK_TTL_SEC
+        ) as got_lock:
+            if not got_lock:
+                Audit.debug("Transaction indexer: lock not acquired – skipping run.")
+                return None
+
+            if from_block is not None and to_block is not None:
+                result = await indexer.backfill(from_block, to_block, max_blocks)
+            else:
+                result = await indexer.run(max_blocks)
+            return result.model_dump()
+    finally:
+        await redis.close()
+        # Each task invocation runs in a fresh event loop; pooled connections
+        # bound to the previous loop must not be reused.
+        await database.dispose()
+
+
+@celery.task(bind=True, name="app.tasks.transaction_indexer.index_transactions_task")
+def index_transactions_task(
+    self,
+    from_block: Optional[int] = None,
+    to_block: Optional[int] = None,
+    max_blocks: Optional[int] = None,
+):  # noqa: D401 – Celery signature
+    """Index new ERC-20 / lending logs for tracked wallets.
+
+    Called without arguments by celery beat to follow the chain head. Passing
+    ``from_block``/``to_block`` runs a resumable backfill of that range; the
+    task re-enqueues itself until the range is fully indexed.
+    """
+    try:
+        result = asyncio.run(_run_indexer(from_block, to_block, max_blocks))
+    except IndexerNotConfiguredError as exc:
+        Audit.warning("Transaction indexer disabled", reason=str(exc))
+        return None
+    except Exception as exc:  # pragma: no cover – capture unexpected errors
+        Audit.error("Transaction indexer failed", error=str(exc))
+        retry_delay = min(15 * 60, (self.request.retries + 1) * 60)
+        raise self.retry(exc=exc, countdown=retry_delay)
+
+    if (
+        result is not None
+        and to_block is not None
+        and result.get("to_block") is not None
+        and result["to_block"] < to_block
+    ):
+        self.apply_async(
+            kwargs={
+                "from_block": from_block,
+                "to_block": to_block,
+                "max_blocks": max_blocks,
+            }
+        )
+    return result
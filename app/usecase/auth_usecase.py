@@ -7,6 +7,7 @@ FastAPI adapters and domain/infrastructure layers.
 """
 from __future__ import annotations
 
+import time
 from datetime import timedelta
 from hashlib import sha256
 from typing import Optional
@@ -26,9 +27,9 @@ from app.repositories.email_verification_repository import (
 from app.repositories.refresh_token_repository import RefreshTokenRepository
 from app.repositories.user_repository import UserRepository
 from app.services.email_service import EmailService
-from app.utils import security
 from app.utils.jwt import JWTUtils
 from app.utils.logging import Audit
+from app.utils.security import PasswordHasher
 from app.utils.token import generate_verification_token
 
 
@@ -50,6 +51,7 @@ class AuthUsecase:
         refresh_token_repository: RefreshTokenRepository,
         email_service: EmailService,
         jwt_utils: JWTUtils,
+        password_hasher: PasswordHasher,
         config: Configuration,
         audit: Audit,
     ):
@@ -59,8 +61,18 @@ class AuthUsecase:
         self.__refresh_token_repo = refresh_token_repository
         self.__email_service = email_service
         self.__jwt_utils = jwt_utils
+        self.__password_hasher = password_hasher
         self.__config_service = config
         self.__audit = audit
+        self.__dummy_hash: Optional[str] = None
+
+    async def _dummy_hash(self) -> str:
+        """Hash verified for unknown users, so their logins cost the same time."""
+        if self.__dummy_hash is None:
+            self.__dummy_hash = await self.__password_hasher.hash_password_async(
+                "dummypassword123!@#"
+            )
+        return self.__dummy_hash
 
     async def register(  # noqa: D401 – business method
         self,
@@ -89,7 +101,7 @@ class AuthUsecase:
             self.__audit.warning("User already exists", email=payload.email)
             raise DuplicateError("email")
 
-        hashed_pw = security.get_password_hash(payload.password)
+        hashed_pw = await self.__password_hasher.hash_password_async(payload.password)
 
         user = User(
             username=payload.username,
@@ -158,16 +170,10 @@ class AuthUsecase:
         # Constant-time password verification
         # ------------------------------------------------------------------
         if user is None:
-            # Generate a dummy hash once (module-level cache) to keep timing
-            # consistent. passlib context handles constant-time comparison.
-            from functools import lru_cache
-
-            @lru_cache(maxsize=1)
-            def _dummy_hash() -> str:  # pragma: no cover – trivial helper
-                return security.get_password_hash("dummypassword123!@#")
-
             # Constant-time verification against dummy hash to equalise timing
-            security.verify_password(password, _dummy_hash())
+            await self.__password_hasher.verify_password_async(
+                password, await self._dummy_hash()
+            )
             self.__audit.error(
                 "AUTH_FAILURE", reason="invalid_credentials", identity=identity_lc
             )
@@ -179,7 +185,9 @@ class AuthUsecase:
             )
             raise InactiveUserError()
 
-        if not security.verify_password(password, user.hashed_password):
+        if not await self.__password_hasher.verify_password_async(
+            password, user.hashed_password
+        ):
             self.__audit.error(
                 "AUTH_FAILURE", reason="invalid_credentials", user_id=str(user.id)
             )
@@ -266,12 +274,12 @@ class AuthUsecase:
             self.__audit.error("Invalid token payload", payload=payload)
             raise InvalidCredentialsError()
 
-        # Verify token exists and not revoked/expired in DB
+        # Verify token exists and is not revoked (mirrored in Redis when set)
         jti_hash = sha256(jti.encode()).hexdigest()
-        token_obj = await self.__refresh_token_repo.get_by_jti_hash(jti_hash)
+        token_state = await self.__refresh_token_repo.get_state(jti_hash)
 
-        if token_obj is None or token_obj.revoked:
-            self.__audit.error("Invalid token object", token_obj=token_obj)
+        if token_state is None or token_state.revoked:
+            self.__audit.error("Invalid token state", token_state=token_state)
             raise InvalidCredentialsError()
 
         # Fetch user
@@ -305,8 +313,9 @@ class AuthUsecase:
     async def revoke_refresh_token(self, refresh_token: str) -> None:
         """Revoke *refresh_token* (logout).
 
-        Marks the corresponding token entry as revoked in the database so it
-        can no longer be used to obtain new access tokens.
+        Marks the corresponding token entry as revoked (in Redis first, then
+        in the database) so it can no longer be used to obtain new access
+        tokens.
         """
         try:
             payload = self.__jwt_utils.decode_token(refresh_token)
@@ -318,12 +327,15 @@ class AuthUsecase:
         if not jti:
             return
 
-        token = await self.__refresh_token_repo.get_by_jti_hash(
-            sha256(jti.encode()).hexdigest()
+        expires_at = payload.get("exp") or (
+            time.time() + self.__config_service.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+        )
+        revoked = await self.__refresh_token_repo.revoke_by_jti_hash(
+            sha256(jti.encode()).hexdigest(),
+            str(payload.get("sub")),
+            float(expires_at),
         )
-        if token:
-            token.revoked = True
-            await self.__refresh_token_repo.save(token)
+        if revoked:
             self.__audit.info("user_logout_success", user_id=payload.get("sub"))
         else:
             self.__audit.warning("logout_token_not_found", jti=jti)
@@ -0,0 +1,205 @@
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import HTTPException, status
+
+from app.core.config import Configuration
+from app.domain.schemas.defi_aggregate import (
+    AggregateMetricsSchema,
+    PositionSchema,
+)
+from app.models.portfolio_snapshot import PortfolioSnapshot
+from app.repositories.portfolio_snapshot_repository import (
+    PortfolioSnapshotRepository,
+)
+from app.repositories.wallet_repository import WalletRepository
+from app.utils.logging import Audit
+from app.utils.metrics_cache import MetricsCacheUtils
+
+
+def build_aggregate_metrics(
+    address: str, snapshot: PortfolioSnapshot
+) -> AggregateMetricsSchema:
+    """Compute TVL, borrowings and USD-weighted APY from one snapshot."""
+    positions = [
+        PositionSchema(
+            protocol=str(c["protocol"]).lower(),
+            asset=c["asset"],
+            amount=c["amount"],
+            usd_value=c["usd_value"],
+        )
+        for c in snapshot.collaterals or []
+    ]
+    positions += [
+        PositionSchema(
+            protocol=str(p["protocol"]).lower(),
+            asset=p["asset"],
+            amount=p["amount"],
+            usd_value=p["usd_value"],
+            apy=p.get("apy"),
+        )
+        for p in snapshot.staked_positions or []
+    ]
+
+    weighted = [(p.apy, p.usd_value) for p in positions if p.apy and p.usd_value > 0]
+    total_weight = sum(weight for _, weight in weighted)
+    aggregate_apy = (
+        sum(apy * weight for apy, weight in weighted) / total_weight
+        if total_weight > 0
+        else None
+    )
+
+    return AggregateMetricsSchema(
+        id=str(snapshot.id),
+        wallet_id=address,
+        tvl=snapshot.total_collateral_usd,
+        total_borrowings=snapshot.total_borrowings_usd,
+        aggregate_apy=aggregate_apy,
+        as_of=datetime.fromtimestamp(snapshot.timestamp, tz=timezone.utc),
+        positions=positions,
+    )
+
+
+class DefiAggregateUsecase:
+    """
+    Use case layer for aggregate DeFi metrics per wallet.
+    Serves metrics from a refresh-ahead Redis cache; recently read entries are
+    recomputed in the background before they expire.
+    """
+
+    def __init__(
+        self,
+        portfolio_snapshot_repo: PortfolioSnapshotRepository,
+        wallet_repo: WalletRepository,
+        metrics_cache_utils: MetricsCacheUtils,
+        config: Configuration,
+        audit: Audit,
+    ):
+        self.__portfolio_snapshot_repo = portfolio_snapshot_repo
+        self.__wallet_repo = wallet_repo
+        self.__metrics_cache = metrics_cache_utils
+        self.__config_service = config
+        self.__audit = audit
+
+    async def get_wallet_metrics(
+        self, user_id: uuid.UUID, address: str
+    ) -> AggregateMetricsSchema:
+        """
+        Return aggregate metrics of a wallet owned by the user.
+        Args:
+            user_id: ID of the current user; must own the wallet.
+            address: Wallet address.
+        Returns:
+            AggregateMetricsSchema: Metrics computed from the latest snapshot.
+        Raises:
+            HTTPException: 404 if the wallet is not owned or has no snapshot.
+        """
+        start_time = time.time()
+        self.__audit.info(
+            "defi_aggregate_usecase_get_wallet_metrics_started",
+            user_id=str(user_id),
+            wallet_address=address,
+        )
+
+        try:
+            wallet = await self.__wallet_repo.get_by_user_and_address(user_id, address)
+            if wallet is None:
+                self.__audit.warning(
+                    "defi_aggregate_usecase_get_wallet_metrics_unauthorized",
+                    user_id=str(user_id),
+                    wallet_address=address,
+                )
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Wallet not found or access denied",
+                )
+
+            metrics = await self.__metrics_cache.get_metrics_cache(wallet.address)
+            await self.__metrics_cache.mark_hot(wallet.address)
+            cache_hit = metrics is not None
+            if metrics is None:
+                metrics = await self.compute_metrics(wallet.address)
+                if metrics is None:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail="No portfolio snapshot for wallet",
+                    )
+                await self.__metrics_cache.set_metrics_cache(wallet.address, metrics)
+
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.info(
+                "defi_aggregate_usecase_get_wallet_metrics_success",
+                user_id=str(user_id),
+                wallet_address=address,
+                cache_hit=cache_hit,
+                duration_ms=duration,
+            )
+            return metrics
+        except HTTPException:
+            raise
+        except Exception as exc:
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.error(
+                "defi_aggregate_usecase_get_wallet_metrics_failed",
+                user_id=str(user_id),
+                wallet_address=address,
+                duration_ms=duration,
+                error=str(exc),
+            )
+            raise
+
+    async def compute_metrics(self, address: str) -> Optional[AggregateMetricsSchema]:
+        """Compute metrics of *address* from its latest snapshot, if any."""
+        snapshot = await self.__portfolio_snapshot_repo.get_latest_snapshot_by_address(
+            address
+        )
+        if snapshot is None:
+            return None
+        return build_aggregate_metrics(address, snapshot)
+
+    async def refresh_hot_metrics(self) -> int:
+        """
+        Recompute hot cache entries that are missing or about to expire.
+        Returns:
+            int: Number of entries refreshed.
+        """
+        start_time = time.time()
+        self.__audit.info("defi_aggregate_usecase_refresh_hot_metrics_started")
+
+        try:
+            due = await self.__metrics_cache.get_keys_due_for_refresh()
+            refreshed = 0
+            for address in due:
+                try:
+                    metrics = await self.compute_metrics(address)
+                except Exception as exc:  # noqa: BLE001 – keep refreshing others
+                    self.__audit.warning(
+                        "defi_aggregate_usecase_refresh_wallet_failed",
+                        wallet_address=address,
+                        error=str(exc),
+                    )
+                    continue
+                if (
+                    metrics is not None
+                    and await self.__metrics_cache.set_metrics_cache(address, metrics)
+                ):
+                    refreshed += 1
+
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.info(
+                "defi_aggregate_usecase_refresh_hot_metrics_success",
+                due=len(due),
+                refreshed=refreshed,
+                duration_ms=duration,
+            )
+            return refreshed
+        except Exception as exc:
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.error(
+                "defi_aggregate_usecase_refresh_hot_metrics_failed",
+                duration_ms=duration,
+                error=str(exc),
+            )
+            raise
@@ -1,11 +1,24 @@
+import time
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException, status
+
 from app.core.config import Configuration
+from app.domain.schemas.bulk import BulkWriteResponse
 from app.domain.schemas.historical_balance import (
+    HistoricalBalanceBatchCreate,
     HistoricalBalanceCreate,
     HistoricalBalanceResponse,
+    HistoricalBalanceRevalue,
+    WalletValuation,
+    WalletValuationPoint,
 )
 from app.repositories.historical_balance_repository import (
     HistoricalBalanceRepository,
 )
+from app.repositories.wallet_repository import WalletRepository
 from app.utils.logging import Audit
 
 
@@ -18,10 +31,12 @@ class HistoricalBalanceUsecase:
     def __init__(
         self,
         historical_balance_repo: HistoricalBalanceRepository,
+        wallet_repo: WalletRepository,
         config: Configuration,
         audit: Audit,
     ):
         self.__historical_balance_repo = historical_balance_repo
+        self.__wallet_repo = wallet_repo
         self.__config_service = config
         self.__audit = audit
 
@@ -55,3 +70,147 @@ class HistoricalBalanceUsecase:
                 error=str(e),
             )
             raise
+
+    async def create_historical_balances(
+        self, batch: HistoricalBalanceBatchCreate
+    ) -> BulkWriteResponse:
+        """
+        Insert a batch of historical balance records.
+        Args:
+            batch: HistoricalBalanceBatchCreate with the items to write.
+        Returns:
+            BulkWriteResponse: Number of rows written.
+        """
+        self.__audit.info(
+            "historical_balance_usecase_create_historical_balances_started",
+            count=len(batch.items),
+        )
+
+        try:
+            count = await self.__historical_balance_repo.bulk_create(batch.items)
+
+            self.__audit.info(
+                "historical_balance_usecase_create_historical_balances_success",
+                count=count,
+            )
+
+            return BulkWriteResponse(count=count)
+        except Exception as e:
+            self.__audit.error(
+                "historical_balance_usecase_create_historical_balances_failed",
+                count=len(batch.items),
+                error=str(e),
+            )
+            raise
+
+    async def get_wallet_valuation(
+        self,
+        user_id: uuid.UUID,
+        address: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> WalletValuation:
+        """
+        Compute a wallet's USD value series from balances and as-of prices.
+        Args:
+            user_id: ID of the current user; must own the wallet.
+            address: Wallet address.
+            start: Optional inclusive lower bound on balance timestamps.
+            end: Optional inclusive upper bound on balance timestamps.
+        Returns:
+            WalletValuation: One point per balance timestamp, oldest first.
+        """
+        start_time = time.time()
+        self.__audit.info(
+            "historical_balance_usecase_get_wallet_valuation_started",
+            user_id=str(user_id),
+            wallet_address=address,
+        )
+
+        try:
+            if start is not None and end is not None and start > end:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="start must not be after end",
+                )
+
+            wallet = await self.__wallet_repo.get_by_user_and_address(user_id, address)
+            if wallet is None:
+                self.__audit.warning(
+                    "historical_balance_usecase_get_wallet_valuation_unauthorized",
+                    user_id=str(user_id),
+                    wallet_address=address,
+                )
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Wallet not found or access denied",
+                )
+
+            rows = await self.__historical_balance_repo.value_series(
+                wallet.id, start=start, end=end
+            )
+            points = [
+                WalletValuationPoint(
+                    timestamp=row.timestamp,
+                    value_usd=float(row.value_usd or 0),
+                    tokens=row.tokens,
+                    unpriced_tokens=row.tokens - row.priced_tokens,
+                )
+                for row in rows
+            ]
+
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.info(
+                "historical_balance_usecase_get_wallet_valuation_success",
+                user_id=str(user_id),
+                wallet_address=address,
+                points=len(points),
+                duration_ms=duration,
+            )
+
+            return WalletValuation(wallet_address=wallet.address, points=points)
+        except HTTPException:
+            raise
+        except Exception as e:
+            self.__audit.error(
+                "historical_balance_usecase_get_wallet_valuation_failed",
+                user_id=str(user_id),
+                wallet_address=address,
+                error=str(e),
+            )
+            raise
+
+    async def revalue_historical_balances(
+        self, request: HistoricalBalanceRevalue
+    ) -> BulkWriteResponse:
+        """
+        Reprice stored balance points of a token after a price correction.
+        Args:
+            request: Token to revalue and optional lower timestamp bound.
+        Returns:
+            BulkWriteResponse: Number of rows updated.
+        """
+        self.__audit.info(
+            "historical_balance_usecase_revalue_started",
+            token_id=str(request.token_id),
+        )
+
+        try:
+            count = await self.__historical_balance_repo.revalue(
+                request.token_id, since=request.since
+            )
+
+            self.__audit.info(
+                "historical_balance_usecase_revalue_success",
+                token_id=str(request.token_id),
+                count=count,
+            )
+
+            return BulkWriteResponse(count=count)
+        except Exception as e:
+            self.__audit.error(
+                "historical_balance_usecase_revalue_failed",
+                token_id=str(request.token_id),
+                error=str(e),
+            )
+            raise
@@ -3,7 +3,7 @@
 from typing import Optional
 
 from app.domain.schemas.jwks import JWKSet
-from app.utils.jwks_cache import JWKSCacheUtils
+from app.utils.jwks_cache import JWKSCacheUtils, JWKSDocument, serialize_jwks
 from app.utils.jwt_keys import JWTKeyUtils
 from app.utils.logging import Audit
 
@@ -45,19 +45,40 @@ class JWKSUsecase:
 
         return jwks_response
 
+    async def get_jwks_document(self) -> JWKSDocument:
+        """Get the JWKS as a pre-encoded response body with its ETag.
+
+        Served from this process's copy when valid; otherwise the body is
+        taken verbatim from Redis or, on a miss, generated and cached.
+        """
+        document = self.jwks_cache_utils.get_local()
+        if document is not None:
+            return document
+
+        body = None
+        try:
+            redis = self.jwks_cache_utils._build_redis_client()
+            body = await self.jwks_cache_utils.get_jwks_body(redis)
+        except Exception as e:
+            self.audit.warning(f"Cache lookup failed, falling back to uncached: {e}")
+
+        cache_hit = body is not None
+        if not cache_hit:
+            jwks = await self._generate_fresh_jwks()
+            await self._cache_jwks(jwks)
+            body = serialize_jwks(jwks)
+
+        self.audit.info("JWKS document refreshed", cache_hit=cache_hit)
+        return self.jwks_cache_utils.set_local(body)
+
     async def _get_cached_jwks(self) -> Optional[JWKSet]:
         """Attempt to retrieve JWKS from cache."""
-        redis = self.jwks_cache_utils._build_redis_client()
         try:
+            redis = self.jwks_cache_utils._build_redis_client()
             return await self.jwks_cache_utils.get_jwks_cache(redis)
         except Exception as e:
             self.audit.warning(f"Cache lookup failed, falling back to uncached: {e}")
             return None
-        finally:
-            try:
-                await redis.close()
-            except Exception as e:
-                self.audit.warning(f"Failed to close Redis connection: {e}")
 
     async def _generate_fresh_jwks(self) -> JWKSet:
         """Generate a fresh JWKS from current keys."""
@@ -77,14 +98,9 @@ class JWKSUsecase:
 
     async def _cache_jwks(self, jwks: JWKSet) -> None:
         """Cache the JWKS response."""
-        redis = self.jwks_cache_utils._build_redis_client()
         try:
+            redis = self.jwks_cache_utils._build_redis_client()
             await self.jwks_cache_utils.set_jwks_cache(redis, jwks)
             self.audit.debug("JWKS cached successfully")
         except Exception as e:
             self.audit.warning(f"Failed to cache JWKS: {e}")
-        finally:
-            try:
-                await redis.close()
-            except Exception as e:
-                self.audit.warning(f"Failed to close Redis connection: {e}")
@@ -1,5 +1,7 @@
 from app.core.config import Configuration
+from app.domain.schemas.bulk import BulkWriteResponse
 from app.domain.schemas.token_balance import (
+    TokenBalanceBatchCreate,
     TokenBalanceCreate,
     TokenBalanceResponse,
 )
@@ -53,3 +55,34 @@ class TokenBalanceUsecase:
                 error=str(e),
             )
             raise
+
+    async def upsert_token_balances(
+        self, batch: TokenBalanceBatchCreate
+    ) -> BulkWriteResponse:
+        """
+        Upsert a batch of token balances keyed on (wallet_id, token_id).
+        Args:
+            batch: TokenBalanceBatchCreate with the items to write.
+        Returns:
+            BulkWriteResponse: Number of rows written.
+        """
+        self.__audit.info(
+            "token_balance_usecase_upsert_token_balances_started",
+            count=len(batch.items),
+        )
+
+        try:
+            count = await self.__token_balance_repo.bulk_upsert(batch.items)
+
+            self.__audit.info(
+                "token_balance_usecase_upsert_token_balances_success", count=count
+            )
+
+            return BulkWriteResponse(count=count)
+        except Exception as e:
+            self.__audit.error(
+                "token_balance_usecase_upsert_token_balances_failed",
+                count=len(batch.items),
+                error=str(e),
+            )
+            raise
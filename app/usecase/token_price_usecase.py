@@ -1,8 +1,53 @@
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional
+
+from fastapi import HTTPException, status
+
 from app.core.config import Configuration
-from app.domain.schemas.token_price import TokenPriceCreate, TokenPriceResponse
+from app.domain.interfaces.utils import PriceIndexInterface
+from app.domain.schemas.bulk import BulkWriteResponse
+from app.domain.schemas.token_price import (
+    CANDLE_INTERVALS,
+    MAX_CANDLES,
+    LatestTokenPrice,
+    PriceCandleSeries,
+    TokenPriceBatchCreate,
+    TokenPriceCreate,
+    TokenPriceResponse,
+)
 from app.repositories.token_price_repository import TokenPriceRepository
+from app.repositories.token_repository import TokenRepository
 from app.utils.logging import Audit
 
+# Range returned when the caller omits ``from``
+_DEFAULT_CANDLE_SPAN = {"1h": timedelta(days=7), "1d": timedelta(days=365)}
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+# Above this many rollup gaps, one raw scan is cheaper than a query per gap
+_MAX_RAW_RANGES = 8
+
+
+def _uncovered_ranges(candles, interval: str, start: datetime, end: datetime):
+    """Yield the ``[lo, hi)`` ranges of ``[start, end)`` without a candle.
+
+    *candles* must be ordered by bucket start.
+    """
+    step = CANDLE_INTERVALS[interval]
+    cursor = start
+    for candle in candles:
+        bucket = _as_utc(candle.timestamp)
+        if bucket > cursor:
+            yield cursor, bucket
+        cursor = max(cursor, bucket + step)
+    if cursor < end:
+        yield cursor, end
+
 
 class TokenPriceUsecase:
     """
@@ -13,10 +58,14 @@ class TokenPriceUsecase:
     def __init__(
         self,
         token_price_repo: TokenPriceRepository,
+        token_repo: TokenRepository,
+        price_index: PriceIndexInterface,
         config: Configuration,
         audit: Audit,
     ):
         self.__token_price_repo = token_price_repo
+        self.__token_repo = token_repo
+        self.__price_index = price_index
         self.__config_service = config
         self.__audit = audit
 
@@ -40,6 +89,7 @@ class TokenPriceUsecase:
                 "token_price_usecase_create_success",
                 token_price_id=str(result.id) if hasattr(result, "id") else None,
             )
+            await self.__publish_latest([tp.token_id])
 
             return result
         except Exception as e:
@@ -48,3 +98,214 @@ class TokenPriceUsecase:
                 error=str(e),
             )
             raise
+
+    async def create_token_prices(
+        self, batch: TokenPriceBatchCreate
+    ) -> BulkWriteResponse:
+        """
+        Insert a batch of token price records.
+        Args:
+            batch: TokenPriceBatchCreate with the items to write.
+        Returns:
+            BulkWriteResponse: Number of rows written.
+        """
+        self.__audit.info(
+            "token_price_usecase_create_token_prices_started", count=len(batch.items)
+        )
+
+        try:
+            count = await self.__token_price_repo.bulk_create(batch.items)
+
+            self.__audit.info(
+                "token_price_usecase_create_token_prices_success", count=count
+            )
+            await self.__publish_latest({item.token_id for item in batch.items})
+
+            return BulkWriteResponse(count=count)
+        except Exception as e:
+            self.__audit.error(
+                "token_price_usecase_create_token_prices_failed",
+                count=len(batch.items),
+                error=str(e),
+            )
+            raise
+
+    def get_latest_price(self, key: str) -> Optional[LatestTokenPrice]:
+        """
+        Return the latest known price of a token from the in-process index.
+        Never touches the database, so it is safe on valuation hot paths.
+        Args:
+            key: Token contract address, symbol or id.
+        Returns:
+            LatestTokenPrice or None when the token has no known price.
+        """
+        return self.__price_index.get(key)
+
+    def get_latest_prices(
+        self, keys: Iterable[str]
+    ) -> Dict[str, Optional[LatestTokenPrice]]:
+        """
+        Return the latest known prices of several tokens from the index.
+        Args:
+            keys: Token contract addresses, symbols or ids.
+        Returns:
+            Mapping of each key to its price, or None when unknown.
+        """
+        return {key: self.__price_index.get(key) for key in keys}
+
+    async def load_price_index(self) -> int:
+        """
+        Fill the in-process price index from the database.
+        Called once at application startup.
+        Returns:
+            int: Number of tokens loaded.
+        """
+        self.__audit.info("token_price_usecase_load_price_index_started")
+
+        try:
+            quotes = await self.__token_price_repo.get_latest_prices()
+            self.__price_index.load(quotes)
+
+            self.__audit.info(
+                "token_price_usecase_load_price_index_success", count=len(quotes)
+            )
+            return len(quotes)
+        except Exception as e:
+            self.__audit.error(
+                "token_price_usecase_load_price_index_failed",
+                error=str(e),
+            )
+            raise
+
+    async def get_price_candles(
+        self,
+        address: str,
+        interval: str = "1h",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> PriceCandleSeries:
+        """
+        Return OHLC candles of a token's price history.
+        Completed buckets come from the rollup table when it is enabled; the
+        latest bucket and any range the rollup does not cover (older than its
+        lookback, or missed while beat was down) are computed from raw prices.
+        Args:
+            address: Token contract address.
+            interval: Candle width ("1h" or "1d").
+            start: Inclusive lower bound; defaults to a span ending at ``end``.
+            end: Exclusive upper bound; defaults to now.
+        Returns:
+            PriceCandleSeries: Candles ordered by bucket start.
+        """
+        start_time = time.time()
+        self.__audit.info(
+            "token_price_usecase_get_price_candles_started",
+            address=address,
+            interval=interval,
+        )
+
+        try:
+            end = _as_utc(end) if end else datetime.now(timezone.utc)
+            start = _as_utc(start) if start else end - _DEFAULT_CANDLE_SPAN[interval]
+            if start >= end:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="from must be before to",
+                )
+            if (end - start) / CANDLE_INTERVALS[interval] > MAX_CANDLES:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Range exceeds {MAX_CANDLES} candles; use a wider interval",
+                )
+
+            tokens = await self.__token_repo.get_by_addresses([address])
+            token = tokens.get(address.lower())
+            if token is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Token not found",
+                )
+
+            rolled = []
+            if self.__config_service.PRICE_CANDLE_ROLLUP_ENABLED:
+                rolled = await self.__token_price_repo.list_rollup_candles(
+                    token.id, interval, start, end
+                )
+                if rolled:
+                    # The newest rolled-up bucket may still have been filling
+                    # when the rollup ran; recompute it from raw prices.
+                    rolled.pop()
+            ranges = list(_uncovered_ranges(rolled, interval, start, end))
+            if len(ranges) > _MAX_RAW_RANGES:
+                ranges = [(ranges[0][0], end)]
+            raw = []
+            for lo, hi in ranges:
+                raw += await self.__token_price_repo.list_candles(
+                    token.id, interval, lo, hi
+                )
+            covered = {_as_utc(c.timestamp) for c in rolled}
+            candles = sorted(
+                rolled + [c for c in raw if _as_utc(c.timestamp) not in covered],
+                key=lambda c: _as_utc(c.timestamp),
+            )
+
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.info(
+                "token_price_usecase_get_price_candles_success",
+                address=address,
+                interval=interval,
+                count=len(candles),
+                duration_ms=duration,
+            )
+
+            return PriceCandleSeries(
+                token_id=token.id,
+                address=token.address,
+                interval=interval,
+                candles=candles,
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            self.__audit.error(
+                "token_price_usecase_get_price_candles_failed",
+                address=address,
+                interval=interval,
+                error=str(e),
+            )
+            raise
+
+    async def refresh_price_candles(self) -> Dict[str, int]:
+        """
+        Refresh the candle rollup for every interval over the configured
+        lookback window.
+        Returns:
+            Dict[str, int]: Candle rows written per interval.
+        """
+        since = datetime.now(timezone.utc) - timedelta(
+            hours=self.__config_service.PRICE_CANDLE_ROLLUP_LOOKBACK_HOURS
+        )
+        written = {}
+        for interval in CANDLE_INTERVALS:
+            written[interval] = await self.__token_price_repo.refresh_candles(
+                interval, since
+            )
+        self.__audit.info(
+            "token_price_usecase_refresh_price_candles_success", written=written
+        )
+        return written
+
+    async def __publish_latest(self, token_ids) -> None:
+        """Broadcast the latest prices of *token_ids* after a write.
+
+        Best effort: the price rows are already committed, so a failure here
+        is logged and the index catches up on the next write or restart.
+        """
+        try:
+            quotes = await self.__token_price_repo.get_latest_prices(list(token_ids))
+            await self.__price_index.publish(quotes)
+        except Exception as e:
+            self.__audit.warning(
+                "token_price_usecase_publish_latest_failed",
+                error=str(e),
+            )
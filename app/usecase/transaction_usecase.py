@@ -0,0 +1,125 @@
+import time
+import uuid
+from typing import Optional
+
+from fastapi import HTTPException, status
+
+from app.core.config import Configuration
+from app.domain.schemas.transaction import TransactionPage, TransactionResponse
+from app.repositories.transaction_repository import TransactionRepository
+from app.repositories.wallet_repository import WalletRepository
+from app.utils.logging import Audit
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+class TransactionUsecase:
+    """
+    Use case layer for wallet transaction history.
+    Handles ownership checks and keyset pagination over indexed transactions.
+    """
+
+    def __init__(
+        self,
+        transaction_repo: TransactionRepository,
+        wallet_repo: WalletRepository,
+        config: Configuration,
+        audit: Audit,
+    ):
+        self.__transaction_repo = transaction_repo
+        self.__wallet_repo = wallet_repo
+        self.__config_service = config
+        self.__audit = audit
+
+    async def list_wallet_transactions(
+        self,
+        user_id: uuid.UUID,
+        address: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        token_id: Optional[uuid.UUID] = None,
+        tx_type: Optional[str] = None,
+    ) -> TransactionPage:
+        """
+        Return one page of a wallet's transactions, newest first.
+        Args:
+            user_id: ID of the current user; must own the wallet.
+            address: Wallet address.
+            limit: Maximum number of items on the page.
+            cursor: Opaque cursor returned as ``next_cursor`` by the previous page.
+            token_id: Optional token filter.
+            tx_type: Optional transaction type filter (IN, OUT, SUPPLY, ...).
+        Returns:
+            TransactionPage: The page and the cursor of the next one.
+        """
+        start_time = time.time()
+        self.__audit.info(
+            "transaction_usecase_list_wallet_transactions_started",
+            user_id=str(user_id),
+            wallet_address=address,
+            limit=limit,
+            has_cursor=cursor is not None,
+        )
+
+        try:
+            after = None
+            if cursor:
+                try:
+                    after = decode_cursor(cursor)
+                except ValueError:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="Invalid pagination cursor",
+                    )
+
+            wallet = await self.__wallet_repo.get_by_user_and_address(user_id, address)
+            if wallet is None:
+                self.__audit.warning(
+                    "transaction_usecase_list_wallet_transactions_unauthorized",
+                    user_id=str(user_id),
+                    wallet_address=address,
+                )
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Wallet not found or access denied",
+                )
+
+            # Fetch one extra row to learn whether another page exists
+            rows = await self.__transaction_repo.list_by_wallet(
+                wallet.id,
+                limit + 1,
+                after=after,
+                token_id=token_id,
+                tx_type=tx_type.upper() if tx_type else None,
+            )
+            items = rows[:limit]
+            next_cursor = None
+            if len(rows) > limit:
+                last = items[-1]
+                next_cursor = encode_cursor(last.timestamp, last.id)
+
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.info(
+                "transaction_usecase_list_wallet_transactions_success",
+                user_id=str(user_id),
+                wallet_address=address,
+                count=len(items),
+                has_more=next_cursor is not None,
+                duration_ms=duration,
+            )
+
+            return TransactionPage(
+                items=[TransactionResponse.model_validate(tx) for tx in items],
+                next_cursor=next_cursor,
+            )
+        except HTTPException:
+            raise
+        except Exception as exc:
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.error(
+                "transaction_usecase_list_wallet_transactions_failed",
+                user_id=str(user_id),
+                wallet_address=address,
+                duration_ms=duration,
+                error=str(exc),
+            )
+            raise
@@ -14,8 +14,8 @@ from app.domain.schemas.user import (
     UserProfileUpdate,
 )
 from app.repositories.user_repository import UserRepository
-from app.utils import security
 from app.utils.logging import Audit
+from app.utils.security import PasswordHasher
 
 
 class ProfileUpdateError(Exception):
@@ -30,8 +30,14 @@ class ProfileUpdateError(Exception):
 class UserProfileUsecase:
     """User profile management business logic."""
 
-    def __init__(self, user_repository: UserRepository, audit: Audit):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        password_hasher: PasswordHasher,
+        audit: Audit,
+    ):
         self.__user_repo = user_repository
+        self.__password_hasher = password_hasher
         self.__audit = audit
 
     async def get_profile(self, user_id: str) -> Optional[UserProfileRead]:
@@ -115,7 +121,7 @@ class UserProfileUsecase:
                 raise InvalidCredentialsError("User not found")
 
             # Verify current password
-            if not security.verify_password(
+            if not await self.__password_hasher.verify_password_async(
                 password_change.current_password, user.hashed_password
             ):
                 self.__audit.warning(
@@ -124,7 +130,7 @@ class UserProfileUsecase:
                 raise InvalidCredentialsError("Current password is incorrect")
 
             # Hash new password
-            new_hashed_password = security.get_password_hash(
+            new_hashed_password = await self.__password_hasher.hash_password_async(
                 password_change.new_password
             )
 
@@ -2,14 +2,14 @@ import time
 import uuid
 from datetime import datetime, timedelta
 from dateutil import parser as date_parser
-from typing import List
+from typing import List, Optional
 
 from fastapi import HTTPException, status
 
 from app.core.config import Configuration
 from app.domain.schemas.portfolio_metrics import PortfolioMetrics
 from app.domain.schemas.portfolio_timeline import PortfolioTimeline
-from app.domain.schemas.wallet import WalletCreate, WalletResponse
+from app.domain.schemas.wallet import WalletCreate, WalletResponse, WalletSort
 from app.repositories.portfolio_snapshot_repository import (
     PortfolioSnapshotRepository,
 )
@@ -95,11 +95,14 @@ class WalletUsecase:
             )
             raise
 
-    async def list_wallets(self, user_id: uuid.UUID) -> List[WalletResponse]:
+    async def list_wallets(
+        self, user_id: uuid.UUID, sort: Optional[WalletSort] = None
+    ) -> List[WalletResponse]:
         """
         List all wallets from the database.
         Args:
             user_id: ID of the current user requesting wallets.
+            sort: Optional ordering; balance orderings use the cached balance_usd.
         Returns:
             List[WalletResponse]: List of wallet response objects.
         """
@@ -116,7 +119,7 @@ class WalletUsecase:
         self.__audit.info("wallet_usecase_list_wallets_started", user_id=str(user_id))
 
         try:
-            result = await self.__wallet_repo.list_by_user(user_id)
+            result = await self.__wallet_repo.list_by_user(user_id, sort)
 
             duration = int((time.time() - start_time) * 1000)
             self.__audit.info(
@@ -137,6 +140,60 @@ class WalletUsecase:
             )
             raise
 
+    async def get_wallet(self, user_id: uuid.UUID, address: str) -> WalletResponse:
+        """
+        Get a single wallet owned by the user.
+        Args:
+            user_id: ID of the current user; must own the wallet.
+            address: Wallet address, in any letter case.
+        Returns:
+            WalletResponse: The wallet.
+        Raises:
+            HTTPException: 404 if the user has no wallet with this address.
+        """
+        start_time = time.time()
+        self.__audit.info(
+            "wallet_usecase_get_wallet_started",
+            user_id=str(user_id),
+            wallet_address=address,
+        )
+
+        try:
+            wallet = await self.__wallet_repo.get_by_user_and_address(user_id, address)
+            if wallet is None:
+                self.__audit.warning(
+                    "wallet_usecase_get_wallet_unauthorized",
+                    user_id=str(user_id),
+                    wallet_address=address,
+                )
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Wallet not found or access denied",
+                )
+
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.info(
+                "wallet_usecase_get_wallet_success",
+                user_id=str(user_id),
+                wallet_address=address,
+                wallet_id=str(wallet.id),
+                duration_ms=duration,
+            )
+
+            return wallet
+        except HTTPException:
+            raise
+        except Exception as exc:
+            duration = int((time.time() - start_time) * 1000)
+            self.__audit.error(
+                "wallet_usecase_get_wallet_failed",
+                user_id=str(user_id),
+                wallet_address=address,
+                duration_ms=duration,
+                error=str(exc),
+            )
+            raise
+
     async def delete_wallet(self, user_id: uuid.UUID, address: str):
         """
         Delete a wallet by its address.
@@ -204,8 +261,10 @@ class WalletUsecase:
         )
 
         try:
-            wallet = await self.__wallet_repo.get_by_address(address=address)
-            is_owner = wallet is not None and wallet.user_id == user_id
+            wallet = await self.__wallet_repo.get_by_user_and_address(
+                user_id, address
+            )
+            is_owner = wallet is not None
 
             duration = int((time.time() - start_time) * 1000)
             self.__audit.info(
@@ -241,14 +300,8 @@ class WalletUsecase:
         """
         start_time = time.time()
 
-        # Verify user exists
-        user = await self.__user_repo.get_by_id(user_id)
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found",
-            )
-
+        # The authenticated user is trusted; ownership is checked by the
+        # owner-scoped snapshot query itself.
         self.__audit.info(
             "wallet_usecase_get_portfolio_snapshots_started",
             user_id=str(user_id),
@@ -256,8 +309,10 @@ class WalletUsecase:
         )
 
         try:
-            # Verify ownership first
-            if not await self.verify_wallet_ownership(user_id, address):
+            snapshots = await self.__portfolio_snapshot_repo.get_owned_snapshots(
+                user_id, address
+            )
+            if snapshots is None:
                 self.__audit.warning(
                     "wallet_usecase_get_portfolio_snapshots_unauthorized",
                     user_id=str(user_id),
@@ -268,10 +323,6 @@ class WalletUsecase:
                     detail="Wallet not found or access denied",
                 )
 
-            snapshots = await self.__portfolio_snapshot_repo.get_by_wallet_address(
-                address
-            )
-
             duration = int((time.time() - start_time) * 1000)
             self.__audit.info(
                 "wallet_usecase_get_portfolio_snapshots_success",
@@ -308,14 +359,8 @@ class WalletUsecase:
         """
         start_time = time.time()
 
-        # Verify user exists
-        user = await self.__user_repo.get_by_id(user_id)
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found",
-            )
-
+        # The authenticated user is trusted; ownership is checked by the
+        # owner-scoped snapshot query itself.
         self.__audit.info(
             "wallet_usecase_get_portfolio_metrics_started",
             user_id=str(user_id),
@@ -323,8 +368,11 @@ class WalletUsecase:
         )
 
         try:
-            # Verify ownership first
-            if not await self.verify_wallet_ownership(user_id, address):
+            # Latest snapshot only, fetched together with the ownership check
+            snapshots = await self.__portfolio_snapshot_repo.get_owned_snapshots(
+                user_id, address, limit=1
+            )
+            if snapshots is None:
                 self.__audit.warning(
                     "wallet_usecase_get_portfolio_metrics_unauthorized",
                     user_id=str(user_id),
@@ -335,10 +383,6 @@ class WalletUsecase:
                     detail="Wallet not found or access denied",
                 )
 
-            # Get latest snapshot
-            snapshots = await self.__portfolio_snapshot_repo.get_by_wallet_address(
-                address
-            )
             if not snapshots:
                 self.__audit.warning(
                     "wallet_usecase_get_portfolio_metrics_no_snapshots",
@@ -363,22 +407,21 @@ class WalletUsecase:
                     timestamp=datetime.now(),
                 )
             else:
-                # Get the most recent snapshot (assuming the first one is the latest)
                 snapshot = snapshots[0]
                 metrics = PortfolioMetrics(
                     user_address=address,
-                    total_collateral=snapshot.get("total_collateral", 0.0),
-                    total_borrowings=snapshot.get("total_borrowings", 0.0),
-                    total_collateral_usd=snapshot.get("total_collateral_usd", 0.0),
-                    total_borrowings_usd=snapshot.get("total_borrowings_usd", 0.0),
-                    aggregate_health_score=snapshot.get("aggregate_health_score"),
-                    aggregate_apy=snapshot.get("aggregate_apy"),
-                    collaterals=snapshot.get("collaterals", []),
-                    borrowings=snapshot.get("borrowings", []),
-                    staked_positions=snapshot.get("staked_positions", []),
-                    health_scores=snapshot.get("health_scores", []),
-                    protocol_breakdown=snapshot.get("protocol_breakdown", {}),
-                    timestamp=snapshot.get("timestamp", datetime.now()),
+                    total_collateral=snapshot.total_collateral or 0.0,
+                    total_borrowings=snapshot.total_borrowings or 0.0,
+                    total_collateral_usd=snapshot.total_collateral_usd or 0.0,
+                    total_borrowings_usd=snapshot.total_borrowings_usd or 0.0,
+                    aggregate_health_score=snapshot.aggregate_health_score,
+                    aggregate_apy=snapshot.aggregate_apy,
+                    collaterals=snapshot.collaterals or [],
+                    borrowings=snapshot.borrowings or [],
+                    staked_positions=snapshot.staked_positions or [],
+                    health_scores=snapshot.health_scores or [],
+                    protocol_breakdown=snapshot.protocol_breakdown or {},
+                    timestamp=snapshot.timestamp,
                 )
 
             duration = int((time.time() - start_time) * 1000)
@@ -430,14 +473,8 @@ class WalletUsecase:
         """
         start_time = time.time()
 
-        # Verify user exists
-        user = await self.__user_repo.get_by_id(user_id)
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found",
-            )
-
+        # The authenticated user is trusted; ownership is checked by the
+        # owner-scoped snapshot query itself.
         self.__audit.info(
             "wallet_usecase_get_portfolio_timeline_started",
             user_id=str(user_id),
@@ -450,19 +487,6 @@ class WalletUsecase:
         )
 
         try:
-            # Verify ownership first
-            if not await self.verify_wallet_ownership(user_id, address):
-                self.__audit.warning(
-                    "wallet_usecase_get_portfolio_timeline_unauthorized",
-                    user_id=str(user_id),
-                    wallet_address=address,
-                )
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Wallet not found or access denied",
-                )
-
-            # Get timeline data
             # Parse and validate date parameters
             try:
                 if start_date and end_date:
@@ -517,9 +541,19 @@ class WalletUsecase:
                     detail=f"Invalid date format. Please use YYYY-MM-DD format. Error: {str(e)}"
                 )
 
-            timeline_data = await self.__portfolio_snapshot_repo.get_timeline(
-                address, from_ts, to_ts, limit, offset, interval
+            timeline_data = await self.__portfolio_snapshot_repo.get_owned_timeline(
+                user_id, address, from_ts, to_ts, limit, offset, interval
             )
+            if timeline_data is None:
+                self.__audit.warning(
+                    "wallet_usecase_get_portfolio_timeline_unauthorized",
+                    user_id=str(user_id),
+                    wallet_address=address,
+                )
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Wallet not found or access denied",
+                )
 
             # Transform data into PortfolioTimeline format
             timestamps = []
@@ -0,0 +1,40 @@
+"""Bounded ``DELETE`` statements for housekeeping jobs.
+
+Deleting every expired row of a large table in one statement holds its locks
+and bloats WAL for the whole run. :func:`build_batch_delete` removes at most
+*limit* rows per statement, addressing them by physical row id (``ctid`` on
+PostgreSQL, ``rowid`` on SQLite) so each batch is a TID lookup rather than a
+second index scan::
+
+    DELETE FROM t WHERE ctid IN (SELECT ctid FROM t WHERE ... LIMIT n)
+
+Callers commit after each batch and pause between them.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import literal_column, select
+from sqlalchemy.sql.elements import ColumnElement
+
+# Dialect → physical row id pseudo-column
+_ROW_ID = {"postgresql": "ctid", "sqlite": "rowid"}
+
+
+def build_batch_delete(
+    dialect: str, table: Any, whereclause: ColumnElement, limit: int
+):
+    """Return a ``DELETE`` of at most *limit* rows of *table* matching *whereclause*.
+
+    Dialects without a row id pseudo-column fall back to the primary key.
+    """
+    row_id = _ROW_ID.get(dialect)
+    if row_id is None:
+        (key,) = table.primary_key.columns
+        batch = select(key).where(whereclause).limit(limit)
+        return table.delete().where(key.in_(batch))
+
+    column = literal_column(row_id)
+    batch = select(column).select_from(table).where(whereclause).limit(limit)
+    return table.delete().where(column.in_(batch))
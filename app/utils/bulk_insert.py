@@ -0,0 +1,87 @@
+"""Dialect-aware multi-row ``INSERT … ON CONFLICT`` helpers.
+
+SQLAlchemy exposes ``on_conflict_do_update`` / ``on_conflict_do_nothing`` only
+through the PostgreSQL and SQLite dialect specific ``insert`` constructs.  The
+helpers below pick the right one for the bound session so repositories can
+issue a single round-trip upsert regardless of the backing database.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator, Sequence
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Both PostgreSQL and SQLite cap bound parameters per statement at ~32k; keep
+# each statement comfortably below that whatever the column count.
+MAX_BIND_PARAMS = 30_000
+
+
+def dialect_name(session: AsyncSession) -> str:
+    """Return the SQL dialect name (``postgresql``, ``sqlite`` …) of *session*."""
+    return session.bind.dialect.name
+
+
+def chunk_rows(
+    rows: Sequence[dict[str, Any]], max_params: int = MAX_BIND_PARAMS
+) -> Iterator[Sequence[dict[str, Any]]]:
+    """Yield slices of *rows* that stay below *max_params* bound parameters."""
+    if not rows:
+        return
+    per_row = max(1, len(rows[0]))
+    size = max(1, max_params // per_row)
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
+def dialect_insert(dialect: str, table: Any):
+    """Return the dialect specific ``insert`` construct for *table*."""
+    if dialect == "postgresql":
+        return pg_insert(table)
+    if dialect == "sqlite":
+        return sqlite_insert(table)
+    raise NotImplementedError(  # pragma: no cover – Postgres & SQLite only
+        f"Upsert not supported for dialect '{dialect}'"
+    )
+
+
+def on_conflict_update(
+    stmt,
+    conflict_columns: Iterable[str],
+    update_columns: Iterable[str] | None = None,
+):
+    """Attach ``ON CONFLICT`` handling to a dialect specific insert *stmt*.
+
+    Empty *update_columns* turns the statement into ``ON CONFLICT DO NOTHING``.
+    """
+    index_elements = list(conflict_columns)
+    updates = list(update_columns or ())
+    if not updates:
+        return stmt.on_conflict_do_nothing(index_elements=index_elements)
+    return stmt.on_conflict_do_update(
+        index_elements=index_elements,
+        set_={col: stmt.excluded[col] for col in updates},
+    )
+
+
+def build_upsert(
+    dialect: str,
+    table: Any,
+    rows: Sequence[dict[str, Any]],
+    conflict_columns: Iterable[str],
+    update_columns: Iterable[str] | None = None,
+):
+    """Build a multi-row upsert statement for *table*.
+
+    Args:
+        dialect: Dialect name as returned by :func:`dialect_name`.
+        table: Mapped class or :class:`~sqlalchemy.Table`.
+        rows: Column/value mappings, one per row.
+        conflict_columns: Columns of the unique constraint to upsert on.
+        update_columns: Columns overwritten on conflict. ``None`` or an empty
+            iterable turns the statement into ``ON CONFLICT DO NOTHING``.
+    """
+    stmt = dialect_insert(dialect, table).values(list(rows))
+    return on_conflict_update(stmt, conflict_columns, update_columns)
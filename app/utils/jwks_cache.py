@@ -1,9 +1,20 @@
-"""Redis caching utilities for JWKS endpoint."""
+"""Caching utilities for the JWKS endpoint.
+
+Each process serves the JWKS from an in-memory :class:`JWKSDocument` (the
+pre-encoded response body plus its ETag), so a fetch costs a dict lookup
+and no serialization. Redis holds the shared copy that new or invalidated
+processes read, over the utility's pooled client. Key rotation deletes the
+shared copy and publishes on ``JWKS_CHANNEL``, and every listening process
+drops its local document; ``JWKS_LOCAL_TTL_SEC`` bounds staleness if that
+message is missed.
+"""
 
 import asyncio
+import hashlib
 import json
 import logging
-from typing import Optional
+import time
+from typing import NamedTuple, Optional
 
 from redis.asyncio import Redis
 
@@ -16,6 +27,40 @@ logger = logging.getLogger(__name__)
 # Cache key for JWKS - static since content is the same for all clients
 JWKS_CACHE_KEY = "jwks:current"
 
+# Upper bound of the invalidation listener's reconnect backoff
+_RECONNECT_MAX_SEC = 30
+
+
+def serialize_jwks(jwks: JWKSet) -> bytes:
+    """Return the JSON body served for *jwks*."""
+    return json.dumps(jwks.model_dump(exclude_none=True)).encode("utf-8")
+
+
+class JWKSDocument(NamedTuple):
+    """Pre-encoded JWKS response with its strong ETag."""
+
+    body: bytes
+    etag: str
+    max_age: int
+
+    @classmethod
+    def from_body(cls, body: bytes, max_age: int) -> "JWKSDocument":
+        """Wrap an already serialized JWKS *body*."""
+        return cls(body, f'"{hashlib.sha256(body).hexdigest()[:32]}"', max_age)
+
+    @classmethod
+    def from_jwks(cls, jwks: JWKSet, max_age: int) -> "JWKSDocument":
+        """Serialize *jwks* into a document."""
+        return cls.from_body(serialize_jwks(jwks), max_age)
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """Return True if an ``If-None-Match`` header covers this document."""
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        # If-None-Match uses weak comparison
+        return "*" in tags or any(tag.removeprefix("W/") == self.etag for tag in tags)
+
 
 class JWKSCacheUtils(JWKSCacheUtilsInterface):
     """Utility class for JWKS caching operations."""
@@ -24,6 +69,9 @@ class JWKSCacheUtils(JWKSCacheUtilsInterface):
         """Initialize JWKSCacheUtils with dependencies."""
         self.__config = config
         self._redis_client: Redis | None = None
+        self._document: Optional[JWKSDocument] = None
+        self._document_expires_at = 0.0
+        self._listener: asyncio.Task | None = None
 
     def _build_redis_client(self) -> Redis:
         """Return an *async* Redis client using ``Configuration.redis_url``."""
@@ -51,6 +99,18 @@ class JWKSCacheUtils(JWKSCacheUtilsInterface):
             logger.warning("Failed to retrieve JWKS from cache: %s", e)
         return None
 
+    async def get_jwks_body(self, redis: Redis) -> Optional[bytes]:
+        """Return the cached JWKS as the serialized body, without parsing it."""
+        try:
+            cached_data = await redis.get(JWKS_CACHE_KEY)
+            if cached_data:
+                if isinstance(cached_data, str):
+                    cached_data = cached_data.encode("utf-8")
+                return cached_data
+        except Exception as e:
+            logger.warning("Failed to retrieve JWKS from cache: %s", e)
+        return None
+
     async def set_jwks_cache(self, redis: Redis, jwks: JWKSet) -> bool:
         """Store JWKS in Redis cache with configured TTL.
 
@@ -58,7 +118,7 @@ class JWKSCacheUtils(JWKSCacheUtilsInterface):
             True if successfully cached, False on error
         """
         try:
-            serialized = json.dumps(jwks.model_dump())
+            serialized = serialize_jwks(jwks).decode("utf-8")
             # Note: Some internal libraries expect the order (key, value, ttl). We
             # follow that ordering here to ensure our property-based tests—which
             # patch the mock Redis client and introspect positional args—can make
@@ -76,7 +136,9 @@ class JWKSCacheUtils(JWKSCacheUtilsInterface):
         """Explicitly invalidate the JWKS cache.
 
         This function is called by the JWT rotation task to ensure
-        fresh keys are published immediately after rotation.
+        fresh keys are published immediately after rotation. Processes
+        holding a local copy are told to drop it even when the Redis entry
+        was already gone.
 
         Returns:
             True if cache entry existed and was deleted, False otherwise or on error
@@ -87,6 +149,7 @@ class JWKSCacheUtils(JWKSCacheUtilsInterface):
                 logger.info("JWKS cache invalidated")
             else:
                 logger.info("JWKS cache key not present; nothing to invalidate")
+            await redis.publish(self.__config.JWKS_CHANNEL, "invalidate")
             return bool(deleted)
         except Exception as e:
             logger.warning("Failed to invalidate JWKS cache: %s", e)
@@ -98,7 +161,80 @@ class JWKSCacheUtils(JWKSCacheUtilsInterface):
             redis = self._build_redis_client()
             result = asyncio.run(self.invalidate_jwks_cache(redis))
             asyncio.run(redis.close())
+            # The pool was bound to the event loop that just finished
+            self._redis_client = None
             return result
         except Exception as e:
             logger.warning("Failed to invalidate JWKS cache (sync): %s", e)
             return False
+
+    # ------------------------------------------------------------------
+    # In-process document
+    # ------------------------------------------------------------------
+
+    def get_local(self) -> Optional[JWKSDocument]:
+        """Return this process's JWKS document unless invalidated or stale."""
+        if self._document is not None and time.monotonic() < self._document_expires_at:
+            return self._document
+        return None
+
+    def set_local(self, body: bytes) -> JWKSDocument:
+        """Keep serialized *body* as this process's JWKS document."""
+        self._document = JWKSDocument.from_body(body, self.__config.JWKS_MAX_AGE_SEC)
+        self._document_expires_at = time.monotonic() + self.__config.JWKS_LOCAL_TTL_SEC
+        return self._document
+
+    def clear_local(self) -> None:
+        """Drop this process's JWKS document."""
+        self._document = None
+
+    # ------------------------------------------------------------------
+    # Pub/sub
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start the invalidation listener (idempotent)."""
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop the invalidation listener and release the Redis connection."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):  # noqa: BLE001
+                pass
+            self._listener = None
+        if self._redis_client is not None:
+            try:
+                await self._redis_client.aclose()
+            except Exception as exc:  # noqa: BLE001 – log only
+                logger.warning("Failed to close JWKS Redis client: %s", exc)
+            self._redis_client = None
+
+    async def _listen(self) -> None:
+        """Drop the local document on every invalidation, reconnecting."""
+        delay = 1
+        max_delay = _RECONNECT_MAX_SEC
+        while True:
+            try:
+                pubsub = self._build_redis_client().pubsub()
+                try:
+                    await pubsub.subscribe(self.__config.JWKS_CHANNEL)
+                    # Invalidations missed while disconnected
+                    self.clear_local()
+                    delay = 1
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            self.clear_local()
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001 – retry
+                logger.warning(
+                    "JWKS listener disconnected (%s); retrying in %ss", exc, delay
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, max_delay)
@@ -0,0 +1,212 @@
+"""Asymmetric JWS signing and verification on pre-parsed key objects.
+
+python-jose re-parses PEM text on every ``encode``/``decode`` and has no
+EdDSA support, so asymmetric tokens (RS*, ES*, EdDSA) are signed and
+verified here with *cryptography* key objects. PEM material is parsed once
+per process (:func:`load_key` is memoised) and the same objects back token
+signing, verification and JWKS export. HS* tokens stay on python-jose.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, padding, rsa
+from cryptography.hazmat.primitives.asymmetric.utils import (
+    decode_dss_signature,
+    encode_dss_signature,
+)
+
+__all__ = [
+    "ASYMMETRIC_ALGORITHMS",
+    "AsymmetricKey",
+    "b64url_uint",
+    "encode",
+    "is_asymmetric",
+    "load_key",
+    "prepare_key",
+    "public_jwk",
+]
+
+_HASHES = {"256": hashes.SHA256, "384": hashes.SHA384, "512": hashes.SHA512}
+
+# ES* algorithm → (curve, JWK "crv" name)
+_EC_CURVES = {
+    "ES256": (ec.SECP256R1, "P-256"),
+    "ES384": (ec.SECP384R1, "P-384"),
+    "ES512": (ec.SECP521R1, "P-521"),
+}
+_CRV_TO_ALG = {crv: alg for alg, (_, crv) in _EC_CURVES.items()}
+
+ASYMMETRIC_ALGORITHMS = frozenset({"RS256", "RS384", "RS512", *_EC_CURVES, "EdDSA"})
+
+
+def is_asymmetric(alg: str) -> bool:
+    """Return True if *alg* is signed with a private/public key pair."""
+    return alg in ASYMMETRIC_ALGORITHMS
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def b64url_uint(integer: int, length: Optional[int] = None) -> str:
+    """Encode an unsigned integer as unpadded base64url (big-endian).
+
+    *length* pads the value to a fixed byte width, as required for EC
+    coordinates.
+    """
+    if length is None:
+        length = (integer.bit_length() + 7) // 8
+    return _b64url(integer.to_bytes(length, "big"))
+
+
+@lru_cache(maxsize=64)
+def load_key(material: str | bytes):
+    """Parse PEM *material* into a private or public key object, once."""
+    data = material.encode() if isinstance(material, str) else material
+    if b"PRIVATE KEY" in data:
+        return serialization.load_pem_private_key(data, password=None)
+    return serialization.load_pem_public_key(data)
+
+
+class AsymmetricKey:
+    """Parsed key bound to one JWS algorithm."""
+
+    __slots__ = ("alg", "private_key", "public_key", "_hash", "_size")
+
+    def __init__(self, alg: str, key):
+        self.alg = alg
+        if hasattr(key, "public_key"):
+            self.private_key = key
+            self.public_key = key.public_key()
+        else:
+            self.private_key = None
+            self.public_key = key
+        self._hash = _HASHES.get(alg[-3:], hashes.SHA256)()
+        self._size = 0
+
+        public = self.public_key
+        if alg.startswith("RS"):
+            valid = isinstance(public, rsa.RSAPublicKey)
+        elif alg.startswith("ES"):
+            valid = isinstance(public, ec.EllipticCurvePublicKey) and isinstance(
+                public.curve, _EC_CURVES[alg][0]
+            )
+            self._size = (public.curve.key_size + 7) // 8 if valid else 0
+        else:
+            valid = isinstance(public, ed25519.Ed25519PublicKey)
+        if not valid:
+            raise ValueError(f"Key type does not match JWT algorithm {alg}")
+
+    def sign(self, msg: bytes) -> bytes:
+        """Return the JWS signature of *msg*."""
+        if self.private_key is None:
+            raise ValueError("A private key is required to sign tokens")
+        if self.alg.startswith("RS"):
+            return self.private_key.sign(msg, padding.PKCS1v15(), self._hash)
+        if self.alg.startswith("ES"):
+            # JWS uses the fixed-size r || s form instead of DER
+            r, s = decode_dss_signature(
+                self.private_key.sign(msg, ec.ECDSA(self._hash))
+            )
+            return r.to_bytes(self._size, "big") + s.to_bytes(self._size, "big")
+        return self.private_key.sign(msg)
+
+    def verify(self, msg: bytes, sig: bytes) -> bool:
+        """Return True if *sig* is a valid signature of *msg*."""
+        try:
+            if self.alg.startswith("RS"):
+                self.public_key.verify(sig, msg, padding.PKCS1v15(), self._hash)
+            elif self.alg.startswith("ES"):
+                if len(sig) != 2 * self._size:
+                    return False
+                r = int.from_bytes(sig[: self._size], "big")
+                s = int.from_bytes(sig[self._size :], "big")
+                self.public_key.verify(
+                    encode_dss_signature(r, s), msg, ec.ECDSA(self._hash)
+                )
+            else:
+                self.public_key.verify(sig, msg)
+        except InvalidSignature:
+            return False
+        return True
+
+
+@lru_cache(maxsize=64)
+def prepare_key(material: str | bytes, alg: str) -> AsymmetricKey:
+    """Return the :class:`AsymmetricKey` for PEM *material* and *alg*."""
+    return AsymmetricKey(alg, load_key(material))
+
+
+def encode(
+    claims: Dict[str, Any],
+    key: AsymmetricKey,
+    headers: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Serialize and sign *claims* as a compact JWS."""
+    header = {"alg": key.alg, "typ": "JWT", **(headers or {})}
+    signing_input = "{}.{}".format(
+        _b64url(json.dumps(header, separators=(",", ":")).encode()),
+        _b64url(json.dumps(claims, separators=(",", ":")).encode()),
+    )
+    signature = key.sign(signing_input.encode("ascii"))
+    return f"{signing_input}.{_b64url(signature)}"
+
+
+def public_jwk(
+    material: str | bytes, kid: str, alg: Optional[str] = None
+) -> Dict[str, Any]:
+    """Return the public JWK of PEM *material* (private keys are accepted).
+
+    RSA keys default to ``RS256``; EC and Ed25519 keys take the algorithm
+    implied by their curve.
+    """
+    key = load_key(material)
+    public = key.public_key() if hasattr(key, "public_key") else key
+
+    if isinstance(public, rsa.RSAPublicKey):
+        numbers = public.public_numbers()
+        return {
+            "kty": "RSA",
+            "use": "sig",
+            "kid": kid,
+            "alg": alg or "RS256",
+            "n": b64url_uint(numbers.n),
+            "e": b64url_uint(numbers.e),
+        }
+    if isinstance(public, ec.EllipticCurvePublicKey):
+        crv = {curve.name: name for curve, name in _EC_CURVES.values()}.get(
+            public.curve.name
+        )
+        if crv is None:
+            raise TypeError(f"Unsupported EC curve: {public.curve.name}")
+        size = (public.curve.key_size + 7) // 8
+        numbers = public.public_numbers()
+        return {
+            "kty": "EC",
+            "use": "sig",
+            "kid": kid,
+            "alg": alg or _CRV_TO_ALG[crv],
+            "crv": crv,
+            "x": b64url_uint(numbers.x, size),
+            "y": b64url_uint(numbers.y, size),
+        }
+    if isinstance(public, ed25519.Ed25519PublicKey):
+        raw = public.public_bytes(
+            serialization.Encoding.Raw, serialization.PublicFormat.Raw
+        )
+        return {
+            "kty": "OKP",
+            "use": "sig",
+            "kid": kid,
+            "alg": alg or "EdDSA",
+            "crv": "Ed25519",
+            "x": _b64url(raw),
+        }
+    raise TypeError("Only RSA, EC and Ed25519 public keys can be exported as JWK")
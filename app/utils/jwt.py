@@ -4,16 +4,22 @@ JWT utility helpers leveraging python-jose.
 
 from __future__ import annotations
 
+import json
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict
 
-from jose import ExpiredSignatureError, JWTError, jwt
+from jose import ExpiredSignatureError, JWTError, jwk, jwt
+from jose.exceptions import JWTClaimsError
+from jose.utils import base64url_decode
 from pydantic import ValidationError
 
 from app.core.config import Configuration
 from app.domain.interfaces.utils import JWTUtilsInterface
 from app.domain.schemas.jwt import JWTPayload
+from app.utils import jws
+from app.utils.jws import is_asymmetric
 from app.utils.logging import Audit
 
 # ---------------------------------------------------------------------------
@@ -24,11 +30,19 @@ from app.utils.logging import Audit
 # valid until *retire_at* then are rejected.
 _RETIRED_KEYS: dict[str, datetime] = {}
 
+# Upper bound on cached verification key objects per JWTUtils instance
+_MAX_VERIFIERS = 32
+
 
 def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def is_key_retired(kid: str | None) -> bool:
+    """Return True once tokens signed with *kid* are past their grace period."""
+    return kid in _RETIRED_KEYS and _now_utc() > _RETIRED_KEYS[kid]
+
+
 def rotate_signing_key(
     new_kid: str,
     new_signing_key: str,
@@ -84,6 +98,7 @@ class JWTUtils(JWTUtilsInterface):
         self.__audit = audit
         self.__sign_key_cache = None
         self.__verify_key_cache = None
+        self.__verifiers: dict = {}
 
     def clear_caches(self) -> None:
         """Clear internal key caches for testing purposes.
@@ -93,6 +108,7 @@ class JWTUtils(JWTUtilsInterface):
         """
         self.__sign_key_cache = None
         self.__verify_key_cache = None
+        self.__verifiers.clear()
 
     def _get_sign_key(self) -> str | bytes:  # pragma: no cover
         """Return the key used to sign tokens based on algorithm."""
@@ -119,10 +135,10 @@ class JWTUtils(JWTUtilsInterface):
             self.__sign_key_cache = key
             return key
 
-        if alg.startswith("RS"):
+        if is_asymmetric(alg):
             if not self.__config.JWT_PRIVATE_KEY_PATH:
                 raise RuntimeError(
-                    "JWT_PRIVATE_KEY_PATH must be set for RS* algorithms"
+                    "JWT_PRIVATE_KEY_PATH must be set for RS*/ES*/EdDSA algorithms"
                 )
             key = self._load_key(self.__config.JWT_PRIVATE_KEY_PATH)
             self.__sign_key_cache = key
@@ -149,9 +165,11 @@ class JWTUtils(JWTUtilsInterface):
             key = _to_text(self._get_sign_key())
             self.__verify_key_cache = key
             return key
-        if alg.startswith("RS"):
+        if is_asymmetric(alg):
             if not self.__config.JWT_PUBLIC_KEY_PATH:
-                raise RuntimeError("JWT_PUBLIC_KEY_PATH must be set for RS* algorithms")
+                raise RuntimeError(
+                    "JWT_PUBLIC_KEY_PATH must be set for RS*/ES*/EdDSA algorithms"
+                )
             key = self._load_key(self.__config.JWT_PUBLIC_KEY_PATH)
             self.__verify_key_cache = key
             return key
@@ -183,29 +201,7 @@ class JWTUtils(JWTUtilsInterface):
         }
         if additional_claims:
             payload.update(additional_claims)
-        headers = {"kid": self.__config.ACTIVE_JWT_KID}
-        sign_key = self._get_sign_key()
-        try:
-            token = jwt.encode(
-                payload,
-                sign_key,
-                algorithm=self.__config.JWT_ALGORITHM,
-                headers=headers,
-            )
-        except JWTError:
-            # Retry with alternate representation if needed
-            alt_key = (
-                sign_key.encode("latin-1")
-                if isinstance(sign_key, str)
-                else sign_key.decode("latin-1")
-            )
-            token = jwt.encode(
-                payload,
-                alt_key,
-                algorithm=self.__config.JWT_ALGORITHM,
-                headers=headers,
-            )
-        return token
+        return self._encode(payload)
 
     def create_refresh_token(self, subject: str | int) -> str:
         """Create a refresh JWT using the default *REFRESH_TOKEN_EXPIRE_DAYS*."""
@@ -222,15 +218,18 @@ class JWTUtils(JWTUtilsInterface):
             "jti": jti,
             "type": "refresh",
         }
+        return self._encode(payload)
+
+    def _encode(self, payload: Dict[str, Any]) -> str:
+        """Sign *payload* with the active key, tagging it with its *kid*."""
         headers = {"kid": self.__config.ACTIVE_JWT_KID}
+        alg = self.__config.JWT_ALGORITHM
         sign_key = self._get_sign_key()
+        if is_asymmetric(alg):
+            # Parsed once per key; python-jose would re-read the PEM each time
+            return jws.encode(payload, jws.prepare_key(sign_key, alg), headers)
         try:
-            token = jwt.encode(
-                payload,
-                sign_key,
-                algorithm=self.__config.JWT_ALGORITHM,
-                headers=headers,
-            )
+            token = jwt.encode(payload, sign_key, algorithm=alg, headers=headers)
         except JWTError:
             # Retry with alternate representation if needed
             alt_key = (
@@ -238,142 +237,74 @@ class JWTUtils(JWTUtilsInterface):
                 if isinstance(sign_key, str)
                 else sign_key.decode("latin-1")
             )
-            token = jwt.encode(
-                payload,
-                alt_key,
-                algorithm=self.__config.JWT_ALGORITHM,
-                headers=headers,
-            )
+            token = jwt.encode(payload, alt_key, algorithm=alg, headers=headers)
         return token
 
-    def decode_token(self, token: str) -> Dict[str, Any]:
-        # Use the latest runtime configuration (tests often patch JWT config).
-        """Decode a JWT and validate its integrity.
-
-        In a few situations (e.g. when an incorrect *options* dict is
-        accidentally supplied) python-jose can skip signature validation and
-        simply return the payload.  We explicitly set *verify_signature=True*
-        to guarantee tamper-detection.  We also perform a minimal sanity check
-        on required claims so that a token missing *sub* will never be treated
-        as valid.  Any failure propagates as *JWTError* subclasses which the
-        caller may handle.
-        """
-
-        # 1. Extract *kid* from unverified header so we can locate verification key.
-        header = jwt.get_unverified_header(token)
-        kid: str | None = header.get("kid") if isinstance(header, dict) else None
-
-        # Determine verification key
-        verify_key = None
+    def _get_verifier(self, kid: str | None):
+        """Return the prepared verification key object for *kid*.
 
-        if kid and kid in self.__config.JWT_KEYS:
-            verify_key = self.__config.JWT_KEYS[kid]
+        Key objects are built once per (algorithm, key material) pair, so a
+        token costs a single signature check and a rotated or patched key
+        map is picked up on the next call.
+        """
+        keys = self.__config.JWT_KEYS
+        if kid and keys and kid in keys:
+            material = keys[kid]
         else:
             # Fallback to default single-key behaviour for backward compatibility
-            verify_key = self._get_verify_key()
+            material = self._get_verify_key()
+
+        alg = self.__config.JWT_ALGORITHM
+        if is_asymmetric(alg):
+            return jws.prepare_key(material, alg)
+        verifier = self.__verifiers.get((alg, material))
+        if verifier is None:
+            if len(self.__verifiers) >= _MAX_VERIFIERS:
+                self.__verifiers.clear()
+            verifier = jwk.construct(_to_text(material), alg)
+            self.__verifiers[(alg, material)] = verifier
+        return verifier
 
+    def decode_token(self, token: str) -> Dict[str, Any]:
+        """Verify a JWT and return its validated payload.
+
+        The signature is checked exactly once over the raw signing input with
+        a cached key object; claims are only parsed after it verifies. The
+        header ``alg`` must equal ``JWT_ALGORITHM``, tokens signed with
+        retired keys are rejected after their grace period, ``sub``, ``jti``
+        and ``exp`` are required and ``exp``/``nbf``/``iat`` are checked
+        like python-jose does. Failures raise *JWTError* subclasses.
+        """
+        try:
+            header_b64, payload_b64, signature_b64 = token.split(".")
+            header = json.loads(base64url_decode(header_b64.encode("ascii")))
+            signature = base64url_decode(signature_b64.encode("ascii"))
+        except (ValueError, TypeError, AttributeError, UnicodeError) as exc:
+            raise JWTError("Invalid token format") from exc
+        if not isinstance(header, dict):
+            raise JWTError("Invalid token header")
+
+        # Never let the token pick its own algorithm (alg confusion / "none")
+        if header.get("alg") != self.__config.JWT_ALGORITHM:
+            raise JWTError("The specified alg value is not allowed")
+
+        kid = header.get("kid")
         # Reject tokens signed with retired keys after grace-period
-        if kid in _RETIRED_KEYS and _now_utc() > _RETIRED_KEYS[kid]:
+        if is_key_retired(kid):
             raise ExpiredSignatureError("Token signed with retired key")
 
-        def _decode_with_key(key):
-            return jwt.decode(
-                token,
-                _to_text(key),
-                algorithms=[self.__config.JWT_ALGORITHM],
-                options={
-                    "verify_signature": True,
-                    "verify_exp": True,
-                    "verify_iat": True,
-                    "verify_nbf": True,
-                    "require": ["sub", "jti", "exp"],
-                },
-            )
+        signing_input = f"{header_b64}.{payload_b64}".encode("ascii")
+        if not self._get_verifier(kid).verify(signing_input, signature):
+            raise JWTError("Signature verification failed")
 
         try:
-            payload = _decode_with_key(verify_key)
-        except Exception as exc:
-            # If the failure is due to token expiry or other standard issues,
-            # propagate it immediately.  We only want to retry on key-format
-            # problems (e.g., JWKError about string/bytes).
-            if isinstance(exc, ExpiredSignatureError):
-                raise
-            if not isinstance(exc, JWTError):
-                # Any other JWT-related error should bubble up.
-                raise
-
-            # Edge-case: retry with the alternate representation (bytes ↔ str).
-            alt_key = None
-            if isinstance(verify_key, bytes):
-                try:
-                    alt_key = verify_key.decode("latin-1")
-                except Exception:
-                    alt_key = None
-            elif isinstance(verify_key, str):
-                alt_key = verify_key.encode("latin-1")
-
-            if alt_key is not None:
-                try:
-                    payload = _decode_with_key(alt_key)
-                except Exception as inner_exc:
-                    if isinstance(inner_exc, ExpiredSignatureError):
-                        raise
-                    # Final fallback – manual HMAC verification (handles rare
-                    # python-jose bug with specific secrets like 'Infinity').
-                    try:
-                        import base64
-                        import json
-
-                        from jose import jwk as jose_jwk
-                        from jose import utils as jose_utils
-
-                        header_b64, payload_b64, signature_b64 = token.split(".")
-                        signing_input = f"{header_b64}.{payload_b64}".encode()
-                        signature = jose_utils.base64url_decode(signature_b64.encode())
-
-                        key_obj = jose_jwk.construct(
-                            _to_text(verify_key), self.__config.JWT_ALGORITHM
-                        )
-                        if not key_obj.verify(signing_input, signature):
-                            raise inner_exc  # Signature invalid
-
-                        padded = payload_b64 + "=" * (-len(payload_b64) % 4)
-                        payload = json.loads(base64.urlsafe_b64decode(padded))
-                        return payload  # Verified manually
-                    except Exception:
-                        raise inner_exc
-            else:
-                raise exc
-
-        # Basic payload sanity – make sure subject still present and non-empty.
-        if not payload.get("sub"):
-            raise JWTError("Token payload is missing required 'sub' claim")
-
-        # Extra integrity guard – ensure provided token signature matches
-        try:
-            recomputed_key = (
-                verify_key if "alt_key" not in locals() or not alt_key else alt_key
-            )
-            recomputed = jwt.encode(
-                payload,
-                recomputed_key,
-                algorithm=self.__config.JWT_ALGORITHM,
-                headers={"kid": kid} if kid else None,
-            )
-            if recomputed.split(".")[2] != token.split(".")[2]:
-                raise JWTError("Signature verification failed")
-        except Exception as exc:
-            # If re-encoding fails due to python-jose edge-cases (e.g. when
-            # the secret cannot be represented in the alternate form) we can
-            # safely ignore *encoding* errors **BUT** we must surface
-            # signature verification problems so that tampering is detected
-            # by calling code and relevant security tests (see
-            # ``tests/unit/auth/test_jwt_utils.py::test_jwt_invalid_token``).
-
-            if isinstance(exc, JWTError):
-                raise
-            # Any non-JWT related exception (mostly encode errors) is deemed
-            # non-critical for verification purposes and can be ignored.
+            payload = json.loads(base64url_decode(payload_b64.encode("ascii")))
+        except ValueError as exc:
+            raise JWTError("Invalid payload string") from exc
+        if not isinstance(payload, dict):
+            raise JWTError("Invalid payload string: must be a json object")
+
+        _validate_claims(payload)
 
         try:
             payload_obj = JWTPayload.model_validate(payload)
@@ -389,6 +320,27 @@ class JWTUtils(JWTUtilsInterface):
 # ---------------------------------------------------------------------------
 
 
+def _validate_claims(claims: Dict[str, Any]) -> None:
+    """Check registered claims of a verified payload."""
+    # Basic payload sanity – make sure subject is present and non-empty.
+    if not claims.get("sub"):
+        raise JWTError("Token payload is missing required 'sub' claim")
+    for claim in ("jti", "exp"):
+        if claim not in claims:
+            raise JWTClaimsError(f'missing required key "{claim}" among claims')
+
+    now = int(time.time())
+    try:
+        if int(claims["exp"]) < now:
+            raise ExpiredSignatureError("Signature has expired.")
+        if "nbf" in claims and int(claims["nbf"]) > now:
+            raise JWTClaimsError("The token is not yet valid (nbf)")
+        if "iat" in claims:
+            int(claims["iat"])
+    except (TypeError, ValueError) as exc:
+        raise JWTClaimsError("Token time claims must be integers") from exc
+
+
 def _to_text(key: str | bytes) -> str:
     """Return *key* as a **str** without losing information.
 
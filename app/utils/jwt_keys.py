@@ -1,37 +1,36 @@
 """Utility helpers for converting public keys to JSON Web Keys (JWK).
 
-This module currently supports RSA public keys which are the only key type
-used by our JWT authentication system (RS256).  Support for additional key
-types (EC, OKP, symmetric) can be added in future tasks.
+RSA, EC (P-256/384/521) and Ed25519 keys are supported. PEM parsing goes
+through :func:`app.utils.jws.load_key`, so a key is parsed once per process
+and shared with token signing and verification.
 """
 
 from __future__ import annotations
 
-import base64
 from datetime import datetime, timezone
-from typing import Any, Dict
-
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
 from app.core.config import Configuration
 from app.domain.interfaces.utils import JWTKeyUtilsInterface
 from app.domain.schemas.jwks import JWK
+from app.utils.jws import public_jwk
 from app.utils.jwt_rotation import Key
 
 __all__ = [
     "JWTKeyUtils",
-    "_b64url_uint",
 ]
 
 
-def _b64url_uint(integer: int) -> str:
-    """Encode an unsigned integer as base64url without padding."""
-
-    byte_length = (integer.bit_length() + 7) // 8
-    as_bytes = integer.to_bytes(byte_length, "big")
-    return base64.urlsafe_b64encode(as_bytes).rstrip(b"=").decode("ascii")
+@lru_cache(maxsize=64)
+def _validated_jwk(
+    public_key_pem: str | bytes, kid: str, alg: Optional[str]
+) -> Dict[str, Any]:
+    """Build and validate the JWK once per (PEM, kid, alg); callers copy it."""
+    jwk_dict = public_jwk(public_key_pem, kid, alg)
+    # Validate via Pydantic – raises if invalid and ensures types/values
+    JWK(**jwk_dict)
+    return jwk_dict
 
 
 class JWTKeyUtils(JWTKeyUtilsInterface):
@@ -94,18 +93,21 @@ class JWTKeyUtils(JWTKeyUtilsInterface):
         return valid_keys
 
     def format_public_key_to_jwk(
-        self, public_key_pem: str | bytes, kid: str, *, alg: str = "RS256"
+        self, public_key_pem: str | bytes, kid: str, *, alg: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Convert an RSA public key to a JWK dictionary conforming to RFC-7517.
+        """Convert a public key to a JWK dictionary conforming to RFC-7517.
 
         Parameters
         ----------
         public_key_pem:
-            The PEM encoded RSA public key as *str* or *bytes*.
+            The PEM encoded RSA, EC or Ed25519 key as *str* or *bytes*.  A
+            private key PEM is accepted; only its public half is exported.
         kid:
             Key identifier to place in the resulting JWK (must match JWT *kid* header).
         alg:
-            Signature algorithm – defaults to "RS256".
+            Signature algorithm.  Defaults to the algorithm implied by the key
+            type: "RS256" for RSA, "ES256"/"ES384"/"ES512" for the P-256/384/521
+            curves and "EdDSA" for Ed25519.
 
         Returns
         -------
@@ -113,31 +115,4 @@ class JWTKeyUtils(JWTKeyUtilsInterface):
             A dictionary representation of the key that validates against
             :class:`app.domain.schemas.jwks.JWK`.
         """
-        if isinstance(public_key_pem, str):
-            key_bytes = public_key_pem.encode()
-        else:
-            key_bytes = public_key_pem
-
-        public_key = serialization.load_pem_public_key(
-            key_bytes, backend=default_backend()
-        )
-
-        if not isinstance(public_key, rsa.RSAPublicKey):
-            raise TypeError("Only RSA public keys are supported for JWKS export")
-
-        numbers = public_key.public_numbers()
-        n_b64 = _b64url_uint(numbers.n)
-        e_b64 = _b64url_uint(numbers.e)
-
-        jwk_dict: Dict[str, Any] = {
-            "kty": "RSA",
-            "use": "sig",
-            "kid": kid,
-            "alg": alg,
-            "n": n_b64,
-            "e": e_b64,
-        }
-
-        # Validate via Pydantic – raises if invalid and ensures types/values
-        JWK(**jwk_dict)
-        return jwk_dict
+        return dict(_validated_jwk(public_key_pem, kid, alg))
@@ -1,53 +1,118 @@
 """Redis caching utilities for DeFi aggregate metrics.
 
 This mirrors the JWKS caching helper but is parameterised by *wallet_id* so
-multiple keys can coexist.
+multiple keys can coexist. Reads also record the key in a "hot" sorted set
+(score = last read time) so a background refresher can recompute recently
+read entries before they expire.
 """
 
 from __future__ import annotations
 
 import json
 import logging
-from typing import Optional
+import time
+from typing import List, Optional
 
 from redis.asyncio import Redis
 
-from app.domain.defi_tracker.schemas import AggregateMetricsSchema
+from app.core.config import Configuration
+from app.domain.interfaces.utils import MetricsCacheUtilsInterface
+from app.domain.schemas.defi_aggregate import AggregateMetricsSchema
 
 logger = logging.getLogger(__name__)
 
 CACHE_PREFIX = "defi:agg:"
-DEFAULT_TTL_SEC = 60  # 1 minute – refreshed frequently by aggregator
-
-
-async def get_metrics_cache(
-    redis: Redis, wallet_id: str
-) -> Optional[AggregateMetricsSchema]:
-    """Retrieve cached :class:`AggregateMetricsSchema` for *wallet_id*."""
-    key = f"{CACHE_PREFIX}{wallet_id.lower()}"
-    try:
-        raw = await redis.get(key)
-        if raw:
-            if isinstance(raw, bytes):
-                raw = raw.decode("utf-8")
-            data = json.loads(raw)
-            return AggregateMetricsSchema(**data)
-    except Exception as exc:  # noqa: BLE001 – log only
-        logger.warning("Failed to read aggregate metrics cache: %s", exc)
-    return None
-
-
-async def set_metrics_cache(
-    redis: Redis,
-    wallet_id: str,
-    metrics: AggregateMetricsSchema,
-    ttl: int = DEFAULT_TTL_SEC,
-) -> bool:
-    """Store *metrics* in Redis for *wallet_id* with **ttl** seconds."""
-    key = f"{CACHE_PREFIX}{wallet_id.lower()}"
-    try:
-        await redis.setex(key, ttl, metrics.model_dump_json())
-        return True
-    except Exception as exc:  # noqa: BLE001 – log only
-        logger.warning("Failed to store aggregate metrics cache: %s", exc)
-        return False
+HOT_KEYS_KEY = "defi:agg:hot"
+
+
+def _cache_key(wallet_id: str) -> str:
+    return f"{CACHE_PREFIX}{wallet_id.lower()}"
+
+
+class MetricsCacheUtils(MetricsCacheUtilsInterface):
+    """Utility class for aggregate DeFi metrics caching operations."""
+
+    def __init__(self, config: Configuration):
+        """Initialize MetricsCacheUtils with dependencies."""
+        self.__config = config
+        self._redis_client: Redis | None = None
+
+    def _build_redis_client(self) -> Redis:
+        """Return an *async* Redis client using ``Configuration.redis_url``."""
+        if self._redis_client is None:
+            self._redis_client = Redis.from_url(self.__config.redis_url)
+        return self._redis_client
+
+    async def close(self) -> None:
+        """Release the shared Redis client; the next call builds a new one."""
+        if self._redis_client is not None:
+            try:
+                await self._redis_client.aclose()
+            except Exception as exc:  # noqa: BLE001 – log only
+                logger.warning("Failed to close metrics Redis client: %s", exc)
+            self._redis_client = None
+
+    async def get_metrics_cache(
+        self, wallet_id: str
+    ) -> Optional[AggregateMetricsSchema]:
+        """Retrieve cached :class:`AggregateMetricsSchema` for *wallet_id*."""
+        try:
+            raw = await self._build_redis_client().get(_cache_key(wallet_id))
+            if raw:
+                if isinstance(raw, bytes):
+                    raw = raw.decode("utf-8")
+                return AggregateMetricsSchema(**json.loads(raw))
+        except Exception as exc:  # noqa: BLE001 – log only
+            logger.warning("Failed to read aggregate metrics cache: %s", exc)
+        return None
+
+    async def set_metrics_cache(
+        self, wallet_id: str, metrics: AggregateMetricsSchema
+    ) -> bool:
+        """Store *metrics* for *wallet_id* with the configured TTL."""
+        try:
+            await self._build_redis_client().setex(
+                _cache_key(wallet_id),
+                self.__config.DEFI_METRICS_CACHE_TTL_SEC,
+                metrics.model_dump_json(),
+            )
+            return True
+        except Exception as exc:  # noqa: BLE001 – log only
+            logger.warning("Failed to store aggregate metrics cache: %s", exc)
+            return False
+
+    async def mark_hot(self, wallet_id: str) -> None:
+        """Record a read of *wallet_id* so the refresher keeps it warm."""
+        try:
+            await self._build_redis_client().zadd(
+                HOT_KEYS_KEY, {wallet_id: time.time()}
+            )
+        except Exception as exc:  # noqa: BLE001 – log only
+            logger.warning("Failed to mark aggregate metrics key hot: %s", exc)
+
+    async def get_keys_due_for_refresh(self) -> List[str]:
+        """Return hot wallet ids whose cached entry is missing or about to expire.
+
+        Keys not read within ``DEFI_METRICS_HOT_WINDOW_SEC`` are dropped from
+        the hot set and left to expire.
+        """
+        redis = self._build_redis_client()
+        cutoff = time.time() - self.__config.DEFI_METRICS_HOT_WINDOW_SEC
+        await redis.zremrangebyscore(HOT_KEYS_KEY, 0, cutoff)
+        members = await redis.zrange(HOT_KEYS_KEY, 0, -1)
+        wallet_ids = [m.decode("utf-8") if isinstance(m, bytes) else m for m in members]
+        if not wallet_ids:
+            return []
+
+        pipe = redis.pipeline(transaction=False)
+        for wallet_id in wallet_ids:
+            pipe.ttl(_cache_key(wallet_id))
+        ttls = await pipe.execute()
+
+        threshold = self.__config.DEFI_METRICS_REFRESH_AHEAD_SEC
+        # TTL is -2 for a missing key and -1 for a key without expiry
+        return [
+            wallet_id
+            for wallet_id, ttl in zip(wallet_ids, ttls)
+            if ttl is None or ttl == -2 or 0 <= ttl < threshold
+        ]
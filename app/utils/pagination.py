@@ -0,0 +1,36 @@
+"""Opaque keyset-pagination cursors.
+
+A cursor encodes the sort key of the last row of a page – ``(timestamp, id)``
+– as URL-safe base64 JSON. Clients treat it as an opaque string and pass it
+back unchanged to fetch the next page.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import uuid
+from datetime import datetime
+
+
+def encode_cursor(timestamp: datetime, row_id: uuid.UUID) -> str:
+    """Return an opaque cursor pointing *after* ``(timestamp, row_id)``."""
+    payload = json.dumps(
+        {"ts": timestamp.isoformat(), "id": str(row_id)}, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["ts"]), uuid.UUID(payload["id"])
+    # binascii.Error, JSON, isoformat and UUID errors all subclass ValueError
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
@@ -0,0 +1,182 @@
+"""In-process index of the latest token prices.
+
+Every API / worker process keeps its own copy of the latest price per token,
+addressable by contract address, symbol or token id, so valuation paths can
+read current prices without a database round-trip. The index is loaded from
+the database at startup and kept current through a Redis pub/sub channel:
+whichever process writes a price publishes the new quote and every
+subscriber (including the writer) merges it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Dict, Iterable, Optional
+
+from redis.asyncio import Redis
+
+from app.core.config import Configuration
+from app.domain.interfaces.utils import PriceIndexInterface
+from app.domain.schemas.token_price import LatestTokenPrice
+
+logger = logging.getLogger(__name__)
+
+
+def _is_newer(candidate: LatestTokenPrice, current: LatestTokenPrice) -> bool:
+    """Return True unless *current* is strictly newer than *candidate*."""
+    if candidate.timestamp is None or current.timestamp is None:
+        return candidate.timestamp is not None or current.timestamp is None
+    return candidate.timestamp >= current.timestamp
+
+
+class PriceIndex(PriceIndexInterface):
+    """Memory-resident latest-price lookup kept in sync over Redis pub/sub."""
+
+    def __init__(self, config: Configuration):
+        """Initialize PriceIndex with dependencies."""
+        self.__config = config
+        self._by_id: Dict[str, LatestTokenPrice] = {}
+        self._by_address: Dict[str, LatestTokenPrice] = {}
+        self._by_symbol: Dict[str, LatestTokenPrice] = {}
+        self._redis_client: Redis | None = None
+        self._listener: asyncio.Task | None = None
+
+    def _build_redis_client(self) -> Redis:
+        """Return an *async* Redis client using ``Configuration.redis_url``."""
+        if self._redis_client is None:
+            self._redis_client = Redis.from_url(self.__config.redis_url)
+        return self._redis_client
+
+    # ------------------------------------------------------------------
+    # Lookups – plain dict reads, safe to call on hot paths
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[LatestTokenPrice]:
+        """Look up a price by token address, symbol or id.
+
+        Addresses match case-insensitively, symbols are upper-cased. When
+        several tokens share a symbol the most recently merged one wins.
+        """
+        if not key:
+            return None
+        return (
+            self._by_address.get(key.lower())
+            or self._by_id.get(key.lower())
+            or self._by_symbol.get(key.upper())
+        )
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def load(self, quotes: Iterable[LatestTokenPrice]) -> None:
+        """Replace the index contents with *quotes*."""
+        by_id: Dict[str, LatestTokenPrice] = {}
+        by_address: Dict[str, LatestTokenPrice] = {}
+        by_symbol: Dict[str, LatestTokenPrice] = {}
+        for quote in quotes:
+            by_id[str(quote.token_id)] = quote
+            if quote.address:
+                by_address[quote.address.lower()] = quote
+            if quote.symbol:
+                by_symbol[quote.symbol.upper()] = quote
+        # Swap whole dicts so concurrent readers never see a half-built index
+        self._by_id, self._by_address, self._by_symbol = by_id, by_address, by_symbol
+
+    def apply(self, quote: LatestTokenPrice) -> bool:
+        """Merge *quote* into the index unless a newer price is held.
+
+        Returns:
+            True if the index was updated.
+        """
+        token_key = str(quote.token_id)
+        current = self._by_id.get(token_key)
+        if current is not None and not _is_newer(quote, current):
+            return False
+
+        self._by_id[token_key] = quote
+        if quote.address:
+            self._by_address[quote.address.lower()] = quote
+        if quote.symbol:
+            self._by_symbol[quote.symbol.upper()] = quote
+        return True
+
+    # ------------------------------------------------------------------
+    # Pub/sub
+    # ------------------------------------------------------------------
+
+    async def publish(self, quotes: Iterable[LatestTokenPrice]) -> None:
+        """Apply *quotes* locally and broadcast them to other processes.
+
+        Publishing is best effort: the local index is always updated, and a
+        Redis failure is logged rather than raised so price writes succeed
+        even when the broker is unavailable.
+        """
+        quotes = list(quotes)
+        for quote in quotes:
+            self.apply(quote)
+
+        try:
+            redis = self._build_redis_client()
+            channel = self.__config.PRICE_INDEX_CHANNEL
+            for quote in quotes:
+                await redis.publish(channel, quote.model_dump_json())
+        except Exception as exc:  # noqa: BLE001 – log only
+            logger.warning("Failed to publish price index update: %s", exc)
+
+    def handle_message(self, data) -> None:
+        """Merge one pub/sub payload; malformed payloads are ignored."""
+        try:
+            if isinstance(data, bytes):
+                data = data.decode("utf-8")
+            self.apply(LatestTokenPrice.model_validate_json(data))
+        except Exception as exc:  # noqa: BLE001 – log only
+            logger.warning("Ignoring malformed price index message: %s", exc)
+
+    async def start(self) -> None:
+        """Start the background listener (idempotent)."""
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop the update listener and release the Redis connection."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):  # noqa: BLE001
+                pass
+            self._listener = None
+        if self._redis_client is not None:
+            try:
+                await self._redis_client.aclose()
+            except Exception as exc:  # noqa: BLE001 – log only
+                logger.warning("Failed to close price index Redis client: %s", exc)
+            self._redis_client = None
+
+    async def _listen(self) -> None:
+        """Consume the price channel forever, reconnecting with backoff."""
+        delay = 1
+        max_delay = self.__config.PRICE_INDEX_RECONNECT_MAX_SEC
+        while True:
+            try:
+                pubsub = self._build_redis_client().pubsub()
+                try:
+                    await pubsub.subscribe(self.__config.PRICE_INDEX_CHANNEL)
+                    delay = 1
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            self.handle_message(message.get("data"))
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001 – retry
+                logger.warning(
+                    "Price index listener disconnected (%s); retrying in %ss",
+                    exc,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, max_delay)
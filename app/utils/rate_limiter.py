@@ -1,52 +1,267 @@
-"""Simple in-memory rate-limiter used for login brute-force protection.
+"""Rate limiting: per-process login throttling and Redis-backed route policies.
 
-For production deployments a shared cache such as Redis **must** replace
-this implementation.  The current design is intentionally minimal to
-support CI tests and local development without external dependencies.
+:class:`InMemoryRateLimiter` throttles failed logins per process in
+bounded memory.
+:class:`RedisRateLimiter` enforces the named route policies of
+``Configuration.RATE_LIMITS`` across all workers with GCRA (generic cell
+rate algorithm): each caller needs a single Redis value, its theoretical
+arrival time, updated by one atomic Lua script call per check. Without
+Redis the policies are enforced per process.
 """
 from __future__ import annotations
 
-from collections import defaultdict
-from time import time
-from typing import DefaultDict, List
+import logging
+from collections import OrderedDict
+from itertools import islice
+from time import monotonic, time
+from typing import Callable, Dict, NamedTuple, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
 from app.core.config import Configuration
+from app.core.prometheus import get_registry
 from app.domain.interfaces.utils import RateLimiterUtilsInterface
 
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Prometheus metrics – gracefully degrade to no-op metrics if the optional
+# dependency is not installed.
+# ---------------------------------------------------------------------------
+
+try:
+    from prometheus_client import Counter  # type: ignore
+
+    RATE_LIMIT_REJECTED = Counter(
+        "rate_limit_rejected_total",
+        "Requests rejected by a route rate-limit policy.",
+        ["policy"],
+        registry=get_registry(),
+    )
+    RATE_LIMIT_FALLBACK = Counter(
+        "rate_limit_fallback_total",
+        "Rate-limit checks answered per process because Redis was unavailable.",
+        registry=get_registry(),
+    )
+
+except ImportError:  # pragma: no cover – prometheus_client optional dependency
+
+    class _NoOpMetric:  # noqa: D401 – minimal stub
+        def labels(self, *_args, **_kwargs) -> "_NoOpMetric":
+            return self
+
+        def inc(self, _n: float = 1) -> None:  # noqa: D401 – no-op
+            return
+
+    RATE_LIMIT_REJECTED = RATE_LIMIT_FALLBACK = _NoOpMetric()
+
+
+# Hard cap on the keys one in-process limiter tracks
+DEFAULT_MAX_KEYS = 10_000
+# Least recently used keys considered when one must be evicted
+_EVICTION_SAMPLE = 32
+
 
 class InMemoryRateLimiter:
-    """Thread-unsafe naïve rate-limiter (per-process memory)."""
+    """Per-process GCRA limiter with a bounded key store (not thread-safe).
+
+    Allows bursts of *max_attempts*, after which one attempt is regained
+    every ``window_seconds / max_attempts`` seconds. Each key holds a single
+    float, its theoretical arrival time (TAT), in an LRU capped at
+    *max_keys*; keys whose TAT has passed carry no state and are swept once
+    per window, so memory stays flat however many distinct keys are seen.
+    When the cap is reached such keys are swept first; otherwise the least
+    throttled of the least recently used keys goes, so spraying fresh keys
+    cannot push a throttled one out.
+    """
 
-    def __init__(self, max_attempts: int, window_seconds: int) -> None:
+    def __init__(
+        self,
+        max_attempts: int,
+        window_seconds: float,
+        max_keys: int = DEFAULT_MAX_KEYS,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
         self.max_attempts = max_attempts
         self.window_seconds = window_seconds
-        self._hits: DefaultDict[str, List[float]] = defaultdict(list)
+        self.max_keys = max_keys
+        self._clock = clock
+        self._interval = window_seconds / max_attempts
+        self._tats: OrderedDict[str, float] = OrderedDict()
+        self._next_sweep = clock() + window_seconds
+        self._next_overflow_sweep = 0.0
 
     # ------------------------------------------------------------------
     # Public helpers
     # ------------------------------------------------------------------
 
+    def hit(self, key: str) -> float:
+        """Count an attempt by *key*; return 0, or seconds until allowed."""
+        now = self._clock()
+        if now >= self._next_sweep:
+            self._sweep(now)
+        tat = max(self._tats.get(key, now), now) + self._interval
+        retry_after = tat - now - self.window_seconds
+        if retry_after > 1e-9:  # ignore float noise at the burst boundary
+            return retry_after
+        self._tats[key] = tat
+        self._tats.move_to_end(key)
+        if len(self._tats) > self.max_keys:
+            self._evict(now)
+        return 0.0
+
     def allow(self, key: str) -> bool:
         """Return **True** if another attempt is allowed for *key*."""
-        now = time()
-        window_start = now - self.window_seconds
-        hits = [ts for ts in self._hits[key] if ts >= window_start]
-        self._hits[key] = hits  # prune old hits
-        if len(hits) >= self.max_attempts:
-            return False
-        hits.append(now)
-        return True
+        return not self.hit(key)
 
     def clear(self) -> None:  # pragma: no cover – test helper
         """Reset the internal hit-store (used in tests)."""
 
-        self._hits.clear()
+        self._tats.clear()
 
     def reset(self, key: str) -> None:  # pragma: no cover – helper
         """Clear stored hits for *key* without affecting others."""
 
-        if key in self._hits:
-            self._hits[key].clear()
+        self._tats.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+    def _evict(self, now: float) -> None:
+        # No key can expire sooner than one interval after the last sweep
+        if now >= self._next_overflow_sweep:
+            self._sweep(now)
+            self._next_overflow_sweep = now + self._interval
+        if len(self._tats) <= self.max_keys:
+            return
+        # Never the key just added (last), which would go untracked
+        sample = min(_EVICTION_SAMPLE, len(self._tats) - 1)
+        oldest = islice(self._tats.items(), sample)
+        key, _ = min(oldest, key=lambda item: item[1])
+        del self._tats[key]
+
+    def _sweep(self, now: float) -> None:
+        # A TAT in the past is equivalent to no entry at all
+        for key in [key for key, tat in self._tats.items() if tat <= now]:
+            del self._tats[key]
+        self._next_sweep = now + self.window_seconds
+
+
+class RateLimitPolicy(NamedTuple):
+    """Allow *limit* requests per *period* seconds to each caller.
+
+    Callers are keyed by client IP, or by user id when *per* is ``"user"``.
+    The whole allowance may be used as a burst.
+    """
+
+    limit: int
+    period: float
+    per: str = "ip"
+
+    @classmethod
+    def parse(cls, spec: str) -> "RateLimitPolicy":
+        """Parse ``"<limit>/<seconds>[/ip|/user]"``, e.g. ``"120/60/user"``."""
+        parts = spec.split("/")
+        per = parts[2] if len(parts) == 3 else "ip"
+        try:
+            limit, period = int(parts[0]), float(parts[1])
+        except (IndexError, ValueError):
+            limit = period = 0
+        if len(parts) > 3 or per not in ("ip", "user") or limit <= 0 or period <= 0:
+            raise ValueError(
+                f"Invalid rate limit {spec!r}; expected '<limit>/<seconds>[/user]'"
+            )
+        return cls(limit, period, per)
+
+    @property
+    def interval_ms(self) -> int:
+        """Milliseconds between requests once the burst is spent."""
+        return max(1, round(self.period * 1000 / self.limit))
+
+
+class RateLimitResult(NamedTuple):
+    """Outcome of a rate-limit check."""
+
+    allowed: bool
+    retry_after: float = 0.0
+
+
+# GCRA over one key per caller holding its theoretical arrival time (TAT) in
+# ms. KEYS[1]: caller key; ARGV[1]: emission interval (ms); ARGV[2]: burst.
+# Returns {allowed, retry_after_ms}. Redis' clock is used so all API
+# instances agree on "now".
+GCRA_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local interval = tonumber(ARGV[1])
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+  tat = now
+end
+local new_tat = tat + interval
+local retry_after = new_tat - interval * tonumber(ARGV[2]) - now
+if retry_after > 0 then
+  return {0, retry_after}
+end
+redis.call('SET', KEYS[1], new_tat, 'PX', new_tat - now)
+return {1, 0}
+"""
+
+KEY_PREFIX = "ratelimit:"
+
+
+class RedisRateLimiter:
+    """GCRA limiter shared by every worker through Redis.
+
+    Each check is one ``EVALSHA`` of :data:`GCRA_SCRIPT`. While Redis is
+    unset or unreachable, checks are answered by per-process
+    :class:`InMemoryRateLimiter` instances and Redis is retried after
+    *retry_interval* seconds rather than on every request.
+    """
+
+    def __init__(self, redis_url: Optional[str], retry_interval: float = 5.0):
+        self._redis_url = redis_url
+        self._retry_interval = retry_interval
+        self._redis_client: Redis | None = None
+        self._script = None
+        self._redis_down_until = 0.0
+        self._local: Dict[RateLimitPolicy, InMemoryRateLimiter] = {}
+
+    def _build_redis_client(self) -> Redis:
+        """Return an *async* Redis client for ``redis_url``."""
+        if self._redis_client is None:
+            self._redis_client = Redis.from_url(self._redis_url)
+        return self._redis_client
+
+    async def hit(self, key: str, policy: RateLimitPolicy) -> RateLimitResult:
+        """Count one request by *key* against *policy*."""
+        if self._redis_url and time() >= self._redis_down_until:
+            try:
+                if self._script is None:
+                    self._script = self._build_redis_client().register_script(
+                        GCRA_SCRIPT
+                    )
+                allowed, retry_after_ms = await self._script(
+                    keys=[KEY_PREFIX + key],
+                    args=[policy.interval_ms, policy.limit],
+                )
+                return RateLimitResult(bool(allowed), int(retry_after_ms) / 1000)
+            except (RedisError, OSError) as exc:
+                self._redis_down_until = time() + self._retry_interval
+                logger.warning("Rate limiter falling back to local state: %s", exc)
+        if self._redis_url:
+            RATE_LIMIT_FALLBACK.inc()
+        return self._hit_locally(key, policy)
+
+    def _hit_locally(self, key: str, policy: RateLimitPolicy) -> RateLimitResult:
+        limiter = self._local.get(policy)
+        if limiter is None:
+            limiter = self._local[policy] = InMemoryRateLimiter(
+                policy.limit, policy.period
+            )
+        retry_after = limiter.hit(key)
+        return RateLimitResult(not retry_after, retry_after)
 
 
 class RateLimiterUtils(RateLimiterUtilsInterface):
@@ -59,21 +274,47 @@ class RateLimiterUtils(RateLimiterUtilsInterface):
             max_attempts=config.AUTH_RATE_LIMIT_ATTEMPTS,
             window_seconds=config.AUTH_RATE_LIMIT_WINDOW_SECONDS,
         )
+        # Parsed up front so a malformed policy fails at startup
+        self.__policies = {
+            name: RateLimitPolicy.parse(spec)
+            for name, spec in config.RATE_LIMITS.items()
+        }
+        self.__limiter = RedisRateLimiter(config.REDIS_URL)
 
     @property
     def login_rate_limiter(self) -> InMemoryRateLimiter:
         """Get the login rate limiter instance."""
         return self.__login_rate_limiter
 
+    async def check(
+        self, policy: str, client_ip: str, user_id: Optional[str] = None
+    ) -> RateLimitResult:
+        """Count one request against the named *policy*.
+
+        Policies missing from ``RATE_LIMITS`` are not limited.
+        """
+        limits = self.__policies.get(policy)
+        if limits is None:
+            return RateLimitResult(True)
+        caller = user_id if limits.per == "user" and user_id else client_ip
+        result = await self.__limiter.hit(f"{policy}:{caller}", limits)
+        if not result.allowed:
+            RATE_LIMIT_REJECTED.labels(policy=policy).inc()
+        return result
+
 
 # ----------------------------------------------------------------------
 # Default instance for backward compatibility
 # ----------------------------------------------------------------------
-_default_rate_limiter_utils = RateLimiterUtils(Configuration())
-login_rate_limiter = _default_rate_limiter_utils.login_rate_limiter
+default_rate_limiter_utils = RateLimiterUtils(Configuration())
+login_rate_limiter = default_rate_limiter_utils.login_rate_limiter
 
 __all__ = [
     "InMemoryRateLimiter",
+    "RateLimitPolicy",
+    "RateLimitResult",
     "RateLimiterUtils",
+    "RedisRateLimiter",
+    "default_rate_limiter_utils",
     "login_rate_limiter",
 ]
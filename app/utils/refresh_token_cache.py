@@ -0,0 +1,110 @@
+"""Redis mirror of refresh-token state.
+
+Refreshing an access token needs only the owner, expiry and revoked flag of
+the refresh token, so :class:`RefreshTokenCacheUtils` keeps that state in
+Redis under the token's JTI hash. The refresh path then reads Redis and only
+falls back to the database on a miss, and logout is a single ``SET`` of the
+revoked state, kept until the token expires. A "not revoked" state is only
+trusted for ``REFRESH_TOKEN_CACHE_VALID_TTL_SEC``, so a revocation that could
+not be mirrored is picked up from the database soon after. Without
+``REDIS_URL`` the mirror is disabled and every lookup goes to the database.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import NamedTuple, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import Configuration
+from app.domain.interfaces.utils import RefreshTokenCacheUtilsInterface
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "refresh:"
+
+
+class RefreshTokenState(NamedTuple):
+    """What a refresh needs to know about a stored refresh token."""
+
+    user_id: str
+    expires_at: float  # UNIX time
+    revoked: bool = False
+
+    def dumps(self) -> str:
+        return f"{self.user_id}|{self.expires_at:.0f}|{int(self.revoked)}"
+
+    @classmethod
+    def loads(cls, raw: str | bytes) -> "RefreshTokenState":
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        user_id, expires_at, revoked = raw.split("|")
+        return cls(user_id, float(expires_at), revoked == "1")
+
+
+class RefreshTokenCacheUtils(RefreshTokenCacheUtilsInterface):
+    """Mirror of refresh-token state in Redis, keyed by JTI hash.
+
+    Failures are logged and reported as misses so callers fall back to the
+    database; after one, Redis is skipped for *retry_interval* seconds,
+    except to mirror a revocation.
+    """
+
+    def __init__(self, config: Configuration, retry_interval: float = 5.0):
+        """Initialize RefreshTokenCacheUtils with dependencies."""
+        self.__config = config
+        self._retry_interval = retry_interval
+        self._redis_client: Redis | None = None
+        self._redis_down_until = 0.0
+
+    def _build_redis_client(self) -> Redis:
+        """Return an *async* Redis client using ``Configuration.redis_url``."""
+        if self._redis_client is None:
+            self._redis_client = Redis.from_url(self.__config.redis_url)
+        return self._redis_client
+
+    @property
+    def enabled(self) -> bool:
+        """Whether Redis is configured and not in its back-off period."""
+        return bool(self.__config.REDIS_URL) and time.time() >= self._redis_down_until
+
+    def _mark_down(self, exc: Exception) -> None:
+        self._redis_down_until = time.time() + self._retry_interval
+        logger.warning("Refresh token cache unavailable: %s", exc)
+
+    async def get(self, jti_hash: str) -> Optional[RefreshTokenState]:
+        """Return the mirrored state of *jti_hash*, or None on a miss."""
+        if not self.enabled:
+            return None
+        try:
+            raw = await self._build_redis_client().get(CACHE_PREFIX + jti_hash)
+        except (RedisError, OSError) as exc:
+            self._mark_down(exc)
+            return None
+        return RefreshTokenState.loads(raw) if raw else None
+
+    async def set(self, jti_hash: str, state: RefreshTokenState) -> bool:
+        """Mirror *state*; return True if stored.
+
+        Revoked states are kept until the token expires and overwrite any
+        entry. Valid states are kept for at most
+        ``REFRESH_TOKEN_CACHE_VALID_TTL_SEC`` and never replace an existing
+        entry, so a lookup racing a logout cannot undo the revocation.
+        """
+        ttl = int(state.expires_at - time.time())
+        if not state.revoked:
+            ttl = min(ttl, self.__config.REFRESH_TOKEN_CACHE_VALID_TTL_SEC)
+        enabled = bool(self.__config.REDIS_URL) if state.revoked else self.enabled
+        if not enabled or ttl <= 0:
+            return False
+        try:
+            await self._build_redis_client().set(
+                CACHE_PREFIX + jti_hash, state.dumps(), ex=ttl, nx=not state.revoked
+            )
+        except (RedisError, OSError) as exc:
+            self._mark_down(exc)
+            return False
+        return True
@@ -5,13 +5,131 @@ without importing FastAPI or other framework-specific code.
 """
 from __future__ import annotations
 
+import asyncio
+import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
 
 from passlib.context import CryptContext
 
 from app.core.config import Configuration
+from app.core.prometheus import get_registry
+from app.domain.errors import PasswordHashingBusyError
 from app.domain.interfaces.utils import PasswordHasherInterface
 
+_T = TypeVar("_T")
+
+# ---------------------------------------------------------------------------
+# Prometheus metrics – gracefully degrade to no-op metrics if the optional
+# dependency is not installed.
+# ---------------------------------------------------------------------------
+
+try:
+    from prometheus_client import Counter, Gauge, Histogram  # type: ignore
+
+    HASH_QUEUE_DEPTH = Gauge(
+        "password_hash_queue_depth",
+        "Password hash/verify calls waiting for a hashing thread.",
+        registry=get_registry(),
+    )
+    HASH_LATENCY = Histogram(
+        "password_hash_seconds",
+        "Time from submitting a password hash/verify call to its result.",
+        ["op"],
+        buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+        registry=get_registry(),
+    )
+    HASH_REJECTED = Counter(
+        "password_hash_rejected_total",
+        "Password hash/verify calls rejected because the pool was saturated.",
+        ["op"],
+        registry=get_registry(),
+    )
+
+except ImportError:  # pragma: no cover – prometheus_client optional dependency
+
+    class _NoOpMetric:  # noqa: D401 – minimal stub
+        def labels(self, *_args, **_kwargs) -> "_NoOpMetric":
+            return self
+
+        def inc(self, _n: float = 1) -> None:  # noqa: D401 – no-op
+            return
+
+        def dec(self, _n: float = 1) -> None:  # noqa: D401 – no-op
+            return
+
+        def observe(self, _value: float) -> None:  # noqa: D401 – no-op
+            return
+
+    HASH_QUEUE_DEPTH = HASH_LATENCY = HASH_REJECTED = _NoOpMetric()
+
+
+# ---------------------------------------------------------------------------
+# Hashing pool
+# ---------------------------------------------------------------------------
+
+
+class HashingPool:
+    """Bounded thread pool running bcrypt off the event loop.
+
+    bcrypt releases the GIL, so the worker threads hash in parallel while the
+    event loop keeps serving other requests. At most ``workers + max_queue``
+    calls are admitted at once; further calls fail fast with
+    :class:`PasswordHashingBusyError` instead of queueing without bound.
+    """
+
+    def __init__(self, workers: int = 0, max_queue: int = 32):
+        """Initialize the pool.
+
+        Args:
+            workers: Hashing threads; 0 means one per CPU core.
+            max_queue: Calls allowed to wait for a free thread.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.capacity = self.workers + max_queue
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def queue_depth(self) -> int:
+        """Admitted calls still waiting for a thread."""
+        return max(0, self._in_flight - self.workers)
+
+    async def run(self, op: str, fn: Callable[..., _T], *args) -> _T:
+        """Run ``fn(*args)`` on the pool; *op* labels the metrics."""
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                HASH_REJECTED.labels(op=op).inc()
+                raise PasswordHashingBusyError()
+            if self._in_flight >= self.workers:
+                HASH_QUEUE_DEPTH.inc()
+            self._in_flight += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.workers, thread_name_prefix="password-hash"
+                )
+            future = self._executor.submit(fn, *args)
+
+        # Released when the call finishes (or is cancelled before starting),
+        # even if the awaiting request has gone away
+        future.add_done_callback(self._release)
+        start = time.perf_counter()
+        try:
+            return await asyncio.wrap_future(future)
+        finally:
+            HASH_LATENCY.labels(op=op).observe(time.perf_counter() - start)
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if self._in_flight >= self.workers:
+                HASH_QUEUE_DEPTH.dec()
+
+
 # ---------------------------------------------------------------------------
 # Password Hasher Utility
 # ---------------------------------------------------------------------------
@@ -22,7 +140,8 @@ class PasswordHasher(PasswordHasherInterface):  # noqa: D101 – simple utility
 
     Uses *passlib*'s :class:`~passlib.context.CryptContext` under the hood and
     retrieves the bcrypt cost factor from :data:`config.BCRYPT_ROUNDS` so it
-    can be tuned per-environment (e.g. lower in CI).
+    can be tuned per-environment (e.g. lower in CI). Async callers use the
+    ``*_async`` variants, which run on a bounded :class:`HashingPool`.
     """
 
     def __init__(self, config: Configuration):
@@ -33,6 +152,9 @@ class PasswordHasher(PasswordHasherInterface):  # noqa: D101 – simple utility
             deprecated="auto",
             bcrypt__rounds=config.BCRYPT_ROUNDS,
         )
+        self.__pool = HashingPool(
+            config.PASSWORD_HASH_WORKERS, config.PASSWORD_HASH_QUEUE_SIZE
+        )
 
     def hash_password(self, plain: str) -> str:  # pragma: no cover – thin wrapper
         """Return a bcrypt hash for *plain* password."""
@@ -44,6 +166,22 @@ class PasswordHasher(PasswordHasherInterface):  # noqa: D101 – simple utility
 
         return self.__context.verify(plain, hashed)
 
+    async def hash_password_async(self, plain: str) -> str:
+        """Hash *plain* on the hashing pool.
+
+        Raises:
+            PasswordHashingBusyError: If the pool is saturated.
+        """
+        return await self.__pool.run("hash", self.hash_password, plain)
+
+    async def verify_password_async(self, plain: str, hashed: str) -> bool:
+        """Verify *plain* against *hashed* on the hashing pool.
+
+        Raises:
+            PasswordHashingBusyError: If the pool is saturated.
+        """
+        return await self.__pool.run("verify", self.verify_password, plain, hashed)
+
     def needs_update(self, hashed: str) -> bool:  # pragma: no cover
         """Return *True* if *hashed* should be re-hashed with stronger params."""
 
@@ -0,0 +1,67 @@
+"""Async token bucket for pacing calls to rate-limited external APIs.
+
+Unlike :class:`~app.utils.rate_limiter.InMemoryRateLimiter`, which rejects
+excess attempts, the bucket *delays* callers until capacity is available so
+outbound request bursts are smoothed to the provider's allowance.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Callable
+
+
+class AsyncTokenBucket:
+    """Token bucket refilled continuously at *rate* tokens per second."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock: asyncio.Lock | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        # Celery runs every task in a fresh event loop; a lock bound to a
+        # finished loop cannot be awaited, so keep one lock per loop.
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        return self._lock
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until *tokens* are available and consume them.
+
+        Waiters are served in FIFO order: the lock is held while sleeping so a
+        later caller cannot overtake one that is already waiting.
+        """
+        if tokens > self.capacity:
+            raise ValueError("cannot acquire more tokens than the bucket holds")
+        async with self._get_lock():
+            self._refill()
+            while self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= tokens
+
+    def drain(self) -> None:
+        """Empty the bucket, e.g. after the provider answered 429."""
+        self._refill()
+        self._tokens = 0.0
@@ -0,0 +1,80 @@
+"""Per-process cache of already verified access tokens.
+
+Clients reuse one access token for its whole lifetime, so after the first
+successful :meth:`JWTUtils.decode_token` the validated payload is kept here,
+keyed by a digest of the token, until the token's ``exp``. Repeat requests
+then cost a hash and a dict lookup instead of signature verification and
+Pydantic validation. Entries are dropped once their signing key is retired.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+
+class _Entry(NamedTuple):
+    exp: float
+    kid: Optional[str]
+    payload: Dict[str, Any]
+
+
+def _digest(token: str) -> bytes:
+    # Raw tokens are never held in memory longer than the request
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of verified token payloads, each valid until its ``exp``."""
+
+    def __init__(
+        self,
+        max_size: int,
+        is_key_retired: Callable[[Optional[str]], bool],
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of tokens kept; 0 disables caching.
+            is_key_retired: Returns True once tokens signed with *kid* must
+                be rejected.
+            clock: Source of the current UNIX time.
+        """
+        self._max_size = max_size
+        self._is_key_retired = is_key_retired
+        self._clock = clock
+        self._entries: OrderedDict[bytes, _Entry] = OrderedDict()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached payload of *token*, if still valid."""
+        if not self._max_size:
+            return None
+        key = _digest(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.exp <= self._clock() or self._is_key_retired(entry.kid):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return dict(entry.payload)
+
+    def put(self, token: str, payload: Dict[str, Any], kid: Optional[str]) -> None:
+        """Cache the verified *payload* of *token* signed with *kid*."""
+        if not self._max_size:
+            return
+        key = _digest(token)
+        self._entries[key] = _Entry(float(payload["exp"]), kid, dict(payload))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached tokens."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
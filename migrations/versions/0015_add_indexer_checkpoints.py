@@ -0,0 +1,29 @@
+"""add indexer checkpoints table"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0015_add_indexer_checkpoints"
+down_revision = "0014_add_user_profile_fields"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "indexer_checkpoints",
+        sa.Column("chain_id", sa.Integer(), nullable=False, autoincrement=False),
+        sa.Column("stream", sa.String(length=32), nullable=False),
+        sa.Column("last_block", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("chain_id", "stream"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("indexer_checkpoints")
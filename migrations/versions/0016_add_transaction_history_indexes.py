@@ -0,0 +1,32 @@
+"""add composite indexes for transaction history pagination"""
+
+from alembic import op
+
+revision = "0016_add_transaction_history_indexes"
+down_revision = "0015_add_indexer_checkpoints"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_transactions_wallet_ts_id",
+        "transactions",
+        ["wallet_id", "timestamp", "id"],
+    )
+    op.create_index(
+        "ix_transactions_wallet_token_ts_id",
+        "transactions",
+        ["wallet_id", "token_id", "timestamp", "id"],
+    )
+    op.create_index(
+        "ix_transactions_wallet_type_ts_id",
+        "transactions",
+        ["wallet_id", "type", "timestamp", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transactions_wallet_type_ts_id", table_name="transactions")
+    op.drop_index("ix_transactions_wallet_token_ts_id", table_name="transactions")
+    op.drop_index("ix_transactions_wallet_ts_id", table_name="transactions")
@@ -0,0 +1,43 @@
+"""unique (wallet_id, token_id) on token_balances for bulk upserts"""
+
+from alembic import op
+
+revision = "0017_token_balance_unique_wallet_token"
+down_revision = "0016_add_transaction_history_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep a single row per (wallet_id, token_id) before adding the
+    # constraint: the most recently written one. token_balances has no
+    # updated_at (0007 dropped it), so rows are ranked by the age of the
+    # transaction that last wrote them; frozen rows count as oldest.
+    op.execute(
+        """
+        DELETE FROM token_balances
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT
+                    id,
+                    row_number() OVER (
+                        PARTITION BY wallet_id, token_id
+                        ORDER BY age(xmin), id DESC
+                    ) AS rank
+                FROM token_balances
+            ) ranked
+            WHERE rank > 1
+        )
+        """
+    )
+    op.create_unique_constraint(
+        "uq_token_balance_wallet_token",
+        "token_balances",
+        ["wallet_id", "token_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "uq_token_balance_wallet_token", "token_balances", type_="unique"
+    )
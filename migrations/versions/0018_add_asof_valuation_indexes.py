@@ -0,0 +1,26 @@
+"""add composite indexes for as-of balance valuation"""
+
+from alembic import op
+
+revision = "0018_add_asof_valuation_indexes"
+down_revision = "0017_token_balance_unique_wallet_token"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_token_prices_token_ts",
+        "token_prices",
+        ["token_id", "timestamp"],
+    )
+    op.create_index(
+        "ix_historical_balances_wallet_ts",
+        "historical_balances",
+        ["wallet_id", "timestamp"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_historical_balances_wallet_ts", table_name="historical_balances")
+    op.drop_index("ix_token_prices_token_ts", table_name="token_prices")
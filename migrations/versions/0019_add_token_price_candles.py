@@ -0,0 +1,30 @@
+"""add token price candle rollup table"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "0019_add_token_price_candles"
+down_revision = "0018_add_asof_valuation_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "token_price_candles",
+        sa.Column("token_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("interval", sa.String(length=8), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("open", sa.Numeric(precision=18, scale=8), nullable=False),
+        sa.Column("high", sa.Numeric(precision=18, scale=8), nullable=False),
+        sa.Column("low", sa.Numeric(precision=18, scale=8), nullable=False),
+        sa.Column("close", sa.Numeric(precision=18, scale=8), nullable=False),
+        sa.Column("samples", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["token_id"], ["tokens.id"]),
+        sa.PrimaryKeyConstraint("token_id", "interval", "bucket_start"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("token_price_candles")
@@ -0,0 +1,25 @@
+"""add wallets.last_snapshot_at and (user_id, balance_usd) index"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0020_wallet_balance_denormalization"
+down_revision = "0019_add_token_price_candles"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "wallets", sa.Column("last_snapshot_at", sa.DateTime(), nullable=True)
+    )
+    op.create_index(
+        "ix_wallets_user_balance_usd",
+        "wallets",
+        ["user_id", "balance_usd"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_wallets_user_balance_usd", table_name="wallets")
+    op.drop_column("wallets", "last_snapshot_at")
@@ -0,0 +1,127 @@
+"""lower-case wallet addresses and enforce canonical form
+
+Wallets that only differed by address letter case for the same user are
+merged into one row (preferring an already lower-case row) before the
+addresses are rewritten, so ``uq_wallet_user_address`` keeps holding and
+``(user_id, address)`` lookups become exact index matches.
+"""
+
+from alembic import op
+
+revision = "0021_canonical_wallet_addresses"
+down_revision = "0020_wallet_balance_denormalization"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Map every case-variant duplicate to the wallet that survives the merge
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE wallet_merge ON COMMIT DROP AS
+        SELECT id AS dup_id, keep_id
+        FROM (
+            SELECT
+                id,
+                first_value(id) OVER (
+                    PARTITION BY user_id, lower(address)
+                    ORDER BY (address = lower(address)) DESC, id
+                ) AS keep_id
+            FROM wallets
+        ) ranked
+        WHERE id <> keep_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE historical_balances hb SET wallet_id = m.keep_id
+        FROM wallet_merge m WHERE hb.wallet_id = m.dup_id
+        """
+    )
+    # Indexed transactions embed their wallet in the hash
+    # ("<tx>:<log>:<wallet_id>"). Re-key them to the survivor so the next
+    # index run upserts instead of duplicating, dropping logs the survivor
+    # (or another merged variant) already holds.
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE transaction_rehash ON COMMIT DROP AS
+        SELECT
+            id,
+            new_hash,
+            row_number() OVER (PARTITION BY new_hash ORDER BY id) AS rank
+        FROM (
+            SELECT
+                t.id,
+                left(t.hash, -36) || m.keep_id::text AS new_hash
+            FROM transactions t
+            JOIN wallet_merge m ON t.wallet_id = m.dup_id
+            WHERE right(t.hash, 37) = ':' || m.dup_id::text
+        ) rehashed
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM transactions t
+        USING transaction_rehash r
+        WHERE t.id = r.id
+          AND (
+            r.rank > 1
+            OR EXISTS (SELECT 1 FROM transactions k WHERE k.hash = r.new_hash)
+          )
+        """
+    )
+    op.execute(
+        """
+        UPDATE transactions t SET hash = r.new_hash
+        FROM transaction_rehash r WHERE t.id = r.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE transactions t SET wallet_id = m.keep_id
+        FROM wallet_merge m WHERE t.wallet_id = m.dup_id
+        """
+    )
+    # Token balances are unique per (wallet, token); the survivor's row wins
+    op.execute(
+        """
+        DELETE FROM token_balances tb
+        USING wallet_merge m, token_balances kept
+        WHERE tb.wallet_id = m.dup_id
+          AND kept.wallet_id = m.keep_id
+          AND kept.token_id = tb.token_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE token_balances tb SET wallet_id = m.keep_id
+        FROM wallet_merge m WHERE tb.wallet_id = m.dup_id
+        """
+    )
+    op.execute("DELETE FROM wallets w USING wallet_merge m WHERE w.id = m.dup_id")
+
+    op.execute(
+        "UPDATE wallets SET address = lower(address) WHERE address <> lower(address)"
+    )
+    op.execute(
+        """
+        UPDATE portfolio_snapshots SET user_address = lower(user_address)
+        WHERE user_address <> lower(user_address)
+        """
+    )
+    # Cached timeline responses are rebuilt on demand
+    op.execute(
+        """
+        DELETE FROM portfolio_snapshot_cache
+        WHERE user_address <> lower(user_address)
+        """
+    )
+
+    op.create_check_constraint(
+        "ck_wallets_address_lower", "wallets", "address = lower(address)"
+    )
+
+
+def downgrade() -> None:
+    # Merged wallets and original letter case cannot be restored
+    op.drop_constraint("ck_wallets_address_lower", "wallets", type_="check")
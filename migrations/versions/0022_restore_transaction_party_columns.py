@@ -0,0 +1,32 @@
+"""restore transaction party and metadata columns
+
+0007 dropped ``from_address``, ``to_address`` and ``extra_metadata`` from
+``transactions``; the log indexer writes all three again, so they are
+re-added (with the original address indexes) here.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0022_restore_transaction_party_columns"
+down_revision = "0021_canonical_wallet_addresses"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("transactions", sa.Column("from_address", sa.String(), nullable=True))
+    op.add_column("transactions", sa.Column("to_address", sa.String(), nullable=True))
+    op.add_column("transactions", sa.Column("extra_metadata", sa.JSON(), nullable=True))
+    op.create_index(
+        op.f("ix_transactions_from_address"), "transactions", ["from_address"]
+    )
+    op.create_index(op.f("ix_transactions_to_address"), "transactions", ["to_address"])
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_transactions_to_address"), table_name="transactions")
+    op.drop_index(op.f("ix_transactions_from_address"), table_name="transactions")
+    op.drop_column("transactions", "extra_metadata")
+    op.drop_column("transactions", "to_address")
+    op.drop_column("transactions", "from_address")
@@ -0,0 +1,62 @@
+"""key indexed transaction legs on (hash, log_index, wallet_id)
+
+The log indexer used to pack ``<tx hash>:<log index>:<wallet id>`` into
+``transactions.hash`` to keep it unique. The log index now has its own column,
+``hash`` holds the plain transaction hash again and uniqueness moves to
+``(hash, log_index, wallet_id)``. Rows without a log index (not produced by
+the indexer) keep the old one-row-per-hash guarantee through a partial index.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0023_transaction_log_index"
+down_revision = "0022_restore_transaction_party_columns"
+branch_labels = None
+depends_on = None
+
+# ``0x<hash>:<log index>:<wallet uuid>`` as written by the indexer
+_COMPOSITE_HASH = r"^[^:]+:[0-9]+:[0-9a-fA-F-]{36}$"
+
+
+def upgrade() -> None:
+    op.add_column("transactions", sa.Column("log_index", sa.Integer(), nullable=True))
+    op.execute(
+        f"""
+        UPDATE transactions
+        SET log_index = split_part(hash, ':', 2)::integer,
+            hash = split_part(hash, ':', 1)
+        WHERE hash ~ '{_COMPOSITE_HASH}'
+        """
+    )
+    op.drop_index(op.f("ix_transactions_hash"), table_name="transactions")
+    op.create_index(op.f("ix_transactions_hash"), "transactions", ["hash"])
+    op.create_unique_constraint(
+        "uq_transactions_hash_log_wallet",
+        "transactions",
+        ["hash", "log_index", "wallet_id"],
+    )
+    op.create_index(
+        "uq_transactions_hash_without_log",
+        "transactions",
+        ["hash"],
+        unique=True,
+        postgresql_where=sa.text("log_index IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_transactions_hash_without_log", table_name="transactions")
+    op.drop_constraint(
+        "uq_transactions_hash_log_wallet", "transactions", type_="unique"
+    )
+    op.execute(
+        """
+        UPDATE transactions
+        SET hash = hash || ':' || log_index::text || ':' || wallet_id::text
+        WHERE log_index IS NOT NULL
+        """
+    )
+    op.drop_index(op.f("ix_transactions_hash"), table_name="transactions")
+    op.create_index(op.f("ix_transactions_hash"), "transactions", ["hash"], unique=True)
+    op.drop_column("transactions", "log_index")
@@ -0,0 +1,24 @@
+"""add wallets.holdings_usd and wallets.holdings_as_of
+
+``balance_usd`` was written both from portfolio snapshots (net of borrowings)
+and from historical balance points (sum of token values). The balance point
+total now has its own columns; ``balance_usd`` stays the snapshot net value.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0024_wallet_holdings_columns"
+down_revision = "0023_transaction_log_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("wallets", sa.Column("holdings_usd", sa.Float(), nullable=True))
+    op.add_column("wallets", sa.Column("holdings_as_of", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("wallets", "holdings_as_of")
+    op.drop_column("wallets", "holdings_usd")
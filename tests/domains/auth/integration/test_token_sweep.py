@@ -0,0 +1,61 @@
+"""Batched deletion of expired and used tokens against a real database."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.email_verification import EmailVerification
+from app.models.password_reset import PasswordReset
+from app.models.refresh_token import RefreshToken
+
+pytestmark = pytest.mark.integration
+
+
+def _hash():
+    return uuid.uuid4().hex + uuid.uuid4().hex
+
+
+async def _add_tokens(db_session, model, flag, user_id):
+    now = datetime.now(timezone.utc)
+    key = "jti_hash" if model is RefreshToken else "token_hash"
+    rows = {
+        name: model(
+            **{key: _hash(), "expires_at": expires_at, flag: flagged},
+            user_id=user_id,
+        )
+        for name, expires_at, flagged in [
+            ("expired", now - timedelta(hours=1), False),
+            ("expired_recently", now - timedelta(minutes=1), False),
+            ("expired_long_ago", now - timedelta(days=3), False),
+            ("used", now + timedelta(hours=1), True),
+            ("valid", now + timedelta(hours=1), False),
+        ]
+    }
+    db_session.add_all(rows.values())
+    await db_session.commit()
+    return rows
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "fixture,model,flag",
+    [
+        ("refresh_token_repository_with_real_db", RefreshToken, "revoked"),
+        ("email_verification_repository_with_real_db", EmailVerification, "used"),
+        ("password_reset_repository_with_real_db", PasswordReset, "used"),
+    ],
+)
+async def test_delete_expired_batch_is_bounded(
+    request, db_session, test_user, fixture, model, flag
+):
+    repository = request.getfixturevalue(fixture)
+    rows = await _add_tokens(db_session, model, flag, test_user.id)
+
+    assert await repository.delete_expired_batch(3) == 3
+    assert await repository.delete_expired_batch(3) == 1
+    assert await repository.delete_expired_batch(3) == 0
+
+    db_session.expunge_all()
+    remaining = [await db_session.get(model, row.id) for row in rows.values()]
+    assert [row.id for row in remaining if row is not None] == [rows["valid"].id]
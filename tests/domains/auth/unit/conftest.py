@@ -101,6 +101,14 @@ def mock_audit():
     return Mock(spec=Audit)
 
 
+@pytest.fixture
+def password_hasher():
+    """Real PasswordHasher (bcrypt rounds are lowered for the test run)."""
+    from app.utils.security import PasswordHasher
+
+    return PasswordHasher(Configuration())
+
+
 @pytest.fixture
 def auth_usecase(
     mock_user_repo,
@@ -108,6 +116,7 @@ def auth_usecase(
     mock_refresh_token_repo,
     mock_email_service,
     mock_jwt_utils,
+    password_hasher,
     mock_config,
     mock_audit,
 ):
@@ -120,6 +129,7 @@ def auth_usecase(
         refresh_token_repository=mock_refresh_token_repo,
         email_service=mock_email_service,
         jwt_utils=mock_jwt_utils,
+        password_hasher=password_hasher,
         config=mock_config,
         audit=mock_audit,
     )
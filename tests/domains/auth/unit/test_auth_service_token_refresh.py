@@ -1,11 +1,12 @@
 """Test auth service token refresh functionality."""
 from __future__ import annotations
 
-from unittest.mock import Mock
+import time
 
 import pytest
 
 from app.domain.errors import InvalidCredentialsError
+from app.utils.refresh_token_cache import RefreshTokenState
 
 
 class TestAuthServiceTokenRefresh:
@@ -26,9 +27,9 @@ class TestAuthServiceTokenRefresh:
         mock_jwt_utils.create_access_token.return_value = "new-access-token"
 
         # Setup mock refresh token repository
-        mock_token = Mock()
-        mock_token.revoked = False
-        mock_refresh_token_repo.get_by_jti_hash.return_value = mock_token
+        mock_refresh_token_repo.get_state.return_value = RefreshTokenState(
+            "1", time.time() + 3600
+        )
 
         # Execute
         result = await auth_usecase.refresh("valid-refresh-token")
@@ -70,7 +71,7 @@ class TestAuthServiceTokenRefresh:
             "type": "refresh",
             "jti": "test-jti",
         }
-        mock_refresh_token_repo.get_by_jti_hash.return_value = None
+        mock_refresh_token_repo.get_state.return_value = None
 
         with pytest.raises(InvalidCredentialsError):
             await auth_usecase.refresh("expired-token")
@@ -87,9 +88,9 @@ class TestAuthServiceTokenRefresh:
             "jti": "test-jti",
         }
 
-        mock_token = Mock()
-        mock_token.revoked = True
-        mock_refresh_token_repo.get_by_jti_hash.return_value = mock_token
+        mock_refresh_token_repo.get_state.return_value = RefreshTokenState(
+            "1", time.time() + 3600, revoked=True
+        )
 
         with pytest.raises(InvalidCredentialsError):
             await auth_usecase.refresh("revoked-token")
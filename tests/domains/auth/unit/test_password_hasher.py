@@ -1,9 +1,14 @@
+import asyncio
+import threading
+
 import pytest
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from app.core.config import Configuration
-from app.utils.security import PasswordHasher
+from app.core.prometheus import get_registry
+from app.domain.errors import PasswordHashingBusyError
+from app.utils.security import HashingPool, PasswordHasher
 
 
 @pytest.fixture
@@ -45,3 +50,68 @@ def test_round_trip_random(password: str):
     password_hasher = PasswordHasher(Configuration())
     hashed = password_hasher.hash_password(password)
     assert password_hasher.verify_password(password, hashed)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_async_hash_and_verify(password_hasher):
+    hashed = await password_hasher.hash_password_async("StrongPass1!")
+
+    assert await password_hasher.verify_password_async("StrongPass1!", hashed)
+    assert not await password_hasher.verify_password_async("wrong", hashed)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_hashing_does_not_block_the_event_loop():
+    hasher = PasswordHasher(Configuration(BCRYPT_ROUNDS=10))
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.001)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    await hasher.hash_password_async("StrongPass1!")
+    task.cancel()
+
+    assert ticks > 5
+
+
+def _rejected(op):
+    return get_registry().get_sample_value("password_hash_rejected_total", {"op": op})
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_saturated_pool_rejects_instead_of_queueing():
+    pool = HashingPool(workers=1, max_queue=1)
+    release = threading.Event()
+    rejected_before = _rejected("test") or 0
+
+    running = asyncio.create_task(pool.run("test", release.wait))
+    queued = asyncio.create_task(pool.run("test", lambda: True))
+    await asyncio.sleep(0.01)
+    assert pool.queue_depth == 1
+
+    with pytest.raises(PasswordHashingBusyError):
+        await pool.run("test", lambda: True)
+    assert _rejected("test") == rejected_before + 1
+
+    release.set()
+    assert await running is True
+    assert await queued is True
+    assert pool.queue_depth == 0
+    assert await pool.run("test", lambda: "free again") == "free again"
+
+
+@pytest.mark.unit
+def test_pool_defaults_to_one_worker_per_core(monkeypatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 6)
+
+    pool = HashingPool(workers=0, max_queue=4)
+
+    assert pool.workers == 6
+    assert pool.capacity == 10
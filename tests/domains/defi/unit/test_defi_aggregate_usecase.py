@@ -0,0 +1,177 @@
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import HTTPException
+
+from app.usecase.defi_aggregate_usecase import (
+    DefiAggregateUsecase,
+    build_aggregate_metrics,
+)
+
+ADDRESS = "0x" + "ab" * 20
+
+
+def _snapshot():
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        timestamp=1_700_000_000,
+        total_collateral_usd=3000.0,
+        total_borrowings_usd=1200.0,
+        collaterals=[
+            {"protocol": "AAVE", "asset": "WETH", "amount": 1.0, "usd_value": 2000.0}
+        ],
+        staked_positions=[
+            {
+                "protocol": "COMPOUND",
+                "asset": "USDC",
+                "amount": 750.0,
+                "usd_value": 750.0,
+                "apy": 0.04,
+            },
+            {
+                "protocol": "AAVE",
+                "asset": "DAI",
+                "amount": 250.0,
+                "usd_value": 250.0,
+                "apy": 0.08,
+            },
+        ],
+    )
+
+
+@pytest.fixture
+def metrics_cache():
+    cache = Mock()
+    cache.get_metrics_cache = AsyncMock(return_value=None)
+    cache.set_metrics_cache = AsyncMock(return_value=True)
+    cache.mark_hot = AsyncMock()
+    cache.get_keys_due_for_refresh = AsyncMock(return_value=[])
+    return cache
+
+
+@pytest.fixture
+def defi_aggregate_usecase(
+    mock_portfolio_snapshot_repository,
+    mock_wallet_repository,
+    metrics_cache,
+    mock_config,
+    mock_audit,
+):
+    return DefiAggregateUsecase(
+        mock_portfolio_snapshot_repository,
+        mock_wallet_repository,
+        metrics_cache,
+        mock_config,
+        mock_audit,
+    )
+
+
+@pytest.mark.unit
+def test_build_aggregate_metrics_weights_apy_by_usd_value():
+    snapshot = _snapshot()
+
+    metrics = build_aggregate_metrics(ADDRESS, snapshot)
+
+    assert metrics.tvl == 3000.0
+    assert metrics.total_borrowings == 1200.0
+    assert metrics.aggregate_apy == pytest.approx(0.05)
+    assert metrics.id == str(snapshot.id)
+    assert [p.protocol for p in metrics.positions] == ["aave", "compound", "aave"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_wallet_metrics_cache_hit_skips_snapshot(
+    defi_aggregate_usecase,
+    mock_wallet_repository,
+    mock_portfolio_snapshot_repository,
+    metrics_cache,
+):
+    cached = build_aggregate_metrics(ADDRESS, _snapshot())
+    mock_wallet_repository.get_by_user_and_address.return_value = SimpleNamespace(
+        address=ADDRESS
+    )
+    metrics_cache.get_metrics_cache.return_value = cached
+
+    result = await defi_aggregate_usecase.get_wallet_metrics(uuid.uuid4(), ADDRESS)
+
+    assert result == cached
+    mock_portfolio_snapshot_repository.get_latest_snapshot_by_address.assert_not_called()
+    metrics_cache.mark_hot.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_wallet_metrics_miss_computes_and_caches(
+    defi_aggregate_usecase,
+    mock_wallet_repository,
+    mock_portfolio_snapshot_repository,
+    metrics_cache,
+):
+    mock_wallet_repository.get_by_user_and_address.return_value = SimpleNamespace(
+        address=ADDRESS
+    )
+    mock_portfolio_snapshot_repository.get_latest_snapshot_by_address.return_value = (
+        _snapshot()
+    )
+
+    result = await defi_aggregate_usecase.get_wallet_metrics(uuid.uuid4(), ADDRESS)
+
+    assert result.tvl == 3000.0
+    metrics_cache.set_metrics_cache.assert_awaited_once()
+    metrics_cache.mark_hot.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_wallet_metrics_not_owned(
+    defi_aggregate_usecase, mock_wallet_repository, metrics_cache
+):
+    mock_wallet_repository.get_by_user_and_address.return_value = None
+
+    with pytest.raises(HTTPException) as exc:
+        await defi_aggregate_usecase.get_wallet_metrics(uuid.uuid4(), ADDRESS)
+
+    assert exc.value.status_code == 404
+    metrics_cache.get_metrics_cache.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_wallet_metrics_without_snapshot(
+    defi_aggregate_usecase,
+    mock_wallet_repository,
+    mock_portfolio_snapshot_repository,
+):
+    mock_wallet_repository.get_by_user_and_address.return_value = SimpleNamespace(
+        address=ADDRESS
+    )
+    mock_portfolio_snapshot_repository.get_latest_snapshot_by_address.return_value = (
+        None
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        await defi_aggregate_usecase.get_wallet_metrics(uuid.uuid4(), ADDRESS)
+
+    assert exc.value.status_code == 404
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_refresh_hot_metrics_recomputes_due_keys(
+    defi_aggregate_usecase, mock_portfolio_snapshot_repository, metrics_cache
+):
+    other = "0x" + "cd" * 20
+    metrics_cache.get_keys_due_for_refresh.return_value = [ADDRESS, other]
+    mock_portfolio_snapshot_repository.get_latest_snapshot_by_address.side_effect = (
+        lambda address: _snapshot() if address == ADDRESS else None
+    )
+
+    refreshed = await defi_aggregate_usecase.refresh_hot_metrics()
+
+    assert refreshed == 1
+    (address, metrics) = metrics_cache.set_metrics_cache.await_args.args
+    assert address == ADDRESS
+    assert metrics.tvl == 3000.0
@@ -17,7 +17,15 @@ from app.domain.schemas.wallet import WalletResponse
 def mock_wallet_uc():
     """A WalletUsecase mock with async methods stubbed out."""
     uc = AsyncMock()
-    DeFi(uc)  # inject singleton dependency for the staticmethods
+    DeFi(uc, AsyncMock())  # inject singleton dependency for the staticmethods
+    return uc
+
+
+@pytest.fixture
+def mock_defi_aggregate_uc():
+    """A DefiAggregateUsecase mock injected next to a wallet usecase mock."""
+    uc = AsyncMock()
+    DeFi(AsyncMock(), uc)
     return uc
 
 
@@ -172,3 +180,17 @@ async def test_kpi_endpoint_uses_snapshot(fake_request):
     assert kpi.tvl == 200.0
     assert kpi.apy == 5.0
     assert kpi.protocols == []
+
+
+@pytest.mark.asyncio
+async def test_wallet_aggregate_metrics_endpoint(mock_defi_aggregate_uc, fake_request):
+    addr = "0x" + "a" * 40
+    uid = uuid.uuid4()
+    sentinel = object()
+    mock_defi_aggregate_uc.get_wallet_metrics.return_value = sentinel
+
+    with patch("app.api.endpoints.defi.get_user_id_from_request", return_value=uid):
+        res = await DeFi.get_wallet_aggregate_metrics(fake_request, addr)
+
+    assert res is sentinel
+    mock_defi_aggregate_uc.get_wallet_metrics.assert_awaited_once_with(uid, addr)
@@ -1,11 +1,12 @@
 """Integration tests for the JWKS endpoint."""
 import json
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
 import pytest
 
 from app.domain.schemas.jwks import JWK, JWKSet
+from app.utils.jwks_cache import JWKSDocument
 
 
 @pytest.mark.unit
@@ -54,7 +55,9 @@ async def test_jwks_endpoint_cache_hit(test_app, sample_jwks):
     """JWKS endpoint should serve cached response when available."""
     # Mock the use case to return the cached JWKS directly
     mock_jwks_usecase = AsyncMock()
-    mock_jwks_usecase.get_jwks.return_value = sample_jwks
+    mock_jwks_usecase.get_jwks_document.return_value = JWKSDocument.from_jwks(
+        sample_jwks, 300
+    )
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         transport = httpx.ASGITransport(app=test_app, raise_app_exceptions=True)
@@ -63,8 +66,8 @@ async def test_jwks_endpoint_cache_hit(test_app, sample_jwks):
 
     assert resp.status_code == 200
     data = resp.json()
-    assert data["keys"] == sample_jwks.model_dump()["keys"]
-    mock_jwks_usecase.get_jwks.assert_called_once()
+    assert data["keys"] == sample_jwks.model_dump(exclude_none=True)["keys"]
+    mock_jwks_usecase.get_jwks_document.assert_called_once()
 
 
 @pytest.mark.unit
@@ -79,7 +82,9 @@ async def test_jwks_endpoint_cache_miss(test_app):
 
     # Mock the use case to return fresh JWKS
     mock_jwks_usecase = AsyncMock()
-    mock_jwks_usecase.get_jwks.return_value = expected_jwks
+    mock_jwks_usecase.get_jwks_document.return_value = JWKSDocument.from_jwks(
+        expected_jwks, 300
+    )
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         transport = httpx.ASGITransport(app=test_app, raise_app_exceptions=True)
@@ -91,7 +96,7 @@ async def test_jwks_endpoint_cache_miss(test_app):
     assert "keys" in data
     assert len(data["keys"]) == 1
     assert data["keys"][0]["kid"] == "test-key-id"
-    mock_jwks_usecase.get_jwks.assert_called_once()
+    mock_jwks_usecase.get_jwks_document.assert_called_once()
 
 
 @pytest.mark.unit
@@ -111,7 +116,9 @@ async def test_jwks_endpoint_redis_error_graceful_fallback(test_app):
 
     # Mock the use case to handle the Redis error gracefully and return fallback
     mock_jwks_usecase = AsyncMock()
-    mock_jwks_usecase.get_jwks.return_value = fallback_jwks
+    mock_jwks_usecase.get_jwks_document.return_value = JWKSDocument.from_jwks(
+        fallback_jwks, 300
+    )
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         transport = httpx.ASGITransport(app=test_app, raise_app_exceptions=True)
@@ -123,7 +130,7 @@ async def test_jwks_endpoint_redis_error_graceful_fallback(test_app):
     assert "keys" in data
     assert len(data["keys"]) == 1
     assert data["keys"][0]["kid"] == "fallback-key"
-    mock_jwks_usecase.get_jwks.assert_called_once()
+    mock_jwks_usecase.get_jwks_document.assert_called_once()
 
 
 @pytest.mark.unit
@@ -143,7 +150,9 @@ async def test_jwks_endpoint_cache_storage_error_graceful(test_app):
 
     # Mock the use case to handle storage error gracefully and still return JWKS
     mock_jwks_usecase = AsyncMock()
-    mock_jwks_usecase.get_jwks.return_value = expected_jwks
+    mock_jwks_usecase.get_jwks_document.return_value = JWKSDocument.from_jwks(
+        expected_jwks, 300
+    )
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         transport = httpx.ASGITransport(app=test_app, raise_app_exceptions=True)
@@ -155,7 +164,7 @@ async def test_jwks_endpoint_cache_storage_error_graceful(test_app):
     assert "keys" in data
     assert len(data["keys"]) == 1
     assert data["keys"][0]["kid"] == "storage-error-key"
-    mock_jwks_usecase.get_jwks.assert_called_once()
+    mock_jwks_usecase.get_jwks_document.assert_called_once()
 
 
 @pytest.mark.unit
@@ -165,7 +174,9 @@ async def test_jwks_endpoint_empty_key_set(test_app):
     # Mock the use case to return empty JWKS
     empty_jwks = JWKSet(keys=[])
     mock_jwks_usecase = AsyncMock()
-    mock_jwks_usecase.get_jwks.return_value = empty_jwks
+    mock_jwks_usecase.get_jwks_document.return_value = JWKSDocument.from_jwks(
+        empty_jwks, 300
+    )
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         transport = httpx.ASGITransport(app=test_app, raise_app_exceptions=True)
@@ -176,7 +187,7 @@ async def test_jwks_endpoint_empty_key_set(test_app):
     data = resp.json()
     assert "keys" in data
     assert data["keys"] == []  # Empty key set
-    mock_jwks_usecase.get_jwks.assert_called_once()
+    mock_jwks_usecase.get_jwks_document.assert_called_once()
 
 
 @pytest.mark.unit
@@ -186,7 +197,9 @@ async def test_jwks_endpoint_key_formatting_failure_graceful(test_app):
     # Mock the use case to return empty JWKS when formatting fails
     empty_jwks = JWKSet(keys=[])
     mock_jwks_usecase = AsyncMock()
-    mock_jwks_usecase.get_jwks.return_value = empty_jwks
+    mock_jwks_usecase.get_jwks_document.return_value = JWKSDocument.from_jwks(
+        empty_jwks, 300
+    )
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         transport = httpx.ASGITransport(app=test_app, raise_app_exceptions=True)
@@ -197,7 +210,7 @@ async def test_jwks_endpoint_key_formatting_failure_graceful(test_app):
     data = resp.json()
     assert "keys" in data
     assert data["keys"] == []  # Should return empty key set when formatting fails
-    mock_jwks_usecase.get_jwks.assert_called_once()
+    mock_jwks_usecase.get_jwks_document.assert_called_once()
 
 
 @pytest.mark.unit
@@ -212,7 +225,9 @@ async def test_jwks_endpoint_mixed_key_formatting_success_and_failure(test_app):
 
     # Mock the use case to return only successfully formatted keys
     mock_jwks_usecase = AsyncMock()
-    mock_jwks_usecase.get_jwks.return_value = partial_jwks
+    mock_jwks_usecase.get_jwks_document.return_value = JWKSDocument.from_jwks(
+        partial_jwks, 300
+    )
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         transport = httpx.ASGITransport(app=test_app, raise_app_exceptions=True)
@@ -224,7 +239,7 @@ async def test_jwks_endpoint_mixed_key_formatting_success_and_failure(test_app):
     assert "keys" in data
     assert len(data["keys"]) == 1  # Should include only the successfully formatted key
     assert data["keys"][0]["kid"] == "good-key"
-    mock_jwks_usecase.get_jwks.assert_called_once()
+    mock_jwks_usecase.get_jwks_document.assert_called_once()
 
 
 @pytest.mark.unit
@@ -244,7 +259,9 @@ async def test_jwks_endpoint_cache_close_failure_graceful(test_app):
 
     # Mock the use case to handle close error gracefully and still return JWKS
     mock_jwks_usecase = AsyncMock()
-    mock_jwks_usecase.get_jwks.return_value = expected_jwks
+    mock_jwks_usecase.get_jwks_document.return_value = JWKSDocument.from_jwks(
+        expected_jwks, 300
+    )
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         transport = httpx.ASGITransport(app=test_app, raise_app_exceptions=True)
@@ -256,7 +273,7 @@ async def test_jwks_endpoint_cache_close_failure_graceful(test_app):
     assert "keys" in data
     assert len(data["keys"]) == 1
     assert data["keys"][0]["kid"] == "close-error-key"
-    mock_jwks_usecase.get_jwks.assert_called_once()
+    mock_jwks_usecase.get_jwks_document.assert_called_once()
 
 
 @pytest.mark.unit
@@ -278,7 +295,9 @@ async def test_jwks_endpoint_concurrent_requests(test_app):
 
     # Mock the use case to return consistent results for concurrent requests
     mock_jwks_usecase = AsyncMock()
-    mock_jwks_usecase.get_jwks.return_value = expected_jwks
+    mock_jwks_usecase.get_jwks_document.return_value = JWKSDocument.from_jwks(
+        expected_jwks, 300
+    )
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         transport = httpx.ASGITransport(app=test_app, raise_app_exceptions=True)
@@ -296,4 +315,134 @@ async def test_jwks_endpoint_concurrent_requests(test_app):
         assert data["keys"][0]["kid"] == "concurrent-key"
 
     # Should have been called 5 times (once per concurrent request)
-    assert mock_jwks_usecase.get_jwks.call_count == 5
+    assert mock_jwks_usecase.get_jwks_document.call_count == 5
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_jwks_endpoint_sets_caching_headers(test_app, sample_jwks):
+    """JWKS responses carry a strong ETag and a public max-age."""
+    document = JWKSDocument.from_jwks(sample_jwks, 300)
+    mock_jwks_usecase = AsyncMock()
+    mock_jwks_usecase.get_jwks_document.return_value = document
+
+    with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
+        transport = httpx.ASGITransport(app=test_app, raise_app_exceptions=True)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            resp = await ac.get("/.well-known/jwks.json")
+
+    assert resp.status_code == 200
+    assert resp.content == document.body
+    assert resp.headers["etag"] == document.etag
+    assert resp.headers["cache-control"] == "public, max-age=300"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_jwks_endpoint_not_modified(test_app, sample_jwks):
+    """A matching If-None-Match is answered with an empty 304."""
+    document = JWKSDocument.from_jwks(sample_jwks, 300)
+    mock_jwks_usecase = AsyncMock()
+    mock_jwks_usecase.get_jwks_document.return_value = document
+
+    with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
+        transport = httpx.ASGITransport(app=test_app, raise_app_exceptions=True)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            fresh = await ac.get(
+                "/.well-known/jwks.json", headers={"If-None-Match": document.etag}
+            )
+            stale = await ac.get(
+                "/.well-known/jwks.json", headers={"If-None-Match": '"stale"'}
+            )
+
+    assert fresh.status_code == 304
+    assert fresh.content == b""
+    assert fresh.headers["etag"] == document.etag
+    assert stale.status_code == 200
+
+
+def _usecase(jwks_cache_utils):
+    from app.usecase.jwks_usecase import JWKSUsecase
+
+    jwt_key_utils = Mock()
+    jwt_key_utils.get_verifying_keys.return_value = []
+    return JWKSUsecase(jwks_cache_utils, jwt_key_utils, Mock())
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_jwks_document_local_hit_skips_redis(sample_jwks):
+    """A valid in-process copy is served without touching Redis."""
+    document = JWKSDocument.from_jwks(sample_jwks, 300)
+    cache = Mock()
+    cache.get_local.return_value = document
+
+    assert await _usecase(cache).get_jwks_document() is document
+    cache._build_redis_client.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_jwks_document_uses_redis_body_verbatim(sample_jwks):
+    """The body cached in Redis becomes the local copy without re-encoding."""
+    body = JWKSDocument.from_jwks(sample_jwks, 300).body
+    cache = Mock()
+    cache.get_local.return_value = None
+    cache.get_jwks_body = AsyncMock(return_value=body)
+    cache.set_local.side_effect = lambda b: JWKSDocument.from_body(b, 300)
+    usecase = _usecase(cache)
+
+    document = await usecase.get_jwks_document()
+
+    assert document.body == body
+    cache.set_local.assert_called_once_with(body)
+    usecase.jwt_key_utils.get_verifying_keys.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_jwks_document_miss_generates_and_caches():
+    """On a Redis miss the JWKS is generated, cached and kept locally."""
+    cache = Mock()
+    cache.get_local.return_value = None
+    cache.get_jwks_body = AsyncMock(return_value=None)
+    cache.set_jwks_cache = AsyncMock(return_value=True)
+    cache.set_local.side_effect = lambda b: JWKSDocument.from_body(b, 300)
+
+    document = await _usecase(cache).get_jwks_document()
+
+    assert json.loads(document.body) == {"keys": []}
+    cache.set_jwks_cache.assert_awaited_once()
+
+
+@pytest.mark.unit
+def test_jwk_schema_accepts_ec_and_okp_keys():
+    """EC and OKP keys validate and serialise without RSA members."""
+    ec_key = JWK(kty="EC", kid="ec", alg="ES256", crv="P-256", x="eA", y="eQ")
+    okp_key = JWK(kty="OKP", kid="ed", alg="EdDSA", crv="Ed25519", x="eA")
+
+    assert ec_key.model_dump(exclude_none=True) == {
+        "kty": "EC",
+        "use": "sig",
+        "kid": "ec",
+        "alg": "ES256",
+        "crv": "P-256",
+        "x": "eA",
+        "y": "eQ",
+    }
+    assert "n" not in okp_key.model_dump(exclude_none=True)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"kty": "RSA", "alg": "RS256", "n": "bg"},
+        {"kty": "EC", "alg": "ES256", "crv": "P-256", "x": "eA"},
+        {"kty": "OKP", "alg": "EdDSA", "x": "eA"},
+    ],
+)
+def test_jwk_schema_requires_key_type_members(fields):
+    """Each key type must carry its own public members."""
+    with pytest.raises(ValueError, match="JWK is missing"):
+        JWK(kid="k", **fields)
@@ -6,6 +6,7 @@ import httpx
 import pytest
 
 from app.domain.schemas.jwks import JWK, JWKSet
+from app.utils.jwks_cache import JWKSDocument
 
 
 @pytest.mark.unit
@@ -14,7 +15,9 @@ async def test_jwks_endpoint_cache_hit_metrics(test_app, sample_jwks):
     """Test that cache hits are properly tracked in metrics."""
     # Mock the use case to return cached JWKS
     mock_jwks_usecase = AsyncMock()
-    mock_jwks_usecase.get_jwks.return_value = sample_jwks
+    mock_jwks_usecase.get_jwks_document.return_value = JWKSDocument.from_jwks(
+        sample_jwks, 300
+    )
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         # Mock metrics to track calls
@@ -27,7 +30,7 @@ async def test_jwks_endpoint_cache_hit_metrics(test_app, sample_jwks):
 
             assert resp.status_code == 200
             assert resp.headers["content-type"] == "application/json"
-            mock_jwks_usecase.get_jwks.assert_called_once()
+            mock_jwks_usecase.get_jwks_document.assert_called_once()
 
             # Verify cache hit was recorded (if metrics are implemented)
             # Note: This test documents the expected behavior even if metrics aren't implemented yet
@@ -51,7 +54,9 @@ async def test_jwks_endpoint_cache_miss_metrics(test_app):
 
     # Mock the use case to simulate cache miss (fresh JWKS generation)
     mock_jwks_usecase = AsyncMock()
-    mock_jwks_usecase.get_jwks.return_value = cache_miss_jwks
+    mock_jwks_usecase.get_jwks_document.return_value = JWKSDocument.from_jwks(
+        cache_miss_jwks, 300
+    )
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         # Mock metrics to track calls
@@ -65,7 +70,7 @@ async def test_jwks_endpoint_cache_miss_metrics(test_app):
             assert resp.status_code == 200
             assert resp.headers["content-type"] == "application/json"
             assert len(resp.json()["keys"]) == 1
-            mock_jwks_usecase.get_jwks.assert_called_once()
+            mock_jwks_usecase.get_jwks_document.assert_called_once()
 
             # Verify cache miss was recorded (if metrics are implemented)
             # mock_metrics["cache_miss"].inc.assert_called()
@@ -77,7 +82,7 @@ async def test_jwks_endpoint_error_metrics(test_app):
     """Test that errors are properly tracked in metrics."""
     # Mock the use case to raise an exception
     mock_jwks_usecase = AsyncMock()
-    mock_jwks_usecase.get_jwks.side_effect = Exception("Service error")
+    mock_jwks_usecase.get_jwks_document.side_effect = Exception("Service error")
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         # Mock metrics to track calls
@@ -93,7 +98,7 @@ async def test_jwks_endpoint_error_metrics(test_app):
                 200,
                 500,
             ]  # Depends on error handling implementation
-            mock_jwks_usecase.get_jwks.assert_called_once()
+            mock_jwks_usecase.get_jwks_document.assert_called_once()
 
             # Verify error was recorded (if metrics are implemented)
             # mock_metrics["error"].inc.assert_called()
@@ -139,7 +144,9 @@ async def test_jwks_endpoint_audit_events(test_app, sample_jwks):
     """Test that JWKS endpoint requests generate proper audit events."""
     # Mock the use case to return sample JWKS
     mock_jwks_usecase = AsyncMock()
-    mock_jwks_usecase.get_jwks.return_value = sample_jwks
+    mock_jwks_usecase.get_jwks_document.return_value = JWKSDocument.from_jwks(
+        sample_jwks, 300
+    )
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         # Mock audit system to track events
@@ -151,7 +158,7 @@ async def test_jwks_endpoint_audit_events(test_app, sample_jwks):
                 resp = await ac.get("/.well-known/jwks.json")
 
             assert resp.status_code == 200
-            mock_jwks_usecase.get_jwks.assert_called_once()
+            mock_jwks_usecase.get_jwks_document.assert_called_once()
 
             # Verify audit event was logged (if audit is implemented)
             # mock_audit.info.assert_called_with("JWKS requested", ...)
@@ -169,7 +176,9 @@ async def test_jwks_endpoint_cache_miss_audit_events(test_app):
 
     # Mock the use case to simulate cache miss
     mock_jwks_usecase = AsyncMock()
-    mock_jwks_usecase.get_jwks.return_value = cache_miss_jwks
+    mock_jwks_usecase.get_jwks_document.return_value = JWKSDocument.from_jwks(
+        cache_miss_jwks, 300
+    )
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         # Mock audit system to track events
@@ -181,7 +190,7 @@ async def test_jwks_endpoint_cache_miss_audit_events(test_app):
                 resp = await ac.get("/.well-known/jwks.json")
 
             assert resp.status_code == 200
-            mock_jwks_usecase.get_jwks.assert_called_once()
+            mock_jwks_usecase.get_jwks_document.assert_called_once()
 
             # Verify cache miss audit event was logged (if audit is implemented)
             # mock_audit.info.assert_called_with("JWKS requested", cache_hit=False, ...)
@@ -193,7 +202,7 @@ async def test_jwks_endpoint_error_audit_events(test_app):
     """Test that error events generate proper audit logs."""
     # Mock the use case to raise an exception
     mock_jwks_usecase = AsyncMock()
-    mock_jwks_usecase.get_jwks.side_effect = Exception("Service error")
+    mock_jwks_usecase.get_jwks_document.side_effect = Exception("Service error")
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         # Mock audit system to track events
@@ -206,7 +215,7 @@ async def test_jwks_endpoint_error_audit_events(test_app):
 
             # The endpoint should handle errors gracefully or return error status
             assert resp.status_code in [200, 500]
-            mock_jwks_usecase.get_jwks.assert_called_once()
+            mock_jwks_usecase.get_jwks_document.assert_called_once()
 
             # Verify error audit event was logged (if audit is implemented)
             # mock_audit.error.assert_called_with("JWKS error", ...)
@@ -218,7 +227,9 @@ async def test_jwks_endpoint_performance_metrics(test_app, sample_jwks):
     """Test that performance metrics are properly tracked."""
     # Mock the use case to return sample JWKS
     mock_jwks_usecase = AsyncMock()
-    mock_jwks_usecase.get_jwks.return_value = sample_jwks
+    mock_jwks_usecase.get_jwks_document.return_value = JWKSDocument.from_jwks(
+        sample_jwks, 300
+    )
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         # Mock metrics to track performance
@@ -230,7 +241,7 @@ async def test_jwks_endpoint_performance_metrics(test_app, sample_jwks):
                 resp = await ac.get("/.well-known/jwks.json")
 
             assert resp.status_code == 200
-            mock_jwks_usecase.get_jwks.assert_called_once()
+            mock_jwks_usecase.get_jwks_document.assert_called_once()
 
             # Verify performance metrics were recorded (if implemented)
             # mock_metrics["response_time"].observe.assert_called()
@@ -242,7 +253,9 @@ async def test_jwks_endpoint_request_count_metrics(test_app, sample_jwks):
     """Test that request count metrics are properly tracked."""
     # Mock the use case to return sample JWKS
     mock_jwks_usecase = AsyncMock()
-    mock_jwks_usecase.get_jwks.return_value = sample_jwks
+    mock_jwks_usecase.get_jwks_document.return_value = JWKSDocument.from_jwks(
+        sample_jwks, 300
+    )
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         # Mock metrics to track request counts
@@ -254,7 +267,7 @@ async def test_jwks_endpoint_request_count_metrics(test_app, sample_jwks):
                 resp = await ac.get("/.well-known/jwks.json")
 
             assert resp.status_code == 200
-            mock_jwks_usecase.get_jwks.assert_called_once()
+            mock_jwks_usecase.get_jwks_document.assert_called_once()
 
             # Verify request count was incremented (if metrics are implemented)
             # mock_metrics["requests_total"].inc.assert_called()
@@ -266,7 +279,7 @@ async def test_jwks_endpoint_error_rate_metrics(test_app):
     """Test that error rate metrics are properly tracked."""
     # Mock the use case to raise an exception
     mock_jwks_usecase = AsyncMock()
-    mock_jwks_usecase.get_jwks.side_effect = Exception("Service error")
+    mock_jwks_usecase.get_jwks_document.side_effect = Exception("Service error")
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         # Mock metrics to track error rates
@@ -279,7 +292,7 @@ async def test_jwks_endpoint_error_rate_metrics(test_app):
 
             # The endpoint should handle errors or return error status
             assert resp.status_code in [200, 500]
-            mock_jwks_usecase.get_jwks.assert_called_once()
+            mock_jwks_usecase.get_jwks_document.assert_called_once()
 
             # Verify error rate was tracked (if metrics are implemented)
             # mock_metrics["error_rate"].inc.assert_called()
@@ -0,0 +1,134 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.models.token import Token
+from app.models.token_price import TokenPrice
+from app.models.token_price_candle import TokenPriceCandle
+from app.repositories.token_price_repository import align_to_bucket
+
+pytestmark = pytest.mark.integration
+
+T0 = datetime(2024, 6, 1)
+
+
+async def _seed(db_session):
+    token = Token(
+        id=uuid.uuid4(),
+        address=f"0x{uuid.uuid4().hex[:40]}",
+        symbol="WETH",
+        name="Wrapped Ether",
+    )
+    db_session.add(token)
+    # Hour 0: 10, 14, 8, 12 -> O10 H14 L8 C12 ; hour 1: 20 ; hour 3: 30, 25
+    points = [
+        (0, 0, 10),
+        (0, 15, 14),
+        (0, 30, 8),
+        (0, 45, 12),
+        (1, 5, 20),
+        (3, 0, 30),
+        (3, 59, 25),
+    ]
+    db_session.add_all(
+        [
+            TokenPrice(
+                token_id=token.id,
+                price_usd=price,
+                timestamp=T0 + timedelta(hours=h, minutes=m),
+            )
+            for h, m, price in points
+        ]
+    )
+    await db_session.commit()
+    return token
+
+
+@pytest.mark.asyncio
+async def test_list_candles_hourly(token_price_repository_with_real_db, db_session):
+    token = await _seed(db_session)
+
+    candles = await token_price_repository_with_real_db.list_candles(
+        token.id, "1h", T0 + timedelta(minutes=20), T0 + timedelta(days=1)
+    )
+
+    assert [c.timestamp for c in candles] == [
+        T0,
+        T0 + timedelta(hours=1),
+        T0 + timedelta(hours=3),
+    ]
+    first = candles[0]
+    assert (first.open, first.high, first.low, first.close, first.samples) == (
+        10,
+        14,
+        8,
+        12,
+        4,
+    )
+    assert (candles[2].open, candles[2].close) == (30, 25)
+
+
+@pytest.mark.asyncio
+async def test_list_candles_daily(token_price_repository_with_real_db, db_session):
+    token = await _seed(db_session)
+
+    candles = await token_price_repository_with_real_db.list_candles(
+        token.id, "1d", T0, T0 + timedelta(days=1)
+    )
+
+    assert len(candles) == 1
+    day = candles[0]
+    assert (day.timestamp, day.open, day.high, day.low, day.close, day.samples) == (
+        T0,
+        10,
+        30,
+        8,
+        25,
+        7,
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_candles_upserts_rollup(
+    token_price_repository_with_real_db, db_session
+):
+    token = await _seed(db_session)
+    token_id = token.id
+    repo = token_price_repository_with_real_db
+
+    assert await repo.refresh_candles("1h", T0) == 3
+    # New price in an already rolled-up bucket: re-running overwrites it
+    db_session.add(
+        TokenPrice(
+            token_id=token_id,
+            price_usd=50,
+            timestamp=T0 + timedelta(hours=1, minutes=30),
+        )
+    )
+    await db_session.commit()
+    assert await repo.refresh_candles("1h", T0) == 3
+
+    db_session.expire_all()
+    stored = (
+        (
+            await db_session.execute(
+                select(TokenPriceCandle).where(TokenPriceCandle.token_id == token_id)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert len(stored) == 3
+
+    rolled = await repo.list_rollup_candles(token_id, "1h", T0, T0 + timedelta(days=1))
+    live = await repo.list_candles(token_id, "1h", T0, T0 + timedelta(days=1))
+    assert rolled == live
+    assert rolled[1].high == 50 and rolled[1].close == 50
+
+
+def test_align_to_bucket():
+    ts = datetime(2024, 6, 1, 13, 47, 12)
+    assert align_to_bucket(ts, "1h") == datetime(2024, 6, 1, 13)
+    assert align_to_bucket(ts, "1d") == datetime(2024, 6, 1)
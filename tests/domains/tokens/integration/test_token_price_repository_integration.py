@@ -0,0 +1,58 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.token import Token
+from app.models.token_price import TokenPrice
+
+pytestmark = pytest.mark.integration
+
+
+def _token(symbol, current_price=None):
+    return Token(
+        id=uuid.uuid4(),
+        address=f"0x{uuid.uuid4().hex[:40]}",
+        symbol=symbol,
+        name=symbol,
+        current_price_usd=current_price,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_latest_prices_picks_newest_row_per_token(
+    token_price_repository_with_real_db, db_session
+):
+    weth, usdc, dai = _token("WETH"), _token("USDC", 1), _token("DAI")
+    t0 = datetime(2024, 1, 1)
+    db_session.add_all([weth, usdc, dai])
+    db_session.add_all(
+        [
+            TokenPrice(token_id=weth.id, price_usd=3000, timestamp=t0),
+            TokenPrice(
+                token_id=weth.id, price_usd=3100, timestamp=t0 + timedelta(hours=1)
+            ),
+        ]
+    )
+    await db_session.commit()
+
+    quotes = await token_price_repository_with_real_db.get_latest_prices(
+        [weth.id, usdc.id, dai.id]
+    )
+    by_symbol = {q.symbol: q for q in quotes}
+
+    assert by_symbol["WETH"].price_usd == 3100
+    assert by_symbol["WETH"].timestamp == t0 + timedelta(hours=1)
+    assert by_symbol["WETH"].address == weth.address
+    # No history: falls back to tokens.current_price_usd
+    assert by_symbol["USDC"].price_usd == 1
+    assert by_symbol["USDC"].timestamp is None
+    # Neither history nor current price: omitted
+    assert "DAI" not in by_symbol
+
+
+@pytest.mark.asyncio
+async def test_get_latest_prices_with_empty_selection(
+    token_price_repository_with_real_db,
+):
+    assert await token_price_repository_with_real_db.get_latest_prices([]) == []
@@ -0,0 +1,63 @@
+import uuid
+from datetime import datetime
+
+import pytest
+
+from app.models.token import Token
+from app.models.token_balance import TokenBalance
+from app.models.transaction import Transaction
+from app.models.wallet import Wallet
+
+pytestmark = pytest.mark.integration
+
+
+def _token(symbol):
+    return Token(
+        id=uuid.uuid4(),
+        address=f"0x{uuid.uuid4().hex[:40]}",
+        symbol=symbol,
+        name=symbol,
+    )
+
+
+def _wallet(is_active=True):
+    return Wallet(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        address=f"0x{uuid.uuid4().hex[:40]}",
+        is_active=is_active,
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_tracked_returns_tokens_of_active_wallets(
+    token_repository_with_real_db, db_session
+):
+    held, traded, both, inactive_only, untracked = (
+        _token(s) for s in ("HELD", "TRADED", "BOTH", "INACTIVE", "NONE")
+    )
+    active, inactive = _wallet(), _wallet(is_active=False)
+    db_session.add_all([held, traded, both, inactive_only, untracked, active, inactive])
+    db_session.add_all(
+        [
+            TokenBalance(wallet_id=active.id, token_id=held.id, balance=1),
+            TokenBalance(wallet_id=active.id, token_id=both.id, balance=1),
+            TokenBalance(wallet_id=inactive.id, token_id=inactive_only.id, balance=1),
+        ]
+    )
+    for i, token in enumerate((traded, both)):
+        db_session.add(
+            Transaction(
+                wallet_id=active.id,
+                hash=f"0x{i:064x}",
+                token_id=token.id,
+                type="IN",
+                amount=1,
+                timestamp=datetime(2024, 1, 1),
+            )
+        )
+    await db_session.commit()
+
+    tokens = await token_repository_with_real_db.list_tracked()
+
+    assert sorted(t.symbol for t in tokens) == ["BOTH", "HELD", "TRADED"]
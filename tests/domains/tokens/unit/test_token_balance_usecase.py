@@ -629,3 +629,33 @@ class TestTokenBalanceUsecase:
         assert result == expected_response
         assert result.balance == balance
         assert result.balance_usd == balance_usd
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_upsert_token_balances_batch(self, token_balance_usecase_with_di):
+        """Test batch token balance upsert delegates to a single bulk write."""
+        from app.domain.schemas.token_balance import TokenBalanceBatchCreate
+
+        usecase = token_balance_usecase_with_di
+        wallet_id = uuid.uuid4()
+        batch = TokenBalanceBatchCreate(
+            items=[
+                TokenBalanceCreate(
+                    token_id=uuid.uuid4(),
+                    wallet_id=wallet_id,
+                    balance=1.0,
+                    balance_usd=2.0,
+                )
+                for _ in range(2)
+            ]
+        )
+        usecase._TokenBalanceUsecase__token_balance_repo.bulk_upsert = AsyncMock(
+            return_value=2
+        )
+
+        result = await usecase.upsert_token_balances(batch)
+
+        assert result.count == 2
+        usecase._TokenBalanceUsecase__token_balance_repo.bulk_upsert.assert_awaited_once_with(
+            batch.items
+        )
@@ -411,3 +411,360 @@ class TestTokenPriceUsecase:
 
         # Verify repository was called for each
         assert usecase._TokenPriceUsecase__token_price_repo.create.call_count == 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_create_token_prices_batch(self, token_price_usecase_with_di):
+        """Test batch token price creation delegates to a single bulk write."""
+        from app.domain.schemas.token_price import TokenPriceBatchCreate
+
+        usecase = token_price_usecase_with_di
+        batch = TokenPriceBatchCreate(
+            items=[
+                TokenPriceCreate(token_id=uuid.uuid4(), price_usd=float(i))
+                for i in range(3)
+            ]
+        )
+        usecase._TokenPriceUsecase__token_price_repo.bulk_create = AsyncMock(
+            return_value=3
+        )
+
+        result = await usecase.create_token_prices(batch)
+
+        assert result.count == 3
+        usecase._TokenPriceUsecase__token_price_repo.bulk_create.assert_awaited_once_with(
+            batch.items
+        )
+        usecase._TokenPriceUsecase__audit.info.assert_any_call(
+            "token_price_usecase_create_token_prices_success", count=3
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_create_token_prices_batch_error(self, token_price_usecase_with_di):
+        """Test batch token price creation surfaces repository errors."""
+        from app.domain.schemas.token_price import TokenPriceBatchCreate
+
+        usecase = token_price_usecase_with_di
+        batch = TokenPriceBatchCreate(
+            items=[TokenPriceCreate(token_id=uuid.uuid4(), price_usd=1.0)]
+        )
+        usecase._TokenPriceUsecase__token_price_repo.bulk_create = AsyncMock(
+            side_effect=Exception("Database error")
+        )
+
+        with pytest.raises(Exception, match="Database error"):
+            await usecase.create_token_prices(batch)
+
+        usecase._TokenPriceUsecase__audit.error.assert_called_once_with(
+            "token_price_usecase_create_token_prices_failed",
+            count=1,
+            error="Database error",
+        )
+
+    @pytest.mark.unit
+    def test_token_price_batch_rejects_empty(self):
+        """Test that an empty batch is rejected by validation."""
+        from pydantic import ValidationError
+
+        from app.domain.schemas.token_price import TokenPriceBatchCreate
+
+        with pytest.raises(ValidationError):
+            TokenPriceBatchCreate(items=[])
+
+
+class TestTokenPriceUsecasePriceIndex:
+    """Test the latest-price index integration of TokenPriceUsecase."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_create_publishes_latest_price(
+        self, token_price_usecase_with_di, mock_token_price_repository, mock_price_index
+    ):
+        """A successful write broadcasts the token's latest price."""
+        from app.domain.schemas.token_price import LatestTokenPrice
+
+        token_id = uuid.uuid4()
+        quote = LatestTokenPrice(token_id=token_id, symbol="WETH", price_usd=3000)
+        mock_token_price_repository.create.return_value = TokenPriceResponse(
+            id=uuid.uuid4(), token_id=token_id, price_usd=3000
+        )
+        mock_token_price_repository.get_latest_prices.return_value = [quote]
+
+        await token_price_usecase_with_di.create_token_price(
+            TokenPriceCreate(token_id=token_id, price_usd=3000)
+        )
+
+        mock_token_price_repository.get_latest_prices.assert_awaited_once_with(
+            [token_id]
+        )
+        mock_price_index.publish.assert_awaited_once_with([quote])
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_batch_publishes_each_token_once(
+        self, token_price_usecase_with_di, mock_token_price_repository
+    ):
+        """Batch writes look up the latest price once per distinct token."""
+        from app.domain.schemas.token_price import TokenPriceBatchCreate
+
+        token_id = uuid.uuid4()
+        mock_token_price_repository.bulk_create.return_value = 2
+        batch = TokenPriceBatchCreate(
+            items=[
+                TokenPriceCreate(token_id=token_id, price_usd=1.0),
+                TokenPriceCreate(token_id=token_id, price_usd=2.0),
+            ]
+        )
+
+        await token_price_usecase_with_di.create_token_prices(batch)
+
+        mock_token_price_repository.get_latest_prices.assert_awaited_once_with(
+            [token_id]
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_publish_failure_does_not_fail_write(
+        self, token_price_usecase_with_di, mock_token_price_repository, mock_audit
+    ):
+        """The price row is committed even if broadcasting fails."""
+        expected = TokenPriceResponse(
+            id=uuid.uuid4(), token_id=uuid.uuid4(), price_usd=1
+        )
+        mock_token_price_repository.create.return_value = expected
+        mock_token_price_repository.get_latest_prices.side_effect = Exception("boom")
+
+        result = await token_price_usecase_with_di.create_token_price(
+            TokenPriceCreate(token_id=expected.token_id, price_usd=1)
+        )
+
+        assert result == expected
+        mock_audit.warning.assert_called_once_with(
+            "token_price_usecase_publish_latest_failed", error="boom"
+        )
+
+    @pytest.mark.unit
+    def test_get_latest_price_reads_index_only(
+        self, token_price_usecase_with_di, mock_token_price_repository, mock_price_index
+    ):
+        """Lookups are served from the index without touching the repository."""
+        from app.domain.schemas.token_price import LatestTokenPrice
+
+        quote = LatestTokenPrice(token_id=uuid.uuid4(), price_usd=1.0)
+        mock_price_index.get.side_effect = lambda key: quote if key == "USDC" else None
+
+        assert token_price_usecase_with_di.get_latest_price("USDC") is quote
+        assert token_price_usecase_with_di.get_latest_prices(["USDC", "DAI"]) == {
+            "USDC": quote,
+            "DAI": None,
+        }
+        mock_token_price_repository.get_latest_prices.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_load_price_index(
+        self, token_price_usecase_with_di, mock_token_price_repository, mock_price_index
+    ):
+        """Startup load fills the index from the repository."""
+        from app.domain.schemas.token_price import LatestTokenPrice
+
+        quotes = [LatestTokenPrice(token_id=uuid.uuid4(), price_usd=1.0)]
+        mock_token_price_repository.get_latest_prices.return_value = quotes
+
+        assert await token_price_usecase_with_di.load_price_index() == 1
+        mock_price_index.load.assert_called_once_with(quotes)
+
+
+class TestTokenPriceUsecaseCandles:
+    """Test OHLC candle queries of TokenPriceUsecase."""
+
+    @staticmethod
+    def _candle(ts, price=1.0):
+        from app.domain.schemas.token_price import PriceCandle
+
+        return PriceCandle(
+            timestamp=ts, open=price, high=price, low=price, close=price, samples=1
+        )
+
+    @staticmethod
+    def _token(mock_token_repository, address="0xabc"):
+        from types import SimpleNamespace
+
+        token = SimpleNamespace(id=uuid.uuid4(), address=address)
+        mock_token_repository.get_by_addresses.return_value = {address: token}
+        return token
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_candles_from_raw_prices(
+        self,
+        token_price_usecase_with_di,
+        mock_token_price_repository,
+        mock_token_repository,
+        mock_config,
+    ):
+        from datetime import datetime
+
+        mock_config.PRICE_CANDLE_ROLLUP_ENABLED = False
+        token = self._token(mock_token_repository)
+        start, end = datetime(2024, 1, 1), datetime(2024, 1, 2)
+        candles = [self._candle(start)]
+        mock_token_price_repository.list_candles.return_value = candles
+
+        result = await token_price_usecase_with_di.get_price_candles(
+            "0xABC", "1h", start, end
+        )
+
+        assert result.candles == candles
+        assert result.token_id == token.id
+        mock_token_repository.get_by_addresses.assert_awaited_once_with(["0xABC"])
+        mock_token_price_repository.list_rollup_candles.assert_not_awaited()
+        args = mock_token_price_repository.list_candles.await_args.args
+        assert args[:2] == (token.id, "1h")
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_candles_from_rollup_recompute_latest_bucket(
+        self,
+        token_price_usecase_with_di,
+        mock_token_price_repository,
+        mock_token_repository,
+        mock_config,
+    ):
+        from datetime import datetime, timedelta, timezone
+
+        mock_config.PRICE_CANDLE_ROLLUP_ENABLED = True
+        self._token(mock_token_repository)
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        rolled = [self._candle(start + timedelta(days=i)) for i in range(3)]
+        fresh = [self._candle(start + timedelta(days=2), price=2.0)]
+        mock_token_price_repository.list_rollup_candles.return_value = list(rolled)
+        mock_token_price_repository.list_candles.return_value = fresh
+
+        result = await token_price_usecase_with_di.get_price_candles(
+            "0xabc", "1d", start, start + timedelta(days=10)
+        )
+
+        assert result.candles == rolled[:2] + fresh
+        live_from = mock_token_price_repository.list_candles.await_args.args[2]
+        assert live_from == rolled[2].timestamp
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_candles_outside_rollup_come_from_raw_prices(
+        self,
+        token_price_usecase_with_di,
+        mock_token_price_repository,
+        mock_token_repository,
+        mock_config,
+    ):
+        from datetime import datetime, timedelta, timezone
+
+        mock_config.PRICE_CANDLE_ROLLUP_ENABLED = True
+        self._token(mock_token_repository)
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        day = timedelta(days=1)
+        # Rollup only holds days 5-6 and 8-9 (day 7 missed while beat was down)
+        rolled = [self._candle(start + i * day) for i in (5, 6, 8, 9)]
+        mock_token_price_repository.list_rollup_candles.return_value = list(rolled)
+
+        async def raw(token_id, interval, lo, hi):
+            days = range((lo - start).days, (hi - start).days)
+            return [self._candle(start + i * day, price=2.0) for i in days]
+
+        mock_token_price_repository.list_candles.side_effect = raw
+
+        result = await token_price_usecase_with_di.get_price_candles(
+            "0xabc", "1d", start, start + 10 * day
+        )
+
+        assert [c.timestamp for c in result.candles] == [
+            start + i * day for i in range(10)
+        ]
+        raw_days = {0, 1, 2, 3, 4, 7, 9}
+        assert [c.close for c in result.candles] == [
+            2.0 if i in raw_days else 1.0 for i in range(10)
+        ]
+        ranges = [
+            c.args[2:] for c in mock_token_price_repository.list_candles.await_args_list
+        ]
+        assert ranges == [
+            (start, start + 5 * day),
+            (start + 7 * day, start + 8 * day),
+            (start + 9 * day, start + 10 * day),
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_sparse_rollup_falls_back_to_one_raw_scan(
+        self,
+        token_price_usecase_with_di,
+        mock_token_price_repository,
+        mock_token_repository,
+        mock_config,
+    ):
+        from datetime import datetime, timedelta, timezone
+
+        mock_config.PRICE_CANDLE_ROLLUP_ENABLED = True
+        self._token(mock_token_repository)
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        hour = timedelta(hours=1)
+        rolled = [self._candle(start + i * hour) for i in range(1, 40, 2)]
+        mock_token_price_repository.list_rollup_candles.return_value = list(rolled)
+        mock_token_price_repository.list_candles.return_value = [
+            self._candle(start + i * hour, price=2.0) for i in range(0, 48)
+        ]
+
+        result = await token_price_usecase_with_di.get_price_candles(
+            "0xabc", "1h", start, start + 48 * hour
+        )
+
+        mock_token_price_repository.list_candles.assert_awaited_once()
+        assert len(result.candles) == 48
+        # Completed rollup buckets win over the raw scan
+        assert sum(c.close == 1.0 for c in result.candles) == len(rolled) - 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_unknown_token_is_404(self, token_price_usecase_with_di):
+        from fastapi import HTTPException
+
+        with pytest.raises(HTTPException) as exc_info:
+            await token_price_usecase_with_di.get_price_candles("0xdead", "1d")
+
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "interval,span_days",
+        [("1h", 500), ("1d", -1)],
+    )
+    async def test_invalid_range_is_400(
+        self, token_price_usecase_with_di, interval, span_days
+    ):
+        from datetime import datetime, timedelta
+
+        from fastapi import HTTPException
+
+        start = datetime(2024, 1, 1)
+        with pytest.raises(HTTPException) as exc_info:
+            await token_price_usecase_with_di.get_price_candles(
+                "0xabc", interval, start, start + timedelta(days=span_days)
+            )
+
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_refresh_price_candles_covers_all_intervals(
+        self, token_price_usecase_with_di, mock_token_price_repository, mock_config
+    ):
+        mock_config.PRICE_CANDLE_ROLLUP_LOOKBACK_HOURS = 48
+        mock_token_price_repository.refresh_candles.return_value = 5
+
+        result = await token_price_usecase_with_di.refresh_price_candles()
+
+        assert result == {"1h": 5, "1d": 5}
+        assert mock_token_price_repository.refresh_candles.await_count == 2
@@ -1,12 +1,14 @@
 """Integration tests for UserProfileUsecase with real dependencies."""
 import pytest
 
+from app.core.config import Configuration
 from app.domain.schemas.user import PasswordChange, UserProfileUpdate
 from app.usecase.user_profile_usecase import (
     ProfileUpdateError,
     UserProfileUsecase,
 )
 from app.utils import security
+from app.utils.security import PasswordHasher
 
 
 @pytest.mark.integration
@@ -16,7 +18,9 @@ class TestUserProfileUsecaseIntegration:
     @pytest.fixture
     def usecase(self, user_repository_with_real_db, mock_audit):
         """UserProfileUsecase with real dependencies."""
-        return UserProfileUsecase(user_repository_with_real_db, mock_audit)
+        return UserProfileUsecase(
+            user_repository_with_real_db, PasswordHasher(Configuration()), mock_audit
+        )
 
     @pytest.mark.asyncio
     async def test_profile_workflow_end_to_end(self, usecase, user_factory):
@@ -12,7 +12,6 @@ from app.usecase.user_profile_usecase import (
     ProfileUpdateError,
     UserProfileUsecase,
 )
-from app.utils import security
 
 
 class TestUserProfileUsecase:
@@ -29,9 +28,19 @@ class TestUserProfileUsecase:
         return Mock()
 
     @pytest.fixture
-    def usecase(self, mock_user_repo, mock_audit):
+    def mock_password_hasher(self):
+        """Mock PasswordHasher for testing."""
+        hasher = Mock()
+        hasher.verify_password_async = AsyncMock(return_value=True)
+        hasher.hash_password_async = AsyncMock(
+            side_effect=lambda password: f"hashed_{password}"
+        )
+        return hasher
+
+    @pytest.fixture
+    def usecase(self, mock_user_repo, mock_password_hasher, mock_audit):
         """UserProfileUsecase instance for testing."""
-        return UserProfileUsecase(mock_user_repo, mock_audit)
+        return UserProfileUsecase(mock_user_repo, mock_password_hasher, mock_audit)
 
     @pytest.mark.asyncio
     @pytest.mark.unit
@@ -150,15 +159,8 @@ class TestUserProfileUsecase:
         mock_user_repo,
         user_with_profile_data,
         password_change_schema,
-        monkeypatch,
     ):
         """Test changing password with valid current password."""
-        # Mock password verification
-        monkeypatch.setattr(security, "verify_password", lambda plain, hashed: True)
-        monkeypatch.setattr(
-            security, "get_password_hash", lambda password: f"hashed_{password}"
-        )
-
         mock_user_repo.get_by_id.return_value = user_with_profile_data
         mock_user_repo.change_password.return_value = user_with_profile_data
 
@@ -177,11 +179,11 @@ class TestUserProfileUsecase:
         mock_user_repo,
         user_with_profile_data,
         password_change_schema,
-        monkeypatch,
+        mock_password_hasher,
     ):
         """Test change_password raises InvalidCredentialsError for wrong current password."""
         # Mock password verification to fail
-        monkeypatch.setattr(security, "verify_password", lambda plain, hashed: False)
+        mock_password_hasher.verify_password_async.return_value = False
 
         mock_user_repo.get_by_id.return_value = user_with_profile_data
 
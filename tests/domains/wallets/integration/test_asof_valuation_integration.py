@@ -0,0 +1,126 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.models.historical_balance import HistoricalBalance
+from app.models.token_price import TokenPrice
+
+pytestmark = pytest.mark.integration
+
+T0 = datetime(2024, 5, 1)
+
+
+async def _seed(db_session, wallet_id, eth, usdc):
+    db_session.add_all(
+        [
+            # ETH: 2000 before the series starts, 3000 from T0+2h
+            TokenPrice(token_id=eth, price_usd=2000, timestamp=T0 - timedelta(days=1)),
+            TokenPrice(token_id=eth, price_usd=3000, timestamp=T0 + timedelta(hours=2)),
+            # USDC has no price until T0+1h
+            TokenPrice(token_id=usdc, price_usd=1, timestamp=T0 + timedelta(hours=1)),
+        ]
+    )
+    for hour in range(4):
+        ts = T0 + timedelta(hours=hour)
+        db_session.add_all(
+            [
+                HistoricalBalance(
+                    wallet_id=wallet_id,
+                    token_id=eth,
+                    balance=2,
+                    balance_usd=0,
+                    timestamp=ts,
+                ),
+                HistoricalBalance(
+                    wallet_id=wallet_id,
+                    token_id=usdc,
+                    balance=100,
+                    balance_usd=0,
+                    timestamp=ts,
+                ),
+            ]
+        )
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_value_series_uses_latest_price_at_or_before_each_point(
+    historical_balance_repository_with_real_db, db_session
+):
+    wallet_id, eth, usdc = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    await _seed(db_session, wallet_id, eth, usdc)
+
+    rows = await historical_balance_repository_with_real_db.value_series(wallet_id)
+
+    assert [r.timestamp for r in rows] == [T0 + timedelta(hours=h) for h in range(4)]
+    assert [float(r.value_usd) for r in rows] == [4000, 4100, 6100, 6100]
+    assert [(r.tokens, r.priced_tokens) for r in rows][0] == (2, 1)
+    assert all(r.priced_tokens == 2 for r in rows[1:])
+
+
+@pytest.mark.asyncio
+async def test_value_series_respects_interval(
+    historical_balance_repository_with_real_db, db_session
+):
+    wallet_id, eth, usdc = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    await _seed(db_session, wallet_id, eth, usdc)
+
+    rows = await historical_balance_repository_with_real_db.value_series(
+        wallet_id, start=T0 + timedelta(hours=1), end=T0 + timedelta(hours=2)
+    )
+
+    assert [float(r.value_usd) for r in rows] == [4100, 6100]
+
+
+@pytest.mark.asyncio
+async def test_revalue_reprices_points_in_one_pass(
+    historical_balance_repository_with_real_db, db_session
+):
+    wallet_id, eth, usdc = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    await _seed(db_session, wallet_id, eth, usdc)
+
+    updated = await historical_balance_repository_with_real_db.revalue(
+        eth, since=T0 + timedelta(hours=1)
+    )
+
+    assert updated == 3
+    db_session.expire_all()
+    rows = (
+        (
+            await db_session.execute(
+                select(HistoricalBalance)
+                .where(HistoricalBalance.token_id == eth)
+                .order_by(HistoricalBalance.timestamp)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    # The point before ``since`` is left untouched
+    assert [float(r.balance_usd) for r in rows] == [0, 4000, 6000, 6000]
+
+
+@pytest.mark.asyncio
+async def test_revalue_keeps_value_when_no_price_is_known(
+    historical_balance_repository_with_real_db, db_session
+):
+    wallet_id, eth, usdc = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    await _seed(db_session, wallet_id, eth, usdc)
+
+    await historical_balance_repository_with_real_db.revalue(usdc)
+
+    db_session.expire_all()
+    rows = (
+        (
+            await db_session.execute(
+                select(HistoricalBalance)
+                .where(HistoricalBalance.token_id == usdc)
+                .order_by(HistoricalBalance.timestamp)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert [float(r.balance_usd) for r in rows] == [0, 100, 100, 100]
@@ -0,0 +1,113 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from app.domain.schemas.historical_balance import HistoricalBalanceCreate
+from app.domain.schemas.token_balance import TokenBalanceCreate
+from app.domain.schemas.token_price import TokenPriceCreate
+from app.models.historical_balance import HistoricalBalance
+from app.models.token_balance import TokenBalance
+from app.models.token_price import TokenPrice
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_token_price_bulk_create(token_price_repository_with_real_db, db_session):
+    token_id = uuid.uuid4()
+    observed = datetime(2024, 3, 1, 12, tzinfo=timezone.utc)
+    items = [
+        TokenPriceCreate(
+            token_id=token_id,
+            price_usd=100 + i,
+            timestamp=observed + timedelta(minutes=i),
+        )
+        for i in range(250)
+    ]
+    items.append(TokenPriceCreate(token_id=token_id, price_usd=1.0))
+
+    count = await token_price_repository_with_real_db.bulk_create(items)
+
+    assert count == 251
+    stored = await db_session.scalar(
+        select(func.count()).where(TokenPrice.token_id == token_id)
+    )
+    assert stored == 251
+    earliest = await db_session.scalar(
+        select(func.min(TokenPrice.timestamp)).where(TokenPrice.token_id == token_id)
+    )
+    assert earliest == observed.replace(tzinfo=None)
+    missing_ts = await db_session.scalar(
+        select(func.count()).where(
+            TokenPrice.token_id == token_id, TokenPrice.timestamp.is_(None)
+        )
+    )
+    assert missing_ts == 0
+
+
+@pytest.mark.asyncio
+async def test_token_balance_bulk_upsert_updates_existing_pairs(
+    token_balance_repository_with_real_db, db_session
+):
+    wallet_id = uuid.uuid4()
+    token_ids = [uuid.uuid4() for _ in range(3)]
+    first = [
+        TokenBalanceCreate(
+            wallet_id=wallet_id, token_id=t, balance=1.0, balance_usd=10.0
+        )
+        for t in token_ids
+    ]
+    await token_balance_repository_with_real_db.bulk_upsert(first)
+
+    second = [
+        TokenBalanceCreate(
+            wallet_id=wallet_id, token_id=token_ids[0], balance=2.0, balance_usd=20.0
+        ),
+        # Duplicate pair within one batch: the last occurrence wins
+        TokenBalanceCreate(
+            wallet_id=wallet_id, token_id=token_ids[0], balance=3.0, balance_usd=30.0
+        ),
+    ]
+    written = await token_balance_repository_with_real_db.bulk_upsert(second)
+
+    assert written == 1
+    db_session.expire_all()
+    rows = (
+        (
+            await db_session.execute(
+                select(TokenBalance).where(TokenBalance.wallet_id == wallet_id)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert len(rows) == 3
+    by_token = {r.token_id: float(r.balance) for r in rows}
+    assert by_token[token_ids[0]] == 3.0
+    assert by_token[token_ids[1]] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_historical_balance_bulk_create(
+    historical_balance_repository_with_real_db, db_session
+):
+    wallet_id = uuid.uuid4()
+    base = datetime(2024, 1, 1)
+    items = [
+        HistoricalBalanceCreate(
+            wallet_id=wallet_id,
+            token_id=uuid.uuid4(),
+            balance=float(i),
+            balance_usd=float(i),
+            timestamp=base + timedelta(hours=i),
+        )
+        for i in range(40)
+    ]
+
+    assert await historical_balance_repository_with_real_db.bulk_create(items) == 40
+    stored = await db_session.scalar(
+        select(func.count()).where(HistoricalBalance.wallet_id == wallet_id)
+    )
+    assert stored == 40
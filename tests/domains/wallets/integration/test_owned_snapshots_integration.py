@@ -0,0 +1,104 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.portfolio_snapshot import PortfolioSnapshot
+from app.models.wallet import Wallet
+
+pytestmark = pytest.mark.integration
+
+T0 = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+
+def _snapshot(address, ts, collateral):
+    return PortfolioSnapshot(
+        user_address=address,
+        timestamp=int(ts.timestamp()),
+        total_collateral=0.0,
+        total_borrowings=0.0,
+        total_collateral_usd=collateral,
+        total_borrowings_usd=0.0,
+        collaterals=[],
+        borrowings=[],
+        staked_positions=[],
+        health_scores=[],
+        protocol_breakdown={},
+    )
+
+
+async def _owned_wallet(db_session, snapshots=()):
+    user_id = uuid.uuid4()
+    address = "0x" + uuid.uuid4().hex + uuid.uuid4().hex[:8]
+    db_session.add(Wallet(user_id=user_id, address=address))
+    for ts, collateral in snapshots:
+        db_session.add(_snapshot(address, ts, collateral))
+    await db_session.commit()
+    return user_id, address
+
+
+@pytest.mark.asyncio
+async def test_owned_snapshots_are_newest_first(
+    portfolio_snapshot_repository_with_real_db, db_session
+):
+    repo = portfolio_snapshot_repository_with_real_db
+    user_id, address = await _owned_wallet(
+        db_session, [(T0, 1.0), (T0 + timedelta(days=1), 2.0)]
+    )
+
+    snapshots = await repo.get_owned_snapshots(user_id, address.upper())
+    assert [s.total_collateral_usd for s in snapshots] == [2.0, 1.0]
+
+    latest = await repo.get_owned_snapshots(user_id, address, limit=1)
+    assert [s.total_collateral_usd for s in latest] == [2.0]
+
+
+@pytest.mark.asyncio
+async def test_owned_wallet_without_snapshots_is_empty_not_none(
+    portfolio_snapshot_repository_with_real_db, db_session
+):
+    repo = portfolio_snapshot_repository_with_real_db
+    user_id, address = await _owned_wallet(db_session)
+
+    assert await repo.get_owned_snapshots(user_id, address) == []
+
+
+@pytest.mark.asyncio
+async def test_foreign_or_unknown_wallet_yields_none(
+    portfolio_snapshot_repository_with_real_db, db_session
+):
+    repo = portfolio_snapshot_repository_with_real_db
+    _, address = await _owned_wallet(db_session, [(T0, 1.0)])
+
+    assert await repo.get_owned_snapshots(uuid.uuid4(), address) is None
+    assert (
+        await repo.get_owned_timeline(uuid.uuid4(), address, 0, int(T0.timestamp()) + 1)
+        is None
+    )
+    assert await repo.get_owned_snapshots(uuid.uuid4(), "0x" + "0" * 40) is None
+
+
+@pytest.mark.asyncio
+async def test_owned_timeline_filters_range_and_groups(
+    portfolio_snapshot_repository_with_real_db, db_session
+):
+    repo = portfolio_snapshot_repository_with_real_db
+    user_id, address = await _owned_wallet(
+        db_session,
+        [
+            (T0, 1.0),
+            (T0 + timedelta(hours=6), 2.0),
+            (T0 + timedelta(days=1), 3.0),
+            (T0 + timedelta(days=10), 4.0),
+        ],
+    )
+    to_ts = int((T0 + timedelta(days=2)).timestamp())
+
+    daily = await repo.get_owned_timeline(
+        user_id, address, int(T0.timestamp()), to_ts, interval="daily"
+    )
+    assert [s.total_collateral_usd for s in daily] == [2.0, 3.0]
+
+    # An owned wallet with no snapshots in range is an empty timeline
+    empty = await repo.get_owned_timeline(user_id, address, 0, 1)
+    assert empty == []
@@ -0,0 +1,65 @@
+import uuid
+
+import pytest
+
+from app.api.endpoints.wallets import Wallets
+from app.core.config import Configuration
+from app.domain.schemas.user import UserCreate
+from app.models.token import Token
+from app.repositories.token_balance_repository import TokenBalanceRepository
+from app.usecase.token_balance_usecase import TokenBalanceUsecase
+from app.utils.logging import Audit
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_repeated_token_balance_post_updates_current_balance(
+    integration_async_client, test_di_container_with_db, monkeypatch
+):
+    """Posting the same (wallet, token) pair twice overwrites the balance."""
+    database = test_di_container_with_db.get_core("database")
+    auth_usecase = test_di_container_with_db.get_usecase("auth")
+    wallet_repo = test_di_container_with_db.get_repository("wallet")
+
+    # The shared test container mocks the token balance stack; wire the real
+    # one so the request reaches the database.
+    monkeypatch.setattr(
+        Wallets,
+        "_Wallets__token_balance_uc",
+        TokenBalanceUsecase(
+            TokenBalanceRepository(database, Audit()), Configuration(), Audit()
+        ),
+    )
+
+    user = await auth_usecase.register(
+        UserCreate(
+            email=f"test.user.{uuid.uuid4()}@example.com",
+            password="Str0ngPassword!",
+            username=f"test.user.{uuid.uuid4()}",
+        )
+    )
+    wallet = await wallet_repo.create(
+        user_id=user.id, address=f"0x{uuid.uuid4().hex}{'a' * 8}"
+    )
+    token = Token(address=f"0x{uuid.uuid4().hex}{'b' * 8}", symbol="TKN", name="T")
+    async with database.get_session() as session:
+        session.add(token)
+        await session.commit()
+        await session.refresh(token)
+
+    payload = {
+        "wallet_id": str(wallet.id),
+        "token_id": str(token.id),
+        "balance": 1,
+        "balance_usd": 2,
+    }
+    first = await integration_async_client.post("/token_balances", json=payload)
+    assert first.status_code == 201
+
+    payload.update(balance=5, balance_usd=10)
+    second = await integration_async_client.post("/token_balances", json=payload)
+    assert second.status_code == 201
+    assert second.json()["id"] == first.json()["id"]
+    assert second.json()["balance"] == 5
+    assert second.json()["balance_usd"] == 10
@@ -0,0 +1,143 @@
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.indexer_checkpoint import IndexerCheckpoint
+from app.models.transaction import Transaction
+from app.repositories.indexer_checkpoint_repository import (
+    IndexerCheckpointRepository,
+)
+from app.repositories.transaction_repository import TransactionRepository
+from app.utils.logging import Audit
+from tests.shared.fixtures.repositories import create_real_database
+
+pytestmark = pytest.mark.integration
+
+
+def _row(tx_hash: str, wallet_id: uuid.UUID, amount: str) -> dict:
+    return {
+        "hash": tx_hash,
+        "log_index": 0,
+        "wallet_id": wallet_id,
+        "type": "IN",
+        "amount": Decimal(amount),
+        "timestamp": datetime(2024, 1, 1),
+        "extra_metadata": {"block_number": 1},
+    }
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_is_idempotent_on_hash(db_session):
+    repo = TransactionRepository(create_real_database(db_session), Audit())
+    wallet_id = uuid.uuid4()
+    hashes = [f"0x{uuid.uuid4().hex}" for _ in range(3)]
+
+    await repo.bulk_upsert([_row(h, wallet_id, "1") for h in hashes])
+    written = await repo.bulk_upsert([_row(h, wallet_id, "2.5") for h in hashes])
+
+    assert written == 3
+    count = await db_session.scalar(
+        select(func.count()).where(Transaction.hash.in_(hashes))
+    )
+    assert count == 3
+    amounts = (
+        await db_session.execute(
+            select(Transaction.amount).where(Transaction.hash.in_(hashes))
+        )
+    ).scalars()
+    assert {Decimal(str(a)) for a in amounts} == {Decimal("2.5")}
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_keeps_every_log_of_one_transaction(db_session):
+    repo = TransactionRepository(create_real_database(db_session), Audit())
+    wallet_id, other_wallet_id = uuid.uuid4(), uuid.uuid4()
+    tx_hash = f"0x{uuid.uuid4().hex}"
+    rows = [_row(tx_hash, wallet_id, "1"), _row(tx_hash, other_wallet_id, "1")]
+    second_leg = _row(tx_hash, wallet_id, "3")
+    second_leg["log_index"] = 1
+    rows.append(second_leg)
+
+    await repo.bulk_upsert(rows)
+    await repo.bulk_upsert(rows)
+
+    stored = (
+        await db_session.execute(
+            select(Transaction.wallet_id, Transaction.log_index).where(
+                Transaction.hash == tx_hash
+            )
+        )
+    ).all()
+    assert sorted(stored, key=lambda r: (str(r[0]), r[1])) == sorted(
+        [(wallet_id, 0), (wallet_id, 1), (other_wallet_id, 0)],
+        key=lambda r: (str(r[0]), r[1]),
+    )
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_save_upserts(db_session):
+    repo = IndexerCheckpointRepository(create_real_database(db_session), Audit())
+    chain_id = 10_000 + uuid.uuid4().int % 10_000
+
+    assert await repo.get(chain_id) is None
+    await repo.save(chain_id, 100)
+    await repo.save(chain_id, 250)
+    db_session.expire_all()
+
+    checkpoint = await repo.get(chain_id)
+    assert isinstance(checkpoint, IndexerCheckpoint)
+    assert checkpoint.last_block == 250
+    assert await repo.get(chain_id, "backfill-0") is None
+
+
+@pytest.mark.asyncio
+async def test_list_by_wallet_keyset_pagination(db_session):
+    repo = TransactionRepository(create_real_database(db_session), Audit())
+    wallet_id = uuid.uuid4()
+    token_id = uuid.uuid4()
+    base = datetime(2024, 1, 1)
+    rows = []
+    for i in range(7):
+        row = _row(f"0x{uuid.uuid4().hex}", wallet_id, "1")
+        # Two rows share each timestamp so the ``id`` tiebreaker is exercised
+        row["timestamp"] = base + timedelta(hours=i // 2)
+        row["type"] = "IN" if i % 2 else "OUT"
+        row["token_id"] = token_id if i < 4 else None
+        rows.append(row)
+    await repo.bulk_upsert(rows)
+
+    seen = []
+    after = None
+    while True:
+        page = await repo.list_by_wallet(wallet_id, 3, after=after)
+        seen.extend(page)
+        if len(page) < 3:
+            break
+        after = (page[-1].timestamp, page[-1].id)
+
+    assert len(seen) == 7
+    assert len({tx.id for tx in seen}) == 7
+    keys = [(tx.timestamp, tx.id) for tx in seen]
+    assert keys == sorted(keys, reverse=True)
+
+    outs = await repo.list_by_wallet(wallet_id, 10, tx_type="OUT")
+    assert {tx.type for tx in outs} == {"OUT"} and len(outs) == 4
+    by_token = await repo.list_by_wallet(wallet_id, 10, token_id=token_id)
+    assert len(by_token) == 4
+
+
+@pytest.mark.asyncio
+async def test_list_by_wallet_skips_rows_without_timestamp(db_session):
+    repo = TransactionRepository(create_real_database(db_session), Audit())
+    wallet_id = uuid.uuid4()
+    dated = _row(f"0x{uuid.uuid4().hex}", wallet_id, "1")
+    undated = _row(f"0x{uuid.uuid4().hex}", wallet_id, "1")
+    undated["timestamp"] = None
+    await repo.bulk_upsert([dated, undated])
+
+    page = await repo.list_by_wallet(wallet_id, 10)
+
+    assert [tx.hash for tx in page] == [dated["hash"]]
@@ -0,0 +1,184 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from app.domain.schemas.historical_balance import HistoricalBalanceCreate
+from app.models.portfolio_snapshot import PortfolioSnapshot
+from app.models.token_price import TokenPrice
+from app.models.wallet import Wallet
+
+pytestmark = pytest.mark.integration
+
+T0 = datetime(2024, 6, 1)
+
+
+def _wallet(user_id, balance_usd=0.0):
+    return Wallet(
+        id=uuid.uuid4(),
+        user_id=user_id,
+        address="0x" + uuid.uuid4().hex + uuid.uuid4().hex[:8],
+        balance_usd=balance_usd,
+    )
+
+
+def _snapshot(address, ts, collateral, borrowings):
+    return PortfolioSnapshot(
+        user_address=address,
+        timestamp=int(ts.replace(tzinfo=timezone.utc).timestamp()),
+        total_collateral=0.0,
+        total_borrowings=0.0,
+        total_collateral_usd=collateral,
+        total_borrowings_usd=borrowings,
+        collaterals=[],
+        borrowings=[],
+        staked_positions=[],
+        health_scores=[],
+        protocol_breakdown={},
+    )
+
+
+async def _cached(db_session, wallet_id):
+    db_session.expire_all()
+    row = (
+        await db_session.execute(
+            select(Wallet.balance_usd, Wallet.last_snapshot_at).where(
+                Wallet.id == wallet_id
+            )
+        )
+    ).one()
+    return row.balance_usd, row.last_snapshot_at
+
+
+async def _holdings(db_session, wallet_id):
+    db_session.expire_all()
+    row = (
+        await db_session.execute(
+            select(Wallet.holdings_usd, Wallet.holdings_as_of).where(
+                Wallet.id == wallet_id
+            )
+        )
+    ).one()
+    return row.holdings_usd, row.holdings_as_of
+
+
+@pytest.mark.asyncio
+async def test_create_snapshot_updates_wallet_balance(
+    portfolio_snapshot_repository_with_real_db, db_session
+):
+    wallet = _wallet(uuid.uuid4())
+    wallet_id, address = wallet.id, wallet.address
+    db_session.add(wallet)
+    await db_session.commit()
+    repo = portfolio_snapshot_repository_with_real_db
+
+    await repo.create_snapshot(_snapshot(address, T0, 1000.0, 250.0))
+    assert await _cached(db_session, wallet_id) == (750.0, T0)
+
+    # An older snapshot arriving late does not overwrite the newer balance
+    await repo.create_snapshot(_snapshot(address, T0 - timedelta(hours=1), 5.0, 0.0))
+    assert await _cached(db_session, wallet_id) == (750.0, T0)
+
+
+@pytest.mark.asyncio
+async def test_bulk_historical_balances_update_wallet_holdings(
+    historical_balance_repository_with_real_db, db_session
+):
+    wallet = _wallet(uuid.uuid4())
+    wallet_id = wallet.id
+    db_session.add(wallet)
+    await db_session.commit()
+    repo = historical_balance_repository_with_real_db
+
+    def point(ts, usd):
+        return HistoricalBalanceCreate(
+            wallet_id=wallet_id,
+            token_id=uuid.uuid4(),
+            balance=1,
+            balance_usd=usd,
+            timestamp=ts,
+        )
+
+    await repo.bulk_create([point(T0, 10.0), point(T0 + timedelta(hours=1), 40.0)])
+    assert await _holdings(db_session, wallet_id) == (40.0, T0 + timedelta(hours=1))
+
+    # Points of the latest timestamp split across batches add up
+    await repo.bulk_create([point(T0 + timedelta(hours=1), 2.5)])
+    assert await _holdings(db_session, wallet_id) == (42.5, T0 + timedelta(hours=1))
+
+
+@pytest.mark.asyncio
+async def test_snapshots_and_balance_points_keep_separate_values(
+    portfolio_snapshot_repository_with_real_db,
+    historical_balance_repository_with_real_db,
+    db_session,
+):
+    wallet = _wallet(uuid.uuid4())
+    wallet_id, address = wallet.id, wallet.address
+    db_session.add(wallet)
+    await db_session.commit()
+
+    await portfolio_snapshot_repository_with_real_db.create_snapshot(
+        _snapshot(address, T0, 1000.0, 250.0)
+    )
+    await historical_balance_repository_with_real_db.bulk_create(
+        [
+            HistoricalBalanceCreate(
+                wallet_id=wallet_id,
+                token_id=uuid.uuid4(),
+                balance=1,
+                balance_usd=40.0,
+                timestamp=T0 + timedelta(hours=1),
+            )
+        ]
+    )
+
+    assert await _cached(db_session, wallet_id) == (750.0, T0)
+    assert await _holdings(db_session, wallet_id) == (40.0, T0 + timedelta(hours=1))
+
+
+@pytest.mark.asyncio
+async def test_revalue_refreshes_wallet_holdings(
+    historical_balance_repository_with_real_db, db_session
+):
+    wallet = _wallet(uuid.uuid4())
+    wallet_id, token_id = wallet.id, uuid.uuid4()
+    db_session.add(wallet)
+    await db_session.commit()
+    repo = historical_balance_repository_with_real_db
+
+    await repo.bulk_create(
+        [
+            HistoricalBalanceCreate(
+                wallet_id=wallet_id,
+                token_id=token_id,
+                balance=2,
+                balance_usd=0,
+                timestamp=T0,
+            )
+        ]
+    )
+    assert await _holdings(db_session, wallet_id) == (0.0, T0)
+
+    db_session.add(TokenPrice(token_id=token_id, price_usd=3000, timestamp=T0))
+    await db_session.commit()
+    await repo.revalue(token_id)
+
+    assert await _holdings(db_session, wallet_id) == (6000.0, T0)
+
+
+@pytest.mark.asyncio
+async def test_list_by_user_sorted_by_balance(
+    wallet_repository_with_real_db, db_session
+):
+    user_id = uuid.uuid4()
+    wallets = [_wallet(user_id, usd) for usd in (50.0, 300.0, 10.0)]
+    db_session.add_all(wallets)
+    await db_session.commit()
+
+    desc = await wallet_repository_with_real_db.list_by_user(user_id, "balance_desc")
+    asc = await wallet_repository_with_real_db.list_by_user(user_id, "balance_asc")
+
+    assert [w.balance_usd for w in desc] == [300.0, 50.0, 10.0]
+    assert [w.balance_usd for w in asc] == [10.0, 50.0, 300.0]
@@ -1,6 +1,7 @@
 import uuid
 
 import pytest
+from fastapi import HTTPException
 
 from app.models.wallet import Wallet
 
@@ -55,3 +56,29 @@ async def test_wallet_default_name(authenticated_client):
     assert resp.status_code == 201
     wallet = resp.json()
     assert wallet["name"] == "Unnamed Wallet"
+
+
+@pytest.mark.asyncio
+async def test_addresses_are_stored_lower_case_and_found_in_any_case(
+    wallet_repository_with_real_db,
+):
+    repo = wallet_repository_with_real_db
+    user_id = uuid.uuid4()
+    address = "0x" + uuid.uuid4().hex.upper() + "ABCDEF01"
+
+    created = await repo.create(address=address, user_id=user_id)
+    assert created.address == address.lower()
+
+    found = await repo.get_by_user_and_address(user_id, address.lower())
+    assert found is not None and found.id == created.id
+    assert (await repo.get_by_address(address)).id == created.id
+    # Other users never see the wallet through the owner-scoped lookup
+    assert await repo.get_by_user_and_address(uuid.uuid4(), address) is None
+
+    # Case variants collide with the existing row instead of duplicating it
+    with pytest.raises(HTTPException) as exc_info:
+        await repo.create(address=address.lower(), user_id=user_id)
+    assert exc_info.value.status_code == 400
+
+    assert await repo.delete(address, user_id=user_id) is True
+    assert await repo.get_by_user_and_address(user_id, address) is None
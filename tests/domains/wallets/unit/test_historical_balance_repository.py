@@ -22,6 +22,9 @@ def setup_mock_session(repository, mock_session):
 
     # Patch the repository's database service get_session method
     repository._HistoricalBalanceRepository__database.get_session = mock_get_session
+    repository._HistoricalBalanceRepository__database.get_read_session = (
+        mock_get_session
+    )
 
 
 @pytest.mark.unit
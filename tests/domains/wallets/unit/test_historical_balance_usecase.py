@@ -288,3 +288,116 @@ class TestHistoricalBalanceUsecase:
                 "timestamp"
             ] + timedelta(seconds=i)
             assert result.balance == sample_historical_balance_data["balance"] + i
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_create_historical_balances_batch(
+        self, historical_balance_usecase, sample_historical_balance_data
+    ):
+        """Test batch historical balance creation uses one bulk write."""
+        from app.domain.schemas.historical_balance import (
+            HistoricalBalanceBatchCreate,
+        )
+
+        repo = (
+            historical_balance_usecase._HistoricalBalanceUsecase__historical_balance_repo
+        )
+        repo.bulk_create = AsyncMock(return_value=2)
+        batch = HistoricalBalanceBatchCreate(
+            items=[HistoricalBalanceCreate(**sample_historical_balance_data)] * 2
+        )
+
+        result = await historical_balance_usecase.create_historical_balances(batch)
+
+        assert result.count == 2
+        repo.bulk_create.assert_awaited_once_with(batch.items)
+
+
+class TestWalletValuation:
+    """Test cases for as-of wallet valuation and revaluation."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_wallet_valuation_builds_points(
+        self, historical_balance_usecase, mock_wallet_repository
+    ):
+        """Repository rows are mapped to valuation points."""
+        from types import SimpleNamespace
+
+        wallet = SimpleNamespace(id=uuid.uuid4(), address="0xabc")
+        mock_wallet_repository.get_by_user_and_address.return_value = wallet
+        ts = datetime(2024, 1, 1)
+        repo = (
+            historical_balance_usecase._HistoricalBalanceUsecase__historical_balance_repo
+        )
+        repo.value_series.return_value = [
+            SimpleNamespace(timestamp=ts, value_usd=10, tokens=2, priced_tokens=1),
+            SimpleNamespace(
+                timestamp=ts + timedelta(hours=1),
+                value_usd=None,
+                tokens=1,
+                priced_tokens=0,
+            ),
+        ]
+
+        user_id = uuid.uuid4()
+        result = await historical_balance_usecase.get_wallet_valuation(
+            user_id, "0xabc", start=ts
+        )
+
+        assert result.wallet_address == "0xabc"
+        assert [p.value_usd for p in result.points] == [10.0, 0.0]
+        assert [p.unpriced_tokens for p in result.points] == [1, 1]
+        repo.value_series.assert_awaited_once_with(wallet.id, start=ts, end=None)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_wallet_valuation_unknown_wallet(
+        self, historical_balance_usecase, mock_wallet_repository
+    ):
+        """A wallet the user does not own yields 404."""
+        from fastapi import HTTPException
+
+        mock_wallet_repository.get_by_user_and_address.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            await historical_balance_usecase.get_wallet_valuation(uuid.uuid4(), "0xabc")
+
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_wallet_valuation_rejects_inverted_interval(
+        self, historical_balance_usecase
+    ):
+        """start after end is a client error."""
+        from fastapi import HTTPException
+
+        with pytest.raises(HTTPException) as exc_info:
+            await historical_balance_usecase.get_wallet_valuation(
+                uuid.uuid4(),
+                "0xabc",
+                start=datetime(2024, 2, 1),
+                end=datetime(2024, 1, 1),
+            )
+
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_revalue_historical_balances(self, historical_balance_usecase):
+        """Revaluation delegates to the single-pass repository update."""
+        from app.domain.schemas.historical_balance import (
+            HistoricalBalanceRevalue,
+        )
+
+        repo = (
+            historical_balance_usecase._HistoricalBalanceUsecase__historical_balance_repo
+        )
+        repo.revalue.return_value = 7
+        request = HistoricalBalanceRevalue(token_id=uuid.uuid4())
+
+        result = await historical_balance_usecase.revalue_historical_balances(request)
+
+        assert result.count == 7
+        repo.revalue.assert_awaited_once_with(request.token_id, since=None)
@@ -20,6 +20,9 @@ def setup_mock_session(repository, mock_session):
 
     # Patch the repository's database service get_session method
     repository._PortfolioSnapshotRepository__database.get_session = mock_get_session
+    repository._PortfolioSnapshotRepository__database.get_read_session = (
+        mock_get_session
+    )
 
 
 # Fixtures are imported from tests.fixtures
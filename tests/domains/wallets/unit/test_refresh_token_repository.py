@@ -10,6 +10,7 @@ import pytest
 
 from app.models.refresh_token import RefreshToken
 from app.repositories.refresh_token_repository import RefreshTokenRepository
+from app.utils.refresh_token_cache import RefreshTokenState
 
 
 def setup_mock_session(repository, mock_session):
@@ -205,6 +206,98 @@ async def test_revoke_exception_handling(refresh_token_repository, mock_session)
     refresh_token_repository._RefreshTokenRepository__audit.error.assert_called_once()
 
 
+def _cached_repository(mock_database, mock_audit, mock_session, cached=None):
+    cache = Mock(get=AsyncMock(return_value=cached), set=AsyncMock(return_value=True))
+    repository = RefreshTokenRepository(mock_database, mock_audit, cache)
+    setup_mock_session(repository, mock_session)
+    return repository, cache
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_state_served_from_cache(mock_database, mock_audit, mock_session):
+    state = RefreshTokenState("user-1", 1_900_000_000.0)
+    repository, _ = _cached_repository(mock_database, mock_audit, mock_session, state)
+
+    assert await repository.get_state("hash") == state
+    mock_session.execute.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_state_cache_miss_reads_and_mirrors_row(
+    mock_database, mock_audit, mock_session
+):
+    repository, cache = _cached_repository(mock_database, mock_audit, mock_session)
+    user_id = uuid.uuid4()
+    token = RefreshToken.from_raw_jti("test-jti", user_id, timedelta(hours=1))
+    token.revoked = False
+    mock_result = Mock()
+    mock_result.scalar_one_or_none.return_value = token
+    mock_session.execute.return_value = mock_result
+
+    state = await repository.get_state(token.jti_hash)
+
+    assert state == RefreshTokenState(str(user_id), token.expires_at.timestamp(), False)
+    cache.set.assert_awaited_once_with(token.jti_hash, state)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_state_unknown_token(refresh_token_repository, mock_session):
+    setup_mock_session(refresh_token_repository, mock_session)
+    mock_result = Mock()
+    mock_result.scalar_one_or_none.return_value = None
+    mock_session.execute.return_value = mock_result
+
+    assert await refresh_token_repository.get_state("hash") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_revoke_by_jti_hash_writes_cache_then_updates_row(
+    mock_database, mock_audit, mock_session
+):
+    repository, cache = _cached_repository(mock_database, mock_audit, mock_session)
+    mock_session.execute.return_value = Mock(rowcount=1)
+
+    assert await repository.revoke_by_jti_hash("hash", "user-1", 1_900_000_000.0)
+
+    cache.set.assert_awaited_once_with(
+        "hash", RefreshTokenState("user-1", 1_900_000_000.0, revoked=True)
+    )
+    statement = mock_session.execute.call_args[0][0]
+    assert statement.is_update
+    mock_session.merge.assert_not_called()
+    mock_session.commit.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_revoke_by_jti_hash_still_revokes_row_when_mirror_fails(
+    mock_database, mock_audit, mock_session
+):
+    repository, cache = _cached_repository(mock_database, mock_audit, mock_session)
+    cache.set.return_value = False
+    mock_session.execute.return_value = Mock(rowcount=1)
+
+    assert await repository.revoke_by_jti_hash("hash", "user-1", 1_900_000_000.0)
+
+    mock_session.commit.assert_awaited_once()
+    mock_audit.warning.assert_called_once_with(
+        "refresh_token_repository_revoke_mirror_failed", jti_hash="hash"
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_revoke_by_jti_hash_unknown_token(refresh_token_repository, mock_session):
+    setup_mock_session(refresh_token_repository, mock_session)
+    mock_session.execute.return_value = Mock(rowcount=0)
+
+    assert not await refresh_token_repository.revoke_by_jti_hash("h", "u", 0.0)
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_delete_expired_success(refresh_token_repository, mock_session):
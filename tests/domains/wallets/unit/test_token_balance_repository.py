@@ -41,25 +41,23 @@ async def test_token_balance_repository_create(
     )
 
     # Configure mocks
-    mock_async_session.add = Mock()
+    mock_async_session.bind = Mock()
+    mock_async_session.bind.dialect.name = "sqlite"
+    mock_async_session.execute = AsyncMock()
     mock_async_session.commit = AsyncMock()
-    mock_async_session.refresh = AsyncMock()
 
     # Mock the returned balance object
     mock_balance = Mock()
     mock_balance.id = uuid.uuid4()
-    mock_async_session.refresh.return_value = mock_balance
+    mock_async_session.scalar = AsyncMock(return_value=mock_balance)
 
     # Execute
-    await token_balance_repository_with_di.create(balance_data)
+    result = await token_balance_repository_with_di.create(balance_data)
 
-    # Verify
-    mock_async_session.add.assert_called_once()
+    # Verify a single upsert is issued and the stored row is returned
+    mock_async_session.execute.assert_awaited_once()
     mock_async_session.commit.assert_awaited_once()
-    mock_async_session.refresh.assert_awaited_once()
-
-    # NOTE: Since we're mocking the session, we can't test the actual returned value
-    # In a real integration test, we would check balance properties
+    assert result is mock_balance
 
 
 @pytest.mark.unit
@@ -80,7 +78,9 @@ async def test_token_balance_repository_create_exception(
     )
 
     # Configure mock to raise exception during commit
-    mock_async_session.add = Mock()
+    mock_async_session.bind = Mock()
+    mock_async_session.bind.dialect.name = "sqlite"
+    mock_async_session.execute = AsyncMock()
     mock_async_session.commit = AsyncMock(side_effect=Exception("Database error"))
 
     # Execute and verify exception is raised
@@ -88,5 +88,5 @@ async def test_token_balance_repository_create_exception(
         await token_balance_repository_with_di.create(balance_data)
 
     # Verify the operations that should have been called
-    mock_async_session.add.assert_called_once()
+    mock_async_session.execute.assert_awaited_once()
     mock_async_session.commit.assert_awaited_once()
@@ -20,6 +20,7 @@ def setup_mock_session(repository, mock_session):
         yield mock_session
 
     repository._TokenPriceRepository__database.get_session = mock_get_session
+    repository._TokenPriceRepository__database.get_read_session = mock_get_session
 
 
 @pytest.mark.unit
@@ -0,0 +1,98 @@
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+def _tx(wallet_id, ts):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        hash=f"0x{uuid.uuid4().hex}",
+        wallet_id=wallet_id,
+        token_id=None,
+        type="IN",
+        amount=Decimal("1.5"),
+        usd_value=None,
+        timestamp=ts,
+        from_address=None,
+        to_address=None,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_list_wallet_transactions_returns_next_cursor(
+    transaction_usecase_with_di, mock_wallet_repository, mock_transaction_repository
+):
+    user_id = uuid.uuid4()
+    wallet = SimpleNamespace(id=uuid.uuid4())
+    mock_wallet_repository.get_by_user_and_address.return_value = wallet
+    now = datetime(2024, 1, 1)
+    rows = [_tx(wallet.id, now - timedelta(minutes=i)) for i in range(3)]
+    mock_transaction_repository.list_by_wallet.return_value = rows
+
+    page = await transaction_usecase_with_di.list_wallet_transactions(
+        user_id, "0xabc", limit=2, tx_type="in"
+    )
+
+    assert [item.id for item in page.items] == [rows[0].id, rows[1].id]
+    assert decode_cursor(page.next_cursor) == (rows[1].timestamp, rows[1].id)
+    mock_transaction_repository.list_by_wallet.assert_awaited_once_with(
+        wallet.id, 3, after=None, token_id=None, tx_type="IN"
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_list_wallet_transactions_last_page_has_no_cursor(
+    transaction_usecase_with_di, mock_wallet_repository, mock_transaction_repository
+):
+    wallet = SimpleNamespace(id=uuid.uuid4())
+    mock_wallet_repository.get_by_user_and_address.return_value = wallet
+    cursor_key = (datetime(2024, 1, 1), uuid.uuid4())
+    mock_transaction_repository.list_by_wallet.return_value = [
+        _tx(wallet.id, datetime(2023, 12, 31))
+    ]
+
+    page = await transaction_usecase_with_di.list_wallet_transactions(
+        uuid.uuid4(), "0xabc", limit=5, cursor=encode_cursor(*cursor_key)
+    )
+
+    assert len(page.items) == 1
+    assert page.next_cursor is None
+    assert (
+        mock_transaction_repository.list_by_wallet.await_args.kwargs["after"]
+        == cursor_key
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_list_wallet_transactions_unknown_wallet(
+    transaction_usecase_with_di, mock_wallet_repository, mock_transaction_repository
+):
+    mock_wallet_repository.get_by_user_and_address.return_value = None
+
+    with pytest.raises(HTTPException) as exc_info:
+        await transaction_usecase_with_di.list_wallet_transactions(
+            uuid.uuid4(), "0xabc"
+        )
+
+    assert exc_info.value.status_code == 404
+    mock_transaction_repository.list_by_wallet.assert_not_awaited()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_list_wallet_transactions_invalid_cursor(transaction_usecase_with_di):
+    with pytest.raises(HTTPException) as exc_info:
+        await transaction_usecase_with_di.list_wallet_transactions(
+            uuid.uuid4(), "0xabc", cursor="not-a-cursor"
+        )
+
+    assert exc_info.value.status_code == 400
@@ -25,6 +25,7 @@ def mock_wallet_repository():
     mock_repo.get_by_id = AsyncMock()
     mock_repo.get_by_address = AsyncMock()
     mock_repo.get_by_address_and_user = AsyncMock()
+    mock_repo.get_by_user_and_address = AsyncMock(return_value=None)
     mock_repo.delete = AsyncMock()
     return mock_repo
 
@@ -45,6 +46,8 @@ def mock_portfolio_snapshot_repository():
     # Make async methods return AsyncMock
     mock_repo.get_snapshots_by_address_and_range = AsyncMock()
     mock_repo.get_by_wallet_address = AsyncMock()
+    mock_repo.get_owned_snapshots = AsyncMock(return_value=None)
+    mock_repo.get_owned_timeline = AsyncMock(return_value=None)
     return mock_repo
 
 
@@ -174,7 +177,7 @@ async def test_list_wallets(
 
     # Assert
     assert len(wallets) == 2
-    mock_wallet_repository.list_by_user.assert_called_once_with(user.id)
+    mock_wallet_repository.list_by_user.assert_called_once_with(user.id, None)
 
 
 @pytest.mark.unit
@@ -232,7 +235,7 @@ async def test_verify_wallet_ownership_owned_wallet(
     # Mock wallet exists and is owned by user
     mock_wallet = Mock()
     mock_wallet.user_id = user.id
-    mock_wallet_repository.get_by_address.return_value = mock_wallet
+    mock_wallet_repository.get_by_user_and_address.return_value = mock_wallet
     mock_user_repository.get_by_id.return_value = user
 
     # Act
@@ -240,7 +243,9 @@ async def test_verify_wallet_ownership_owned_wallet(
 
     # Assert
     assert result is True
-    mock_wallet_repository.get_by_address.assert_called_once_with(address=addr)
+    mock_wallet_repository.get_by_user_and_address.assert_called_once_with(
+        user.id, addr
+    )
 
 
 @pytest.mark.unit
@@ -254,10 +259,12 @@ async def test_verify_wallet_ownership_not_owned(
     other_user_id = uuid.uuid4()
     addr = f"0x{uuid.uuid4().hex:0<40}"[:42]
 
-    # Mock wallet exists but is owned by different user
+    # Wallet exists but is owned by a different user, so the owner-scoped
+    # lookup finds nothing
     mock_wallet = Mock()
     mock_wallet.user_id = other_user_id
     mock_wallet_repository.get_by_address.return_value = mock_wallet
+    mock_wallet_repository.get_by_user_and_address.return_value = None
     mock_user_repository.get_by_id.return_value = user
 
     # Act
@@ -265,6 +272,7 @@ async def test_verify_wallet_ownership_not_owned(
 
     # Assert
     assert result is False
+    mock_wallet_repository.get_by_address.assert_not_called()
 
 
 @pytest.mark.unit
@@ -277,7 +285,7 @@ async def test_verify_wallet_ownership_nonexistent_wallet(
     user = _dummy_user()
     addr = f"0x{uuid.uuid4().hex:0<40}"[:42]
 
-    mock_wallet_repository.get_by_address.return_value = None
+    mock_wallet_repository.get_by_user_and_address.return_value = None
     mock_user_repository.get_by_id.return_value = user
 
     # Act
@@ -287,6 +295,38 @@ async def test_verify_wallet_ownership_nonexistent_wallet(
     assert result is False
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_wallet_uses_owner_scoped_lookup(
+    wallet_usecase, mock_wallet_repository
+):
+    """get_wallet loads the wallet with a single (user_id, address) lookup."""
+    user = _dummy_user()
+    addr = "0xABCDEF" + "0" * 34
+    wallet = SimpleNamespace(id=uuid.uuid4(), user_id=user.id, address=addr.lower())
+    mock_wallet_repository.get_by_user_and_address.return_value = wallet
+
+    result = await wallet_usecase.get_wallet(user.id, addr)
+
+    assert result is wallet
+    mock_wallet_repository.get_by_user_and_address.assert_awaited_once_with(
+        user.id, addr
+    )
+    mock_wallet_repository.list_by_user.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_wallet_not_owned_returns_404(wallet_usecase, mock_wallet_repository):
+    """get_wallet raises 404 when the user has no wallet with the address."""
+    mock_wallet_repository.get_by_user_and_address.return_value = None
+
+    with pytest.raises(HTTPException) as exc_info:
+        await wallet_usecase.get_wallet(uuid.uuid4(), "0x" + "1" * 40)
+
+    assert exc_info.value.status_code == 404
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_get_portfolio_snapshots_success(
@@ -295,17 +335,11 @@ async def test_get_portfolio_snapshots_success(
     mock_portfolio_snapshot_repository,
     mock_user_repository,
 ):
-    """Test successful portfolio snapshots retrieval."""
+    """Snapshots and ownership come from one owner-scoped repository call."""
     # Arrange
     user = _dummy_user()
     addr = f"0x{uuid.uuid4().hex:0<40}"[:42]
 
-    # Mock wallet exists and is owned by user (for verify_wallet_ownership)
-    mock_wallet = Mock()
-    mock_wallet.user_id = user.id
-    mock_wallet_repository.get_by_address.return_value = mock_wallet
-    mock_user_repository.get_by_id.return_value = user
-
     mock_snapshots = [
         {"timestamp": int(datetime.utcnow().timestamp()), "value": 1000.0},
         {
@@ -313,79 +347,66 @@ async def test_get_portfolio_snapshots_success(
             "value": 950.0,
         },
     ]
-    mock_portfolio_snapshot_repository.get_by_wallet_address.return_value = (
-        mock_snapshots
-    )
+    mock_portfolio_snapshot_repository.get_owned_snapshots.return_value = mock_snapshots
 
     # Act
     result = await wallet_usecase.get_portfolio_snapshots(user.id, addr)
 
     # Assert
     assert result == mock_snapshots
-    mock_wallet_repository.get_by_address.assert_called_once_with(address=addr)
+    mock_portfolio_snapshot_repository.get_owned_snapshots.assert_awaited_once_with(
+        user.id, addr
+    )
+    # No separate user or ownership round-trips
+    mock_user_repository.get_by_id.assert_not_called()
+    mock_wallet_repository.get_by_user_and_address.assert_not_called()
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_get_portfolio_snapshots_not_owned(
-    wallet_usecase, mock_wallet_repository, mock_user_repository
+async def test_get_portfolio_snapshots_owned_without_snapshots(
+    wallet_usecase, mock_portfolio_snapshot_repository
 ):
-    """Test portfolio snapshots retrieval for wallet not owned by user."""
-    # Arrange
-    user = _dummy_user()
-    other_user_id = uuid.uuid4()
-    addr = f"0x{uuid.uuid4().hex:0<40}"[:42]
-
-    # Mock wallet exists but is owned by different user
-    mock_wallet = Mock()
-    mock_wallet.user_id = other_user_id
-    mock_wallet_repository.get_by_address.return_value = mock_wallet
-    mock_user_repository.get_by_id.return_value = user
+    """An owned wallet without snapshots returns an empty list, not 404."""
+    mock_portfolio_snapshot_repository.get_owned_snapshots.return_value = []
 
-    # Act & Assert
-    with pytest.raises(HTTPException) as exc:
-        await wallet_usecase.get_portfolio_snapshots(user.id, addr)
+    result = await wallet_usecase.get_portfolio_snapshots(uuid.uuid4(), "0x" + "a" * 40)
 
-    assert exc.value.status_code == 404
-    assert "Wallet not found or access denied" in exc.value.detail
+    assert result == []
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_get_portfolio_snapshots_nonexistent_wallet(
-    wallet_usecase, mock_wallet_repository, mock_user_repository
+async def test_get_portfolio_snapshots_not_owned(
+    wallet_usecase, mock_portfolio_snapshot_repository
 ):
-    """Test portfolio snapshots retrieval for nonexistent wallet."""
+    """Test portfolio snapshots retrieval for wallet not owned by user."""
     # Arrange
     user = _dummy_user()
     addr = f"0x{uuid.uuid4().hex:0<40}"[:42]
 
-    mock_wallet_repository.get_by_address.return_value = None
-    mock_user_repository.get_by_id.return_value = user
+    # Missing or foreign wallets both come back as None
+    mock_portfolio_snapshot_repository.get_owned_snapshots.return_value = None
 
     # Act & Assert
     with pytest.raises(HTTPException) as exc:
         await wallet_usecase.get_portfolio_snapshots(user.id, addr)
 
     assert exc.value.status_code == 404
+    assert "Wallet not found or access denied" in exc.value.detail
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_get_portfolio_metrics_not_owned(
-    wallet_usecase, mock_wallet_repository, mock_user_repository
+    wallet_usecase, mock_portfolio_snapshot_repository
 ):
     """Test portfolio metrics retrieval for wallet not owned by user."""
     # Arrange
     user = _dummy_user()
-    other_user_id = uuid.uuid4()
     addr = f"0x{uuid.uuid4().hex:0<40}"[:42]
 
-    # Mock wallet exists but is owned by different user
-    mock_wallet = Mock()
-    mock_wallet.user_id = other_user_id
-    mock_wallet_repository.get_by_address.return_value = mock_wallet
-    mock_user_repository.get_by_id.return_value = user
+    mock_portfolio_snapshot_repository.get_owned_snapshots.return_value = None
 
     # Act & Assert
     with pytest.raises(HTTPException) as exc:
@@ -398,19 +419,14 @@ async def test_get_portfolio_metrics_not_owned(
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_get_portfolio_timeline_not_owned(
-    wallet_usecase, mock_wallet_repository, mock_user_repository
+    wallet_usecase, mock_portfolio_snapshot_repository
 ):
     """Test portfolio timeline retrieval for wallet not owned by user."""
     # Arrange
     user = _dummy_user()
-    other_user_id = uuid.uuid4()
     addr = f"0x{uuid.uuid4().hex:0<40}"[:42]
 
-    # Mock wallet exists but is owned by different user
-    mock_wallet = Mock()
-    mock_wallet.user_id = other_user_id
-    mock_wallet_repository.get_by_address.return_value = mock_wallet
-    mock_user_repository.get_by_id.return_value = user
+    mock_portfolio_snapshot_repository.get_owned_timeline.return_value = None
 
     # Act & Assert
     with pytest.raises(HTTPException) as exc:
@@ -550,29 +566,22 @@ async def test_get_portfolio_metrics_with_snapshot(
     mock_user_repository.get_by_id.return_value = user
     addr = "0x" + "d" * 40
 
-    # snapshot list – most recent first
     now_ts = int(datetime.utcnow().timestamp())
-    snapshot_dict = {
-        "timestamp": now_ts,
-        "total_collateral": 200.0,
-        "total_borrowings": 80.0,
-        "total_collateral_usd": 300.0,
-        "total_borrowings_usd": 120.0,
-        "aggregate_health_score": 0.95,
-        "aggregate_apy": 7.5,
-        "collaterals": [],
-        "borrowings": [],
-        "staked_positions": [],
-        "health_scores": [],
-        "protocol_breakdown": {},
-    }
-    mock_portfolio_snapshot_repository.get_by_wallet_address.return_value = [
-        snapshot_dict
-    ]
-    # ownership check returns True
-    mock_wallet_repository.get_by_address.return_value = SimpleNamespace(
-        user_id=user.id
+    snapshot = SimpleNamespace(
+        timestamp=now_ts,
+        total_collateral=200.0,
+        total_borrowings=80.0,
+        total_collateral_usd=300.0,
+        total_borrowings_usd=120.0,
+        aggregate_health_score=0.95,
+        aggregate_apy=7.5,
+        collaterals=[],
+        borrowings=[],
+        staked_positions=[],
+        health_scores=[],
+        protocol_breakdown={},
     )
+    mock_portfolio_snapshot_repository.get_owned_snapshots.return_value = [snapshot]
 
     metrics: PortfolioMetrics = await wallet_usecase.get_portfolio_metrics(
         user.id, addr
@@ -580,7 +589,10 @@ async def test_get_portfolio_metrics_with_snapshot(
 
     assert metrics.total_collateral_usd == 300.0
     assert metrics.aggregate_health_score == 0.95
-    mock_portfolio_snapshot_repository.get_by_wallet_address.assert_awaited_once()
+    assert metrics.timestamp.timestamp() == now_ts
+    mock_portfolio_snapshot_repository.get_owned_snapshots.assert_awaited_once_with(
+        user.id, addr, limit=1
+    )
 
 
 @pytest.mark.unit
@@ -596,11 +608,6 @@ async def test_get_portfolio_timeline_success(
 
     addr = "0x" + "e" * 40
 
-    # Mock wallet ownership True
-    mock_wallet_repository.get_by_address.return_value = SimpleNamespace(
-        user_id=user.id
-    )
-
     # timeline snapshots list
     base = datetime.utcnow()
     s1 = SimpleNamespace(
@@ -614,7 +621,7 @@ async def test_get_portfolio_timeline_success(
         total_borrowings_usd=None,
     )
 
-    mock_portfolio_snapshot_repository.get_timeline = AsyncMock(return_value=[s1, s2])
+    mock_portfolio_snapshot_repository.get_owned_timeline.return_value = [s1, s2]
 
     timeline = await wallet_usecase.get_portfolio_timeline(
         user.id, addr, "daily", 30, 0
@@ -626,4 +633,7 @@ async def test_get_portfolio_timeline_success(
     ]
     assert timeline.collateral_usd == [100.0, 0.0]
     assert timeline.borrowings_usd == [50.0, 0.0]
-    mock_portfolio_snapshot_repository.get_timeline.assert_awaited_once()
+    mock_portfolio_snapshot_repository.get_owned_timeline.assert_awaited_once()
+    assert mock_portfolio_snapshot_repository.get_owned_timeline.await_args.args[
+        :2
+    ] == (user.id, addr)
@@ -20,6 +20,7 @@ def _setup_wallets_endpoint():
         AsyncMock(),
         AsyncMock(),
         AsyncMock(),
+        AsyncMock(),
     )
     return Wallets, fake_wallet_uc
 
@@ -46,7 +47,7 @@ async def test_list_wallets_success(_setup_wallets_endpoint):
     with patch("app.api.endpoints.wallets.get_user_id_from_request", return_value=uid):
         result = await endpoint_cls.list_wallets(req)
         assert result == [example_wallet]
-        wallet_uc.list_wallets.assert_awaited_once_with(uid)
+        wallet_uc.list_wallets.assert_awaited_once_with(uid, None)
 
 
 @pytest.mark.asyncio
@@ -73,3 +74,99 @@ async def test_create_wallet_success(_setup_wallets_endpoint):
         result = await endpoint_cls.create_wallet(req, create_payload)
         assert result == created
         wallet_uc.create_wallet.assert_awaited_once_with(uid, create_payload)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_list_wallet_transactions_delegates_to_usecase():
+    transaction_uc = AsyncMock()
+    Wallets(
+        AsyncMock(),
+        AsyncMock(),
+        AsyncMock(),
+        AsyncMock(),
+        AsyncMock(),
+        AsyncMock(),
+        transaction_uc,
+    )
+    uid = uuid.uuid4()
+    token_id = uuid.uuid4()
+    req = Mock(spec=Request)
+
+    with patch("app.api.endpoints.wallets.get_user_id_from_request", return_value=uid):
+        await Wallets.list_wallet_transactions(
+            req, "0xabc", limit=10, cursor="c", token_id=token_id, type="out"
+        )
+
+    transaction_uc.list_wallet_transactions.assert_awaited_once_with(
+        uid, "0xabc", limit=10, cursor="c", token_id=token_id, tx_type="out"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_get_wallet_valuation_delegates_to_usecase():
+    historical_balance_uc = AsyncMock()
+    Wallets(
+        AsyncMock(),
+        AsyncMock(),
+        historical_balance_uc,
+        AsyncMock(),
+        AsyncMock(),
+        AsyncMock(),
+        AsyncMock(),
+    )
+    uid = uuid.uuid4()
+    req = Mock(spec=Request)
+
+    with patch("app.api.endpoints.wallets.get_user_id_from_request", return_value=uid):
+        await Wallets.get_wallet_valuation(req, "0xabc", start=None, end=None)
+
+    historical_balance_uc.get_wallet_valuation.assert_awaited_once_with(
+        uid, "0xabc", start=None, end=None
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_get_latest_token_price_unknown_token_is_404():
+    from fastapi import HTTPException
+
+    token_price_uc = Mock()
+    token_price_uc.get_latest_price.return_value = None
+    Wallets(
+        AsyncMock(),
+        AsyncMock(),
+        AsyncMock(),
+        token_price_uc,
+        AsyncMock(),
+        AsyncMock(),
+        AsyncMock(),
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await Wallets.get_latest_token_price("DAI")
+
+    assert exc_info.value.status_code == 404
+    token_price_uc.get_latest_price.assert_called_once_with("DAI")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_get_token_price_candles_delegates_to_usecase():
+    token_price_uc = AsyncMock()
+    Wallets(
+        AsyncMock(),
+        AsyncMock(),
+        AsyncMock(),
+        token_price_uc,
+        AsyncMock(),
+        AsyncMock(),
+        AsyncMock(),
+    )
+
+    await Wallets.get_token_price_candles("0xabc", interval="1d", start=None, end=None)
+
+    token_price_uc.get_price_candles.assert_awaited_once_with(
+        "0xabc", interval="1d", start=None, end=None
+    )
@@ -0,0 +1,97 @@
+"""Read-replica routing in CoreDatabase, using SQLite files as replicas."""
+
+import pytest
+import pytest_asyncio
+
+from app.core.config import Configuration
+from app.core.database import CoreDatabase
+from app.utils.logging import Audit
+
+pytestmark = pytest.mark.integration
+
+
+def _db_name(session):
+    return session.bind.url.database.rsplit("/", 1)[-1]
+
+
+@pytest_asyncio.fixture
+async def replicated(tmp_path):
+    databases = []
+
+    async def build(replicas=("r1", "r2"), strategy="round_robin"):
+        config = Configuration(
+            DATABASE_URL=f"sqlite+aiosqlite:///{tmp_path}/primary.db",
+            DATABASE_READ_URLS=[
+                f"sqlite+aiosqlite:///{tmp_path}/{name}.db" for name in replicas
+            ],
+            DB_READ_STRATEGY=strategy,
+        )
+        database = CoreDatabase(config, Audit())
+        databases.append(database)
+        return database
+
+    yield build
+    for database in databases:
+        await database.dispose()
+
+
+@pytest.mark.asyncio
+async def test_reads_round_robin_across_replicas(replicated):
+    database = await replicated()
+
+    names = []
+    for _ in range(4):
+        async with database.get_read_session() as session:
+            names.append(_db_name(session))
+
+    assert names == ["r1.db", "r2.db", "r1.db", "r2.db"]
+
+
+@pytest.mark.asyncio
+async def test_least_connections_prefers_idle_replica(replicated):
+    database = await replicated(strategy="least_connections")
+
+    async with database.get_read_session() as busy:
+        async with database.get_read_session() as other:
+            assert _db_name(other) != _db_name(busy)
+    async with database.get_read_session() as idle:
+        assert _db_name(idle) == "r1.db"
+
+
+@pytest.mark.asyncio
+async def test_without_replicas_reads_use_the_primary(replicated):
+    database = await replicated(replicas=())
+
+    async with database.request_scope():
+        async with database.get_session() as primary:
+            pass
+        async with database.get_read_session() as read:
+            pass
+
+    assert read is primary
+
+
+@pytest.mark.asyncio
+async def test_reads_follow_writes_to_the_primary_within_a_scope(replicated):
+    database = await replicated()
+
+    async with database.request_scope():
+        async with database.get_read_session() as before:
+            assert _db_name(before) != "primary.db"
+
+        async with database.get_session() as session:
+            await session.commit()
+
+        async with database.get_read_session() as after:
+            assert _db_name(after) == "primary.db"
+
+
+@pytest.mark.asyncio
+async def test_use_primary_forces_primary_reads(replicated):
+    database = await replicated()
+
+    with database.use_primary():
+        async with database.get_read_session() as session:
+            assert _db_name(session) == "primary.db"
+    async with database.get_read_session() as session:
+        assert _db_name(session) != "primary.db"
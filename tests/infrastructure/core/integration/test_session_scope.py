@@ -0,0 +1,130 @@
+"""Request-scoped sessions and units of work on a real database."""
+
+import asyncio
+import uuid
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import select, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.middleware import DBSessionMiddleware
+from app.models.wallet import Wallet
+
+pytestmark = pytest.mark.integration
+
+
+def _wallet():
+    return Wallet(user_id=uuid.uuid4(), address="0x" + uuid.uuid4().hex.ljust(40, "0"))
+
+
+async def _exists(database, wallet_id):
+    async with database.get_session() as session:
+        result = await session.execute(select(Wallet.id).where(Wallet.id == wallet_id))
+        return result.scalar_one_or_none() is not None
+
+
+@pytest.mark.asyncio
+async def test_calls_outside_a_scope_get_their_own_session(database):
+    async with database.get_session() as first:
+        pass
+    async with database.get_session() as second:
+        pass
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_request_scope_shares_one_session(database):
+    async with database.request_scope():
+        async with database.get_session() as first:
+            pass
+        async with database.get_session() as second:
+            pass
+    assert first is second
+
+
+@pytest.mark.asyncio
+async def test_child_tasks_do_not_share_the_scope_session(database):
+    async def session_of():
+        async with database.get_session() as session:
+            return session
+
+    async with database.request_scope():
+        mine = await session_of()
+        children = await asyncio.gather(session_of(), session_of())
+    assert mine not in children
+    assert children[0] is not children[1]
+
+
+@pytest.mark.asyncio
+async def test_failed_statement_leaves_the_scope_session_usable(database):
+    async with database.request_scope():
+        with pytest.raises(SQLAlchemyError):
+            async with database.get_session() as session:
+                await session.execute(text("SELECT * FROM no_such_table"))
+        async with database.get_session() as session:
+            assert (await session.execute(text("SELECT 1"))).scalar_one() == 1
+
+
+@pytest.mark.asyncio
+async def test_any_error_discards_pending_scope_work(database):
+    wallet = _wallet()
+    async with database.request_scope():
+        with pytest.raises(ValueError):
+            async with database.get_session() as session:
+                session.add(wallet)
+                await session.flush()
+                raise ValueError("validation failed after flush")
+        async with database.get_session() as session:
+            await session.commit()
+    assert not await _exists(database, wallet.id)
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_commits_on_success(database):
+    wallet = _wallet()
+    async with database.unit_of_work():
+        async with database.get_session() as session:
+            session.add(wallet)
+            await session.commit()
+    assert await _exists(database, wallet.id)
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_rolls_back_repository_commits(database):
+    first, second = _wallet(), _wallet()
+    with pytest.raises(RuntimeError):
+        async with database.unit_of_work():
+            for wallet in (first, second):
+                # Each block mimics one repository method committing its work
+                async with database.get_session() as session:
+                    session.add(wallet)
+                    await session.commit()
+            raise RuntimeError("boom")
+
+    assert not await _exists(database, first.id)
+    assert not await _exists(database, second.id)
+
+
+@pytest.mark.asyncio
+async def test_middleware_binds_one_session_per_request(database):
+    app = FastAPI()
+    app.add_middleware(DBSessionMiddleware, database=database)
+    seen = []
+
+    @app.get("/twice")
+    async def twice():
+        for _ in range(2):
+            async with database.get_session() as session:
+                seen.append(session)
+        return {"ok": True}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        assert (await c.get("/twice")).status_code == 200
+        assert (await c.get("/twice")).status_code == 200
+
+    assert seen[0] is seen[1]
+    assert seen[2] is seen[3]
+    assert seen[0] is not seen[2]
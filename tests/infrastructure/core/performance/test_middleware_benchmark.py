@@ -0,0 +1,136 @@
+"""Per-request overhead of the trace-id / JWT auth middleware.
+
+``test_request_context_middleware`` drives 200 authenticated requests to a
+trivial endpoint through :class:`RequestContextMiddleware`;
+``test_base_http_middleware_reference`` does the same through a
+``BaseHTTPMiddleware`` pair equivalent to the previous implementation
+(token cache included).
+Run with ``pytest tests/infrastructure/core/performance --benchmark-only``.
+"""
+
+import asyncio
+import uuid
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.config import Configuration
+from app.core.middleware import RequestContextMiddleware
+from app.utils.jwt import JWTUtils
+from app.utils.logging import Audit
+from app.utils.verified_token_cache import VerifiedTokenCache
+
+pytestmark = pytest.mark.performance
+
+_REQUESTS = 200
+
+
+@pytest.fixture(scope="module")
+def jwt_utils():
+    config = Configuration(
+        JWT_ALGORITHM="HS256",
+        JWT_KEYS={"bench": "benchmark-secret"},
+        ACTIVE_JWT_KID="bench",
+    )
+    return JWTUtils(config, Audit())
+
+
+@pytest.fixture(scope="module")
+def scope(jwt_utils):
+    token = jwt_utils.create_access_token(str(uuid.uuid4()))
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/users/me",
+        "raw_path": b"/users/me",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"test"),
+            (b"authorization", f"Bearer {token}".encode()),
+        ],
+        "client": ("127.0.0.1", 1234),
+        "server": ("test", 80),
+    }
+
+
+def _app():
+    app = FastAPI()
+
+    @app.get("/users/me")
+    async def me(request: Request):
+        return {"user_id": str(request.state.user_id)}
+
+    return app
+
+
+def _container(jwt_utils):
+    container = Mock()
+    container.get_utility.return_value = jwt_utils
+    return container
+
+
+def _run(app, scope):
+    async def drive():
+        statuses = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                statuses.append(message["status"])
+
+        for _ in range(_REQUESTS):
+            await app(dict(scope), receive, send)
+        return statuses
+
+    return asyncio.run(drive())
+
+
+@pytest.mark.benchmark(group="middleware")
+def test_request_context_middleware(benchmark, jwt_utils, scope):
+    app = _app()
+    app.add_middleware(RequestContextMiddleware, di_container=_container(jwt_utils))
+
+    statuses = benchmark.pedantic(_run, args=(app, scope), rounds=10)
+    assert statuses == [200] * _REQUESTS
+
+
+@pytest.mark.benchmark(group="middleware")
+def test_base_http_middleware_reference(benchmark, jwt_utils, scope):
+    excluded = ("/auth/token", "/health", "/jwks", "/docs")
+    cache = VerifiedTokenCache(100, lambda kid: False)
+
+    class TraceId(BaseHTTPMiddleware):
+        async def dispatch(self, request, call_next):
+            request.state.trace_id = str(uuid.uuid4())
+            response = await call_next(request)
+            response.headers["X-Trace-ID"] = request.state.trace_id
+            return response
+
+    class Auth(BaseHTTPMiddleware):
+        async def dispatch(self, request, call_next):
+            request.state.user_id = None
+            path = request.url.path
+            if any(path.startswith(p) for p in ("/users", "/wallets", "/admin")):
+                if not any(path.startswith(p) for p in excluded):
+                    token = request.headers["Authorization"].split(" ")[1]
+                    payload = cache.get(token)
+                    if payload is None:
+                        payload = jwt_utils.decode_token(token)
+                        cache.put(token, payload, "bench")
+                    request.state.user_id = uuid.UUID(payload["sub"])
+            return await call_next(request)
+
+    app = _app()
+    app.add_middleware(TraceId)
+    app.add_middleware(Auth)
+
+    statuses = benchmark.pedantic(_run, args=(app, scope), rounds=10)
+    assert statuses == [200] * _REQUESTS
@@ -0,0 +1,44 @@
+"""Startup benchmarks for the DI container and application factory.
+
+Run with ``pytest tests/infrastructure/core/performance --benchmark-only``
+to compare cold-start cost across changes.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from app.di import DIContainer
+from app.main import ApplicationFactory
+
+pytestmark = pytest.mark.performance
+
+
+def test_container_construction(benchmark):
+    container = benchmark.pedantic(DIContainer, rounds=5, iterations=1)
+
+    # Worker-only pieces are left for the first caller that needs them
+    assert "celery" not in container._core
+    assert "sync_engine" not in container.get_core("database").__dict__
+
+
+def test_app_creation(benchmark):
+    def build():
+        factory = ApplicationFactory(DIContainer(), skip_startup=True)
+        return factory.create_app()
+
+    app = benchmark.pedantic(build, rounds=5, iterations=1)
+    assert app.routes
+
+
+def test_importing_main_builds_nothing():
+    code = (
+        "import sys, app.main as m; "
+        "assert 'celery' not in sys.modules, 'celery imported'; "
+        "assert 'app' not in vars(m), 'app built at import'"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr
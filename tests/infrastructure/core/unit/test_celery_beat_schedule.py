@@ -19,3 +19,60 @@ def test_jwt_rotation_beat_schedule_is_configured():
     # Check that the schedule matches the cron expression from settings
     expected_schedule = crontab(*Configuration().JWT_ROTATION_SCHEDULE_CRON.split())
     assert schedule_config["schedule"] == expected_schedule
+
+
+@pytest.mark.unit
+def test_transaction_indexer_beat_schedule_is_configured():
+    """The incremental transaction indexer runs on its own beat entry."""
+    assert "transaction-indexer-beat" in celery.conf.beat_schedule
+    schedule_config = celery.conf.beat_schedule["transaction-indexer-beat"]
+    assert (
+        schedule_config["task"]
+        == "app.tasks.transaction_indexer.index_transactions_task"
+    )
+    expected_schedule = crontab(*Configuration().INDEXER_SCHEDULE_CRON.split())
+    assert schedule_config["schedule"] == expected_schedule
+
+
+@pytest.mark.unit
+def test_price_candle_rollup_beat_schedule_is_configured():
+    """The OHLC candle rollup refresh runs on its own beat entry."""
+    schedule_config = celery.conf.beat_schedule["price-candle-rollup-beat"]
+    assert (
+        schedule_config["task"] == "app.tasks.price_candles.rollup_price_candles_task"
+    )
+    expected_schedule = crontab(
+        *Configuration().PRICE_CANDLE_ROLLUP_SCHEDULE_CRON.split()
+    )
+    assert schedule_config["schedule"] == expected_schedule
+
+
+@pytest.mark.unit
+def test_price_feed_beat_schedule_is_configured():
+    """The price-feed ingestion worker runs on its own beat entry."""
+    schedule_config = celery.conf.beat_schedule["price-feed-beat"]
+    assert schedule_config["task"] == "app.tasks.price_feed.ingest_prices_task"
+    expected_schedule = crontab(*Configuration().PRICE_FEED_SCHEDULE_CRON.split())
+    assert schedule_config["schedule"] == expected_schedule
+
+
+@pytest.mark.unit
+def test_defi_metrics_refresh_beat_schedule_is_configured():
+    """Hot aggregate DeFi metrics are refreshed ahead of expiry."""
+    schedule_config = celery.conf.beat_schedule["defi-metrics-refresh-beat"]
+    assert schedule_config["task"] == "app.tasks.defi_metrics.refresh_defi_metrics_task"
+    expected_schedule = crontab(
+        *Configuration().DEFI_METRICS_REFRESH_SCHEDULE_CRON.split()
+    )
+    assert schedule_config["schedule"] == expected_schedule
+
+
+@pytest.mark.unit
+def test_token_sweep_beat_schedule_is_configured():
+    """Expired and used tokens are swept on their own beat entry."""
+    schedule_config = celery.conf.beat_schedule["token-sweep-beat"]
+    assert (
+        schedule_config["task"] == "app.tasks.token_cleanup.sweep_expired_tokens_task"
+    )
+    expected_schedule = crontab(*Configuration().TOKEN_SWEEP_SCHEDULE_CRON.split())
+    assert schedule_config["schedule"] == expected_schedule
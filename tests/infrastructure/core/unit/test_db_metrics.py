@@ -0,0 +1,65 @@
+"""Unit tests for connection-pool telemetry."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.db_metrics import InstrumentedAsyncQueuePool, instrument_engine
+from app.core.prometheus import get_registry
+
+
+def _sample(name, label):
+    return get_registry().get_sample_value(name, {"pool": label})
+
+
+@pytest.fixture
+def pooled_engine(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path}/pool.db",
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=1,
+        max_overflow=1,
+    )
+    yield engine
+    engine.sync_engine.dispose()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_checked_out_gauge_follows_checkout_and_checkin(pooled_engine):
+    instrument_engine(pooled_engine, "unit_checked_out")
+
+    async with pooled_engine.connect() as first:
+        await first.execute(text("SELECT 1"))
+        assert _sample("db_pool_checked_out", "unit_checked_out") == 1
+        async with pooled_engine.connect() as second:
+            await second.execute(text("SELECT 1"))
+            assert _sample("db_pool_checked_out", "unit_checked_out") == 2
+            assert _sample("db_pool_overflow", "unit_checked_out") == 1
+
+    assert _sample("db_pool_checked_out", "unit_checked_out") == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_checkout_wait_is_observed_under_the_engine_label(pooled_engine):
+    instrument_engine(pooled_engine, "unit_wait")
+
+    for _ in range(3):
+        async with pooled_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    assert _sample("db_pool_checkout_wait_seconds_count", "unit_wait") == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_label_survives_engine_dispose(pooled_engine):
+    instrument_engine(pooled_engine, "unit_dispose")
+    await pooled_engine.dispose()
+
+    async with pooled_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+    assert _sample("db_pool_checkout_wait_seconds_count", "unit_dispose") == 1
+    assert _sample("db_pool_checked_out", "unit_dispose") == 0
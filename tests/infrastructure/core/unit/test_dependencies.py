@@ -470,3 +470,31 @@ class TestAuthorizationDeps:
             assert exc.value.status_code == 403
             assert "Access denied" in exc.value.detail
             assert "admin:delete" in exc.value.detail
+
+
+@pytest.mark.unit
+def test_rate_limit_policy_dependency_returns_429_with_retry_after():
+    from fastapi import Depends, FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.api.dependencies import RateLimit
+    from app.utils.rate_limiter import RateLimitResult
+
+    utils = Mock()
+    utils.check = AsyncMock(
+        side_effect=[RateLimitResult(True), RateLimitResult(False, 2.2)]
+    )
+    app = FastAPI()
+
+    @app.get("/limited", dependencies=[Depends(RateLimit.policy("oauth"))])
+    async def limited():
+        return {"ok": True}
+
+    with patch.object(RateLimit, "_rate_limiter_utils", utils):
+        client = TestClient(app)
+        assert client.get("/limited").status_code == 200
+        response = client.get("/limited")
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "3"
+    utils.check.assert_awaited_with("oauth", "testclient", None)
@@ -111,6 +111,8 @@ class TestDIContainer:
             "token",
             "token_price",
             "token_balance",
+            "transaction",
+            "indexer_checkpoint",
         ]
 
         for repo_name in expected_repositories:
@@ -209,6 +211,13 @@ class TestDIContainer:
         celery_service2 = di_container.get_core("celery")
         assert celery_service1 is celery_service2
 
+    @pytest.mark.unit
+    def test_celery_is_created_on_first_access(self, di_container):
+        """Test that Celery is only built when it is first requested."""
+        assert "celery" not in di_container._core
+        celery = di_container.get_core("celery")
+        assert di_container._core["celery"] is celery
+
         error_handling_service1 = di_container.get_core("error_handling")
         error_handling_service2 = di_container.get_core("error_handling")
         assert error_handling_service1 is error_handling_service2
@@ -340,6 +349,17 @@ class TestDIContainer:
                     usecase, f"_{usecase.__class__.__name__}__config_service"
                 ), f"Usecase '{usecase_name}' missing config"
 
+    @pytest.mark.unit
+    def test_usecases_share_the_password_hasher(self, di_container):
+        """Password hashing runs on the single pool of the registered hasher."""
+        password_hasher = di_container.get_utility("password_hasher")
+
+        auth_uc = di_container.get_usecase("auth")
+        profile_uc = di_container.get_usecase("user_profile")
+
+        assert auth_uc._AuthUsecase__password_hasher is password_hasher
+        assert profile_uc._UserProfileUsecase__password_hasher is password_hasher
+
     @pytest.mark.unit
     def test_endpoint_router_configuration(self, di_container):
         """Test that endpoints have proper router configuration."""
@@ -16,6 +16,7 @@ from starlette.requests import Request
 from starlette.testclient import TestClient
 
 from app.core.error_handling import CoreErrorHandling
+from app.domain.errors import PasswordHashingBusyError
 from app.utils.logging import Audit
 
 # ---------------------------------------------------------------------------
@@ -99,6 +100,19 @@ class Ping(BaseModel):
     msg: str
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_password_hashing_busy_handler_sheds_with_429():
+    eh = CoreErrorHandling(Audit())
+    resp = await eh.password_hashing_busy_handler(
+        _make_request(), PasswordHashingBusyError(retry_after=2)
+    )
+    body = json.loads(resp.body)
+    assert resp.status_code == 429
+    assert resp.headers["Retry-After"] == "2"
+    assert body["code"] == "RATE_LIMIT" and body["trace_id"] == "test-trace"
+
+
 @pytest.fixture
 def app_with_handlers():
     audit = Mock()
@@ -1,17 +1,35 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
 import pytest
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from starlette.testclient import TestClient
 
-from app.core.middleware import CorrelationIdMiddleware
+from app.api.dependencies import RateLimit
+from app.core.config import Configuration
+from app.core.middleware import PrefixTrie, RequestContextMiddleware
+from app.utils.jwt import _RETIRED_KEYS, JWTUtils
+from app.utils.logging import Audit
+from app.utils.rate_limiter import RateLimitResult
 
 
 def _create_app():
     app = FastAPI()
-    app.add_middleware(CorrelationIdMiddleware)
+    app.add_middleware(RequestContextMiddleware)
 
     @app.get("/ping")
-    async def ping():
-        return {"ok": True}
+    async def ping(request: Request):
+        return {"trace_id": request.state.trace_id}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for chunk in (b"a", b"b", b"c"):
+                yield chunk
+
+        return StreamingResponse(chunks())
 
     return app
 
@@ -25,3 +43,191 @@ def test_trace_id_header_present():
     trace_id = resp.headers["X-Trace-Id"]
     # header should be 32-char hex uuid
     assert len(trace_id) in (32, 36)
+    assert resp.json() == {"trace_id": trace_id}
+
+
+def test_trace_id_is_unique_per_request():
+    client = TestClient(_create_app())
+
+    first, second = client.get("/ping"), client.get("/ping")
+
+    assert first.headers["X-Trace-Id"] != second.headers["X-Trace-Id"]
+
+
+def test_streaming_responses_pass_through():
+    client = TestClient(_create_app())
+
+    with client.stream("GET", "/stream") as resp:
+        chunks = list(resp.iter_raw())
+
+    assert b"".join(chunks) == b"abc"
+    assert "X-Trace-Id" in resp.headers
+
+
+def test_http_exception_outside_handlers_gets_error_response():
+    async def raising_app(scope, receive, send):
+        raise HTTPException(status_code=429, detail="slow down")
+
+    client = TestClient(RequestContextMiddleware(raising_app))
+    resp = client.get("/anything")
+
+    assert resp.status_code == 429
+    assert resp.json()["code"] == "RATE_LIMIT"
+    assert resp.json()["trace_id"] == resp.headers["X-Trace-Id"]
+
+
+def test_prefix_trie_combines_flags_of_matching_prefixes():
+    trie = PrefixTrie()
+    trie.add("/users", 1)
+    trie.add("/users/admin", 2)
+    trie.add("/wallets", 1)
+
+    assert trie.match("/users/admin/x") == 3
+    assert trie.match("/users/me") == 1
+    assert trie.match("/user") == 0
+    assert trie.match("/") == 0
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("/users/me", True),
+        ("/wallets/0xabc", True),
+        ("/admin", True),
+        ("/health", False),
+        ("/auth/token", False),
+        ("/jwks", False),
+        ("/defi/timeline", True),
+    ],
+)
+def test_route_classification(path, expected):
+    middleware = RequestContextMiddleware(app=None)
+
+    assert middleware.requires_auth(path) is expected
+
+
+def test_excluded_prefixes_win_over_protected_ones():
+    middleware = RequestContextMiddleware(app=None, protected_paths=["/auth"])
+
+    assert middleware.requires_auth("/auth/me")
+    assert not middleware.requires_auth("/auth/token")
+
+
+def _create_auth_app(jwt_utils, **kwargs):
+    container = Mock()
+    container.get_utility.return_value = jwt_utils
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware, di_container=container, **kwargs)
+
+    @app.get("/users/me")
+    async def me(request: Request):
+        return {"user_id": str(request.state.user_id)}
+
+    @app.get("/public")
+    async def public(request: Request):
+        return {"user_id": str(request.state.user_id)}
+
+    return app
+
+
+def _jwt_utils():
+    config = Configuration(
+        JWT_ALGORITHM="HS256",
+        JWT_KEYS={"k1": "middleware-secret"},
+        ACTIVE_JWT_KID="k1",
+    )
+    jwt_utils = JWTUtils(config, Audit())
+    jwt_utils.decode_token = Mock(wraps=jwt_utils.decode_token)
+    return jwt_utils
+
+
+def test_jwt_middleware_verifies_a_token_once():
+    jwt_utils = _jwt_utils()
+    user_id = str(uuid.uuid4())
+    token = jwt_utils.create_access_token(user_id)
+    client = TestClient(_create_auth_app(jwt_utils))
+
+    for _ in range(3):
+        resp = client.get("/users/me", headers={"Authorization": f"Bearer {token}"})
+        assert resp.json() == {"user_id": user_id}
+
+    jwt_utils.decode_token.assert_called_once()
+
+
+def test_jwt_middleware_reverifies_after_key_retirement():
+    jwt_utils = _jwt_utils()
+    token = jwt_utils.create_access_token(str(uuid.uuid4()))
+    client = TestClient(_create_auth_app(jwt_utils))
+    headers = {"Authorization": f"Bearer {token}"}
+    client.get("/users/me", headers=headers)
+
+    _RETIRED_KEYS["k1"] = datetime.now(timezone.utc) - timedelta(seconds=1)
+    try:
+        resp = client.get("/users/me", headers=headers)
+    finally:
+        _RETIRED_KEYS.pop("k1", None)
+
+    assert resp.json() == {"user_id": "None"}
+    assert jwt_utils.decode_token.call_count == 2
+
+
+def test_jwt_middleware_cache_can_be_disabled():
+    jwt_utils = _jwt_utils()
+    token = jwt_utils.create_access_token(str(uuid.uuid4()))
+    client = TestClient(_create_auth_app(jwt_utils, token_cache_size=0))
+
+    for _ in range(2):
+        client.get("/users/me", headers={"Authorization": f"Bearer {token}"})
+
+    assert jwt_utils.decode_token.call_count == 2
+
+
+def test_jwt_middleware_reads_the_access_token_cookie():
+    jwt_utils = _jwt_utils()
+    user_id = str(uuid.uuid4())
+    client = TestClient(_create_auth_app(jwt_utils))
+    client.cookies.set("access_token", jwt_utils.create_access_token(user_id))
+
+    resp = client.get("/users/me")
+
+    assert resp.json() == {"user_id": user_id}
+
+
+def test_jwt_middleware_skips_unprotected_paths():
+    jwt_utils = _jwt_utils()
+    token = jwt_utils.create_access_token(str(uuid.uuid4()))
+    client = TestClient(_create_auth_app(jwt_utils))
+
+    resp = client.get("/public", headers={"Authorization": f"Bearer {token}"})
+
+    assert resp.json() == {"user_id": "None"}
+    jwt_utils.decode_token.assert_not_called()
+
+
+def test_jwt_middleware_leaves_invalid_tokens_unauthenticated():
+    jwt_utils = _jwt_utils()
+    client = TestClient(_create_auth_app(jwt_utils))
+
+    resp = client.get("/users/me", headers={"Authorization": "Bearer not-a-jwt"})
+
+    assert resp.json() == {"user_id": "None"}
+
+
+def test_defi_rate_limit_is_keyed_by_authenticated_user():
+    jwt_utils = _jwt_utils()
+    user_id = str(uuid.uuid4())
+    token = jwt_utils.create_access_token(user_id)
+    app = _create_auth_app(jwt_utils)
+
+    @app.get("/defi/wallets", dependencies=[Depends(RateLimit.policy("defi"))])
+    async def wallets():
+        return []
+
+    utils = Mock()
+    utils.check = AsyncMock(return_value=RateLimitResult(True))
+    with patch.object(RateLimit, "_rate_limiter_utils", utils):
+        TestClient(app).get(
+            "/defi/wallets", headers={"Authorization": f"Bearer {token}"}
+        )
+
+    utils.check.assert_awaited_once_with("defi", "testclient", user_id)
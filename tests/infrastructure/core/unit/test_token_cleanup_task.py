@@ -0,0 +1,60 @@
+"""Unit tests for the expired-token sweeper task."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from app.core.config import Configuration
+from app.tasks import token_cleanup
+
+
+@pytest.fixture
+def container():
+    repositories = {
+        "refresh_token": Mock(delete_expired_batch=AsyncMock(side_effect=[3, 3, 1])),
+        "email_verification": Mock(delete_expired_batch=AsyncMock(return_value=0)),
+        "password_reset": Mock(delete_expired_batch=AsyncMock(side_effect=[3] * 10)),
+    }
+    config = Configuration(
+        TOKEN_SWEEP_BATCH_SIZE=3, TOKEN_SWEEP_PAUSE_SEC=0.5, TOKEN_SWEEP_MAX_BATCHES=4
+    )
+    database = Mock(dispose=AsyncMock())
+    cores = {"config": config, "database": database}
+    container = Mock(
+        get_core=cores.__getitem__, get_repository=repositories.__getitem__
+    )
+    container.repositories = repositories
+    with patch.object(token_cleanup, "di_container", container):
+        yield container
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sweep_deletes_in_batches_and_reports_rows(container):
+    with patch.object(token_cleanup.asyncio, "sleep", AsyncMock()) as sleep:
+        removed = await token_cleanup._sweep_expired_tokens()
+
+    assert removed == {
+        "refresh_tokens": 7,
+        "email_verification_tokens": 0,
+        # Capped at TOKEN_SWEEP_MAX_BATCHES per run
+        "password_reset_tokens": 12,
+    }
+    # Pauses only between batches of the same table
+    assert sleep.await_count == 2 + 0 + 3
+    sleep.assert_awaited_with(0.5)
+    container.get_core("database").dispose.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sweep_uses_one_cutoff_per_run(container):
+    with patch.object(token_cleanup.asyncio, "sleep", AsyncMock()):
+        await token_cleanup._sweep_expired_tokens()
+
+    cutoffs = {
+        call.kwargs["before"]
+        for repository in container.repositories.values()
+        for call in repository.delete_expired_batch.await_args_list
+    }
+    assert len(cutoffs) == 1
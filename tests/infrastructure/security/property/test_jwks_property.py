@@ -12,6 +12,7 @@ from hypothesis import strategies as st
 from hypothesis.strategies import composite
 
 from app.domain.schemas.jwks import JWK, JWKSet
+from app.utils.jwks_cache import JWKSDocument
 from app.utils.jwt_rotation import Key
 
 
@@ -119,9 +120,13 @@ async def test_jwks_endpoint_property_based(
             n="cached-modulus",
             e="AQAB",
         )
-        mock_jwks_usecase.get_jwks.return_value = JWKSet(keys=[cached_jwk])
+        mock_jwks_usecase.get_jwks_document.return_value = JWKSDocument.from_jwks(
+            JWKSet(keys=[cached_jwk]), 300
+        )
     else:
-        mock_jwks_usecase.get_jwks.return_value = expected_jwk_set
+        mock_jwks_usecase.get_jwks_document.return_value = JWKSDocument.from_jwks(
+            expected_jwk_set, 300
+        )
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         import httpx
@@ -168,7 +173,9 @@ async def test_jwks_cache_ttl_property_based(cache_ttl: int, monkeypatch):
 
     # Mock JWKSUsecase to verify caching behavior (even though we don't directly test Redis TTL anymore)
     mock_jwks_usecase = AsyncMock()
-    mock_jwks_usecase.get_jwks.return_value = JWKSet(keys=[])
+    mock_jwks_usecase.get_jwks_document.return_value = JWKSDocument.from_jwks(
+        JWKSet(keys=[]), 300
+    )
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         import httpx
@@ -181,7 +188,7 @@ async def test_jwks_cache_ttl_property_based(cache_ttl: int, monkeypatch):
             assert resp.status_code == 200
 
             # Property: Should call the use case (since we can't directly test Redis TTL now)
-            mock_jwks_usecase.get_jwks.assert_called_once()
+            mock_jwks_usecase.get_jwks_document.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -206,7 +213,9 @@ async def test_jwks_error_handling_property_based(error_type: str):
     mock_jwks_usecase = AsyncMock()
 
     # For all error types, return empty key set - the use case should handle errors gracefully
-    mock_jwks_usecase.get_jwks.return_value = JWKSet(keys=[])
+    mock_jwks_usecase.get_jwks_document.return_value = JWKSDocument.from_jwks(
+        JWKSet(keys=[]), 300
+    )
 
     with patch("app.api.endpoints.jwks.JWKS._JWKS__jwks_uc", mock_jwks_usecase):
         import httpx
@@ -0,0 +1,189 @@
+"""Unit tests for PriceFeedService against a local HTTP stub."""
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from app.services.price_feed_service import PriceFeedError, PriceFeedService
+from app.utils.token_bucket import AsyncTokenBucket
+
+UPDATED_AT = 1_700_000_000
+
+
+class StubProvider:
+    """Minimal ``/simple/token_price`` server with scripted failures."""
+
+    def __init__(self, prices, failures=None, delay=0.0):
+        self.prices = prices
+        self.failures = list(failures or [])
+        self.delay = delay
+        self.calls = []
+        self.headers = []
+
+    async def handle(self, request):
+        addresses = request.query["contract_addresses"].split(",")
+        self.calls.append(addresses)
+        self.headers.append(dict(request.headers))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.failures:
+            status, headers = self.failures.pop(0)
+            return web.Response(status=status, headers=headers)
+        return web.json_response(
+            {
+                a: {"usd": self.prices[a], "last_updated_at": UPDATED_AT}
+                for a in addresses
+                if a in self.prices
+            }
+        )
+
+
+@pytest_asyncio.fixture
+async def provider():
+    """Start a stub provider on an ephemeral localhost port."""
+    servers = []
+
+    async def start(stub):
+        app = web.Application()
+        app.router.add_get("/simple/token_price/{platform}", stub.handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        servers.append(runner)
+        port = runner.addresses[0][1]
+        return f"http://127.0.0.1:{port}"
+
+    yield start
+    for runner in servers:
+        await runner.cleanup()
+
+
+def _address(i):
+    return "0x" + f"{i:040x}"
+
+
+def _service(base_url, tokens=(), batch_size=2, api_key=None, bucket=None):
+    config = SimpleNamespace(
+        PRICE_FEED_BASE_URL=base_url,
+        PRICE_FEED_PLATFORM="ethereum",
+        PRICE_FEED_API_KEY_HEADER="x-cg-demo-api-key",
+        PRICE_FEED_BATCH_SIZE=batch_size,
+        PRICE_FEED_RATE_PER_MIN=6000,
+        PRICE_FEED_BURST=100,
+        PRICE_FEED_MAX_RETRIES=2,
+        PRICE_FEED_TIMEOUT_SEC=5,
+        COINGECKO_API_KEY=api_key,
+    )
+    token_repo = Mock()
+    token_repo.list_tracked = AsyncMock(return_value=list(tokens))
+    return PriceFeedService(token_repo, config, Mock(), bucket=bucket)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_fetch_prices_batches_and_dedupes(provider):
+    addresses = [_address(i) for i in range(5)]
+    stub = StubProvider({a: float(i) for i, a in enumerate(addresses)})
+    service = _service(await provider(stub), batch_size=2)
+
+    quotes = await service.fetch_prices(addresses + [addresses[0].upper()])
+
+    assert len(stub.calls) == 3
+    assert sorted(a for call in stub.calls for a in call) == sorted(addresses)
+    assert quotes[addresses[3]].price_usd == 3.0
+    assert quotes[addresses[3]].timestamp == datetime.fromtimestamp(
+        UPDATED_AT, tz=timezone.utc
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unknown_addresses_are_omitted(provider):
+    known, unknown = _address(1), _address(2)
+    stub = StubProvider({known: 1.5})
+    service = _service(await provider(stub))
+
+    quotes = await service.fetch_prices([known, unknown])
+
+    assert set(quotes) == {known}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_coalesced(provider):
+    a, b = _address(1), _address(2)
+    stub = StubProvider({a: 1.0, b: 2.0}, delay=0.05)
+    service = _service(await provider(stub), batch_size=10)
+
+    first, second = await asyncio.gather(
+        service.fetch_prices([a, b]), service.fetch_prices([b, a])
+    )
+
+    assert len(stub.calls) == 1
+    assert first[a].price_usd == second[a].price_usd == 1.0
+    assert first[b].price_usd == second[b].price_usd == 2.0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_rate_limited_request_is_retried(provider, monkeypatch):
+    a = _address(1)
+    stub = StubProvider({a: 1.0}, failures=[(429, {"Retry-After": "0"})])
+    bucket = AsyncTokenBucket(rate=1000, capacity=10)
+    service = _service(await provider(stub), bucket=bucket, api_key="secret")
+
+    quotes = await service.fetch_prices([a])
+
+    assert len(stub.calls) == 2
+    assert quotes[a].price_usd == 1.0
+    assert stub.headers[0]["x-cg-demo-api-key"] == "secret"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries(provider):
+    a = _address(1)
+    stub = StubProvider({a: 1.0}, failures=[(503, {"Retry-After": "0"})] * 3)
+    service = _service(await provider(stub))
+
+    with pytest.raises(PriceFeedError):
+        await service.fetch_prices([a])
+    assert len(stub.calls) == 3
+    # Failed addresses are not left registered as in flight
+    stub.failures = []
+    assert (await service.fetch_prices([a]))[a].price_usd == 1.0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_requests_are_paced_by_the_bucket(provider):
+    addresses = [_address(i) for i in range(3)]
+    stub = StubProvider({a: 1.0 for a in addresses})
+    bucket = Mock(acquire=AsyncMock(), drain=Mock())
+    service = _service(await provider(stub), batch_size=1, bucket=bucket)
+
+    await service.fetch_prices(addresses)
+
+    assert bucket.acquire.await_count == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_collect_maps_quotes_to_tracked_tokens(provider):
+    priced = SimpleNamespace(id=uuid.uuid4(), address=_address(1).upper())
+    unpriced = SimpleNamespace(id=uuid.uuid4(), address=_address(2))
+    stub = StubProvider({_address(1): 42.0})
+    service = _service(await provider(stub), tokens=[priced, unpriced])
+
+    items = await service.collect()
+
+    assert len(items) == 1
+    assert items[0].token_id == priced.id
+    assert items[0].price_usd == 42.0
@@ -0,0 +1,225 @@
+"""Unit tests for TransactionIndexerService."""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.services.transaction_indexer_service import (
+    LENDING_EVENTS,
+    TRANSFER_TOPIC,
+    IndexerNotConfiguredError,
+    TransactionIndexerService,
+    _address_to_topic,
+)
+
+WALLET = "0x" + "ab" * 20
+OTHER = "0x" + "cd" * 20
+TOKEN = "0x" + "11" * 20
+POOL = "0x" + "22" * 20
+
+
+def _transfer(block, log_index, sender, receiver, amount):
+    return {
+        "address": TOKEN,
+        "topics": [
+            TRANSFER_TOPIC,
+            _address_to_topic(sender),
+            _address_to_topic(receiver),
+        ],
+        "data": "0x" + f"{amount:064x}",
+        "transactionHash": bytes.fromhex(f"{block:064x}"),
+        "logIndex": log_index,
+        "blockNumber": block,
+    }
+
+
+class FakeEth:
+    """Minimal async ``w3.eth`` stand-in with a provider result cap."""
+
+    def __init__(self, head, logs, max_range=None):
+        self._head = head
+        self._logs = logs
+        self._max_range = max_range
+        self.calls = []
+
+    @property
+    async def block_number(self):
+        return self._head
+
+    async def get_logs(self, params):
+        start, end = params["fromBlock"], params["toBlock"]
+        self.calls.append((start, end))
+        if self._max_range and end - start + 1 > self._max_range:
+            raise ValueError("query returned more than 10000 results")
+        topics = params["topics"]
+        matched = []
+        for log in self._logs:
+            if not start <= log["blockNumber"] <= end:
+                continue
+            if log["topics"][0] not in (
+                topics[0] if isinstance(topics[0], list) else [topics[0]]
+            ):
+                continue
+            if topics[1] is not None and log["topics"][1] not in topics[1]:
+                continue
+            if len(topics) > 2 and log["topics"][2] not in topics[2]:
+                continue
+            matched.append(log)
+        return matched
+
+    async def get_block(self, number):
+        return {"timestamp": 1_700_000_000 + number}
+
+
+def _config(**overrides):
+    values = dict(
+        INDEXER_CHAIN_ID=1,
+        INDEXER_START_BLOCK=0,
+        INDEXER_INITIAL_LOOKBACK_BLOCKS=100,
+        INDEXER_CHUNK_SIZE=10,
+        INDEXER_CONCURRENCY=2,
+        INDEXER_CONFIRMATIONS=0,
+        INDEXER_MAX_BLOCKS_PER_RUN=1000,
+        INDEXER_LENDING_POOL_ADDRESSES=[],
+        WEB3_PROVIDER_URI=None,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _service(eth, checkpoint=None, config=None, wallets=None):
+    transaction_repo = Mock()
+    transaction_repo.bulk_upsert = AsyncMock(side_effect=lambda rows: len(rows))
+    checkpoint_repo = Mock()
+    checkpoint_repo.get = AsyncMock(return_value=checkpoint)
+    checkpoint_repo.save = AsyncMock()
+    wallet_repo = Mock()
+    wallet_id = uuid.uuid4()
+    wallet_repo.list_tracked = AsyncMock(
+        return_value=wallets
+        if wallets is not None
+        else [SimpleNamespace(id=wallet_id, address=WALLET.upper().replace("X", "x"))]
+    )
+    token_repo = Mock()
+    token_repo.get_by_addresses = AsyncMock(
+        return_value={TOKEN: SimpleNamespace(id=uuid.uuid4(), decimals=6)}
+    )
+    service = TransactionIndexerService(
+        transaction_repo,
+        checkpoint_repo,
+        wallet_repo,
+        token_repo,
+        config or _config(),
+        Mock(),
+        web3=SimpleNamespace(eth=eth),
+    )
+    return service, transaction_repo, checkpoint_repo, wallet_id
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_indexes_transfers_and_checkpoints_each_window():
+    eth = FakeEth(
+        head=45,
+        logs=[
+            _transfer(3, 0, OTHER, WALLET, 2_500_000),
+            _transfer(31, 4, WALLET, OTHER, 1_000_000),
+            _transfer(32, 1, OTHER, OTHER, 1),
+        ],
+    )
+    service, tx_repo, cp_repo, wallet_id = _service(eth)
+
+    result = await service.run()
+
+    assert (result.from_block, result.to_block) == (0, 45)
+    assert result.transactions == 2
+    rows = [r for call in tx_repo.bulk_upsert.await_args_list for r in call.args[0]]
+    by_type = {r["type"]: r for r in rows}
+    assert str(by_type["IN"]["amount"]) == "2.50000000"
+    assert by_type["OUT"]["from_address"] == WALLET
+    assert all(r["wallet_id"] == wallet_id for r in rows)
+    assert by_type["IN"]["extra_metadata"]["block_number"] == 3
+    # window = chunk (10) * concurrency (2) blocks
+    saved = [c.args[1] for c in cp_repo.save.await_args_list]
+    assert saved == [19, 39, 45]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_resumes_after_checkpoint():
+    eth = FakeEth(head=30, logs=[_transfer(5, 0, OTHER, WALLET, 1)])
+    service, tx_repo, _, _ = _service(eth, checkpoint=SimpleNamespace(last_block=20))
+
+    result = await service.run()
+
+    assert result.from_block == 21
+    assert result.transactions == 0
+    assert all(start >= 21 for start, _ in eth.calls)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_capped_ranges_are_bisected():
+    eth = FakeEth(head=9, logs=[_transfer(7, 0, OTHER, WALLET, 10**6)], max_range=3)
+    service, _, _, _ = _service(eth)
+
+    result = await service.run()
+
+    assert result.transactions == 1
+    assert max(end - start + 1 for start, end in eth.calls) == 10
+    successful = [(s, e) for s, e in eth.calls if e - s + 1 <= 3]
+    covered = sorted(b for s, e in successful for b in range(s, e + 1))
+    assert set(covered) == set(range(0, 10))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_lending_events_are_indexed():
+    supply_topic = next(
+        t for t, (kind, _) in LENDING_EVENTS.items() if kind == "SUPPLY"
+    )
+    log = {
+        "address": POOL,
+        "topics": [supply_topic, _address_to_topic(TOKEN), _address_to_topic(WALLET)],
+        "data": "0x" + f"{int(WALLET, 16):064x}" + f"{3_000_000:064x}",
+        "transactionHash": "0x" + "ee" * 32,
+        "logIndex": 2,
+        "blockNumber": 4,
+    }
+    eth = FakeEth(head=5, logs=[log])
+    service, tx_repo, _, _ = _service(
+        eth, config=_config(INDEXER_LENDING_POOL_ADDRESSES=[POOL])
+    )
+
+    await service.run()
+
+    rows = tx_repo.bulk_upsert.await_args_list[0].args[0]
+    assert len(rows) == 1
+    assert rows[0]["type"] == "SUPPLY"
+    assert str(rows[0]["amount"]) == "3.00000000"
+    assert rows[0]["to_address"] == POOL
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_backfill_uses_its_own_checkpoint_stream():
+    eth = FakeEth(head=1000, logs=[])
+    service, _, cp_repo, _ = _service(eth)
+
+    result = await service.backfill(100, 500, max_blocks=50)
+
+    assert result.stream == "backfill-100"
+    assert (result.from_block, result.to_block) == (100, 149)
+    cp_repo.get.assert_awaited_once_with(1, "backfill-100")
+    assert cp_repo.save.await_args_list[-1].args == (1, 149, "backfill-100")
+
+
+@pytest.mark.unit
+def test_missing_provider_raises():
+    service = TransactionIndexerService(
+        Mock(), Mock(), Mock(), Mock(), _config(), Mock()
+    )
+    with pytest.raises(IndexerNotConfiguredError):
+        service._get_web3()
@@ -0,0 +1,68 @@
+"""Sign/verify cost per asymmetric algorithm on pre-parsed key objects.
+
+Compares RS256, ES256 and EdDSA for :func:`app.utils.jws.encode` and
+:meth:`AsymmetricKey.verify`; ``test_jose_rs256_decode_reference`` is the
+previous python-jose path, which re-parses the PEM on every call. Run with
+``pytest tests/infrastructure/utils/performance --benchmark-only``.
+"""
+
+import base64
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from jose import jwt
+
+from app.utils import jws
+
+pytestmark = pytest.mark.performance
+
+_CLAIMS = {"sub": "bench", "type": "access", "roles": ["individual_investor"]}
+
+
+def _pem(private_key):
+    return private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+
+@pytest.fixture(scope="module")
+def keys():
+    return {
+        "RS256": _pem(rsa.generate_private_key(65537, 2048)),
+        "ES256": _pem(ec.generate_private_key(ec.SECP256R1())),
+        "EdDSA": _pem(ed25519.Ed25519PrivateKey.generate()),
+    }
+
+
+@pytest.mark.parametrize("alg", ["RS256", "ES256", "EdDSA"])
+@pytest.mark.benchmark(group="jws-sign")
+def test_sign(benchmark, keys, alg):
+    key = jws.prepare_key(keys[alg], alg)
+    token = benchmark(jws.encode, _CLAIMS, key)
+    assert token.count(".") == 2
+
+
+@pytest.mark.parametrize("alg", ["RS256", "ES256", "EdDSA"])
+@pytest.mark.benchmark(group="jws-verify")
+def test_verify(benchmark, keys, alg):
+    key = jws.prepare_key(keys[alg], alg)
+    signing_input, signature = jws.encode(_CLAIMS, key).rsplit(".", 1)
+    sig = base64.urlsafe_b64decode(signature + "=" * (-len(signature) % 4))
+    assert benchmark(key.verify, signing_input.encode(), sig)
+
+
+@pytest.mark.benchmark(group="jws-verify")
+def test_jose_rs256_decode_reference(benchmark, keys):
+    public_pem = (
+        jws.load_key(keys["RS256"])
+        .public_key()
+        .public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+    )
+    token = jws.encode(_CLAIMS, jws.prepare_key(keys["RS256"], "RS256"))
+    claims = benchmark(jwt.decode, token, public_pem.decode(), ["RS256"])
+    assert claims == _CLAIMS
@@ -0,0 +1,58 @@
+"""Microbenchmark of access-token verification.
+
+``test_decode_token`` measures :meth:`JWTUtils.decode_token`;
+``test_decode_and_reencode_reference`` reproduces the previous approach
+(``jwt.decode`` followed by a full ``jwt.encode`` to compare signatures)
+for comparison. Run with
+``pytest tests/infrastructure/utils/performance --benchmark-only``.
+"""
+
+import uuid
+
+import pytest
+from jose import jwt
+
+from app.core.config import Configuration
+from app.domain.schemas.jwt import JWTPayload
+from app.utils.jwt import JWTUtils
+from app.utils.logging import Audit
+
+pytestmark = pytest.mark.performance
+
+
+@pytest.fixture(scope="module")
+def jwt_utils():
+    config = Configuration(
+        JWT_ALGORITHM="HS256",
+        JWT_KEYS={"bench": "benchmark-secret"},
+        ACTIVE_JWT_KID="bench",
+    )
+    return JWTUtils(config, Audit())
+
+
+@pytest.fixture(scope="module")
+def token(jwt_utils):
+    return jwt_utils.create_access_token(
+        str(uuid.uuid4()),
+        additional_claims={"roles": ["individual_investor"], "attributes": {}},
+    )
+
+
+@pytest.mark.benchmark(group="jwt-decode")
+def test_decode_token(benchmark, jwt_utils, token):
+    payload = benchmark(jwt_utils.decode_token, token)
+    assert payload["type"] == "access"
+
+
+@pytest.mark.benchmark(group="jwt-decode")
+def test_decode_and_reencode_reference(benchmark, token):
+    def decode():
+        payload = jwt.decode(token, "benchmark-secret", algorithms=["HS256"])
+        recomputed = jwt.encode(
+            payload, "benchmark-secret", algorithm="HS256", headers={"kid": "bench"}
+        )
+        assert recomputed.split(".")[2] == token.split(".")[2]
+        return JWTPayload.model_validate(payload).model_dump(mode="json")
+
+    payload = benchmark(decode)
+    assert payload["type"] == "access"
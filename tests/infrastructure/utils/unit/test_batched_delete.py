@@ -0,0 +1,41 @@
+"""Unit tests for bounded DELETE statements."""
+
+import pytest
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.models.password_reset import PasswordReset
+from app.utils.batched_delete import build_batch_delete
+
+_TABLE = PasswordReset.__table__
+_EXPIRED = PasswordReset.used.is_(True)
+
+
+def _sql(dialect, name):
+    stmt = build_batch_delete(name, _TABLE, _EXPIRED, 500)
+    return str(stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.unit
+def test_postgres_deletes_by_ctid():
+    sql = " ".join(_sql(postgresql.dialect(), "postgresql").split())
+
+    assert sql == (
+        "DELETE FROM password_reset_tokens WHERE ctid IN "
+        "(SELECT ctid FROM password_reset_tokens "
+        "WHERE password_reset_tokens.used IS true LIMIT 500)"
+    )
+
+
+@pytest.mark.unit
+def test_sqlite_deletes_by_rowid():
+    sql = " ".join(_sql(sqlite.dialect(), "sqlite").split())
+
+    assert "WHERE rowid IN (SELECT rowid FROM password_reset_tokens" in sql
+    assert "LIMIT 500" in sql
+
+
+@pytest.mark.unit
+def test_other_dialects_delete_by_primary_key():
+    sql = " ".join(_sql(postgresql.dialect(), "mysql").split())
+
+    assert "WHERE password_reset_tokens.id IN (SELECT password_reset_tokens.id" in sql
@@ -1,4 +1,5 @@
 """Unit tests for JWKS cache utilities."""
+import asyncio
 import json
 from unittest.mock import AsyncMock, patch
 
@@ -6,7 +7,12 @@ import pytest
 
 from app.core.config import Configuration
 from app.domain.schemas.jwks import JWK, JWKSet
-from app.utils.jwks_cache import JWKS_CACHE_KEY, JWKSCacheUtils
+from app.utils.jwks_cache import (
+    JWKS_CACHE_KEY,
+    JWKSCacheUtils,
+    JWKSDocument,
+    serialize_jwks,
+)
 
 
 @pytest.fixture
@@ -36,6 +42,9 @@ class _MockConfig:
     def __init__(self):
         self.redis_url = "redis://localhost:6379/15"
         self.JWKS_CACHE_TTL_SEC = 3600
+        self.JWKS_MAX_AGE_SEC = 300
+        self.JWKS_LOCAL_TTL_SEC = 60
+        self.JWKS_CHANNEL = "jwks:invalidate"
 
 
 class TestJWKSCacheUtils:
@@ -105,7 +114,7 @@ class TestJWKSCacheUtils:
         assert call_args[0][1] == 3600  # Default TTL from settings
         # Verify the serialized data is valid JSON
         stored_data = json.loads(call_args[0][2])
-        assert stored_data["keys"] == sample_jwks.model_dump()["keys"]
+        assert stored_data["keys"] == sample_jwks.model_dump(exclude_none=True)["keys"]
 
     @pytest.mark.asyncio
     @pytest.mark.unit
@@ -158,6 +167,7 @@ class TestJWKSCacheUtils:
 
         assert result is True
         mock_redis.delete.assert_called_once_with(JWKS_CACHE_KEY)
+        mock_redis.publish.assert_awaited_once_with("jwks:invalidate", "invalidate")
 
     @pytest.mark.asyncio
     @pytest.mark.unit
@@ -188,6 +198,8 @@ class TestJWKSCacheUtils:
         # *tests/integration/api/test_jwks_metrics.py*.
         assert result is False
         mock_redis.delete.assert_called_once_with(JWKS_CACHE_KEY)
+        # Processes may still hold a local copy
+        mock_redis.publish.assert_awaited_once()
 
     @patch("app.utils.jwks_cache.Redis")
     @pytest.mark.unit
@@ -233,3 +245,87 @@ class TestJWKSCacheUtils:
             result = jwks_cache_utils.invalidate_jwks_cache_sync()
 
             assert result is False
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_get_jwks_body_returns_raw_bytes(
+        self, mock_redis, sample_jwks, jwks_cache_utils
+    ):
+        mock_redis.get.return_value = serialize_jwks(sample_jwks).decode()
+
+        assert await jwks_cache_utils.get_jwks_body(mock_redis) == serialize_jwks(
+            sample_jwks
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_get_jwks_body_miss_and_error(self, mock_redis, jwks_cache_utils):
+        mock_redis.get.side_effect = [None, Exception("Redis down")]
+
+        assert await jwks_cache_utils.get_jwks_body(mock_redis) is None
+        assert await jwks_cache_utils.get_jwks_body(mock_redis) is None
+
+    @pytest.mark.unit
+    def test_local_document_expires_and_clears(self, jwks_cache_utils):
+        with patch("app.utils.jwks_cache.time.monotonic", return_value=100.0):
+            document = jwks_cache_utils.set_local(b'{"keys":[]}')
+            assert jwks_cache_utils.get_local() is document
+        assert document.max_age == 300
+
+        with patch("app.utils.jwks_cache.time.monotonic", return_value=161.0):
+            assert jwks_cache_utils.get_local() is None
+
+        with patch("app.utils.jwks_cache.time.monotonic", return_value=100.0):
+            jwks_cache_utils.clear_local()
+            assert jwks_cache_utils.get_local() is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_invalidation_message_drops_local_document(self, jwks_cache_utils):
+        messages = [
+            {"type": "subscribe", "data": 1},
+            {"type": "message", "data": b"invalidate"},
+        ]
+        seen = []
+
+        async def listen():
+            for message in messages:
+                seen.append(jwks_cache_utils.get_local())
+                yield message
+            raise asyncio.CancelledError
+
+        pubsub = AsyncMock()
+        pubsub.listen = listen
+        redis = AsyncMock()
+        redis.pubsub = lambda: pubsub
+        jwks_cache_utils._redis_client = redis
+
+        with patch.object(jwks_cache_utils, "clear_local") as clear_local:
+            with pytest.raises(asyncio.CancelledError):
+                await jwks_cache_utils._listen()
+
+        pubsub.subscribe.assert_awaited_once_with("jwks:invalidate")
+        # Once on (re)subscribe, once for the message
+        assert clear_local.call_count == 2
+
+
+@pytest.mark.unit
+def test_document_etag_is_strong_and_content_addressed(sample_jwks):
+    document = JWKSDocument.from_jwks(sample_jwks, 300)
+    other = JWKSDocument.from_jwks(JWKSet(keys=[]), 300)
+
+    assert document.body == serialize_jwks(sample_jwks)
+    assert document.etag.startswith('"') and document.etag.endswith('"')
+    assert document.etag == JWKSDocument.from_jwks(sample_jwks, 300).etag
+    assert document.etag != other.etag
+
+
+@pytest.mark.unit
+def test_document_matches_if_none_match(sample_jwks):
+    document = JWKSDocument.from_jwks(sample_jwks, 300)
+
+    assert document.matches(document.etag)
+    assert document.matches(f'"stale", W/{document.etag}')
+    assert document.matches("*")
+    assert not document.matches('"stale"')
+    assert not document.matches(None)
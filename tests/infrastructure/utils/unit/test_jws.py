@@ -0,0 +1,134 @@
+"""Unit tests for asymmetric JWS signing in app.utils.jws."""
+
+import base64
+import json
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from jose import jwt
+
+from app.domain.schemas.jwks import JWK
+from app.utils import jws
+
+
+def _pem(private_key, public=False):
+    if public:
+        return private_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+    return private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+
+_KEYS = {
+    "RS256": rsa.generate_private_key(public_exponent=65537, key_size=2048),
+    "ES256": ec.generate_private_key(ec.SECP256R1()),
+    "ES384": ec.generate_private_key(ec.SECP384R1()),
+    "EdDSA": ed25519.Ed25519PrivateKey.generate(),
+}
+
+
+def _segments(token):
+    return [
+        json.loads(base64.urlsafe_b64decode(part + "=" * (-len(part) % 4)))
+        for part in token.split(".")[:2]
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("alg", sorted(_KEYS))
+def test_sign_and_verify_round_trip(alg):
+    private = jws.prepare_key(_pem(_KEYS[alg]), alg)
+    public = jws.prepare_key(_pem(_KEYS[alg], public=True), alg)
+
+    token = jws.encode({"sub": "alice"}, private, {"kid": "k1"})
+    header, claims = _segments(token)
+    signing_input, signature = token.rsplit(".", 1)
+
+    assert header == {"alg": alg, "typ": "JWT", "kid": "k1"}
+    assert claims == {"sub": "alice"}
+    sig = base64.urlsafe_b64decode(signature + "=" * (-len(signature) % 4))
+    assert public.verify(signing_input.encode(), sig)
+    assert not public.verify(signing_input.encode() + b"x", sig)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("alg", ["RS256", "ES256"])
+def test_tokens_interoperate_with_python_jose(alg):
+    token = jws.encode({"sub": "alice"}, jws.prepare_key(_pem(_KEYS[alg]), alg))
+
+    decoded = jwt.decode(token, _pem(_KEYS[alg], public=True).decode(), [alg])
+
+    assert decoded == {"sub": "alice"}
+
+
+@pytest.mark.unit
+def test_es256_rejects_wrong_signature_length():
+    key = jws.prepare_key(_pem(_KEYS["ES256"], public=True), "ES256")
+
+    assert not key.verify(b"msg", b"\x00" * 63)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "alg,material",
+    [("ES256", "RS256"), ("ES256", "ES384"), ("EdDSA", "ES256"), ("RS256", "EdDSA")],
+)
+def test_key_must_match_algorithm(alg, material):
+    with pytest.raises(ValueError, match="does not match"):
+        jws.prepare_key(_pem(_KEYS[material]), alg)
+
+
+@pytest.mark.unit
+def test_public_key_cannot_sign():
+    key = jws.prepare_key(_pem(_KEYS["EdDSA"], public=True), "EdDSA")
+
+    with pytest.raises(ValueError, match="private key"):
+        jws.encode({"sub": "alice"}, key)
+
+
+@pytest.mark.unit
+def test_keys_are_parsed_once():
+    pem = _pem(_KEYS["ES256"])
+
+    assert jws.prepare_key(pem, "ES256") is jws.prepare_key(pem, "ES256")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "alg,kty,extra",
+    [
+        ("RS256", "RSA", {"n", "e"}),
+        ("ES256", "EC", {"crv", "x", "y"}),
+        ("ES384", "EC", {"crv", "x", "y"}),
+        ("EdDSA", "OKP", {"crv", "x"}),
+    ],
+)
+def test_public_jwk_shapes(alg, kty, extra):
+    jwk = jws.public_jwk(_pem(_KEYS[alg], public=True), "k1")
+
+    assert jwk["kty"] == kty
+    assert jwk["alg"] == alg
+    assert set(jwk) == {"kty", "use", "kid", "alg"} | extra
+    JWK(**jwk)
+
+
+@pytest.mark.unit
+def test_public_jwk_from_private_key_has_no_private_members():
+    jwk = jws.public_jwk(_pem(_KEYS["ES256"]), "k1")
+
+    assert "d" not in jwk
+    assert jwk == jws.public_jwk(_pem(_KEYS["ES256"], public=True), "k1")
+
+
+@pytest.mark.unit
+def test_public_jwk_pads_ec_coordinates():
+    jwk = jws.public_jwk(_pem(_KEYS["ES384"], public=True), "k1")
+
+    for member in ("x", "y"):
+        assert len(base64.urlsafe_b64decode(jwk[member] + "==")) == 48
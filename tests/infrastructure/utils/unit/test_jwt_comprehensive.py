@@ -5,7 +5,10 @@ from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
-from jose import ExpiredSignatureError, JWSError, JWTError
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from jose import ExpiredSignatureError, JWTError, jwk, jwt
+from jose.exceptions import JWTClaimsError
 
 from app.core.config import Configuration
 from app.utils.jwt import (
@@ -18,6 +21,25 @@ from app.utils.jwt import (
 from app.utils.logging import Audit
 
 
+def _claims(**overrides):
+    now = int(datetime.now(timezone.utc).timestamp())
+    claims = {
+        "sub": str(uuid.uuid4()),
+        "jti": "token123",
+        "iat": now,
+        "exp": now + 3600,
+        "type": "access",
+        "roles": ["user"],
+        "attributes": {},
+    }
+    claims.update(overrides)
+    return claims
+
+
+def _signed(claims, key="secret1", kid="kid1", alg="HS256"):
+    return jwt.encode(claims, key, algorithm=alg, headers={"kid": kid})
+
+
 @pytest.fixture
 def mock_config():
     """Return a mocked Configuration instance."""
@@ -112,7 +134,7 @@ class TestJWTUtils:
     @pytest.mark.unit
     def test_get_sign_key_unsupported_algorithm(self, mock_config):
         """Test _get_sign_key with unsupported algorithm."""
-        mock_config.JWT_ALGORITHM = "ES256"
+        mock_config.JWT_ALGORITHM = "PS256"
 
         jwt_utils = JWTUtils(mock_config, Audit())
         with pytest.raises(RuntimeError, match="Unsupported JWT_ALGORITHM"):
@@ -176,7 +198,7 @@ class TestJWTUtils:
     @pytest.mark.unit
     def test_get_verify_key_unsupported_algorithm(self, mock_config):
         """Test _get_verify_key with unsupported algorithm."""
-        mock_config.JWT_ALGORITHM = "ES256"
+        mock_config.JWT_ALGORITHM = "PS256"
 
         jwt_utils = JWTUtils(mock_config, Audit())
         with pytest.raises(RuntimeError, match="Unsupported JWT_ALGORITHM"):
@@ -284,79 +306,47 @@ class TestJWTUtils:
         assert payload["type"] == "refresh"
         assert payload["sub"] == "user123"
 
-    @patch("app.utils.jwt.jwt.decode")
-    @patch("app.utils.jwt.jwt.get_unverified_header")
     @pytest.mark.unit
-    def test_decode_token_success(self, mock_get_header, mock_decode, mock_config):
+    def test_decode_token_success(self, mock_config):
         """Test successful token decoding."""
-        mock_config.JWT_ALGORITHM = "HS256"
         mock_config.JWT_KEYS = {"kid1": "secret1"}
-        mock_get_header.return_value = {"kid": "kid1"}
-
-        # Create a valid payload that matches the JWTPayload schema
         user_id = str(uuid.uuid4())
         now = int(datetime.now(timezone.utc).timestamp())
-        mock_decode.return_value = {
-            "sub": user_id,
-            "jti": "token123",
-            "iat": now,
-            "exp": now + 3600,  # 1 hour in the future
-            "type": "access",
-            "roles": ["user"],
-            "attributes": {},
-        }
 
         jwt_utils = JWTUtils(mock_config, Audit())
-        result = jwt_utils.decode_token("valid_token")
+        result = jwt_utils.decode_token(
+            _signed(_claims(sub=user_id, iat=now, exp=now + 3600))
+        )
 
         assert result["sub"] == user_id
         assert result["jti"] == "token123"
         assert result["exp"] == now + 3600
-        mock_get_header.assert_called_once_with("valid_token")
-        mock_decode.assert_called_once()
+        assert result["roles"] == ["user"]
 
-    @patch("app.utils.jwt.jwt.decode")
-    @patch("app.utils.jwt.jwt.get_unverified_header")
     @pytest.mark.unit
-    def test_decode_token_expired_signature(
-        self, mock_get_header, mock_decode, mock_config
-    ):
+    def test_decode_token_expired_signature(self, mock_config):
         """Test token decoding with expired signature."""
-        mock_config.JWT_ALGORITHM = "HS256"
         mock_config.JWT_KEYS = {"kid1": "secret1"}
-        mock_get_header.return_value = {"kid": "kid1"}
-        mock_decode.side_effect = ExpiredSignatureError("Token expired")
+        now = int(datetime.now(timezone.utc).timestamp())
 
         jwt_utils = JWTUtils(mock_config, Audit())
-        with pytest.raises(ExpiredSignatureError, match="Token expired"):
-            jwt_utils.decode_token("expired_token")
+        with pytest.raises(ExpiredSignatureError, match="Signature has expired"):
+            jwt_utils.decode_token(_signed(_claims(exp=now - 10)))
 
-    @patch("app.utils.jwt.jwt.decode")
-    @patch("app.utils.jwt.jwt.get_unverified_header")
     @pytest.mark.unit
-    def test_decode_token_jwt_error(self, mock_get_header, mock_decode, mock_config):
-        """Test token decoding with JWT error."""
-        mock_config.JWT_ALGORITHM = "HS256"
+    def test_decode_token_jwt_error(self, mock_config):
+        """Test token decoding with a malformed token."""
         mock_config.JWT_KEYS = {"kid1": "secret1"}
-        mock_get_header.return_value = {"kid": "kid1"}
-        mock_decode.side_effect = JWTError("Invalid token")
 
         jwt_utils = JWTUtils(mock_config, Audit())
-        with pytest.raises(JWTError, match="Invalid token"):
+        with pytest.raises(JWTError, match="Invalid token format"):
             jwt_utils.decode_token("invalid_token")
 
-    @patch("app.utils.jwt.jwt.decode")
-    @patch("app.utils.jwt.jwt.get_unverified_header")
     @patch("app.utils.jwt._now_utc")
     @pytest.mark.unit
-    def test_decode_token_with_retired_keys(
-        self, mock_now_utc, mock_get_header, mock_decode, mock_config
-    ):
+    def test_decode_token_with_retired_keys(self, mock_now_utc, mock_config):
         """Test token decoding with retired keys."""
-        mock_config.JWT_ALGORITHM = "HS256"
         mock_config.JWT_KEYS = {"kid1": "secret1", "kid2": "secret2"}
-        mock_get_header.return_value = {"kid": "kid2"}
-        mock_decode.return_value = {"sub": "user123", "type": "access"}
 
         # Set up retired key with expiry in the past
         past_time = datetime.now(timezone.utc) - timedelta(days=1)
@@ -367,186 +357,144 @@ class TestJWTUtils:
         with pytest.raises(
             ExpiredSignatureError, match="Token signed with retired key"
         ):
-            jwt_utils.decode_token("token_with_retired_key")
+            jwt_utils.decode_token(_signed(_claims(), key="secret2", kid="kid2"))
 
-    @patch("app.utils.jwt.jwt.encode")
-    @patch("app.utils.jwt.jwt.decode")
-    @patch("app.utils.jwt.jwt.get_unverified_header")
     @pytest.mark.unit
-    def test_decode_token_with_jwk_error_and_retry(
-        self, mock_get_header, mock_decode, mock_encode, mock_config
-    ):
-        """Test token decoding with successful decode on first try."""
-        mock_config.JWT_ALGORITHM = "HS256"
+    def test_decode_token_reuses_key_objects(self, mock_config):
+        """Test verification keys are built once and reused across tokens."""
         mock_config.JWT_KEYS = {"kid1": "secret1", "kid2": "secret2"}
-        mock_get_header.return_value = {"kid": "kid1"}
 
-        # Create a valid payload that matches the JWTPayload schema
-        user_id = str(uuid.uuid4())
-        now = int(datetime.now(timezone.utc).timestamp())
-        valid_payload = {
-            "sub": user_id,
-            "jti": "token123",
-            "iat": now,
-            "exp": now + 3600,  # 1 hour in the future
-            "type": "access",
-            "roles": ["user"],
-            "attributes": {},
-        }
+        tokens = [_signed(_claims()) for _ in range(3)]
+        tokens.append(_signed(_claims(), key="secret2", kid="kid2"))
 
-        # Successful decode on first try
-        mock_decode.return_value = valid_payload
+        jwt_utils = JWTUtils(mock_config, Audit())
+        with patch("app.utils.jwt.jwk.construct", wraps=jwk.construct) as construct:
+            for token in tokens:
+                jwt_utils.decode_token(token)
 
-        # Mock the encode method to return a consistent signature for verification
-        mock_encode.return_value = "header.payload.signature"
+        assert construct.call_count == 2
 
+    @pytest.mark.unit
+    def test_decode_token_picks_up_changed_key_material(self, mock_config):
+        """Test a replaced key under the same kid is not served from cache."""
+        mock_config.JWT_KEYS = {"kid1": "secret1"}
         jwt_utils = JWTUtils(mock_config, Audit())
-        result = jwt_utils.decode_token("header.payload.signature")
+        token = _signed(_claims())
+        jwt_utils.decode_token(token)
 
-        assert result["sub"] == user_id
-        assert result["jti"] == "token123"
-        assert result["exp"] == now + 3600
-        assert mock_decode.call_count == 1
+        mock_config.JWT_KEYS = {"kid1": "replaced"}
+
+        with pytest.raises(JWTError, match="Signature verification failed"):
+            jwt_utils.decode_token(token)
 
-    @patch("app.utils.jwt.jwt.decode")
-    @patch("app.utils.jwt.jwt.get_unverified_header")
     @pytest.mark.unit
-    def test_decode_token_all_keys_fail(
-        self, mock_get_header, mock_decode, mock_config
-    ):
-        """Test token decoding when all keys fail."""
-        mock_config.JWT_ALGORITHM = "HS256"
-        mock_config.JWT_KEYS = {"kid1": "secret1", "kid2": "secret2"}
-        mock_get_header.return_value = {"kid": "kid1"}
-        # Both original and alternate key representations fail
-        mock_decode.side_effect = JWSError("JWK error")
+    def test_decode_token_rejects_other_algorithms(self, mock_config):
+        """Test the token header cannot choose the verification algorithm."""
+        mock_config.JWT_KEYS = {"kid1": "secret1"}
 
         jwt_utils = JWTUtils(mock_config, Audit())
-        with pytest.raises(JWSError, match="JWK error"):
-            jwt_utils.decode_token("token_with_all_keys_failing")
+        with pytest.raises(JWTError, match="alg value is not allowed"):
+            jwt_utils.decode_token(_signed(_claims(), alg="HS512"))
 
-    @patch("app.utils.jwt.jwt.encode")
-    @patch("app.utils.jwt.jwt.decode")
-    @patch("app.utils.jwt.jwt.get_unverified_header")
     @pytest.mark.unit
-    def test_decode_token_signature_verification_failure(
-        self, mock_get_header, mock_decode, mock_encode, mock_config
-    ):
-        """Test token decoding with signature verification failure during re-encoding check."""
-        mock_config.JWT_ALGORITHM = "HS256"
+    def test_decode_token_signature_verification_failure(self, mock_config):
+        """Test token decoding with a token signed by another secret."""
         mock_config.JWT_KEYS = {"kid1": "secret1"}
-        mock_get_header.return_value = {"kid": "kid1"}
-
-        # Valid payload for initial decode
-        user_id = str(uuid.uuid4())
-        now = int(datetime.now(timezone.utc).timestamp())
-        valid_payload = {
-            "sub": user_id,
-            "jti": "token123",
-            "iat": now,
-            "exp": now + 3600,
-            "type": "access",
-            "roles": ["user"],
-            "attributes": {},
-        }
-        mock_decode.return_value = valid_payload
-
-        # Mock encode to return a different signature to trigger verification failure
-        mock_encode.return_value = "header.payload.different_signature"
 
         jwt_utils = JWTUtils(mock_config, Audit())
         with pytest.raises(JWTError, match="Signature verification failed"):
-            jwt_utils.decode_token("header.payload.original_signature")
+            jwt_utils.decode_token(_signed(_claims(), key="not-the-secret"))
 
-    @patch("app.utils.jwt.jwt.decode")
-    @patch("app.utils.jwt.jwt.get_unverified_header")
     @pytest.mark.unit
-    def test_decode_token_missing_sub_claim(
-        self, mock_get_header, mock_decode, mock_config
-    ):
+    def test_decode_token_missing_sub_claim(self, mock_config):
         """Test token decoding with missing sub claim."""
-        mock_config.JWT_ALGORITHM = "HS256"
         mock_config.JWT_KEYS = {"kid1": "secret1"}
-        mock_get_header.return_value = {"kid": "kid1"}
-
-        # Create an invalid payload without the required 'sub' field
-        now = int(datetime.now(timezone.utc).timestamp())
-        mock_decode.return_value = {
-            "jti": "token123",
-            "iat": now,
-            "exp": now + 3600,
-            "type": "access",
-        }  # Missing 'sub'
+        claims = _claims()
+        del claims["sub"]
 
         jwt_utils = JWTUtils(mock_config, Audit())
         with pytest.raises(
             JWTError, match="Token payload is missing required 'sub' claim"
         ):
-            jwt_utils.decode_token("token_missing_sub")
+            jwt_utils.decode_token(_signed(claims))
 
-    @patch("app.utils.jwt.jwt.decode")
-    @patch("app.utils.jwt.jwt.get_unverified_header")
     @pytest.mark.unit
-    def test_decode_token_empty_sub_claim(
-        self, mock_get_header, mock_decode, mock_config
-    ):
+    def test_decode_token_empty_sub_claim(self, mock_config):
         """Test token decoding with empty sub claim."""
-        mock_config.JWT_ALGORITHM = "HS256"
         mock_config.JWT_KEYS = {"kid1": "secret1"}
-        mock_get_header.return_value = {"kid": "kid1"}
-
-        # Create an invalid payload with empty 'sub' field
-        now = int(datetime.now(timezone.utc).timestamp())
-        mock_decode.return_value = {
-            "sub": "",  # Empty 'sub'
-            "jti": "token123",
-            "iat": now,
-            "exp": now + 3600,
-            "type": "access",
-        }
 
         jwt_utils = JWTUtils(mock_config, Audit())
         with pytest.raises(
             JWTError, match="Token payload is missing required 'sub' claim"
         ):
-            jwt_utils.decode_token("token_empty_sub")
+            jwt_utils.decode_token(_signed(_claims(sub="")))
 
-    @patch("app.utils.jwt.jwt.encode")
-    @patch("app.utils.jwt.jwt.decode")
-    @patch("app.utils.jwt.jwt.get_unverified_header")
     @pytest.mark.unit
-    def test_decode_token_fallback_to_default_key(
-        self, mock_get_header, mock_decode, mock_encode, mock_config
-    ):
+    def test_decode_token_missing_jti_claim(self, mock_config):
+        """Test token decoding with missing jti claim."""
+        mock_config.JWT_KEYS = {"kid1": "secret1"}
+        claims = _claims()
+        del claims["jti"]
+
+        jwt_utils = JWTUtils(mock_config, Audit())
+        with pytest.raises(JWTClaimsError, match='missing required key "jti"'):
+            jwt_utils.decode_token(_signed(claims))
+
+    @pytest.mark.unit
+    def test_decode_token_fallback_to_default_key(self, mock_config):
         """Test token decoding with fallback to default key when kid not found."""
-        mock_config.JWT_ALGORITHM = "HS256"
         mock_config.JWT_KEYS = {"kid1": "secret1"}
         mock_config.ACTIVE_JWT_KID = "kid1"
-        mock_get_header.return_value = {"kid": "unknown_kid"}
-
-        # Create a valid payload that matches the JWTPayload schema
         user_id = str(uuid.uuid4())
-        now = int(datetime.now(timezone.utc).timestamp())
-        valid_payload = {
-            "sub": user_id,
-            "jti": "token123",
-            "iat": now,
-            "exp": now + 3600,  # 1 hour in the future
-            "type": "access",
-            "roles": ["user"],
-            "attributes": {},
-        }
 
-        # When unknown kid is used, it should fallback to the verify key which uses the first key
-        mock_decode.return_value = valid_payload
-        mock_encode.return_value = "header.payload.signature"
+        jwt_utils = JWTUtils(mock_config, Audit())
+        result = jwt_utils.decode_token(
+            _signed(_claims(sub=user_id), kid="unknown_kid")
+        )
+
+        assert result["sub"] == user_id
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "alg,private_key",
+        [
+            ("RS256", lambda: rsa.generate_private_key(65537, 2048)),
+            ("ES256", lambda: ec.generate_private_key(ec.SECP256R1())),
+            ("EdDSA", ed25519.Ed25519PrivateKey.generate),
+        ],
+    )
+    def test_asymmetric_token_round_trip(self, alg, private_key, mock_config, tmp_path):
+        """Asymmetric tokens are signed and verified with the configured keys."""
+        key = private_key()
+        private_path = tmp_path / "private.pem"
+        public_path = tmp_path / "public.pem"
+        private_path.write_bytes(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+        public_path.write_bytes(
+            key.public_key().public_bytes(
+                serialization.Encoding.PEM,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+        )
+        mock_config.JWT_ALGORITHM = alg
+        mock_config.JWT_PRIVATE_KEY_PATH = str(private_path)
+        mock_config.JWT_PUBLIC_KEY_PATH = str(public_path)
+        user_id = str(uuid.uuid4())
 
         jwt_utils = JWTUtils(mock_config, Audit())
-        result = jwt_utils.decode_token("header.payload.signature")
+        token = jwt_utils.create_access_token(user_id)
+        result = jwt_utils.decode_token(token)
 
+        assert jwt.get_unverified_header(token)["alg"] == alg
         assert result["sub"] == user_id
-        assert result["jti"] == "token123"
-        assert result["exp"] == now + 3600
+        tampered = token[:-4] + ("AAAA" if token[-4:] != "AAAA" else "BBBB")
+        with pytest.raises(JWTError):
+            jwt_utils.decode_token(tampered)
 
     @pytest.mark.unit
     def test_load_key_success(self, mock_config):
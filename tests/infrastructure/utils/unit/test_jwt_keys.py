@@ -6,8 +6,11 @@ from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
 import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
 
-from app.utils.jwt_keys import JWTKeyUtils, _b64url_uint
+from app.utils.jws import b64url_uint
+from app.utils.jwt_keys import JWTKeyUtils
 
 
 @pytest.fixture
@@ -40,8 +43,9 @@ class _MockConfig:
 @pytest.mark.unit
 def test_b64url_uint():
     """Test base64url encoding of integers."""
-    assert _b64url_uint(1) == "AQ"
-    assert _b64url_uint(65537) == "AQAB"
+    assert b64url_uint(1) == "AQ"
+    assert b64url_uint(65537) == "AQAB"
+    assert b64url_uint(1, 4) == "AAAAAQ"
 
 
 @pytest.mark.unit
@@ -80,6 +84,71 @@ def test_format_public_key_to_jwk_with_custom_alg(jwt_key_utils):
     assert jwk["alg"] == "RS384"
 
 
+@pytest.mark.unit
+def test_format_public_key_to_jwk_with_ec_key(jwt_key_utils):
+    """EC keys are exported with their curve and padded coordinates."""
+    public_key = (
+        ec.generate_private_key(ec.SECP256R1())
+        .public_key()
+        .public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode()
+    )
+
+    jwk = jwt_key_utils.format_public_key_to_jwk(public_key, "kid1")
+
+    assert jwk["kty"] == "EC"
+    assert jwk["crv"] == "P-256"
+    assert jwk["alg"] == "ES256"
+    assert len(jwk["x"]) == len(jwk["y"]) == 43
+
+
+@pytest.mark.unit
+def test_format_public_key_to_jwk_with_ed25519_key(jwt_key_utils):
+    """Ed25519 keys are exported as OKP keys for EdDSA."""
+    public_key = (
+        ed25519.Ed25519PrivateKey.generate()
+        .public_key()
+        .public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode()
+    )
+
+    jwk = jwt_key_utils.format_public_key_to_jwk(public_key, "kid1")
+
+    assert jwk == {
+        "kty": "OKP",
+        "use": "sig",
+        "kid": "kid1",
+        "alg": "EdDSA",
+        "crv": "Ed25519",
+        "x": jwk["x"],
+    }
+
+
+@pytest.mark.unit
+def test_format_public_key_to_jwk_derives_alg_from_key(mock_config):
+    """The advertised algorithm follows the key, not ``JWT_ALGORITHM``."""
+    mock_config.JWT_ALGORITHM = "ES256"
+    public_key = (
+        ec.generate_private_key(ec.SECP384R1())
+        .public_key()
+        .public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode()
+    )
+
+    jwk = JWTKeyUtils(mock_config).format_public_key_to_jwk(public_key, "kid1")
+
+    assert jwk["alg"] == "ES384"
+
+
 @pytest.mark.unit
 def test_get_signing_key(mock_config):
     """Test get_signing_key with mock settings."""
@@ -0,0 +1,123 @@
+"""Unit tests for the aggregate DeFi metrics cache utilities."""
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from app.domain.schemas.defi_aggregate import AggregateMetricsSchema
+from app.utils.metrics_cache import HOT_KEYS_KEY, MetricsCacheUtils
+
+ADDRESS = "0x" + "Ab" * 20
+
+
+def _config():
+    return SimpleNamespace(
+        redis_url="redis://localhost:6379/15",
+        DEFI_METRICS_CACHE_TTL_SEC=180,
+        DEFI_METRICS_REFRESH_AHEAD_SEC=90,
+        DEFI_METRICS_HOT_WINDOW_SEC=900,
+    )
+
+
+def _utils():
+    """Return cache utilities wired to a mocked shared Redis client."""
+    utils = MetricsCacheUtils(_config())
+    redis = AsyncMock()
+    utils._redis_client = redis
+    return utils, redis
+
+
+def _metrics():
+    return AggregateMetricsSchema(
+        id="snap-1",
+        wallet_id=ADDRESS,
+        tvl=100.0,
+        total_borrowings=10.0,
+        aggregate_apy=0.05,
+        as_of=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        positions=[],
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_set_and_get_round_trip():
+    utils, redis = _utils()
+
+    assert await utils.set_metrics_cache(ADDRESS, _metrics())
+    key, ttl, payload = redis.setex.await_args.args
+    assert key == f"defi:agg:{ADDRESS.lower()}"
+    assert ttl == 180
+
+    redis.get.return_value = payload.encode()
+    cached = await utils.get_metrics_cache(ADDRESS)
+    assert cached == _metrics()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_redis_errors_are_swallowed():
+    utils, redis = _utils()
+    redis.get.side_effect = ConnectionError("down")
+    redis.setex.side_effect = ConnectionError("down")
+    redis.zadd.side_effect = ConnectionError("down")
+
+    assert await utils.get_metrics_cache(ADDRESS) is None
+    assert await utils.set_metrics_cache(ADDRESS, _metrics()) is False
+    await utils.mark_hot(ADDRESS)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_mark_hot_records_read_time():
+    utils, redis = _utils()
+
+    await utils.mark_hot(ADDRESS)
+
+    key, mapping = redis.zadd.await_args.args
+    assert key == HOT_KEYS_KEY
+    assert mapping[ADDRESS] == pytest.approx(time.time(), abs=5)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_keys_due_for_refresh_selects_missing_and_expiring():
+    utils, redis = _utils()
+    redis.zrange.return_value = [b"0xfresh", b"0xexpiring", b"0xmissing"]
+    pipe = Mock()
+    pipe.execute = AsyncMock(return_value=[170, 30, -2])
+    redis.pipeline = Mock(return_value=pipe)
+
+    due = await utils.get_keys_due_for_refresh()
+
+    assert due == ["0xexpiring", "0xmissing"]
+    # Keys not read within the hot window are pruned first
+    _, low, high = redis.zremrangebyscore.await_args.args
+    assert low == 0
+    assert high == pytest.approx(time.time() - 900, abs=5)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_keys_due_for_refresh_with_no_hot_keys():
+    utils, redis = _utils()
+    redis.zrange.return_value = []
+
+    assert await utils.get_keys_due_for_refresh() == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_client_is_shared_until_closed():
+    utils = MetricsCacheUtils(_config())
+    client = AsyncMock()
+
+    with patch("app.utils.metrics_cache.Redis.from_url", return_value=client) as new:
+        assert utils._build_redis_client() is utils._build_redis_client()
+        await utils.close()
+        utils._build_redis_client()
+
+    client.aclose.assert_awaited_once()
+    assert new.call_count == 2
@@ -0,0 +1,21 @@
+import uuid
+from datetime import datetime
+
+import pytest
+
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+@pytest.mark.unit
+def test_cursor_round_trip():
+    key = (datetime(2024, 5, 1, 12, 30, 15, 123456), uuid.uuid4())
+    cursor = encode_cursor(*key)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == key
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("cursor", ["", "abc", "e30", "eyJ0cyI6MX0"])
+def test_invalid_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
@@ -0,0 +1,136 @@
+"""Unit tests for the in-process latest-price index."""
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.core.config import Configuration
+from app.domain.schemas.token_price import LatestTokenPrice
+from app.utils.price_index import PriceIndex
+
+T0 = datetime(2024, 1, 1)
+
+
+def _quote(token_id=None, price=1.0, ts=T0, address="0xAbC", symbol="weth"):
+    return LatestTokenPrice(
+        token_id=token_id or uuid.uuid4(),
+        address=address,
+        symbol=symbol,
+        price_usd=price,
+        timestamp=ts,
+    )
+
+
+@pytest.fixture
+def price_index():
+    """PriceIndex with a mocked Redis client."""
+    index = PriceIndex(Configuration())
+    index._redis_client = AsyncMock()
+    return index
+
+
+class TestPriceIndexLookups:
+    @pytest.mark.unit
+    def test_get_by_address_symbol_and_id(self, price_index):
+        quote = _quote()
+        price_index.load([quote])
+
+        assert price_index.get("0xabc") is quote
+        assert price_index.get("0XABC".lower()) is quote
+        assert price_index.get("WETH") is quote
+        assert price_index.get("weth") is quote
+        assert price_index.get(str(quote.token_id)) is quote
+        assert price_index.get("unknown") is None
+        assert price_index.get("") is None
+
+    @pytest.mark.unit
+    def test_load_replaces_contents(self, price_index):
+        price_index.load([_quote(symbol="OLD", address="0x1")])
+        price_index.load([_quote(symbol="NEW", address="0x2")])
+
+        assert price_index.get("OLD") is None
+        assert price_index.get("NEW") is not None
+
+    @pytest.mark.unit
+    def test_apply_keeps_newest_price(self, price_index):
+        token_id = uuid.uuid4()
+        price_index.apply(_quote(token_id, price=2.0, ts=T0 + timedelta(hours=1)))
+
+        assert not price_index.apply(_quote(token_id, price=1.0, ts=T0))
+        assert price_index.get("WETH").price_usd == 2.0
+
+        assert price_index.apply(
+            _quote(token_id, price=3.0, ts=T0 + timedelta(hours=2))
+        )
+        assert price_index.get("0xabc").price_usd == 3.0
+
+    @pytest.mark.unit
+    def test_apply_prefers_dated_over_undated(self, price_index):
+        token_id = uuid.uuid4()
+        price_index.apply(_quote(token_id, price=2.0, ts=T0))
+
+        assert not price_index.apply(_quote(token_id, price=9.0, ts=None))
+        assert price_index.get("WETH").price_usd == 2.0
+
+
+class TestPriceIndexPubSub:
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_publish_applies_locally_and_broadcasts(self, price_index):
+        quote = _quote()
+
+        await price_index.publish([quote])
+
+        assert price_index.get("WETH") is quote
+        price_index._redis_client.publish.assert_awaited_once_with(
+            "token_prices:latest", quote.model_dump_json()
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_publish_tolerates_redis_failure(self, price_index):
+        price_index._redis_client.publish.side_effect = ConnectionError("down")
+        quote = _quote()
+
+        await price_index.publish([quote])
+
+        assert price_index.get("WETH") is quote
+
+    @pytest.mark.unit
+    def test_handle_message_merges_and_ignores_garbage(self, price_index):
+        quote = _quote()
+
+        price_index.handle_message(quote.model_dump_json().encode())
+        price_index.handle_message(b"not json")
+
+        assert price_index.get("WETH") == quote
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_listener_consumes_channel_until_stopped(self, price_index):
+        quote = _quote()
+        received = asyncio.Event()
+
+        async def listen():
+            yield {"type": "subscribe", "data": 1}
+            yield {"type": "message", "data": quote.model_dump_json().encode()}
+            received.set()
+            await asyncio.Event().wait()
+
+        pubsub = Mock()
+        pubsub.subscribe = AsyncMock()
+        pubsub.aclose = AsyncMock()
+        pubsub.listen = listen
+        redis = price_index._redis_client
+        redis.pubsub = Mock(return_value=pubsub)
+
+        await price_index.start()
+        await asyncio.wait_for(received.wait(), timeout=1)
+        await price_index.stop()
+
+        assert price_index.get("WETH") == quote
+        pubsub.subscribe.assert_awaited_once_with("token_prices:latest")
+        pubsub.aclose.assert_awaited_once()
+        redis.aclose.assert_awaited_once()
@@ -68,3 +68,105 @@ class TestInMemoryRateLimiter:
 
         assert limiter.allow("user1") is True
         assert limiter.allow("user2") is True
+
+
+class _Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+def test_attempts_are_regained_one_interval_at_a_time():
+    clock = _Clock()
+    limiter = InMemoryRateLimiter(max_attempts=3, window_seconds=60, clock=clock)
+
+    assert [limiter.allow("ip") for _ in range(4)] == [True, True, True, False]
+    assert limiter.hit("ip") == pytest.approx(20)
+
+    clock.now += 20
+    assert limiter.allow("ip") is True
+    assert limiter.allow("ip") is False
+
+    clock.now += 60
+    assert [limiter.allow("ip") for _ in range(4)] == [True, True, True, False]
+
+
+@pytest.mark.unit
+def test_reset_forgets_one_key():
+    limiter = InMemoryRateLimiter(max_attempts=1, window_seconds=60)
+    limiter.allow("user1")
+    limiter.allow("user2")
+
+    limiter.reset("user1")
+
+    assert limiter.allow("user1") is True
+    assert limiter.allow("user2") is False
+
+
+@pytest.mark.unit
+def test_key_count_is_capped_by_lru_eviction():
+    limiter = InMemoryRateLimiter(max_attempts=1, window_seconds=60, max_keys=100)
+
+    for i in range(10_000):
+        assert limiter.allow(f"10.0.{i // 256}.{i % 256}") is True
+
+    assert len(limiter) == 100
+    # The most recent keys are still limited
+    assert limiter.allow("10.0.39.15") is False
+
+
+@pytest.mark.unit
+def test_spraying_keys_does_not_evict_a_throttled_one():
+    clock = _Clock()
+    limiter = InMemoryRateLimiter(
+        max_attempts=3, window_seconds=60, max_keys=100, clock=clock
+    )
+    while limiter.allow("victim"):
+        pass
+
+    for i in range(1_000):
+        clock.now += 0.001
+        limiter.allow(f"spray{i}")
+
+    assert len(limiter) == 100
+    assert limiter.allow("victim") is False
+
+
+@pytest.mark.unit
+def test_expired_keys_are_evicted_before_live_ones():
+    clock = _Clock()
+    limiter = InMemoryRateLimiter(
+        max_attempts=1, window_seconds=60, max_keys=3, clock=clock
+    )
+    limiter.allow("old1")
+    limiter.allow("old2")
+    clock.now += 30
+    limiter.allow("live")
+    clock.now += 31
+
+    limiter.allow("new1")
+    limiter.allow("new2")
+
+    assert limiter.allow("live") is False
+    assert limiter.allow("new1") is False
+    assert len(limiter) == 3
+
+
+@pytest.mark.unit
+def test_idle_keys_are_swept_after_a_window():
+    clock = _Clock()
+    limiter = InMemoryRateLimiter(max_attempts=5, window_seconds=60, clock=clock)
+    for i in range(50):
+        limiter.allow(f"ip{i}")
+    clock.now += 30
+    for _ in range(5):
+        limiter.allow("busy")
+
+    clock.now += 31
+    limiter.allow("other")
+
+    # Only keys still owing time survive the sweep
+    assert len(limiter) == 2
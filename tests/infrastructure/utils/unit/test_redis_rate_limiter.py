@@ -0,0 +1,168 @@
+"""Unit tests for the Redis GCRA limiter and named route policies."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.config import Configuration
+from app.utils.rate_limiter import (
+    KEY_PREFIX,
+    RateLimiterUtils,
+    RateLimitPolicy,
+    RateLimitResult,
+    RedisRateLimiter,
+)
+
+
+def _limiter_with_script(script):
+    limiter = RedisRateLimiter("redis://localhost:6379/0")
+    limiter._script = script
+    return limiter
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "spec,expected",
+    [
+        ("20/60", RateLimitPolicy(20, 60.0, "ip")),
+        ("120/60/user", RateLimitPolicy(120, 60.0, "user")),
+        ("5/0.5/ip", RateLimitPolicy(5, 0.5, "ip")),
+    ],
+)
+def test_policy_parse(spec, expected):
+    assert RateLimitPolicy.parse(spec) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "spec", ["", "20", "x/60", "0/60", "20/0", "20/60/team", "1/2/ip/x"]
+)
+def test_policy_parse_rejects_malformed_specs(spec):
+    with pytest.raises(ValueError, match="Invalid rate limit"):
+        RateLimitPolicy.parse(spec)
+
+
+@pytest.mark.unit
+def test_policy_interval():
+    assert RateLimitPolicy(20, 60).interval_ms == 3000
+    assert RateLimitPolicy(10_000, 1).interval_ms == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_hit_runs_one_script_call():
+    script = AsyncMock(return_value=[1, 0])
+    limiter = _limiter_with_script(script)
+
+    result = await limiter.hit("auth_token:1.2.3.4", RateLimitPolicy(20, 60))
+
+    assert result == RateLimitResult(True, 0.0)
+    script.assert_awaited_once_with(
+        keys=[KEY_PREFIX + "auth_token:1.2.3.4"], args=[3000, 20]
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_hit_reports_retry_after_in_seconds():
+    limiter = _limiter_with_script(AsyncMock(return_value=[0, 2500]))
+
+    result = await limiter.hit("k", RateLimitPolicy(20, 60))
+
+    assert result == RateLimitResult(False, 2.5)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_script_registered_once():
+    client = Mock()
+    client.register_script.return_value = AsyncMock(return_value=[1, 0])
+    limiter = RedisRateLimiter("redis://localhost:6379/0")
+
+    with patch.object(limiter, "_build_redis_client", return_value=client):
+        await limiter.hit("k", RateLimitPolicy(2, 1))
+        await limiter.hit("k", RateLimitPolicy(2, 1))
+
+    client.register_script.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_redis_errors_fall_back_to_local_limits():
+    script = AsyncMock(side_effect=RedisConnectionError("down"))
+    limiter = _limiter_with_script(script)
+    policy = RateLimitPolicy(2, 60)
+
+    results = [await limiter.hit("k", policy) for _ in range(3)]
+
+    assert [r.allowed for r in results] == [True, True, False]
+    assert results[2].retry_after == pytest.approx(30, abs=0.1)
+    # Redis is not retried on every request while it is down
+    script.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_redis_is_retried_after_the_interval():
+    script = AsyncMock(side_effect=[RedisConnectionError("down"), [1, 0]])
+    limiter = _limiter_with_script(script)
+
+    with patch("app.utils.rate_limiter.time", return_value=100.0):
+        await limiter.hit("k", RateLimitPolicy(2, 60))
+    with patch("app.utils.rate_limiter.time", return_value=106.0):
+        await limiter.hit("k", RateLimitPolicy(2, 60))
+
+    assert script.await_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_without_redis_url_limits_are_local():
+    limiter = RedisRateLimiter(None)
+
+    assert (await limiter.hit("k", RateLimitPolicy(1, 60))).allowed is True
+    assert (await limiter.hit("k", RateLimitPolicy(1, 60))).allowed is False
+
+
+def _utils(**limits):
+    utils = RateLimiterUtils(Configuration(RATE_LIMITS=limits))
+    hit = AsyncMock(return_value=RateLimitResult(True))
+    utils._RateLimiterUtils__limiter = Mock(hit=hit)
+    return utils, hit
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_check_keys_ip_policies_by_client_ip():
+    utils, hit = _utils(oauth="30/60")
+
+    await utils.check("oauth", "1.2.3.4", user_id="u1")
+
+    hit.assert_awaited_once_with("oauth:1.2.3.4", RateLimitPolicy(30, 60.0))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_check_keys_user_policies_by_user_id():
+    utils, hit = _utils(defi="120/60/user")
+
+    await utils.check("defi", "1.2.3.4", user_id="u1")
+    await utils.check("defi", "1.2.3.4")
+
+    assert [c.args[0] for c in hit.await_args_list] == ["defi:u1", "defi:1.2.3.4"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_check_allows_unknown_policies():
+    utils, hit = _utils()
+
+    assert await utils.check("missing", "1.2.3.4") == RateLimitResult(True)
+    hit.assert_not_awaited()
+
+
+@pytest.mark.unit
+def test_malformed_policy_fails_at_startup():
+    with pytest.raises(ValueError):
+        RateLimiterUtils(Configuration(RATE_LIMITS={"oauth": "lots"}))
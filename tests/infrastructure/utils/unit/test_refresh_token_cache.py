@@ -0,0 +1,112 @@
+"""Unit tests for the Redis mirror of refresh-token state."""
+
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.config import Configuration
+from app.utils.refresh_token_cache import (
+    CACHE_PREFIX,
+    RefreshTokenCacheUtils,
+    RefreshTokenState,
+)
+
+
+def _cache(redis=None, redis_url="redis://localhost:6379/15"):
+    cache = RefreshTokenCacheUtils(Configuration(REDIS_URL=redis_url))
+    cache._redis_client = redis or AsyncMock()
+    return cache
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("revoked", [False, True])
+def test_state_round_trip(revoked):
+    state = RefreshTokenState("0b5c7a7e-1d2f-4c38-9c1a-3f7d2e1b4a55", 1.9e9, revoked)
+
+    assert RefreshTokenState.loads(state.dumps().encode()) == state
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_revoked_state_expires_with_the_token():
+    cache = _cache()
+    state = RefreshTokenState("u1", time.time() + 600, revoked=True)
+
+    assert await cache.set("hash", state) is True
+
+    cache._redis_client.set.assert_awaited_once()
+    args, kwargs = cache._redis_client.set.await_args
+    assert args == (CACHE_PREFIX + "hash", state.dumps())
+    assert 598 <= kwargs["ex"] <= 600
+    assert kwargs["nx"] is False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_valid_state_is_trusted_briefly_and_never_overwrites():
+    cache = _cache()
+
+    assert await cache.set("hash", RefreshTokenState("u1", time.time() + 600))
+
+    _, kwargs = cache._redis_client.set.await_args
+    assert kwargs["ex"] == Configuration().REFRESH_TOKEN_CACHE_VALID_TTL_SEC
+    # A revoked entry written by a concurrent logout must survive
+    assert kwargs["nx"] is True
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_expired_state_is_not_stored():
+    cache = _cache()
+
+    assert await cache.set("hash", RefreshTokenState("u1", time.time() - 1)) is False
+    cache._redis_client.set.assert_not_awaited()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_hit_and_miss():
+    state = RefreshTokenState("u1", 1.9e9, True)
+    cache = _cache(AsyncMock(get=AsyncMock(side_effect=[state.dumps().encode(), None])))
+
+    assert await cache.get("hash") == state
+    assert await cache.get("hash") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_disabled_without_redis_url():
+    cache = _cache(redis_url=None)
+
+    assert await cache.get("hash") is None
+    assert await cache.set("hash", RefreshTokenState("u1", time.time() + 60)) is False
+    cache._redis_client.get.assert_not_awaited()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_redis_errors_are_misses_and_back_off():
+    redis = AsyncMock(get=AsyncMock(side_effect=RedisConnectionError("down")))
+    cache = _cache(redis)
+
+    with patch("app.utils.refresh_token_cache.time.time", return_value=100.0):
+        assert await cache.get("hash") is None
+        assert await cache.get("hash") is None
+    assert redis.get.await_count == 1
+
+    with patch("app.utils.refresh_token_cache.time.time", return_value=106.0):
+        await cache.get("hash")
+    assert redis.get.await_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_revocations_are_mirrored_during_back_off():
+    cache = _cache()
+    cache._redis_down_until = time.time() + 60
+
+    assert not await cache.set("hash", RefreshTokenState("u1", time.time() + 600))
+    assert await cache.set("hash", RefreshTokenState("u1", time.time() + 600, True))
+    cache._redis_client.set.assert_awaited_once()
@@ -0,0 +1,53 @@
+"""Unit tests for the async token bucket."""
+import asyncio
+import time
+
+import pytest
+
+from app.utils.token_bucket import AsyncTokenBucket
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_burst_is_served_without_waiting():
+    bucket = AsyncTokenBucket(rate=0.001, capacity=3)
+    started = time.monotonic()
+    for _ in range(3):
+        await bucket.acquire()
+    assert time.monotonic() - started < 0.05
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_callers_are_paced():
+    bucket = AsyncTokenBucket(rate=100, capacity=1)
+    started = time.monotonic()
+    await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+    # First token is in the bucket, the other four refill at 10ms each
+    assert time.monotonic() - started >= 0.035
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_drain_forces_next_caller_to_wait():
+    bucket = AsyncTokenBucket(rate=50, capacity=5)
+    bucket.drain()
+    started = time.monotonic()
+    await bucket.acquire()
+    assert time.monotonic() - started >= 0.015
+
+
+@pytest.mark.unit
+def test_bucket_can_be_reused_across_event_loops():
+    bucket = AsyncTokenBucket(rate=1000, capacity=1)
+    asyncio.run(asyncio.wait_for(bucket.acquire(), 1))
+    asyncio.run(asyncio.wait_for(bucket.acquire(), 1))
+
+
+@pytest.mark.unit
+def test_invalid_arguments_are_rejected():
+    with pytest.raises(ValueError):
+        AsyncTokenBucket(rate=0, capacity=1)
+    bucket = AsyncTokenBucket(rate=1, capacity=1)
+    with pytest.raises(ValueError):
+        asyncio.run(bucket.acquire(2))
@@ -0,0 +1,76 @@
+import pytest
+
+from app.utils.verified_token_cache import VerifiedTokenCache
+
+
+class _Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _payload(exp=2000):
+    return {"sub": "user", "exp": exp, "roles": ["individual_investor"]}
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def retired():
+    return set()
+
+
+@pytest.fixture
+def cache(clock, retired):
+    return VerifiedTokenCache(3, retired.__contains__, clock=clock)
+
+
+def test_hit_returns_a_copy_of_the_payload(cache):
+    cache.put("tok", _payload(), "kid1")
+
+    first = cache.get("tok")
+    first["sub"] = "changed"
+
+    assert cache.get("tok") == _payload()
+
+
+def test_entries_expire_at_token_exp(cache, clock):
+    cache.put("tok", _payload(exp=1500), "kid1")
+
+    clock.now = 1499
+    assert cache.get("tok") is not None
+    clock.now = 1500
+    assert cache.get("tok") is None
+    assert len(cache) == 0
+
+
+def test_retired_key_invalidates_its_tokens(cache, retired):
+    cache.put("a", _payload(), "old")
+    cache.put("b", _payload(), "new")
+
+    retired.add("old")
+
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+
+
+def test_least_recently_used_entry_is_evicted(cache):
+    for token in ("a", "b", "c"):
+        cache.put(token, _payload(), "kid1")
+    cache.get("a")
+
+    cache.put("d", _payload(), "kid1")
+
+    assert cache.get("b") is None
+    assert all(cache.get(t) is not None for t in ("a", "c", "d"))
+
+
+def test_zero_size_disables_caching(clock, retired):
+    cache = VerifiedTokenCache(0, retired.__contains__, clock=clock)
+    cache.put("tok", _payload(), "kid1")
+    assert cache.get("tok") is None
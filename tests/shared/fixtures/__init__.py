@@ -85,6 +85,7 @@ from .mocks import (
     mock_celery,
     mock_httpx_client,
     mock_password_hasher,
+    mock_price_index,
     mock_redis,
     mock_web3,
 )
@@ -158,6 +159,7 @@ __all__ = [
     "mock_httpx_client",
     "mock_celery",
     "mock_password_hasher",
+    "mock_price_index",
     "mock_all_external_services",
     # Sample data fixtures
     "sample_jwks",
@@ -431,6 +431,7 @@ def create_test_auth_usecase(db_session):
     from app.services.email_service import EmailService
     from app.utils.jwt import JWTUtils
     from app.utils.logging import Audit
+    from app.utils.security import PasswordHasher
 
     database = Mock(spec=CoreDatabase)
 
@@ -455,6 +456,7 @@ def create_test_auth_usecase(db_session):
         refresh_token_repository=refresh_token_repo,
         email_service=email_service,
         jwt_utils=jwt_utils,
+        password_hasher=PasswordHasher(config),
         config=config,
         audit=audit,
     )
@@ -164,7 +164,7 @@ async def async_engine(tmp_path_factory: pytest.TempPathFactory):
 async def test_app(async_engine):
     """Return the *singleton* FastAPI application for tests.
 
-    We reuse the instance created at import time in *app.main* to avoid the
+    We reuse the instance created on first access in *app.main* to avoid the
     costly FastAPI *startup* sequence (and its SQL ``CREATE TABLE`` calls)
     multiple times. Only the database engine/session bindings are patched to
     use the per-session *async_engine* fixture.
@@ -64,6 +64,7 @@ def mock_database():
         yield session
 
     mock.get_session = mock_get_session
+    mock.get_read_session = mock_get_session
     mock.async_engine = Mock()
     mock.sync_engine = Mock()
     return mock
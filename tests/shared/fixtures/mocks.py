@@ -114,6 +114,8 @@ def mock_password_hasher():
     mock_hasher = Mock()
     mock_hasher.hash_password = Mock(return_value="hashed_password")
     mock_hasher.verify_password = Mock(return_value=True)
+    mock_hasher.hash_password_async = AsyncMock(return_value="hashed_password")
+    mock_hasher.verify_password_async = AsyncMock(return_value=True)
 
     with patch("app.utils.security.PasswordHasher", mock_hasher):
         yield mock_hasher
@@ -132,6 +134,22 @@ def mock_rate_limiter_utils():
     return mock_rate_limiter
 
 
+@pytest.fixture
+def mock_price_index():
+    """
+    Mock in-process price index for testing.
+    Lookups return None and publishing is a no-op.
+    """
+    from app.domain.interfaces.utils import PriceIndexInterface
+
+    mock_index = Mock(spec=PriceIndexInterface)
+    mock_index.get = Mock(return_value=None)
+    mock_index.publish = AsyncMock()
+    mock_index.start = AsyncMock()
+    mock_index.stop = AsyncMock()
+    return mock_index
+
+
 @pytest.fixture
 def mock_all_external_services(
     mock_redis,
@@ -91,18 +91,32 @@ def mock_wallet_repository():
     mock = Mock()
     mock.create = AsyncMock()
     mock.get_by_address = AsyncMock()
+    mock.get_by_user_and_address = AsyncMock()
     mock.list_by_user = AsyncMock()
+    mock.list_tracked = AsyncMock()
     mock.update = AsyncMock()
     mock.delete = AsyncMock()
     return mock
 
 
+@pytest.fixture
+def mock_transaction_repository():
+    """Mock TransactionRepository with common async methods."""
+    mock = Mock()
+    mock.bulk_upsert = AsyncMock()
+    mock.list_by_wallet = AsyncMock(return_value=[])
+    return mock
+
+
 @pytest.fixture
 def mock_portfolio_snapshot_repository():
     """Mock PortfolioSnapshotRepository with common async methods."""
     mock = Mock()
     mock.get_snapshots_in_range = AsyncMock()
     mock.get_by_wallet_address = AsyncMock()
+    mock.get_owned_snapshots = AsyncMock(return_value=None)
+    mock.get_owned_timeline = AsyncMock(return_value=None)
+    mock.get_latest_snapshot_by_address = AsyncMock()
     mock.create = AsyncMock()
     mock.update = AsyncMock()
     mock.delete = AsyncMock()
@@ -114,6 +128,9 @@ def mock_historical_balance_repository():
     """Mock HistoricalBalanceRepository with common async methods."""
     mock = Mock()
     mock.create = AsyncMock()
+    mock.bulk_create = AsyncMock()
+    mock.value_series = AsyncMock()
+    mock.revalue = AsyncMock()
     mock.get_by_wallet_and_token = AsyncMock()
     mock.list_by_wallet = AsyncMock()
     mock.update = AsyncMock()
@@ -127,6 +144,8 @@ def mock_token_repository():
     mock = Mock()
     mock.create = AsyncMock()
     mock.get_by_address = AsyncMock()
+    mock.get_by_addresses = AsyncMock(return_value={})
+    mock.list_tracked = AsyncMock(return_value=[])
     mock.list_all = AsyncMock()
     mock.update = AsyncMock()
     mock.delete = AsyncMock()
@@ -138,6 +157,11 @@ def mock_token_price_repository():
     """Mock TokenPriceRepository with common async methods."""
     mock = Mock()
     mock.create = AsyncMock()
+    mock.bulk_create = AsyncMock()
+    mock.get_latest_prices = AsyncMock(return_value=[])
+    mock.list_candles = AsyncMock(return_value=[])
+    mock.list_rollup_candles = AsyncMock(return_value=[])
+    mock.refresh_candles = AsyncMock(return_value=0)
     mock.get_latest_by_token = AsyncMock()
     mock.list_by_token = AsyncMock()
     mock.update = AsyncMock()
@@ -150,6 +174,7 @@ def mock_token_balance_repository():
     """Mock TokenBalanceRepository with common async methods."""
     mock = Mock()
     mock.create = AsyncMock()
+    mock.bulk_upsert = AsyncMock()
     mock.get_by_wallet_and_token = AsyncMock()
     mock.list_by_wallet = AsyncMock()
     mock.update = AsyncMock()
@@ -276,6 +301,7 @@ def create_real_database(db_session):
         yield db_session
 
     mock_database.get_session = mock_get_session
+    mock_database.get_read_session = mock_get_session
     return mock_database
 
 
@@ -355,6 +381,20 @@ def historical_balance_repository_with_real_db(db_session):
     return HistoricalBalanceRepository(database, audit)
 
 
+@pytest.fixture
+def portfolio_snapshot_repository_with_real_db(db_session):
+    """Create PortfolioSnapshotRepository with real database session for integration tests."""
+    from app.repositories.portfolio_snapshot_repository import (
+        PortfolioSnapshotRepository,
+    )
+    from app.utils.logging import Audit
+
+    database = create_real_database(db_session)
+    audit = Audit()
+
+    return PortfolioSnapshotRepository(database, audit)
+
+
 @pytest.fixture
 def password_reset_repository_with_real_db(db_session):
     """Create PasswordResetRepository with real database session for integration tests."""
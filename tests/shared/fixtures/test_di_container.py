@@ -30,6 +30,7 @@ try:
         TokenBalanceRepositoryInterface,
         TokenPriceRepositoryInterface,
         TokenRepositoryInterface,
+        TransactionRepositoryInterface,
         UserRepositoryInterface,
         WalletRepositoryInterface,
     )
@@ -46,6 +47,7 @@ except ImportError:
     TokenBalanceRepositoryInterface = ABC
     TokenPriceRepositoryInterface = ABC
     TokenRepositoryInterface = ABC
+    TransactionRepositoryInterface = ABC
     UserRepositoryInterface = ABC
     WalletRepositoryInterface = ABC
 
@@ -69,6 +71,7 @@ class TestDIContainer(DIContainer):
         """
         # Initialize base container attributes (don't call super().__init__() to avoid production services)
         self._core = {}
+        self._core_factories = {}
         self._services = {}
         self._repositories = {}
         self._usecases = {}
@@ -147,6 +150,7 @@ class TestDIContainer(DIContainer):
 
         mock_database = Mock(spec=CoreDatabase)
         mock_database.get_session = AsyncMock()
+        mock_database.get_read_session = AsyncMock()
         mock_database.init_db = AsyncMock()  # Add this for startup events
         mock_database.config = self.get_core("config")
         mock_database.async_engine = Mock()
@@ -245,14 +249,28 @@ class TestDIContainer(DIContainer):
 
         # Mock JWKS cache utils
         from app.domain.interfaces.utils import JWKSCacheUtilsInterface
+        from app.utils.jwks_cache import JWKSDocument
 
         mock_jwks_cache = Mock(spec=JWKSCacheUtilsInterface)
+        # No in-process copy: every request builds its document
+        mock_jwks_cache.get_local = Mock(return_value=None)
+        mock_jwks_cache.get_jwks_body = AsyncMock(return_value=None)
+        mock_jwks_cache.set_local = Mock(
+            side_effect=lambda body: JWKSDocument.from_body(body, 300)
+        )
         self.register_utility("jwks_cache_utils", mock_jwks_cache)
 
+        # Mock aggregate DeFi metrics cache utils
+        from app.domain.interfaces.utils import MetricsCacheUtilsInterface
+
+        mock_metrics_cache = Mock(spec=MetricsCacheUtilsInterface)
+        self.register_utility("metrics_cache_utils", mock_metrics_cache)
+
         # Mock JWT key utils
         from app.domain.interfaces.utils import JWTKeyUtilsInterface
 
         mock_jwt_key_utils = Mock(spec=JWTKeyUtilsInterface)
+        mock_jwt_key_utils.get_verifying_keys = Mock(return_value=[])
         self.register_utility("jwt_key_utils", mock_jwt_key_utils)
 
         # Mock password hasher
@@ -261,6 +279,11 @@ class TestDIContainer(DIContainer):
         mock_password_hasher = Mock(spec=PasswordHasherInterface)
         self.register_utility("password_hasher", mock_password_hasher)
 
+        # Real in-memory price index (Redis is only touched on publish/start)
+        from app.utils.price_index import PriceIndex
+
+        self.register_utility("price_index", PriceIndex(self.get_core("config")))
+
     def _register_mock_audit(self):
         """Register mock audit service for tests."""
         from app.utils.logging import Audit
@@ -351,6 +374,9 @@ class TestDIContainer(DIContainer):
             from app.repositories.refresh_token_repository import (
                 RefreshTokenRepository,
             )
+            from app.repositories.transaction_repository import (
+                TransactionRepository,
+            )
             from app.repositories.user_repository import UserRepository
             from app.repositories.wallet_repository import WalletRepository
 
@@ -376,6 +402,9 @@ class TestDIContainer(DIContainer):
             portfolio_snapshot_repo = PortfolioSnapshotRepository(database, audit)
             self.register_repository("portfolio_snapshot", portfolio_snapshot_repo)
 
+            transaction_repo = TransactionRepository(database, audit)
+            self.register_repository("transaction", transaction_repo)
+
             # For other repositories that may not exist yet, use mocks
             repository_specs = {
                 "historical_balance": HistoricalBalanceRepositoryInterface,
@@ -461,6 +490,7 @@ class TestDIContainer(DIContainer):
             "token_balance": TokenBalanceRepositoryInterface,
             "token_price": TokenPriceRepositoryInterface,
             "refresh_token": RefreshTokenRepositoryInterface,
+            "transaction": TransactionRepositoryInterface,
         }
 
         for repo_name, repo_spec in repository_specs.items():
@@ -497,6 +527,8 @@ class TestDIContainer(DIContainer):
                 setattr(mock_repo, "delete_expired", AsyncMock())
             elif repo_name == "portfolio_snapshot":
                 setattr(mock_repo, "get_by_wallet_address", AsyncMock(return_value=[]))
+                setattr(mock_repo, "get_owned_snapshots", AsyncMock(return_value=[]))
+                setattr(mock_repo, "get_owned_timeline", AsyncMock(return_value=[]))
                 setattr(
                     mock_repo,
                     "get_snapshots_by_address_and_range",
@@ -555,6 +587,7 @@ class TestDIContainer(DIContainer):
         """Register mock usecases for testing."""
         # Import usecase classes (only existing ones)
         from app.usecase.auth_usecase import AuthUsecase
+        from app.usecase.defi_aggregate_usecase import DefiAggregateUsecase
         from app.usecase.email_verification_usecase import (
             EmailVerificationUsecase,
         )
@@ -568,6 +601,7 @@ class TestDIContainer(DIContainer):
         from app.usecase.token_balance_usecase import TokenBalanceUsecase
         from app.usecase.token_price_usecase import TokenPriceUsecase
         from app.usecase.token_usecase import TokenUsecase
+        from app.usecase.transaction_usecase import TransactionUsecase
         from app.usecase.user_profile_usecase import UserProfileUsecase
         from app.usecase.wallet_usecase import WalletUsecase
 
@@ -595,6 +629,11 @@ class TestDIContainer(DIContainer):
 
         # Get utilities
         jwt_utils = self.get_utility("jwt_utils")
+        # The registered "password_hasher" utility is a mock; usecases that
+        # store and check real credentials need working hashes.
+        from app.utils.security import PasswordHasher
+
+        password_hasher = PasswordHasher(config)
 
         # Create usecases with proper dependency injection
         try:
@@ -604,6 +643,7 @@ class TestDIContainer(DIContainer):
                 refresh_token_repo,
                 email_service,
                 jwt_utils,
+                password_hasher,
                 config,
                 audit,
             )
@@ -648,7 +688,7 @@ class TestDIContainer(DIContainer):
             self.register_usecase("oauth", mock_usecase)
 
         try:
-            user_profile_uc = UserProfileUsecase(user_repo, audit)
+            user_profile_uc = UserProfileUsecase(user_repo, password_hasher, audit)
             self.register_usecase("user_profile", user_profile_uc)
         except Exception:
             mock_usecase = Mock(spec=UserProfileUsecase)
@@ -667,6 +707,18 @@ class TestDIContainer(DIContainer):
             mock_usecase = Mock(spec=WalletUsecase)
             self.register_usecase("wallet", mock_usecase)
 
+        try:
+            transaction_uc = TransactionUsecase(
+                self.get_repository("transaction"),
+                wallet_repo,
+                config,
+                audit,
+            )
+            self.register_usecase("transaction", transaction_uc)
+        except Exception:
+            mock_usecase = Mock(spec=TransactionUsecase)
+            self.register_usecase("transaction", mock_usecase)
+
         # Add JWKS usecase
         try:
             from app.usecase.jwks_usecase import JWKSUsecase
@@ -689,6 +741,7 @@ class TestDIContainer(DIContainer):
             "token": TokenUsecase,
             "historical_balance": HistoricalBalanceUsecase,
             "portfolio_snapshot": PortfolioSnapshotUsecase,
+            "defi_aggregate": DefiAggregateUsecase,
         }
 
         for name, usecase_class in remaining_usecases.items():
@@ -734,7 +787,8 @@ class TestDIContainer(DIContainer):
         try:
             # DeFi endpoint
             wallet_uc = self.get_usecase("wallet")
-            defi_endpoint = DeFi(wallet_uc)
+            defi_aggregate_uc = self.get_usecase("defi_aggregate")
+            defi_endpoint = DeFi(wallet_uc, defi_aggregate_uc)
             self.register_endpoint("defi", defi_endpoint)
         except Exception:
             mock_endpoint = Mock(spec=DeFi)
@@ -822,6 +876,7 @@ class TestDIContainer(DIContainer):
             token_price_uc = self.get_usecase("token_price")
             token_balance_uc = self.get_usecase("token_balance")
             portfolio_snapshot_uc = self.get_usecase("portfolio_snapshot")
+            transaction_uc = self.get_usecase("transaction")
             wallets_endpoint = Wallets(
                 wallet_uc,
                 token_uc,
@@ -829,6 +884,7 @@ class TestDIContainer(DIContainer):
                 token_price_uc,
                 token_balance_uc,
                 portfolio_snapshot_uc,
+                transaction_uc,
             )
             self.register_endpoint("wallets", wallets_endpoint)
         except Exception:
@@ -87,6 +87,8 @@ def oauth_usecase_with_di(
 @pytest.fixture
 def token_price_usecase_with_di(
     mock_token_price_repository,
+    mock_token_repository,
+    mock_price_index,
     mock_config,
     mock_audit,
 ):
@@ -95,6 +97,8 @@ def token_price_usecase_with_di(
 
     return TokenPriceUsecase(
         mock_token_price_repository,
+        mock_token_repository,
+        mock_price_index,
         mock_config,
         mock_audit,
     )
@@ -119,6 +123,7 @@ def token_usecase_with_di(
 @pytest.fixture
 def historical_balance_usecase_with_di(
     mock_historical_balance_repository,
+    mock_wallet_repository,
     mock_config,
     mock_audit,
 ):
@@ -127,6 +132,7 @@ def historical_balance_usecase_with_di(
 
     return HistoricalBalanceUsecase(
         mock_historical_balance_repository,
+        mock_wallet_repository,
         mock_config,
         mock_audit,
     )
@@ -162,3 +168,21 @@ def portfolio_snapshot_usecase_with_di(
         mock_wallet_repository,
         mock_audit,
     )
+
+
+@pytest.fixture
+def transaction_usecase_with_di(
+    mock_transaction_repository,
+    mock_wallet_repository,
+    mock_config,
+    mock_audit,
+):
+    """Create TransactionUsecase with mocked dependencies."""
+    from app.usecase.transaction_usecase import TransactionUsecase
+
+    return TransactionUsecase(
+        mock_transaction_repository,
+        mock_wallet_repository,
+        mock_config,
+        mock_audit,
+    )